@@ -13,6 +13,14 @@ from datetime import datetime
 # Check for --debug flag early (before heavy imports)
 DEBUG_MODE = '--debug' in sys.argv
 
+# Time every import from here on (--profile-startup); the report is printed
+# once the window is up, or at exit for CLI commands
+if '--profile-startup' in sys.argv:
+    import atexit
+    from src.utils import startup_profile
+    startup_profile.install()
+    atexit.register(startup_profile.report)
+
 def debug_print(msg):
     """Print debug message if DEBUG_MODE is enabled, otherwise print on same line"""
     # Skip printing if no console exists (console=False build)
@@ -34,99 +42,34 @@ def debug_print(msg):
         # Console operations failed, silently ignore
         pass
 
-import requests
-from requests.adapters import HTTPAdapter
-import pycurl
-import io
-import json
 import argparse
-import sys
-from typing import Optional
-
-from concurrent.futures import ThreadPoolExecutor
-import concurrent.futures
-import time
-import threading
-from tqdm import tqdm
-from src.utils.format_utils import format_binary_size, format_binary_rate
-from src.utils.logger import log
-from src.network.image_host_client import ImageHostClient
-import configparser
-import platform
-import sqlite3
 import glob
-try:
-    import winreg  # Windows-only
-except ImportError:
-    winreg = None  # Not available on Linux/Mac
-import mimetypes
-
-from src.network.imx_uploader import ImxToUploader
-
-from src.utils.credentials import (
-    CredentialDecryptionError,
-    get_encryption_key,
-    migrate_credentials_from_ini,
-    migrate_imx_credentials,
-    setup_secure_password,
-)
 
+from src.utils.format_utils import format_binary_size, format_binary_rate, timestamp
+from src.utils.logger import configure_async_logging, log
 from src.utils.paths import (
     __version__,
-    get_project_root,
     get_config_path,
-    read_config,
-    get_central_store_base_path,
-    get_central_storage_path,
     load_user_defaults,
     migrate_from_imxup,
 )
-from src.utils.format_utils import timestamp
 
 # GitHub repository info for update checker
 GITHUB_OWNER = "twwat"
 GITHUB_REPO = "bbdrop"
 
+# Everything heavier (uploader, credentials/cryptography, templates, Qt and
+# the main window) is imported inside main() by the path that needs it, so
+# --version, the single-instance handoff and the CLI commands only pay for
+# what they use.
 
-# Imports used by main() CLI flow
-from src.utils.templates import save_gallery_artifacts
-from src.storage.gallery_management import get_unnamed_galleries
-from src.utils.windows_integration import create_windows_context_menu, remove_windows_context_menu
-
-def main():
-    # Migrate credentials from INI to keyring (runs once, safe to call multiple times)
-    migrate_credentials_from_ini()
-    migrate_imx_credentials()
 
-    # Ensure CSPRNG master key exists — triggers one-time re-encryption migration
-    # if upgrading from SHA-256-derived key. Must run after INI migration above.
-    try:
-        get_encryption_key()
-    except CredentialDecryptionError as e:
-        log(f"Encryption key initialization failed: {e}", level="error", category="auth")
-
-    # Auto-launch GUI if double-clicked (no arguments, no other console processes)
-    if len(sys.argv) == 1:  # No arguments provided
-        try:
-            # Check if this is the only process attached to the console
-            import ctypes
-            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
-            process_array = (ctypes.c_uint * 1)()
-            num_processes = kernel32.GetConsoleProcessList(process_array, 1)
-            # If num_processes <= 2, likely double-clicked (only this process and conhost)
-            # If num_processes > 2, launched from terminal (cmd.exe/powershell also attached)
-            if num_processes <= 2:
-                sys.argv.append('--gui')
-        except (AttributeError, OSError, TypeError):
-            pass  # Not Windows or check failed, don't auto-launch GUI
-
-    # Migrate from old imxup installation if needed (first run after upgrade)
-    migrate_from_imxup()
-
-    # Load user defaults
-    user_defaults = load_user_defaults()
-
-    parser = argparse.ArgumentParser(description='Upload image folders to imx.to as galleries and generate bbcode.\n\nSettings file: ' + get_config_path())
+def build_arg_parser(user_defaults, config_path=None):
+    """Command line parser; defaults come from the saved user settings."""
+    description = 'Upload image folders to imx.to as galleries and generate bbcode.'
+    if config_path:
+        description += '\n\nSettings file: ' + config_path
+    parser = argparse.ArgumentParser(description=description)
     parser.add_argument('-v', '--version', action='store_true', help='Show version and exit')
     parser.add_argument('folder_paths', nargs='*', help='Paths to folders containing images')
     parser.add_argument('--name', help='Gallery name (optional, uses folder name if not specified)')
@@ -142,10 +85,18 @@ def main():
     parser.add_argument('--parallel', type=int,
                        default=user_defaults.get('parallel_batch_size', 4),
                        help='Number of images to upload simultaneously (default: 4)')
+    parser.add_argument('--engine', choices=['threads', 'multi'],
+                       default=user_defaults.get('upload_engine', 'threads'),
+                       help='Upload engine: threads=one blocking transfer per thread, '
+                            'multi=single CurlMulti event loop (default: threads)')
     parser.add_argument('--setup-secure', action='store_true',
                        help='Set up secure password storage (interactive)')
     parser.add_argument('--rename-unnamed', action='store_true',
                        help='Rename all unnamed galleries from previous uploads')
+    parser.add_argument('--rebuild-gallery-index', action='store_true',
+                       help='Rebuild the index of uploaded galleries used for duplicate detection '
+                            'from the central store; folder_paths given are also searched for '
+                            '.uploaded subfolders')
     parser.add_argument('--template', '-t', 
                        help='Template name to use for bbcode generation (default: "default")')
 
@@ -157,11 +108,87 @@ def main():
                        help='Launch graphical user interface')
     parser.add_argument('--debug', action='store_true',
                        help='Enable debug mode: print all log messages to console')
+    parser.add_argument('--profile-startup', action='store_true',
+                       help='Print how long each module took to import during startup '
+                            '(same layout as python -X importtime)')
+
+    return parser
+
+
+def _handoff_to_running_instance(folder_paths):
+    """Forward this --gui launch to a running BBDrop, if there is one.
+
+    Runs before the credential migrations and any Qt or main window import,
+    so a second launch (e.g. from the Explorer context menu) just sends its
+    folder over COMMUNICATION_PORT and exits. Returns True if it did.
+    """
+    from src.network.single_instance import check_single_instance
 
+    if folder_paths:
+        folders_to_add = [path for path in folder_paths if os.path.isdir(path)]
+        return bool(folders_to_add) and check_single_instance(folders_to_add[0])
+    if check_single_instance():
+        print(f"{timestamp()} INFO: BBDrop GUI already running, bringing existing instance to front.")
+        return True
+    return False
+
+
+def main():
+    # Auto-launch GUI if double-clicked (no arguments, no other console processes)
+    if len(sys.argv) == 1:  # No arguments provided
+        try:
+            # Check if this is the only process attached to the console
+            import ctypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            process_array = (ctypes.c_uint * 1)()
+            num_processes = kernel32.GetConsoleProcessList(process_array, 1)
+            # If num_processes <= 2, likely double-clicked (only this process and conhost)
+            # If num_processes > 2, launched from terminal (cmd.exe/powershell also attached)
+            if num_processes <= 2:
+                sys.argv.append('--gui')
+        except (AttributeError, OSError, TypeError):
+            pass  # Not Windows or check failed, don't auto-launch GUI
+
+    # --version and the single-instance handoff need none of the setup below.
+    # The saved defaults only affect upload options, so parsing without them
+    # is enough to find these flags and the folders.
+    if {'--gui', '-v', '--version'} & set(sys.argv[1:]):
+        early_args, _ = build_arg_parser({}).parse_known_args()
+        if early_args.version:
+            print(f"imxup {__version__}")
+            return
+        if early_args.gui and _handoff_to_running_instance(early_args.folder_paths):
+            return
+
+    from src.utils.credentials import (
+        CredentialDecryptionError,
+        get_encryption_key,
+        migrate_credentials_from_ini,
+        migrate_imx_credentials,
+    )
+
+    # Migrate credentials from INI to keyring (runs once, safe to call multiple times)
+    migrate_credentials_from_ini()
+    migrate_imx_credentials()
+
+    # Ensure CSPRNG master key exists — triggers one-time re-encryption migration
+    # if upgrading from SHA-256-derived key. Must run after INI migration above.
+    try:
+        get_encryption_key()
+    except CredentialDecryptionError as e:
+        log(f"Encryption key initialization failed: {e}", level="error", category="auth")
+
+    # Migrate from old imxup installation if needed (first run after upgrade)
+    migrate_from_imxup()
+
+    # Load user defaults
+    user_defaults = load_user_defaults()
+
+    parser = build_arg_parser(user_defaults, get_config_path())
     args = parser.parse_args()
-    if args.version:
-        print(f"imxup {__version__}")
-        return
+
+    # Move log formatting and file I/O off the calling threads (Settings > Logs)
+    configure_async_logging()
     
     # Handle GUI launch
     if args.gui:
@@ -252,22 +279,10 @@ def main():
                 except (OSError, AttributeError):
                     pass
             debug_print("Importing main_window...")
-            from src.gui.main_window import BBDropGUI, check_single_instance
-
-            # Check for existing instance
-            folders_to_add = []
-            if len(sys.argv) > 1:
-                for arg in sys.argv[1:]:
-                    if os.path.isdir(arg):
-                        folders_to_add.append(arg)
-                if folders_to_add and check_single_instance(folders_to_add[0]):
-                    splash.finish_and_hide()
-                    return
-            else:
-                if check_single_instance():
-                    print(f"{timestamp()} INFO: BBDrop GUI already running, bringing existing instance to front.")
-                    splash.finish_and_hide()
-                    return
+            from src.gui.main_window import BBDropGUI
+
+            # A running instance was already handed our folders at the top of main()
+            folders_to_add = [arg for arg in sys.argv[1:] if os.path.isdir(arg)]
 
             splash.set_status("Creating main window")
 
@@ -356,6 +371,10 @@ def main():
                 except (AttributeError, OSError):
                     pass
 
+            if args.profile_startup:
+                from src.utils import startup_profile
+                startup_profile.report()
+
             sys.exit(app.exec())
 
         except ImportError as e:
@@ -369,6 +388,7 @@ def main():
     
     # Handle secure setup
     if args.setup_secure:
+            from src.utils.credentials import setup_secure_password
             if setup_secure_password():
                 debug_print("Setup complete! You can now use the script without storing passwords in plaintext.")
             else:
@@ -377,6 +397,7 @@ def main():
     
     # Handle context menu installation
     if args.install_context_menu:
+        from src.utils.windows_integration import create_windows_context_menu
         if create_windows_context_menu():
             debug_print("Context Menu: Installed successfully")
         else:
@@ -385,17 +406,31 @@ def main():
     
     # Handle context menu removal
     if args.remove_context_menu:
+        from src.utils.windows_integration import remove_windows_context_menu
         if remove_windows_context_menu():
             debug_print("Context Menu: Removed successfully")
         else:
             debug_print("Context Menu: Failed to removeFailed to remove context menu.")
         return
     
+    # Rebuild the duplicate-detection index from artifacts already on disk
+    if args.rebuild_gallery_index:
+        from src.storage.gallery_index import get_gallery_index
+        index = get_gallery_index()
+        result = index.rebuild(scan_roots=args.folder_paths)
+        print(f"Gallery index rebuilt: {result.central} artifact files in {index.central_path}")
+        if args.folder_paths:
+            print(f"  {result.uploaded} artifact files in {result.folders} .uploaded folders")
+        if result.kept:
+            print(f"  {result.kept} previously recorded artifact files kept")
+        return 0
+
     # Handle gallery visibility changes
     if len(args.folder_paths) == 1 and args.folder_paths[0].startswith('--'):
         # This is a gallery ID for visibility change
         gallery_id = args.folder_paths[0][2:]  # Remove -- prefix
         
+        from src.network.imx_uploader import ImxToUploader
         uploader = ImxToUploader()
         
         if args.public:
@@ -414,6 +449,7 @@ def main():
     
     # Handle unnamed gallery renaming
     if args.rename_unnamed:
+        from src.storage.gallery_management import get_unnamed_galleries
         unnamed_galleries = get_unnamed_galleries()
 
         if not unnamed_galleries:
@@ -498,6 +534,9 @@ def main():
     # public_gallery is deprecated but kept for compatibility
     # All galleries are public now
     
+    from src.network.imx_uploader import ImxToUploader
+    from src.utils.templates import save_gallery_artifacts
+
     try:
         uploader = ImxToUploader()
         all_results = []
@@ -533,6 +572,7 @@ def main():
                     max_retries=args.max_retries,
                     parallel_batch_size=args.parallel,
                     template_name=args.template or "default",
+                    engine_mode=args.engine,
                 )
 
                 # Save artifacts through shared helper
@@ -2,7 +2,7 @@
 
 # Build both GUI (no console) and CLI (with console) executables from same codebase
 
-from PyInstaller.utils.hooks import collect_all, collect_dynamic_libs
+from PyInstaller.utils.hooks import collect_all, collect_dynamic_libs, collect_submodules
 import os
 import sys
 import subprocess
@@ -124,12 +124,17 @@ for binary in all_binaries:
     print(f"  - {binary}")
 print("=" * 50 + "\n")
 
+# Bundle every app module explicitly: the settings dialog, dialogs package,
+# gallery file manager and archive backends are imported on first use by
+# name (src.utils.lazy_imports), which the import scanner cannot follow.
+src_hiddenimports = collect_submodules('src')
+
 a = Analysis(
     ['bbdrop.py'],
     pathex=[],
     binaries=all_binaries,
     datas=[('assets', 'assets')] + pycurl_datas,
-    hiddenimports=['imghdr', 'requests', 'PyQt6', 'pycurl', 'certifi'] + pycurl_hiddenimports,
+    hiddenimports=['imghdr', 'requests', 'PyQt6', 'pycurl', 'certifi'] + pycurl_hiddenimports + src_hiddenimports,
     hookspath=['hooks'],  # Use custom hooks directory
     hooksconfig={},
     runtime_hooks=[],
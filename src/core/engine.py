@@ -22,6 +22,7 @@ from typing import Callable, Optional, Tuple, List, Dict, Any, Set
 
 from src.utils.format_utils import format_binary_size, format_binary_rate
 from src.utils.logger import log
+from src.network.bandwidth_shaper import get_bandwidth_shaper
 from src.network.image_host_client import ImageHostClient
 
 
@@ -49,27 +50,53 @@ class AtomicCounter:
 
 
 class ByteCountingCallback:
-    """Callback wrapper that tracks upload progress deltas and updates global counter."""
+    """Callback wrapper that tracks upload progress deltas and updates global counter.
+
+    With a host_id, each delta is also drawn from the shared BandwidthShaper.
+    By default the shaper sleeps here (inside curl's progress callback) while
+    the global or per-host upload limit is exceeded, until should_stop returns
+    True. Transfers in a shared CurlMulti loop pass pause instead: it is
+    called with the delay, so the loop can pause that handle rather than
+    block every transfer.
+    """
 
     def __init__(self, global_counter: Optional[AtomicCounter] = None,
                  gallery_counter: Optional[AtomicCounter] = None,
-                 worker_thread: Optional[Any] = None):
+                 worker_thread: Optional[Any] = None,
+                 host_id: Optional[str] = None,
+                 should_stop: Optional[Callable[[], bool]] = None,
+                 pause: Optional[Callable[[float], None]] = None):
         """Initialize with optional global counter.
 
         Args:
             global_counter: Tracks bytes across ALL galleries (used by Speed box)
             gallery_counter: Ignored (per-gallery tracking removed)
             worker_thread: Ignored (not needed)
+            host_id: Image host the bytes go to, for upload rate limiting
+            should_stop: Ends a rate-limit sleep early when it returns True
+            pause: Called with the seconds to hold off instead of sleeping
         """
         self.global_counter = global_counter
+        self.host_id = host_id
+        self.should_stop = should_stop
+        self.pause = pause
         self.last_bytes = 0
 
     def __call__(self, bytes_read: int, total_size: int) -> None:
         """Called by pycurl during upload transmission."""
         delta = bytes_read - self.last_bytes
-        if delta > 0 and self.global_counter:
-            self.global_counter.add(delta)
+        if delta > 0:
+            if self.global_counter:
+                self.global_counter.add(delta)
             self.last_bytes = bytes_read
+            if self.host_id:
+                shaper = get_bandwidth_shaper()
+                if self.pause is None:
+                    shaper.throttle(self.host_id, delta, self.should_stop)
+                else:
+                    delay = shaper.reserve(self.host_id, delta)
+                    if delay > 0:
+                        self.pause(delay)
 
 
 # Type aliases for callbacks
@@ -77,6 +104,12 @@ ProgressCallback = Callable[[int, int, int, str], None]
 SoftStopCallback = Callable[[], bool]
 ImageUploadedCallback = Callable[[str, Dict[str, Any], int], None]
 
+# Engine modes: one blocking perform() per pooled thread, or a single
+# CurlMulti event loop that multiplexes every transfer on the calling thread.
+ENGINE_MODE_THREADS = "threads"
+ENGINE_MODE_MULTI = "multi"
+ENGINE_MODES = (ENGINE_MODE_THREADS, ENGINE_MODE_MULTI)
+
 
 class UploadEngine:
     """Shared engine for uploading a folder as a gallery.
@@ -103,6 +136,17 @@ class UploadEngine:
         self.gallery_byte_counter = gallery_byte_counter  # Can be None
         self.worker_thread = worker_thread
 
+    def _host_id(self) -> Optional[str]:
+        config = getattr(self.uploader, 'config', None)
+        return getattr(config, 'host_id', None)
+
+    def _byte_counting_callback(self, should_stop: Optional[Callable[[], bool]] = None,
+                                pause: Optional[Callable[[float], None]] = None) -> ByteCountingCallback:
+        """Progress callback for one image transfer, rate limited per image host."""
+        return ByteCountingCallback(self.global_byte_counter, self.gallery_byte_counter,
+                                    self.worker_thread, host_id=self._host_id(),
+                                    should_stop=should_stop, pause=pause)
+
     def _is_gallery_unnamed(self, gallery_id: str) -> bool:
         """Check if gallery is in the unnamed galleries list."""
         try:
@@ -113,6 +157,194 @@ class UploadEngine:
             log(f"Failed to check gallery rename status: {e}", level="error", category="engine")
             return False
 
+    def _multi_upload_available(self) -> bool:
+        """Whether the uploader and the local pycurl build support the multi loop."""
+        try:
+            if not self.uploader.supports_multi_upload():
+                return False
+        except Exception:
+            return False
+        try:
+            import pycurl  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _run_multi_batch(
+        self,
+        files: List[str],
+        folder_path: str,
+        gallery_id: Optional[str],
+        thumbnail_size: int,
+        thumbnail_format: int,
+        gallery_name: Optional[str],
+        concurrency: int,
+        on_result: Callable[[Tuple[str, Optional[Dict[str, Any]], Optional[str], Optional[float], str]], None],
+        keep_going: Optional[Callable[[], bool]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        """Upload ``files`` through a single ``pycurl.CurlMulti`` event loop.
+
+        Up to ``concurrency`` transfers run at once on the calling thread, so
+        raising concurrency adds curl handles instead of threads. Each finished
+        transfer is reported through ``on_result`` with the same tuple shape as
+        the thread-pool path. Refills stop once ``keep_going`` returns False;
+        in-flight transfers are always allowed to finish.
+
+        A transfer over the upload limit is paused (``PAUSE_SEND``) and
+        resumed from this loop once the shaper's delay has passed, so the
+        other transfers keep running. Once ``should_stop`` returns True,
+        paused transfers are resumed at once and no longer paused.
+
+        Returns:
+            The highest number of concurrent transfers seen.
+        """
+        import pycurl
+
+        concurrency = max(1, int(concurrency or 1))
+        remaining: List[str] = list(files)
+        if not remaining:
+            return 0
+
+        multi = pycurl.CurlMulti()
+        # Share DNS cache and TLS sessions between handles so new connections
+        # to the same host skip the lookup and resume the TLS session.
+        share = pycurl.CurlShare()
+        share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
+        share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
+        try:
+            multi.setopt(pycurl.M_MAXCONNECTS, concurrency)
+        except Exception:
+            pass
+
+        idle_handles: List[Any] = [pycurl.Curl() for _ in range(min(concurrency, len(remaining)))]
+        all_handles = list(idle_handles)
+        # curl handle -> (image_file, image_path, response_buffer, start_time)
+        active: Dict[Any, Tuple[str, str, Any, float]] = {}
+        # curl handle -> time.monotonic() when it may send again
+        paused: Dict[Any, float] = {}
+        max_concurrent_seen = 0
+        host_id = self._host_id()
+        shaper = get_bandwidth_shaper()
+
+        def stopping() -> bool:
+            return should_stop is not None and should_stop()
+
+        def pause_handle(curl: Any, delay: float) -> None:
+            # Runs inside curl's progress callback; pausing there is allowed
+            if curl in paused or stopping():
+                return
+            curl.pause(pycurl.PAUSE_SEND)
+            paused[curl] = time.monotonic() + delay
+
+        def resume_due() -> None:
+            now = time.monotonic()
+            force = stopping()
+            for curl, resume_at in list(paused.items()):
+                if not force:
+                    if now < resume_at:
+                        continue
+                    # Other transfers may have drawn the bucket down meanwhile
+                    delay = shaper.reserve(host_id, 0)
+                    if delay > 0:
+                        paused[curl] = now + delay
+                        continue
+                del paused[curl]
+                curl.pause(pycurl.PAUSE_CONT)
+
+        def start_next() -> None:
+            image_file = remaining.pop(0)
+            image_path = os.path.join(folder_path, image_file)
+            curl = idle_handles.pop()
+            try:
+                response_buffer = self.uploader.prepare_multi_upload(
+                    curl,
+                    image_path,
+                    gallery_id=gallery_id,
+                    thumbnail_size=thumbnail_size,
+                    thumbnail_format=thumbnail_format,
+                    progress_callback=self._byte_counting_callback(
+                        pause=lambda delay, curl=curl: pause_handle(curl, delay)),
+                    gallery_name=gallery_name,
+                )
+                # prepare_multi_upload() may reset the handle, so attach the
+                # share afterwards
+                curl.setopt(pycurl.SHARE, share)
+                multi.add_handle(curl)
+            except Exception as e:
+                try:
+                    curl.unsetopt(pycurl.SHARE)
+                except Exception:
+                    pass
+                idle_handles.append(curl)
+                on_result((image_file, None, f"Upload error: {e}", None, image_path))
+                return
+            active[curl] = (image_file, image_path, response_buffer, time.time())
+
+        def finish(curl: Any, curl_error: Optional[Tuple[int, str]]) -> None:
+            multi.remove_handle(curl)
+            paused.pop(curl, None)
+            image_file, image_path, response_buffer, upload_start = active.pop(curl)
+            try:
+                response = self.uploader.finish_multi_upload(curl, response_buffer, image_path, curl_error=curl_error)
+                upload_duration = time.time() - upload_start
+                if response.get('status') == 'success':
+                    result = (image_file, response['data'], None, upload_duration, image_path)
+                else:
+                    result = (image_file, None, f"API error: {response}", None, image_path)
+            except Exception as e:
+                result = (image_file, None, f"Upload error: {e}", None, image_path)
+            # Detach from the share so the handle can be prepared again
+            curl.unsetopt(pycurl.SHARE)
+            idle_handles.append(curl)
+            on_result(result)
+
+        try:
+            # Prime the loop
+            while remaining and idle_handles:
+                start_next()
+            max_concurrent_seen = len(active)
+
+            while active:
+                if paused:
+                    resume_due()
+                while True:
+                    ret, _ = multi.perform()
+                    if ret != pycurl.E_CALL_MULTI_PERFORM:
+                        break
+                while True:
+                    queued, succeeded, failed = multi.info_read()
+                    for curl in succeeded:
+                        finish(curl, None)
+                    for curl, errno, errmsg in failed:
+                        finish(curl, (errno, errmsg))
+                    if not queued:
+                        break
+                # Refill freed slots unless the caller asked us to wind down
+                while remaining and idle_handles and (keep_going is None or keep_going()):
+                    start_next()
+                max_concurrent_seen = max(max_concurrent_seen, len(active))
+                if active:
+                    timeout = 1.0
+                    if paused:
+                        timeout = min(timeout, max(0.01, min(paused.values()) - time.monotonic()))
+                    multi.select(timeout)
+        finally:
+            for curl in list(active):
+                try:
+                    multi.remove_handle(curl)
+                except Exception:
+                    pass
+            for curl in all_handles:
+                try:
+                    curl.close()
+                except Exception:
+                    pass
+            multi.close()
+            share.close()
+
+        return max_concurrent_seen
+
     def run(
         self,
         folder_path: str,
@@ -134,8 +366,15 @@ class UploadEngine:
         on_progress: Optional[ProgressCallback] = None,
         should_soft_stop: Optional[SoftStopCallback] = None,
         on_image_uploaded: Optional[ImageUploadedCallback] = None,
+        # Transfer engine: ENGINE_MODE_THREADS (default) or ENGINE_MODE_MULTI
+        engine_mode: str = ENGINE_MODE_THREADS,
+        # Hard stop (worker shutting down); like a soft stop, it ends rate-limit waits
+        should_stop: Optional[SoftStopCallback] = None,
     ) -> Dict[str, Any]:
         start_time = time.time()
+
+        def stop_requested() -> bool:
+            return bool((should_stop and should_stop()) or (should_soft_stop and should_soft_stop()))
         if not os.path.exists(folder_path):
             raise FileNotFoundError(f"Folder not found: {folder_path}")
 
@@ -255,7 +494,7 @@ class UploadEngine:
                 create_gallery=True,
                 thumbnail_size=thumbnail_size,
                 thumbnail_format=thumbnail_format,
-                progress_callback=ByteCountingCallback(self.global_byte_counter, self.gallery_byte_counter, self.worker_thread),
+                progress_callback=self._byte_counting_callback(should_stop=stop_requested),
                 gallery_name=gallery_name,
             )
             first_upload_duration = time.time() - first_upload_start
@@ -322,7 +561,7 @@ class UploadEngine:
                     gallery_id=gallery_id,
                     thumbnail_size=thumbnail_size,
                     thumbnail_format=thumbnail_format,
-                    progress_callback=ByteCountingCallback(self.global_byte_counter, self.gallery_byte_counter, self.worker_thread),
+                    progress_callback=self._byte_counting_callback(should_stop=stop_requested),
                     gallery_name=gallery_name,
                 )
                 upload_duration = time.time() - upload_start
@@ -344,102 +583,125 @@ class UploadEngine:
         active_uploads = 0
         max_concurrent_seen = 0
 
-        with ThreadPoolExecutor(max_workers=parallel_batch_size) as executor:
-            remaining: List[str] = list(files_to_upload)
-            futures_map: Dict[concurrent.futures.Future, str] = {}
-            # Prime pool
-            for _ in range(min(parallel_batch_size, len(remaining))):
-                img = remaining.pop(0)
-                futures_map[executor.submit(upload_single_image, img)] = img
-                active_uploads += 1
-
-            max_concurrent_seen = len(futures_map)
-            #if on_log:
-            #    on_log(f"[concurrency] Primed pool with {len(futures_map)} initial uploads")
-
-            while futures_map:
-                # Log current concurrency before waiting
-                current_active = len(futures_map)
-                if current_active > max_concurrent_seen:
-                    max_concurrent_seen = current_active
-                done, _ = concurrent.futures.wait(list(futures_map.keys()), return_when=concurrent.futures.FIRST_COMPLETED)
-                for fut in done:
-                    img = futures_map.pop(fut)
-                    active_uploads -= 1
-                    image_file, image_data, error, upload_duration, image_path = fut.result()
-                    if image_data:
-                        uploaded_images.append((image_file, image_data))
-                        # Per-image success log (categorized)
-                        try:
-                            img_url = image_data.get('image_url', '')
-                            duration_str = f"{upload_duration:.3f}" if upload_duration is not None else "?.???"
-                            url_suffix = f"  ({img_url})" if img_url else ""
-                            log(f"Uploaded (in {duration_str}s): {image_path}{url_suffix}", category="uploads:file")
-                        except Exception:
-                            pass
-                        # Per-image callback for resume-aware consumers
-                        if on_image_uploaded:
-                            try:
-                                size_bytes = os.path.getsize(os.path.join(folder_path, image_file))
-                            except Exception:
-                                size_bytes = 0
-                            on_image_uploaded(image_file, image_data, size_bytes)
-                    else:
-                        failed_images.append((image_file, error or "unknown error"))
-                        # Log the failure immediately with clear error indication
-                        log(f"[uploads:file] ✗ Upload failed: {image_file} - {error or 'unknown error'}", level="warning", category="uploads:file")
-                    # Progress
-                    completed_count = initial_completed + len(uploaded_images)
-                    if on_progress:
-                        percent = int((completed_count / max(original_total_images, 1)) * 100)
-                        on_progress(completed_count, original_total_images, percent, image_file)
-                    # Queue next if not soft-stopping
-                    if remaining and not maybe_soft_stopping():
-                        nxt = remaining.pop(0)
-                        futures_map[executor.submit(upload_single_image, nxt)] = nxt
-                        active_uploads += 1
-
-        # Retries
-        retry_count = 0
-        while failed_images and retry_count < max_retries and not maybe_soft_stopping():
-            retry_count += 1
-            retry_failed: List[Tuple[str, str]] = []
-            log(f"[uploads] Retrying {len(failed_images)} failed uploads (attempt {retry_count}/{max_retries})", level="info", category="uploads")
+        def record_primary_result(result: Tuple[str, Optional[Dict[str, Any]], Optional[str], Optional[float], str]) -> None:
+            image_file, image_data, error, upload_duration, image_path = result
+            if image_data:
+                uploaded_images.append((image_file, image_data))
+                # Per-image success log (categorized)
+                try:
+                    img_url = image_data.get('image_url', '')
+                    duration_str = f"{upload_duration:.3f}" if upload_duration is not None else "?.???"
+                    url_suffix = f"  ({img_url})" if img_url else ""
+                    log(f"Uploaded (in {duration_str}s): {image_path}{url_suffix}", category="uploads:file")
+                except Exception:
+                    pass
+                # Per-image callback for resume-aware consumers
+                if on_image_uploaded:
+                    try:
+                        size_bytes = os.path.getsize(os.path.join(folder_path, image_file))
+                    except Exception:
+                        size_bytes = 0
+                    on_image_uploaded(image_file, image_data, size_bytes)
+            else:
+                failed_images.append((image_file, error or "unknown error"))
+                # Log the failure immediately with clear error indication
+                log(f"[uploads:file] ✗ Upload failed: {image_file} - {error or 'unknown error'}", level="warning", category="uploads:file")
+            # Progress
+            completed_count = initial_completed + len(uploaded_images)
+            if on_progress:
+                percent = int((completed_count / max(original_total_images, 1)) * 100)
+                on_progress(completed_count, original_total_images, percent, image_file)
+
+        use_multi = engine_mode == ENGINE_MODE_MULTI and self._multi_upload_available()
+        if engine_mode == ENGINE_MODE_MULTI and not use_multi:
+            log("CurlMulti engine unavailable for this host, using thread pool", level="debug", category="uploads")
+
+        if use_multi:
+            max_concurrent_seen = self._run_multi_batch(
+                files_to_upload, folder_path, gallery_id, thumbnail_size, thumbnail_format,
+                gallery_name, parallel_batch_size, record_primary_result,
+                keep_going=lambda: not maybe_soft_stopping(),
+                should_stop=stop_requested,
+            )
+        else:
             with ThreadPoolExecutor(max_workers=parallel_batch_size) as executor:
-                remaining = [img for img, _ in failed_images]
-                futures_map = {executor.submit(upload_single_image, img): img for img in remaining[:parallel_batch_size]}
-                remaining = remaining[parallel_batch_size:]
+                remaining: List[str] = list(files_to_upload)
+                futures_map: Dict[concurrent.futures.Future, str] = {}
+                # Prime pool
+                for _ in range(min(parallel_batch_size, len(remaining))):
+                    img = remaining.pop(0)
+                    futures_map[executor.submit(upload_single_image, img)] = img
+                    active_uploads += 1
+
+                max_concurrent_seen = len(futures_map)
+
                 while futures_map:
+                    # Log current concurrency before waiting
+                    current_active = len(futures_map)
+                    if current_active > max_concurrent_seen:
+                        max_concurrent_seen = current_active
                     done, _ = concurrent.futures.wait(list(futures_map.keys()), return_when=concurrent.futures.FIRST_COMPLETED)
                     for fut in done:
                         img = futures_map.pop(fut)
-                        image_file, image_data, error, upload_duration, image_path = fut.result()
-                        if image_data:
-                            uploaded_images.append((image_file, image_data))
-                            if on_image_uploaded:
-                                try:
-                                    size_bytes = os.path.getsize(os.path.join(folder_path, image_file))
-                                except Exception:
-                                    size_bytes = 0
-                                on_image_uploaded(image_file, image_data, size_bytes)
-                            # Per-image success log (retry path)
-                            try:
-                                img_url = image_data.get('image_url', '')
-                                duration_str = f"{upload_duration:.3f}" if upload_duration is not None else "?.???"
-                                url_suffix = f"  ({img_url})" if img_url else ""
-                                log(f"[uploads] Retry successful (in {duration_str}s): {image_path}{url_suffix}", level="info", category="uploads:file")
-                            except Exception:
-                                pass
-                        else:
-                            retry_failed.append((image_file, error or "unknown error"))
-                            log(f"[uploads] ✗ Retry failed: {image_file} - {error or 'unknown error'}", level="warning", category="uploads")
-                        completed_count = initial_completed + len(uploaded_images)
-                        if on_progress:
-                            percent = int((completed_count / max(original_total_images, 1)) * 100)
-                            on_progress(completed_count, original_total_images, percent, image_file)
-                        if remaining:
+                        active_uploads -= 1
+                        record_primary_result(fut.result())
+                        # Queue next if not soft-stopping
+                        if remaining and not maybe_soft_stopping():
                             nxt = remaining.pop(0)
                             futures_map[executor.submit(upload_single_image, nxt)] = nxt
+                            active_uploads += 1
+
+        # Retries
+        retry_count = 0
+        while failed_images and retry_count < max_retries and not maybe_soft_stopping():
+            retry_count += 1
+            retry_failed: List[Tuple[str, str]] = []
+            log(f"[uploads] Retrying {len(failed_images)} failed uploads (attempt {retry_count}/{max_retries})", level="info", category="uploads")
+
+            def record_retry_result(result: Tuple[str, Optional[Dict[str, Any]], Optional[str], Optional[float], str]) -> None:
+                image_file, image_data, error, upload_duration, image_path = result
+                if image_data:
+                    uploaded_images.append((image_file, image_data))
+                    if on_image_uploaded:
+                        try:
+                            size_bytes = os.path.getsize(os.path.join(folder_path, image_file))
+                        except Exception:
+                            size_bytes = 0
+                        on_image_uploaded(image_file, image_data, size_bytes)
+                    # Per-image success log (retry path)
+                    try:
+                        img_url = image_data.get('image_url', '')
+                        duration_str = f"{upload_duration:.3f}" if upload_duration is not None else "?.???"
+                        url_suffix = f"  ({img_url})" if img_url else ""
+                        log(f"[uploads] Retry successful (in {duration_str}s): {image_path}{url_suffix}", level="info", category="uploads:file")
+                    except Exception:
+                        pass
+                else:
+                    retry_failed.append((image_file, error or "unknown error"))
+                    log(f"[uploads] ✗ Retry failed: {image_file} - {error or 'unknown error'}", level="warning", category="uploads")
+                completed_count = initial_completed + len(uploaded_images)
+                if on_progress:
+                    percent = int((completed_count / max(original_total_images, 1)) * 100)
+                    on_progress(completed_count, original_total_images, percent, image_file)
+
+            if use_multi:
+                self._run_multi_batch(
+                    [img for img, _ in failed_images], folder_path, gallery_id, thumbnail_size,
+                    thumbnail_format, gallery_name, parallel_batch_size, record_retry_result,
+                )
+            else:
+                with ThreadPoolExecutor(max_workers=parallel_batch_size) as executor:
+                    remaining = [img for img, _ in failed_images]
+                    futures_map = {executor.submit(upload_single_image, img): img for img in remaining[:parallel_batch_size]}
+                    remaining = remaining[parallel_batch_size:]
+                    while futures_map:
+                        done, _ = concurrent.futures.wait(list(futures_map.keys()), return_when=concurrent.futures.FIRST_COMPLETED)
+                        for fut in done:
+                            img = futures_map.pop(fut)
+                            record_retry_result(fut.result())
+                            if remaining:
+                                nxt = remaining.pop(0)
+                                futures_map[executor.submit(upload_single_image, nxt)] = nxt
             failed_images = retry_failed
 
         # Log concurrency summary
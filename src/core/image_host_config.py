@@ -99,6 +99,7 @@ _HARDCODED_DEFAULTS = {
     "auto_retry": True,
     "max_upload_time": 0,
     "max_file_size_mb": 0,
+    "upload_engine": "threads",
 }
 
 
@@ -23,6 +23,8 @@ from PyQt6.QtCore import (
     pyqtSlot,
 )
 
+from src.network.bandwidth_shaper import get_bandwidth_shaper, parse_host_limits
+
 
 class BandwidthSource:
     """Per-source bandwidth tracking with asymmetric EMA smoothing.
@@ -168,6 +170,8 @@ class BandwidthManager(QObject):
     SETTINGS_KEY_ALPHA_UP = "bandwidth/alpha_up"
     SETTINGS_KEY_ALPHA_DOWN = "bandwidth/alpha_down"
     SETTINGS_KEY_WINDOW_SIZE = "bandwidth/window_size"
+    SETTINGS_KEY_UPLOAD_LIMIT = "bandwidth/upload_limit_kbps"
+    SETTINGS_KEY_HOST_UPLOAD_LIMITS = "bandwidth/host_upload_limits"
 
     # Emit interval in milliseconds
     EMIT_INTERVAL_MS = 200
@@ -253,6 +257,14 @@ class BandwidthManager(QObject):
         # Session peak tracking
         self._session_peak: float = 0.0
 
+        # Upload rate limits, enforced by the shared BandwidthShaper
+        self._upload_limit_kbps = 0
+        self._host_upload_limits = ""
+        self._apply_upload_limits(
+            settings.value(self.SETTINGS_KEY_UPLOAD_LIMIT, 0, type=int),
+            settings.value(self.SETTINGS_KEY_HOST_UPLOAD_LIMITS, "", type=str),
+        )
+
         # Aggregation timer
         self._emit_timer = QTimer(self)
         self._emit_timer.timeout.connect(self._emit_aggregated)
@@ -493,6 +505,39 @@ class BandwidthManager(QObject):
         settings.setValue(self.SETTINGS_KEY_ALPHA_DOWN, self._alpha_down)
         settings.setValue(self.SETTINGS_KEY_WINDOW_SIZE, self._window_size)
 
+    def update_upload_limits(self, total_kbps: int, host_limits: str) -> None:
+        """Change the upload rate limits for all transfers, including running ones.
+
+        Persists the new values to QSettings.
+
+        Args:
+            total_kbps: Total upload limit in KiB/s (0 = unlimited).
+            host_limits: Per-host limits as 'host=KiB/s' pairs separated by
+                commas, e.g. 'imx=2048, rapidgator=512'.
+        """
+        self._apply_upload_limits(total_kbps, host_limits)
+
+        settings = QSettings("BBDropUploader", "Settings")
+        settings.setValue(self.SETTINGS_KEY_UPLOAD_LIMIT, self._upload_limit_kbps)
+        settings.setValue(self.SETTINGS_KEY_HOST_UPLOAD_LIMITS, self._host_upload_limits)
+
+    def _apply_upload_limits(self, total_kbps: int, host_limits: str) -> None:
+        """Push limits in KiB/s to the BandwidthShaper (which works in bytes/s)."""
+        self._upload_limit_kbps = max(0, int(total_kbps or 0))
+        self._host_upload_limits = host_limits or ""
+        get_bandwidth_shaper().configure(
+            self._upload_limit_kbps * 1024,
+            {host: kbps * 1024 for host, kbps in parse_host_limits(self._host_upload_limits).items()},
+        )
+
+    def get_upload_limit(self) -> int:
+        """Get the total upload limit.
+
+        Returns:
+            Total upload limit in KiB/s, 0 if unlimited.
+        """
+        return self._upload_limit_kbps
+
     def get_smoothing_settings(self) -> tuple[float, float]:
         """Get the current smoothing parameters.
 
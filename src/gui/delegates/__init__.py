@@ -4,5 +4,8 @@ from src.gui.delegates.action_button_delegate import ActionButtonDelegate
 from src.gui.delegates.cover_indicator_delegate import CoverIndicatorDelegate
 from src.gui.delegates.file_hosts_status_delegate import FileHostsStatusDelegate
 from src.gui.delegates.media_type_delegate import MediaTypeDelegate
+from src.gui.delegates.progress_bar_delegate import ProgressBarDelegate
+from src.gui.delegates.status_icon_delegate import StatusIconDelegate
 
-__all__ = ['ActionButtonDelegate', 'CoverIndicatorDelegate', 'FileHostsStatusDelegate', 'MediaTypeDelegate']
+__all__ = ['ActionButtonDelegate', 'CoverIndicatorDelegate', 'FileHostsStatusDelegate', 'MediaTypeDelegate',
+           'ProgressBarDelegate', 'StatusIconDelegate']
@@ -0,0 +1,58 @@
+"""Progress bar delegate for model-based gallery tables."""
+
+from PyQt6.QtCore import Qt, QModelIndex, QSize
+from PyQt6.QtGui import QColor, QPainter, QPalette
+from PyQt6.QtWidgets import (
+    QApplication, QStyle, QStyledItemDelegate, QStyleOptionProgressBar, QStyleOptionViewItem
+)
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """Paints a progress bar from the cell's (percent, status) data.
+
+    Replaces one TableProgressWidget per row: nothing is allocated per
+    row, the bar is drawn only while the cell is on screen.
+
+    data_role: Role holding the (percent, status) tuple
+    """
+
+    MARGIN = 2
+
+    # Chunk color per status, approximating QProgressBar[status=...] in progress.qss;
+    # other statuses use the palette highlight
+    STATUS_COLORS = {
+        'completed': QColor(76, 175, 80),
+        'failed': QColor(220, 53, 69),
+        'incomplete': QColor(255, 165, 0),
+    }
+
+    def __init__(self, data_role: int, parent=None):
+        super().__init__(parent)
+        self._data_role = data_role
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+
+        value = index.data(self._data_role)
+        if not value:
+            return
+        percent, status = value
+
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        bar.state = option.state | QStyle.StateFlag.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = max(0, min(100, int(percent)))
+        bar.text = f"{bar.progress}%"
+        bar.textVisible = True
+        bar.textAlignment = Qt.AlignmentFlag.AlignCenter
+        bar.palette = QPalette(option.palette)
+        color = self.STATUS_COLORS.get(status)
+        if color is not None:
+            bar.palette.setColor(QPalette.ColorRole.Highlight, color)
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter, option.widget)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(120, 19 + 2 * self.MARGIN)
@@ -0,0 +1,64 @@
+"""Status icon delegate for model-based gallery tables."""
+
+from PyQt6.QtCore import Qt, QEvent, QModelIndex, QRect, QSize
+from PyQt6.QtGui import QPainter
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem, QToolTip
+
+from src.gui.icon_manager import get_icon_manager
+
+
+class StatusIconDelegate(QStyledItemDelegate):
+    """Paints the gallery status icon, centered, with selection awareness.
+
+    UserRole: status string ("ready", "uploading", "completed", ...)
+    frame_role: uploading animation frame
+
+    Selection is read from the paint option, so selecting rows does not
+    require re-rendering every status cell.
+    """
+
+    ICON_SIZE = 20
+
+    def __init__(self, frame_role: int, parent=None):
+        super().__init__(parent)
+        self._frame_role = frame_role
+        self.theme_mode = None  # None = IconManager auto-detect
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+
+        status = index.data(Qt.ItemDataRole.UserRole)
+        icon_mgr = get_icon_manager()
+        if not status or icon_mgr is None:
+            return
+
+        icon = icon_mgr.get_status_icon(
+            status,
+            theme_mode=self.theme_mode,
+            is_selected=bool(option.state & QStyle.StateFlag.State_Selected),
+            animation_frame=index.data(self._frame_role) or 0,
+        )
+        if icon.isNull():
+            return
+
+        cell = option.rect
+        icon_rect = QRect(
+            cell.x() + (cell.width() - self.ICON_SIZE) // 2,
+            cell.y() + (cell.height() - self.ICON_SIZE) // 2,
+            self.ICON_SIZE, self.ICON_SIZE
+        )
+        painter.drawPixmap(icon_rect, icon.pixmap(QSize(self.ICON_SIZE, self.ICON_SIZE)))
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() != QEvent.Type.ToolTip:
+            return super().helpEvent(event, view, option, index)
+        status = index.data(Qt.ItemDataRole.UserRole)
+        icon_mgr = get_icon_manager()
+        if status and icon_mgr is not None:
+            QToolTip.showText(event.globalPos(), icon_mgr.get_status_tooltip(status), view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(self.ICON_SIZE + 8, self.ICON_SIZE + 4)
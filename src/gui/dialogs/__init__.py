@@ -1,9 +1,13 @@
-# Dialog windows
+# Dialog windows (each module is imported when its dialog is first used)
 
-from .credential_setup import CredentialSetupDialog
-from .unrenamed_galleries import UnrenamedGalleriesDialog
-from .image_status_dialog import ImageStatusDialog
-from .image_status_checker import ImageStatusChecker
-from .update_dialog import UpdateDialog
-from .proxy_pool_dialog import ProxyPoolDialog
-from .proxy_bulk_import_dialog import ProxyBulkImportDialog
+from src.utils.lazy_imports import LazyImports
+
+__getattr__ = LazyImports(__name__, {
+    "CredentialSetupDialog": "src.gui.dialogs.credential_setup",
+    "UnrenamedGalleriesDialog": "src.gui.dialogs.unrenamed_galleries",
+    "ImageStatusDialog": "src.gui.dialogs.image_status_dialog",
+    "ImageStatusChecker": "src.gui.dialogs.image_status_checker",
+    "UpdateDialog": "src.gui.dialogs.update_dialog",
+    "ProxyPoolDialog": "src.gui.dialogs.proxy_pool_dialog",
+    "ProxyBulkImportDialog": "src.gui.dialogs.proxy_bulk_import_dialog",
+}).load
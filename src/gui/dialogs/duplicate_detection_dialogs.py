@@ -397,7 +397,8 @@ def show_duplicate_detection_dialogs(
     folders_to_add: List[str], 
     check_gallery_exists_func, 
     queue_manager, 
-    parent=None
+    parent=None,
+    find_existing_func=None,
 ) -> Tuple[List[str], List[str]]:
     """
     Show appropriate duplicate detection dialogs and return lists of folders to process.
@@ -407,6 +408,9 @@ def show_duplicate_detection_dialogs(
         check_gallery_exists_func: Function to check if gallery files exist
         queue_manager: Queue manager to check for existing items
         parent: Parent widget for dialogs
+        find_existing_func: Optional batch check, {folder path: existing files} for a
+            list of folder paths (see find_existing_galleries); used instead of one
+            check_gallery_exists_func call per folder
         
     Returns:
         Tuple of (folders_to_add_normally, folders_to_replace_in_queue)
@@ -415,7 +419,8 @@ def show_duplicate_detection_dialogs(
     previously_uploaded = []
     already_in_queue = []
     folders_to_add_normally = []
-    
+
+    not_queued = []
     for folder_path in folders_to_add:
         folder_name = os.path.basename(folder_path)
         
@@ -428,9 +433,18 @@ def show_duplicate_detection_dialogs(
                 'status': existing_item.status
             })
             continue
-        
+        not_queued.append(folder_path)
+
+    existing_by_path = find_existing_func(not_queued) if find_existing_func and not_queued else None
+
+    for folder_path in not_queued:
+        folder_name = os.path.basename(folder_path)
+
         # Check if previously uploaded
-        existing_files = check_gallery_exists_func(folder_name)
+        if existing_by_path is not None:
+            existing_files = existing_by_path.get(folder_path, [])
+        else:
+            existing_files = check_gallery_exists_func(folder_name)
         if existing_files:
             previously_uploaded.append({
                 'path': folder_path,
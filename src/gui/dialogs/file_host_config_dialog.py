@@ -570,23 +570,23 @@ class FileHostConfigDialog(QDialog):
         retry_row_widget.setLayout(retry_row)
         settings_layout.addWidget(retry_row_widget, 0, 0, 1, 4)
 
-        # Row 1 left: Concurrent uploads - fixed at 1 (not user-configurable yet)
+        # Row 1 left: Concurrent uploads (upload lanes in FileHostWorker)
         concurrent_label_widget = QWidget()
         concurrent_label_row = QHBoxLayout(concurrent_label_widget)
         concurrent_label_row.setContentsMargins(0, 0, 0, 0)
         concurrent_label_row.addWidget(QLabel("Concurrent uploads"))
         concurrent_label_row.addWidget(InfoButton(
-            "Number of simultaneous uploads to this host. Currently fixed at 1 "
-            "— per-host concurrency will be configurable in a future release."
+            "Number of simultaneous uploads to this host. Each upload runs in "
+            "its own lane with separate progress and cancellation. Also capped "
+            "by the global per-host limit in File Host settings."
         ))
         concurrent_label_row.addStretch()
 
         self.max_connections_spin = QSpinBox()
-        self.max_connections_spin.setRange(1, 1)
-        self.max_connections_spin.setValue(1)
-        self.max_connections_spin.setEnabled(False)
+        self.max_connections_spin.setRange(1, 10)
+        self.max_connections_spin.setValue(get_file_host_setting(self.host_id, 'max_connections', 'int') or 1)
         self.max_connections_spin.setMaximumWidth(80)
-        self.max_connections_spin.setToolTip("Concurrent uploads is currently fixed at 1")
+        self.max_connections_spin.valueChanged.connect(self._mark_dirty)
         settings_layout.addWidget(concurrent_label_widget, 1, 0)
         settings_layout.addWidget(self.max_connections_spin, 1, 1)
 
@@ -167,6 +167,8 @@ class ImageStatusChecker:
             self._on_error, Qt.ConnectionType.QueuedConnection)
         self.rename_worker.quick_count_available.connect(
             self._on_quick_count, Qt.ConnectionType.QueuedConnection)
+        self.rename_worker.status_check_partial.connect(
+            self._on_partial, Qt.ConnectionType.QueuedConnection)
 
         # Start the check
         self.rename_worker.check_image_status(galleries_data)
@@ -178,6 +180,7 @@ class ImageStatusChecker:
             self.rename_worker.status_check_completed.disconnect(self._on_completed)
             self.rename_worker.status_check_error.disconnect(self._on_error)
             self.rename_worker.quick_count_available.disconnect(self._on_quick_count)
+            self.rename_worker.status_check_partial.disconnect(self._on_partial)
         except TypeError:
             # Signals already disconnected
             pass
@@ -231,6 +234,22 @@ class ImageStatusChecker:
         if self.dialog:
             self.dialog.show_quick_count(online, total)
 
+    def _on_partial(self, results: dict) -> None:
+        """Handle results for galleries whose shards finished (sharded checks only).
+
+        Only updates the dialog; the database and gallery table are updated
+        once from the complete results in _on_completed().
+
+        Args:
+            results: Dict keyed by gallery path with status results
+        """
+        with self._state_lock:
+            if self._cancelled:
+                return
+
+        if self.dialog:
+            self.dialog.show_partial_results(results)
+
     def _on_completed(self, results: dict) -> None:
         """Handle completion of status check.
 
@@ -175,6 +175,7 @@ class ImageStatusDialog(QDialog):
 
         self._results: Dict[str, Dict[str, Any]] = {}
         self._start_time: float = 0
+        self._partial_galleries = 0  # Galleries filled in by show_partial_results()
         self._setup_ui()
 
     def _center_on_parent(self) -> None:
@@ -547,6 +548,31 @@ class ImageStatusDialog(QDialog):
             # Still scanning to identify which galleries have offline images
             self.spinner_label.setText(f"Identifying {offline:,} offline images...")
 
+    def show_partial_results(self, results: Dict[str, Dict[str, Any]]) -> None:
+        """Fill in rows for galleries whose check finished before the rest.
+
+        Sent while a sharded check is still running; set_results() later
+        updates every row and the summary.
+
+        Args:
+            results: Dict keyed by gallery path with check results
+        """
+        colors = get_online_status_colors()
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row in range(self.table.rowCount()):
+                id_item = self.table.item(row, 0)
+                result = results.get(id_item.data(Qt.ItemDataRole.UserRole)) if id_item else None
+                if result is not None:
+                    self._update_result_row(row, result, colors)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+        self._partial_galleries += len(results)
+        self.spinner_label.setText(
+            f"Checked {self._partial_galleries:,} of {self.table.rowCount():,} galleries..."
+        )
+
     def set_results(self, results: Dict[str, Dict[str, Any]], elapsed_time: float = 0.0) -> None:
         """Set check results and update the table.
 
@@ -610,43 +636,7 @@ class ImageStatusDialog(QDialog):
                     else:
                         galleries_partial += 1
 
-                # Update table cells with new format: "X/Y (Z%)"
-                online_item = self.table.item(row, 3)
-                offline_item = self.table.item(row, 4)
-                status_item = self.table.item(row, 5)
-
-                if online_item:
-                    online_item.setData(Qt.ItemDataRole.UserRole, online)
-                    if total > 0:
-                        online_pct = online * 100 // total
-                        online_item.setText(f"{online}/{total} ({online_pct}%)")
-                        # Red if not 100%
-                        if online < total:
-                            online_item.setForeground(colors['offline'])
-                            bold_font = QFont()
-                            bold_font.setBold(True)
-                            online_item.setFont(bold_font)
-                    else:
-                        online_item.setText("0/0 (0%)")
-                        dim_color = QColor(128, 128, 128, 128)
-                        online_item.setForeground(dim_color)
-
-                # Update hidden offline column for sorting
-                if offline_item:
-                    offline_item.setData(Qt.ItemDataRole.UserRole, offline)
-                    offline_item.setText(str(offline))
-
-                # Update status with centered icon
-                if total == 0:
-                    self._set_centered_status(row, "No images", None, colors['gray'], 'No images')
-                elif online == total:
-                    self._set_centered_status(row, None, get_icon('status_online'), colors['online'], 'Online')
-                else:
-                    color = colors['offline'] if online == 0 else colors['partial']
-                    label = 'Offline' if online == 0 else 'Partial'
-                    self._set_centered_status(
-                        row, None, get_icon('status_failed'), color, label,
-                    )
+                self._update_result_row(row, result, colors)
 
             # Update galleries bar
             self.galleries_bar.set_segments([
@@ -718,6 +708,56 @@ class ImageStatusDialog(QDialog):
         self.cancel_btn.setVisible(False)
         self.close_btn.setVisible(True)
 
+    def _update_result_row(self, row: int, result: Dict[str, Any], colors: Dict[str, QColor]) -> None:
+        """Fill a gallery row's online/offline/status cells from its check result.
+
+        Args:
+            row: Table row index
+            result: Status result for the gallery (online, offline, total)
+            colors: Online status colors from get_online_status_colors()
+        """
+        online = result.get('online', 0)
+        offline = result.get('offline', 0)
+        total = result.get('total', 0)
+
+        # Update table cells with new format: "X/Y (Z%)"
+        online_item = self.table.item(row, 3)
+        offline_item = self.table.item(row, 4)
+        status_item = self.table.item(row, 5)
+
+        if online_item:
+            online_item.setData(Qt.ItemDataRole.UserRole, online)
+            if total > 0:
+                online_pct = online * 100 // total
+                online_item.setText(f"{online}/{total} ({online_pct}%)")
+                # Red if not 100%
+                if online < total:
+                    online_item.setForeground(colors['offline'])
+                    bold_font = QFont()
+                    bold_font.setBold(True)
+                    online_item.setFont(bold_font)
+            else:
+                online_item.setText("0/0 (0%)")
+                dim_color = QColor(128, 128, 128, 128)
+                online_item.setForeground(dim_color)
+
+        # Update hidden offline column for sorting
+        if offline_item:
+            offline_item.setData(Qt.ItemDataRole.UserRole, offline)
+            offline_item.setText(str(offline))
+
+        # Update status with centered icon
+        if total == 0:
+            self._set_centered_status(row, "No images", None, colors['gray'], 'No images')
+        elif online == total:
+            self._set_centered_status(row, None, get_icon('status_online'), colors['online'], 'Online')
+        else:
+            color = colors['offline'] if online == 0 else colors['partial']
+            label = 'Offline' if online == 0 else 'Partial'
+            self._set_centered_status(
+                row, None, get_icon('status_failed'), color, label,
+            )
+
     def _set_centered_status(self, row: int, text: str = None, icon: QIcon = None, color: QColor = None, status_type: str = None) -> None:
         """Set a centered status widget in the given row.
 
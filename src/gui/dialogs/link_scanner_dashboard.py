@@ -202,10 +202,15 @@ class LinkScannerDashboard(QDialog):
 
         if self._coordinator:
             try:
+                from src.processing.scan_coordinator import CHECKPOINT_MAX_AGE
                 gallery_data = self._gather_scan_data(age_days, host_filter, scan_type, age_mode)
+                # Re-running the same scan after a cancel or crash resumes it
+                # (within the age window, or a day for 'All')
                 self._coordinator.start_scan(
                     gallery_data.get('image_galleries', []),
                     gallery_data.get('file_uploads', []),
+                    scan_key=f"{scan_type}:{age_days}:{host_filter}:{age_mode}",
+                    resume_max_age=age_days * 86400 if age_days else CHECKPOINT_MAX_AGE,
                 )
             except Exception as e:
                 log(f"Failed to start scan: {e}", level="error", category="scanner")
@@ -245,6 +250,8 @@ class LinkScannerDashboard(QDialog):
         elapsed = summary.get('elapsed', 0)
         total = summary.get('total_galleries', 0)
         log(f"Scan complete: {total} galleries in {elapsed:.1f}s", level="info", category="scanner")
+        for host_id, rate in summary.get('thumbnail_checks_per_sec', {}).items():
+            log(f"{host_id}: {rate:.1f} thumbnail checks/sec", level="info", category="scanner")
 
         self._overall_bar.hide()
         self._controls.set_scanning(False)
@@ -5,18 +5,45 @@ Provides log viewing, filtering, and configuration capabilities
 """
 
 import os
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, List
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QGridLayout, QCheckBox,
     QComboBox, QSpinBox, QLabel, QPushButton, QTabWidget, QWidget,
-    QTableWidget, QTableWidgetItem, QLineEdit, QDialogButtonBox, QHeaderView, QAbstractItemView, QApplication
+    QTableWidget, QTableWidgetItem, QLineEdit, QDialogButtonBox, QHeaderView, QAbstractItemView, QApplication,
+    QDateTimeEdit
 )
-from PyQt6.QtCore import Qt, QSettings
+from PyQt6.QtCore import Qt, QSettings, QThread, QDateTime, pyqtSignal
 from PyQt6.QtGui import QFont
 from src.gui.widgets.custom_widgets import CopyableLogTableWidget
+from src.utils.log_index import LogMatch, LogQuery, get_log_index
 from src.utils.logger import log
 
+# Lines shown by one indexed search
+SEARCH_LIMIT = 5000
+
+
+class _LogSearchWorker(QThread):
+    """Update the log index, then run one query, off the GUI thread."""
+    finished = pyqtSignal(list)  # LogMatch list, newest first
+
+    def __init__(self, query: LogQuery, limit: int = SEARCH_LIMIT):
+        super().__init__()
+        self._query = query
+        self._limit = limit
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        matches: List[LogMatch] = []
+        try:
+            index = get_log_index()
+            index.update(self.cancel_event)
+            matches = index.search(self._query, self._limit, self.cancel_event)
+        except Exception as e:
+            log(f"Log search failed: {e}", level="warning", category="ui")
+        self.finished.emit(matches)
+
 
 class LogViewerDialog(QDialog):
     """Popout viewer for application logs."""
@@ -106,6 +133,30 @@ class LogViewerDialog(QDialog):
         filters_bar.addStretch()
         logs_vbox.addLayout(filters_bar)
 
+        # Indexed search row: find text + filters above, across all log files
+        search_bar = QHBoxLayout()
+        self.chk_until = QCheckBox("Up to:")
+        self.chk_until.setToolTip("Jump to a time: show the newest matching lines at or before it")
+        self.dt_until = QDateTimeEdit(QDateTime.currentDateTime())
+        self.dt_until.setDisplayFormat("yyyy-MM-dd HH:mm:ss")
+        self.dt_until.setCalendarPopup(True)
+        self.dt_until.setEnabled(False)
+        self.chk_until.toggled.connect(self.dt_until.setEnabled)
+        self.btn_search_all = QPushButton("Search All Logs")
+        self.btn_search_all.setToolTip(
+            "Search the current and rotated log files (including .gz) for the Find text,\n"
+            "using the category and level filters. Words match by prefix.")
+        self.btn_search_all.clicked.connect(self._start_indexed_search)
+        self.find_input.returnPressed.connect(self._start_indexed_search)
+        self.lbl_search_status = QLabel("")
+        search_bar.addWidget(self.chk_until)
+        search_bar.addWidget(self.dt_until)
+        search_bar.addWidget(self.btn_search_all)
+        search_bar.addWidget(self.lbl_search_status, 1)
+        logs_vbox.addLayout(search_bar)
+        self._search_worker = None
+        self._showing_search = False
+
         # Body: log view table with timestamp, level, category, message columns
         body_hbox = QHBoxLayout()
         self.log_view = QTableWidget()
@@ -302,6 +353,12 @@ class LogViewerDialog(QDialog):
         _load_logs_list()
         _apply_initial_content()
 
+        # Index new log data now so the first search has little left to do
+        try:
+            get_log_index().start_background_update()
+        except Exception as e:
+            log(f"Could not start log indexer: {e}", level="debug", category="ui")
+
         # Register with logger to receive live log messages with metadata
         from src.utils.logger import register_log_viewer
         register_log_viewer(self)
@@ -341,6 +398,8 @@ class LogViewerDialog(QDialog):
                 return block
 
         def on_refresh():
+            self._showing_search = False
+            self.lbl_search_status.setText("")
             text = _normalize_dates(_read_selected_file())
             text = _filter_block_by_view_cats(text)
             # Add lines in reverse order (newest first)
@@ -450,6 +509,8 @@ class LogViewerDialog(QDialog):
             level: Log level (trace/debug/info/warning/error/critical)
             category: Log category (uploads/auth/network/etc.)
         """
+        if self._showing_search:
+            return  # Search results stay put until Refresh
         try:
             # Extract timestamp from message
             timestamp = ""
@@ -510,6 +571,48 @@ class LogViewerDialog(QDialog):
         except Exception:
             pass
 
+    def _search_query(self) -> LogQuery:
+        """Build an indexed query from the find box and filter controls."""
+        checked = {key for key, cb in self._filters_row.items() if cb.isChecked()}
+        level_text = self.cmb_level_filter.currentText()
+        return LogQuery(
+            text=(self.find_input.text() or "").strip(),
+            min_level="" if level_text == "All" else level_text.rstrip("+").lower(),
+            categories=None if len(checked) == len(self._filters_row) else checked,
+            until=self.dt_until.dateTime().toString("yyyy-MM-dd HH:mm:ss") if self.chk_until.isChecked() else "",
+        )
+
+    def _start_indexed_search(self):
+        """Search all log files in the background; results replace the table."""
+        if self._search_worker is not None and self._search_worker.isRunning():
+            return
+        self.btn_search_all.setEnabled(False)
+        self.lbl_search_status.setText("Searching...")
+        self._search_worker = _LogSearchWorker(self._search_query())
+        self._search_worker.finished.connect(self._show_search_results)
+        self._search_worker.start()
+
+    def _show_search_results(self, matches: List[LogMatch]):
+        """Fill the table with indexed search results (newest first)."""
+        self.btn_search_all.setEnabled(True)
+        self._showing_search = True
+        files = {m.path for m in matches}
+        more = " (limit reached)" if len(matches) >= SEARCH_LIMIT else ""
+        self.lbl_search_status.setText(
+            f"{len(matches)} lines from {len(files)} file(s){more} - Refresh returns to the live log")
+
+        self.log_view.setRowCount(0)
+        self.log_view.setRowCount(len(matches))
+        for row, match in enumerate(matches):
+            self.log_view.setVerticalHeaderItem(row, QTableWidgetItem(str(row + 1)))
+            ts_item = QTableWidgetItem(match.timestamp)
+            ts_item.setToolTip(os.path.basename(match.path))
+            self.log_view.setItem(row, 0, ts_item)
+            self.log_view.setItem(row, 1, QTableWidgetItem(match.level.upper()))
+            self.log_view.setItem(row, 2, QTableWidgetItem(match.category))
+            self.log_view.setItem(row, 3, QTableWidgetItem(match.message))
+        self.log_view.scrollToTop()
+
     def _should_show_level(self, level: str) -> bool:
         """Check if a log level should be shown based on the level filter dropdown.
 
@@ -614,6 +717,9 @@ class LogViewerDialog(QDialog):
         """Unregister from logger when dialog closes"""
         from src.utils.logger import unregister_log_viewer
         unregister_log_viewer(self)
+        if self._search_worker is not None and self._search_worker.isRunning():
+            self._search_worker.cancel_event.set()
+            self._search_worker.wait(2000)
         super().closeEvent(event)
     def _center_on_parent(self):
         """Center dialog on parent window or screen"""
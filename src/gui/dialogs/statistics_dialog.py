@@ -17,6 +17,7 @@ from PyQt6.QtCore import Qt, QSettings
 
 from src.utils.format_utils import format_binary_size, format_binary_rate, format_duration
 from src.core.host_registry import get_display_name
+from src.gui.widgets.throughput_chart import ThroughputChart
 from src.utils.logger import log
 
 
@@ -45,7 +46,7 @@ class StatisticsDialog(QDialog):
         self.setWindowTitle("Application Statistics")
         self.setModal(True)
         self.setMinimumSize(850, 420)
-        self.resize(900, 480)
+        self.resize(900, 600)
         self._center_on_parent()
 
         self._setup_ui()
@@ -176,8 +177,35 @@ class StatisticsDialog(QDialog):
             header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
 
         layout.addWidget(self._file_hosts_table)
+        layout.addWidget(self._create_throughput_group())
         return tab
 
+    def _create_throughput_group(self) -> QGroupBox:
+        """Create the throughput chart group for the File Hosts tab.
+
+        Returns:
+            QGroupBox containing a range selector and ThroughputChart
+        """
+        group = QGroupBox("Throughput (all hosts)")
+        layout = QVBoxLayout(group)
+
+        range_layout = QHBoxLayout()
+        range_layout.addWidget(QLabel("Range:"))
+        self._throughput_range_combo = QComboBox()
+        self._throughput_range_combo.addItem("Last Hour", 1)
+        self._throughput_range_combo.addItem("Last 6 Hours", 6)
+        self._throughput_range_combo.addItem("Last 24 Hours", 24)
+        self._throughput_range_combo.addItem("Last 7 Days", 24 * 7)
+        self._throughput_range_combo.setCurrentIndex(2)  # Default to Last 24 Hours
+        self._throughput_range_combo.currentIndexChanged.connect(self._load_throughput_chart)
+        range_layout.addWidget(self._throughput_range_combo)
+        range_layout.addStretch()
+        layout.addLayout(range_layout)
+
+        self._throughput_chart = ThroughputChart()
+        layout.addWidget(self._throughput_chart)
+        return group
+
     def _create_session_group(self) -> QGroupBox:
         """Create the session statistics group box.
 
@@ -392,6 +420,7 @@ class StatisticsDialog(QDialog):
 
         # Load file host statistics
         self._load_file_host_stats()
+        self._load_throughput_chart()
 
     def _on_timeframe_changed(self, index: int) -> None:
         """Handle timeframe filter selection change.
@@ -497,3 +526,30 @@ class StatisticsDialog(QDialog):
             rate_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
             self._file_hosts_table.setItem(row, 9, rate_item)
 
+    def _load_throughput_chart(self, index: int = -1) -> None:
+        """Load the throughput series for the selected range into the chart.
+
+        Args:
+            index: New combo box index (unused, we read currentData instead)
+        """
+        hours = self._throughput_range_combo.currentData() or 24
+        # Same bucket widths as MetricsStore.get_throughput_series defaults
+        if hours <= 6:
+            bucket_seconds = 60
+        elif hours <= 48:
+            bucket_seconds = 300
+        else:
+            bucket_seconds = 3600
+
+        try:
+            from src.utils.metrics_store import get_metrics_store
+            points = get_metrics_store().get_throughput_series(
+                hours=hours, bucket_seconds=bucket_seconds
+            )
+        except (ImportError, RuntimeError, OSError) as e:
+            log(f"Failed to load throughput series: {type(e).__name__}: {e}",
+                level="warning", category="stats")
+            points = []
+
+        end_ts = int(time.time()) // bucket_seconds * bucket_seconds + bucket_seconds
+        self._throughput_chart.set_series(points, end_ts - int(hours * 3600), end_ts, bucket_seconds)
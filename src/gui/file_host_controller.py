@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Optional
 from PyQt6.QtCore import QObject, Qt
 
 from src.utils.logger import log
+from src.gui.widgets.gallery_table_view import get_model_view
 
 if TYPE_CHECKING:
     from src.gui.main_window import BBDropGUI
@@ -45,6 +46,18 @@ class FileHostController(QObject):
             if not gallery_path:
                 return
 
+            view = get_model_view(self._main_window.gallery_table)
+            if view is not None:
+                try:
+                    uploads_list = self._main_window.queue_manager.store.get_file_host_uploads(gallery_path)
+                except Exception as e:
+                    log(f"Failed to load file host uploads: {e}", level="warning", category="file_hosts")
+                    return
+                view.gallery_model.set_file_host_uploads(gallery_path, uploads_list)
+                if hasattr(self._main_window, '_file_host_uploads_cache'):
+                    self._main_window._file_host_uploads_cache[gallery_path] = uploads_list
+                return
+
             row = self._main_window.path_to_row.get(gallery_path)
             if row is None:
                 return
@@ -424,6 +437,12 @@ class FileHostController(QObject):
             uploads = self._main_window.queue_manager.store.get_file_host_uploads(item.path)
             file_host_uploads_map[item.path] = {u['host_name']: u for u in uploads}
 
+        view = get_model_view(self._main_window.gallery_table)
+        if view is not None:
+            for path, host_uploads in file_host_uploads_map.items():
+                view.gallery_model.set_file_host_uploads(path, host_uploads.values())
+            return
+
         # Update all file host status table items for delegate rendering
         table = self._main_window.gallery_table.table
         for row in range(self._main_window.gallery_table.rowCount()):
@@ -23,6 +23,7 @@ from src.utils.logger import log
 from src.utils.archive_utils import is_archive_file
 from src.processing.archive_worker import ArchiveExtractionWorker
 from src.storage.queue_manager import GalleryQueueItem
+from src.gui.widgets.gallery_table_view import get_model_view
 
 if TYPE_CHECKING:
     from src.gui.main_window import BBDropGUI
@@ -542,7 +543,8 @@ class GalleryQueueController(QObject):
                 folders_to_add=folder_paths,
                 check_gallery_exists_func=mw._check_if_gallery_exists,
                 queue_manager=mw.queue_manager,
-                parent=mw
+                parent=mw,
+                find_existing_func=mw._find_existing_galleries,
             )
 
             # Get current tab before adding items
@@ -832,11 +834,13 @@ class GalleryQueueController(QObject):
         if hasattr(mw.gallery_table, 'table'):
             table = mw.gallery_table.table
 
+        view = get_model_view(mw.gallery_table)
         selected_rows = set()
-        for item in table.selectedItems():
-            selected_rows.add(item.row())
+        if view is None:
+            for item in table.selectedItems():
+                selected_rows.add(item.row())
 
-        if not selected_rows:
+        if not selected_rows and view is None:
             log(f"No rows selected", level="debug", category="queue")
             return
 
@@ -844,6 +848,12 @@ class GalleryQueueController(QObject):
         selected_paths = []
         selected_names = []
 
+        if view is not None:
+            for path in view.selected_paths():
+                item = mw.queue_manager.get_item(path)
+                selected_paths.append(path)
+                selected_names.append(item.name if item and item.name else os.path.basename(path))
+
         for row in selected_rows:
             name_item = table.item(row, COL_NAME)
             if name_item:
@@ -13,6 +13,7 @@ from PyQt6.QtWidgets import QTableWidgetItem
 
 from src.utils.logger import log
 from src.gui.widgets.gallery_table import GalleryTableWidget
+from src.gui.widgets.gallery_table_view import get_model_view
 
 if TYPE_CHECKING:
     from src.gui.main_window import BBDropGUI
@@ -30,6 +31,16 @@ class GalleryTableController(QObject):
         mw = self._main_window
         log(f"_add_gallery_to_table called for {item.path} with tab_name={item.tab_name}", level="debug", category="queue")
 
+        view = get_model_view(mw.gallery_table)
+        if view is not None:
+            # The model reads QueueManager.items; sync() inserts the new row
+            # and the proxy decides tab visibility
+            mw._last_scan_states[item.path] = item.scan_complete
+            view.gallery_model.sync()
+            if hasattr(mw.gallery_table, 'tab_manager') and item.tab_name:
+                mw.gallery_table.tab_manager.invalidate_tab_cache(item.tab_name)
+            return
+
         # CRITICAL FIX: Check if path already exists in table to prevent duplicates
         if item.path in mw.path_to_row:
             existing_row = mw.path_to_row[item.path]
@@ -72,6 +83,15 @@ class GalleryTableController(QObject):
     def _remove_gallery_from_table(self, path: str):
         """Remove a gallery from the table and update mappings"""
         mw = self._main_window
+        view = get_model_view(mw.gallery_table)
+        if view is not None:
+            # Callers drop items from QueueManager first; one sync() removes every
+            # vanished row, so the rest of a batch finds nothing left to do
+            mw._last_scan_states.pop(path, None)
+            if view.gallery_model.row_for_path(path) is not None:
+                view.gallery_model.sync()
+            return
+
         if path not in mw.path_to_row:
             return
 
@@ -188,6 +208,12 @@ class GalleryTableController(QObject):
         if not item:
             return
 
+        view = get_model_view(mw.gallery_table)
+        if view is not None:
+            # Only the visible cells of this row repaint
+            view.gallery_model.refresh_item(path)
+            return
+
         # Get current font sizes
 
         # If item not in table, skip update (it should be added explicitly via add_folders)
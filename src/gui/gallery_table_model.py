@@ -0,0 +1,508 @@
+"""
+Model/view backing for the gallery table.
+
+``GalleryTableWidget`` is a ``QTableWidget``: every row owns ~15
+``QTableWidgetItem`` objects plus progress/action widgets, all built up
+front by ``TableRowManager._populate_table_row``. ``GalleryTableModel``
+instead reads ``QueueManager.items`` on demand, so the view only asks for
+the cells it is painting and a row costs one list entry. Live updates emit
+``dataChanged`` for the changed cells only, and tab/text filtering and
+sorting run in ``GalleryFilterProxyModel`` without touching the rows.
+
+Columns and their indices are shared with ``GalleryTableWidget.COLUMNS``;
+per-cell data follows the roles the existing delegates already read
+(UserRole = path for NAME/ACTION, media type for MEDIA_TYPE, and so on).
+"""
+
+import os
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+
+from src.core.host_registry import get_display_name
+from src.gui.icon_manager import get_icon
+from src.gui.widgets.gallery_table import GalleryTableWidget
+from src.utils.format_utils import format_binary_rate, format_binary_size
+from src.utils.logger import log
+
+if TYPE_CHECKING:
+    from src.storage.queue_manager import GalleryQueueItem, QueueManager
+
+_Col = GalleryTableWidget
+
+# Custom roles (UserRole .. UserRole+2 keep the meaning the delegates expect)
+SORT_ROLE = Qt.ItemDataRole.UserRole + 10  # Plain int/float/str sort key
+PROGRESS_ROLE = Qt.ItemDataRole.UserRole + 11  # (percent, status) for ProgressBarDelegate
+ANIMATION_FRAME_ROLE = Qt.ItemDataRole.UserRole + 12  # Uploading icon frame for StatusIconDelegate
+
+# Columns the user may edit, mapped to the GalleryQueueItem field they write
+EDITABLE_FIELDS = {
+    _Col.COL_CUSTOM1: 'custom1', _Col.COL_CUSTOM2: 'custom2',
+    _Col.COL_CUSTOM3: 'custom3', _Col.COL_CUSTOM4: 'custom4',
+    _Col.COL_EXT1: 'ext1', _Col.COL_EXT2: 'ext2',
+    _Col.COL_EXT3: 'ext3', _Col.COL_EXT4: 'ext4',
+}
+
+_RIGHT_ALIGNED = {
+    _Col.COL_UPLOADED, _Col.COL_ADDED, _Col.COL_FINISHED, _Col.COL_SIZE, _Col.COL_TRANSFER,
+}
+_CENTERED = {_Col.COL_ORDER, _Col.COL_STATUS_TEXT, _Col.COL_RENAMED}
+
+# Columns whose content depends only on status/progress (live upload updates)
+PROGRESS_COLUMNS = (
+    _Col.COL_UPLOADED, _Col.COL_PROGRESS, _Col.COL_STATUS, _Col.COL_STATUS_TEXT,
+    _Col.COL_FINISHED, _Col.COL_ACTION, _Col.COL_TRANSFER,
+)
+
+
+def _format_timestamp(ts: Optional[float]) -> Tuple[str, str]:
+    """(display, tooltip) text for a unix timestamp, ("", "") if unset or invalid."""
+    if not ts:
+        return "", ""
+    try:
+        dt = datetime.fromtimestamp(ts)
+    except (ValueError, OSError, OverflowError):
+        return "", ""
+    return dt.strftime("%Y-%m-%d %H:%M"), dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _imx_counts(item: 'GalleryQueueItem') -> Optional[Tuple[int, int]]:
+    """(online, total) parsed from imx_status like "Online (87/87)", or None."""
+    status = item.imx_status or ''
+    if not item.imx_status_checked or '(' not in status:
+        return None
+    try:
+        online, total = status[status.index('(') + 1:status.index(')')].split('/')
+        return int(online), int(total)
+    except ValueError:
+        return None
+
+
+class GalleryTableModel(QAbstractTableModel):
+    """Table model over ``QueueManager.items``, one row per gallery path.
+
+    Rows are kept in queue order; the model never copies item fields, it
+    looks the item up when a cell is painted. Call ``refresh_item()`` after
+    changing an item (or rely on ``status_changed``), and ``sync()`` after
+    galleries are added or removed.
+    """
+
+    def __init__(self, queue_manager: 'QueueManager', parent=None,
+                 progress_provider: Optional[Callable[['GalleryQueueItem'], Tuple[int, str]]] = None):
+        """
+        Args:
+            queue_manager: Source of the gallery items
+            parent: Optional QObject parent
+            progress_provider: Returns (percent, status) for the progress column,
+                e.g. ProgressTracker.compute_item_display; defaults to the
+                item's own progress and status
+        """
+        super().__init__(parent)
+        self._queue_manager = queue_manager
+        self._progress_provider = progress_provider
+        self._paths: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._host_uploads: Dict[str, Dict[str, dict]] = {}
+        self._scan_status: Dict[str, Dict[str, Any]] = {}
+        self._unnamed_galleries: Optional[Set[str]] = None
+        self._animation_frame = 0
+
+        status_changed = getattr(queue_manager, 'status_changed', None)
+        if status_changed is not None:
+            status_changed.connect(self._on_status_changed)
+
+        self.reload()
+
+    # =========================================================================
+    # Row bookkeeping
+    # =========================================================================
+
+    def reload(self) -> None:
+        """Rebuild the row list from the queue manager (resets the model)."""
+        self.beginResetModel()
+        self._paths = [item.path for item in self._queue_manager.get_all_items()]
+        self._reindex()
+        self.endResetModel()
+
+    def sync(self) -> None:
+        """Insert rows for new galleries and remove rows for deleted ones.
+
+        Existing rows keep their position, so selection and scroll state
+        survive; only the changed ranges are announced to the views.
+        """
+        current = [item.path for item in self._queue_manager.get_all_items()]
+        current_set = set(current)
+
+        # Remove vanished rows bottom-up, one contiguous run at a time
+        gone = [row for row, path in enumerate(self._paths) if path not in current_set]
+        while gone:
+            last = gone.pop()
+            first = last
+            while gone and gone[-1] == first - 1:
+                first = gone.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._paths[first:last + 1]
+            self.endRemoveRows()
+
+        known = set(self._paths)
+        added = [path for path in current if path not in known]
+        if added:
+            start = len(self._paths)
+            self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+            self._paths.extend(added)
+            self.endInsertRows()
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._rows = {path: row for row, path in enumerate(self._paths)}
+
+    def row_for_path(self, path: str) -> Optional[int]:
+        """Model row of a gallery, or None if it is not in the model."""
+        return self._rows.get(path)
+
+    def path_for_row(self, row: int) -> Optional[str]:
+        """Gallery path of a model row, or None if out of range."""
+        return self._paths[row] if 0 <= row < len(self._paths) else None
+
+    def item_for_row(self, row: int) -> Optional['GalleryQueueItem']:
+        """Queue item of a model row, or None if out of range or removed."""
+        path = self.path_for_row(row)
+        return self._queue_manager.get_item(path) if path else None
+
+    # =========================================================================
+    # Incremental updates
+    # =========================================================================
+
+    def refresh_item(self, path: str, columns: Optional[Iterable[int]] = None) -> None:
+        """Announce that a gallery changed; views repaint it if it is visible.
+
+        Args:
+            path: Gallery path
+            columns: Columns that changed; None for the whole row
+        """
+        row = self._rows.get(path)
+        if row is None:
+            return
+        cols = list(columns) if columns is not None else [0, self.columnCount() - 1]
+        if not cols:
+            return
+        self.dataChanged.emit(self.index(row, min(cols)), self.index(row, max(cols)))
+
+    def refresh_column(self, column: int) -> None:
+        """Announce that a column changed for every row (e.g. theme switch)."""
+        if self._paths:
+            self.dataChanged.emit(self.index(0, column), self.index(len(self._paths) - 1, column))
+
+    def set_file_host_uploads(self, path: str, uploads: Iterable[dict]) -> None:
+        """Set the file host upload rows shown in the HOSTS_STATUS column."""
+        self._host_uploads[path] = {upload['host_name']: upload for upload in uploads}
+        self.refresh_item(path, [_Col.COL_HOSTS_STATUS])
+
+    def set_scan_status(self, path: str, scan_status: Dict[str, Any]) -> None:
+        """Set per-host link scan results used by the HOSTS_STATUS overlay."""
+        self._scan_status[path] = dict(scan_status)
+        self.refresh_item(path, [_Col.COL_HOSTS_STATUS])
+
+    def set_unnamed_galleries(self, gallery_ids: Iterable[str]) -> None:
+        """Set the IMX gallery IDs still awaiting rename (RENAMED column).
+
+        Loaded once by the owner (QueueStore.get_unnamed_galleries()) instead
+        of a database query per row.
+        """
+        self._unnamed_galleries = set(gallery_ids)
+        self.refresh_column(_Col.COL_RENAMED)
+
+    def set_animation_frame(self, frame: int) -> None:
+        """Advance the uploading icon animation; only uploading rows repaint."""
+        self._animation_frame = frame
+        for row, path in enumerate(self._paths):
+            item = self._queue_manager.get_item(path)
+            if item is not None and item.status == 'uploading':
+                index = self.index(row, _Col.COL_STATUS)
+                self.dataChanged.emit(index, index, [ANIMATION_FRAME_ROLE])
+
+    def _on_status_changed(self, path: str, _old_status: str, _new_status: str) -> None:
+        self.refresh_item(path, PROGRESS_COLUMNS)
+
+    # =========================================================================
+    # QAbstractTableModel interface
+    # =========================================================================
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._paths)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_Col.COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation != Qt.Orientation.Horizontal or not 0 <= section < len(_Col.COLUMNS):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return _Col.COLUMNS[section][2]
+        if role == Qt.ItemDataRole.TextAlignmentRole and _Col.COLUMNS[section][6]:
+            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() in EDITABLE_FIELDS:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        field = EDITABLE_FIELDS.get(index.column())
+        path = self.path_for_row(index.row())
+        if role != Qt.ItemDataRole.EditRole or field is None or path is None:
+            return False
+        value = str(value or '')
+        if field.startswith('custom'):
+            if not self._queue_manager.update_custom_field(path, field, value):
+                return False
+        else:
+            # update_custom_field() only accepts custom1-4; ext columns are
+            # persisted the way GalleryTableController does it
+            item = self._queue_manager.get_item(path)
+            if item is None:
+                return False
+            setattr(item, field, value)
+            self._queue_manager.store.update_item_custom_field(path, field, value)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        item = self.item_for_row(index.row())
+        if item is None:
+            return None
+        col = index.column()
+        try:
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+                return self._display_text(item, col)
+            if role == SORT_ROLE:
+                return self._sort_key(item, col)
+            if role == Qt.ItemDataRole.UserRole:
+                return self._user_data(item, col)
+            if role == Qt.ItemDataRole.UserRole + 1:
+                if col == _Col.COL_COVER and item.cover_source_path:
+                    return item.cover_status or 'pending'
+                if col == _Col.COL_HOSTS_STATUS:
+                    return self._host_uploads.get(item.path, {})
+                return None
+            if role == Qt.ItemDataRole.UserRole + 2 and col == _Col.COL_HOSTS_STATUS:
+                uploads = self._host_uploads.get(item.path, {})
+                scan = self._scan_status.get(item.path, {})
+                return {host: scan[host] for host in uploads if host in scan}
+            if role == PROGRESS_ROLE and col == _Col.COL_PROGRESS:
+                return self._progress(item)
+            if role == ANIMATION_FRAME_ROLE and col == _Col.COL_STATUS:
+                return self._animation_frame if item.status == 'uploading' else 0
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self._decoration(item, col)
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return self._tooltip(item, col)
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                if col in _RIGHT_ALIGNED:
+                    return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                if col in _CENTERED:
+                    return Qt.AlignmentFlag.AlignCenter
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        except Exception as e:
+            log(f"GalleryTableModel.data failed for {item.path} column {col}: {e}",
+                level="debug", category="ui")
+        return None
+
+    # =========================================================================
+    # Cell contents
+    # =========================================================================
+
+    def _progress(self, item: 'GalleryQueueItem') -> Tuple[int, str]:
+        if self._progress_provider is not None:
+            try:
+                return self._progress_provider(item)
+            except Exception as e:
+                log(f"Progress provider failed for {item.path}: {e}", level="debug", category="ui")
+        return int(item.progress or 0), item.status
+
+    def _display_text(self, item: 'GalleryQueueItem', col: int) -> str:
+        if col == _Col.COL_ORDER:
+            return str(item.db_id or 0)
+        if col == _Col.COL_NAME:
+            return item.name or os.path.basename(item.path) or "Unknown"
+        if col == _Col.COL_UPLOADED:
+            total = item.total_images or 0
+            return f"{item.uploaded_images or 0}/{total}" if total > 0 else ""
+        if col == _Col.COL_STATUS_TEXT:
+            return item.status.capitalize() if item.status else ""
+        if col == _Col.COL_ADDED:
+            return _format_timestamp(item.added_time)[0]
+        if col == _Col.COL_FINISHED:
+            return _format_timestamp(item.finished_time)[0]
+        if col == _Col.COL_SIZE:
+            return format_binary_size(item.total_size, precision=2) if item.total_size else ""
+        if col == _Col.COL_TRANSFER:
+            rate = self._transfer_rate(item)
+            return format_binary_rate(rate, precision=2) if rate > 0 else ""
+        if col == _Col.COL_TEMPLATE:
+            return item.template_name or ""
+        if col == _Col.COL_IMAGE_HOST:
+            return get_display_name(item.image_host_id) if item.image_host_id else ""
+        if col == _Col.COL_GALLERY_ID:
+            return item.gallery_id or ""
+        if col in EDITABLE_FIELDS:
+            return str(getattr(item, EDITABLE_FIELDS[col], '') or '')
+        if col == _Col.COL_ONLINE_IMX:
+            return datetime.fromtimestamp(item.imx_status_checked).strftime("%Y-%m-%d") \
+                if _imx_counts(item) else ""
+        if col == _Col.COL_RENAMED and item.image_host_id != 'imx':
+            return "N/A"
+        return ""
+
+    @staticmethod
+    def _transfer_rate(item: 'GalleryQueueItem') -> float:
+        if item.status == "uploading" and item.current_kibps > 0:
+            return float(item.current_kibps)
+        return float(item.final_kibps or 0.0)
+
+    def _user_data(self, item: 'GalleryQueueItem', col: int) -> Any:
+        if col in (_Col.COL_NAME, _Col.COL_ACTION, _Col.COL_HOSTS_STATUS):
+            return item.path
+        if col == _Col.COL_STATUS:
+            return item.status
+        if col == _Col.COL_MEDIA_TYPE:
+            return item.media_type or "image"
+        if col == _Col.COL_COVER:
+            return item.cover_source_path or None
+        return None
+
+    def _is_renamed(self, item: 'GalleryQueueItem') -> Optional[bool]:
+        if item.image_host_id != 'imx' or not item.gallery_id or self._unnamed_galleries is None:
+            return None
+        return item.gallery_id not in self._unnamed_galleries
+
+    def _decoration(self, item: 'GalleryQueueItem', col: int) -> Any:
+        if col == _Col.COL_RENAMED:
+            renamed = self._is_renamed(item)
+            if renamed is None:
+                return None
+            return get_icon('renamed_true' if renamed else 'renamed_false')
+        if col == _Col.COL_ONLINE_IMX:
+            counts = _imx_counts(item)
+            if counts and counts[1] > 0:
+                return get_icon('status_online' if counts[0] == counts[1] else 'status_offline')
+        return None
+
+    def _tooltip(self, item: 'GalleryQueueItem', col: int) -> Optional[str]:
+        if col == _Col.COL_NAME:
+            return item.path
+        if col == _Col.COL_ADDED:
+            return _format_timestamp(item.added_time)[1] or None
+        if col == _Col.COL_FINISHED:
+            return _format_timestamp(item.finished_time)[1] or None
+        if col == _Col.COL_RENAMED:
+            renamed = self._is_renamed(item)
+            return None if renamed is None else ("Renamed" if renamed else "Pending rename")
+        if col == _Col.COL_ONLINE_IMX:
+            counts = _imx_counts(item)
+            if counts:
+                return f"{counts[0]}/{counts[1]} images online"
+        return None
+
+    def _sort_key(self, item: 'GalleryQueueItem', col: int) -> Any:
+        """Sort key of native type so QSortFilterProxyModel compares it in C++."""
+        if col == _Col.COL_ORDER:
+            return item.db_id or 0
+        if col == _Col.COL_UPLOADED:
+            return item.uploaded_images or 0
+        if col == _Col.COL_PROGRESS:
+            return int(item.progress or 0)
+        if col in (_Col.COL_STATUS, _Col.COL_STATUS_TEXT):
+            return item.status or ""
+        if col == _Col.COL_ADDED:
+            return float(item.added_time or 0)
+        if col == _Col.COL_FINISHED:
+            return float(item.finished_time or 0)
+        if col == _Col.COL_SIZE:
+            # float, not int: Python ints past 32 bits reach Qt as opaque objects
+            return float(item.total_size or 0)
+        if col == _Col.COL_TRANSFER:
+            return self._transfer_rate(item)
+        if col == _Col.COL_MEDIA_TYPE:
+            return item.media_type or "image"
+        if col == _Col.COL_ONLINE_IMX:
+            counts = _imx_counts(item)
+            return (counts[1] - counts[0]) if counts else -1
+        return self._display_text(item, col).lower()
+
+
+class GalleryFilterProxyModel(QSortFilterProxyModel):
+    """Tab and text filter plus sorting on top of ``GalleryTableModel``.
+
+    Switching tabs re-evaluates the filter over the source rows without
+    hiding or rebuilding any view rows; sorting uses ``SORT_ROLE`` keys.
+    """
+
+    ALL_TABS = "All Tabs"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tab_name: Optional[str] = None
+        self._tab_paths: Set[str] = set()
+        self._text = ""
+        self.setSortRole(SORT_ROLE)
+        self.setDynamicSortFilter(True)
+
+    def set_tab(self, tab_name: Optional[str], tab_paths: Iterable[str] = ()) -> None:
+        """Show only galleries of one tab (None or "All Tabs" shows all).
+
+        Args:
+            tab_name: Tab to show
+            tab_paths: Paths assigned to the tab in the database; galleries are
+                also matched on their in-memory tab_name, so unsaved ones show
+        """
+        self._tab_name = None if tab_name == self.ALL_TABS else tab_name
+        self._tab_paths = set(tab_paths)
+        self.invalidateFilter()
+
+    def set_text_filter(self, text: str) -> None:
+        """Show only galleries whose name or path contains text (case-insensitive)."""
+        self._text = (text or '').strip().lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        model = self.sourceModel()
+        item = model.item_for_row(source_row) if model is not None else None
+        if item is None:
+            return False
+        if self._tab_name and item.tab_name != self._tab_name and item.path not in self._tab_paths:
+            return False
+        if self._text:
+            name = (item.name or '').lower()
+            return self._text in name or self._text in item.path.lower()
+        return True
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        if left.column() != _Col.COL_ONLINE_IMX:
+            return super().lessThan(left, right)
+        # Most offline first whatever the sort direction, then by check time
+        model = self.sourceModel()
+        left_item = model.item_for_row(left.row())
+        right_item = model.item_for_row(right.row())
+        left_offline = left.data(SORT_ROLE) or 0
+        right_offline = right.data(SORT_ROLE) or 0
+        if left_offline != right_offline:
+            descending = self.sortOrder() == Qt.SortOrder.DescendingOrder
+            return (left_offline < right_offline) if descending else (left_offline > right_offline)
+        left_ts = (left_item.imx_status_checked or 0) if left_item else 0
+        right_ts = (right_item.imx_status_checked or 0) if right_item else 0
+        return left_ts < right_ts
+
+    def source_path(self, proxy_index: QModelIndex) -> Optional[str]:
+        """Gallery path behind a proxy index."""
+        if not proxy_index.isValid():
+            return None
+        return self.sourceModel().path_for_row(self.mapToSource(proxy_index).row())
@@ -103,7 +103,6 @@ from src.core.engine import UploadEngine
 from src.core.constants import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
 from src.storage.database import QueueStore
 from src.utils.logging import get_logger
-from src.gui.settings import ComprehensiveSettingsDialog
 from src.gui.tab_manager import TabManager
 
 # Import widget classes from module
@@ -111,6 +110,7 @@ from src.gui.widgets.custom_widgets import TableProgressWidget, ActionButtonWidg
 from src.gui.widgets.context_menu_helper import GalleryContextMenuHelper
 from src.gui.widgets.gallery_table import GalleryTableWidget, NumericColumnDelegate
 from src.gui.widgets.tabbed_gallery import TabbedGalleryWidget, DropEnabledTabBar
+from src.gui.widgets.gallery_table_view import get_model_view, model_view_enabled
 from src.gui.widgets.adaptive_settings_panel import AdaptiveQuickSettingsPanel
 from src.gui.widgets.worker_status_widget import WorkerStatusWidget
 from src.core.image_host_config import get_image_host_config_manager
@@ -137,20 +137,30 @@ from src.processing.tasks import (
 from src.processing.upload_workers import UploadWorker
 
 # Import dialog classes
-from src.gui.dialogs.template_manager import TemplateManagerDialog
 from src.gui.dialogs.log_viewer import LogViewerDialog
 from src.gui.dialogs.bbcode_viewer import BBCodeViewerDialog
 from src.gui.dialogs.help_dialog import HelpDialog
 
-# Import archive support
-from src.services.archive_service import ArchiveService
-from src.processing.archive_coordinator import ArchiveCoordinator
+# Import archive support (the extraction backends load on first use, see _lazy)
 from src.processing.archive_worker import ArchiveExtractionWorker
 from src.utils.archive_utils import is_archive_file
 from src.utils.system_utils import convert_to_wsl_path, is_wsl2
 
 # Import artifact handling
 from src.processing.artifact_handler import CompletionWorker, ArtifactHandler
+from src.network.single_instance import check_single_instance  # noqa: F401 (re-export)
+from src.utils.lazy_imports import LazyImports
+
+# Settings dialog, template manager and archive extraction are imported on
+# first use rather than with the main window; they stay patchable as
+# main_window.<Name>.
+_lazy = LazyImports(__name__, {
+    'ComprehensiveSettingsDialog': 'src.gui.settings',
+    'TemplateManagerDialog': 'src.gui.dialogs.template_manager',
+    'ArchiveService': 'src.services.archive_service',
+    'ArchiveCoordinator': 'src.processing.archive_coordinator',
+})
+__getattr__ = _lazy.load
 
 
 def format_timestamp_for_display(timestamp_value, include_seconds=False):
@@ -505,15 +515,9 @@ class BBDropGUI(QMainWindow):
         # Connect queue loaded signal to refresh filter
         self.queue_manager.queue_loaded.connect(self.refresh_filter)
 
-        # Initialize archive support
-        temp_dir = Path(get_config_path()).parent / "temp"
-        archive_service = ArchiveService(temp_dir)
-        from src.gui.dialogs.archive_folder_selector import ArchiveFolderSelector
-        self.archive_coordinator = ArchiveCoordinator(
-            archive_service,
-            parent_widget=self,
-            folder_selector_factory=ArchiveFolderSelector,
-        )
+        # Archive support (py7zr/rarfile backends) is created on first use,
+        # see the archive_coordinator property
+        self._archive_coordinator = None
         if self.splash:
             self.splash.set_status("QueueManager")
         
@@ -711,6 +715,18 @@ class BBDropGUI(QMainWindow):
                     actual_table.show_context_menu = new_show_context_menu
         except Exception as e:
             log(f"Could not connect context menu helper: {e}", level="error", category="ui")
+
+        # Model-based gallery table (Advanced setting gui/virtual_gallery_table).
+        # Must run before setup_delegate_handlers() below picks up the delegates.
+        if model_view_enabled():
+            table_view = self.gallery_table.enable_model_view(
+                self.queue_manager, progress_provider=self.progress_tracker.compute_item_display
+            )
+            table_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+            table_view.customContextMenuRequested.connect(
+                lambda position: self.context_menu_helper.show_context_menu_for_view(table_view, position)
+            )
+            log("Gallery table: model/view mode enabled", level="info", category="ui")
         
         if self.splash:
             self.splash.set_status("Setting up menu bar...")
@@ -1070,10 +1086,14 @@ class BBDropGUI(QMainWindow):
         # Theme cache
         self._current_theme_mode = str(self.settings.value('ui/theme', 'dark'))
     
-    def _on_scan_status_changed(self, queue_size: int, items_pending: int):
+    def _on_scan_status_changed(self, queue_size: int, items_pending: int,
+                                galleries_per_s: float = 0.0, files_per_s: float = 0.0):
         """Handle scan status update from QueueManager signal."""
         if queue_size > 0 or items_pending > 0:
-            self.scan_status_label.setText(f"Scanning: {items_pending} pending, {queue_size} in queue")
+            text = f"Scanning: {items_pending} pending, {queue_size} in queue"
+            if files_per_s > 0:
+                text += f" ({galleries_per_s:.1f} galleries/s, {files_per_s:.0f} files/s)"
+            self.scan_status_label.setText(text)
             self.scan_status_label.setVisible(True)
         else:
             self.scan_status_label.setVisible(False)
@@ -1464,13 +1484,14 @@ class BBDropGUI(QMainWindow):
         """Pre-cache utility functions to avoid blocking imports during runtime"""
         try:
             from src.utils.format_utils import format_binary_rate, format_binary_size, timestamp
-            from src.storage.gallery_management import get_unnamed_galleries, check_if_gallery_exists, build_gallery_filenames
+            from src.storage.gallery_management import get_unnamed_galleries, check_if_gallery_exists, find_existing_galleries, build_gallery_filenames
             from src.utils.paths import get_central_storage_path, get_central_store_base_path, __version__
             from src.utils.templates import save_gallery_artifacts, generate_bbcode_from_template, load_templates, get_template_path
             self._format_binary_rate = format_binary_rate
             self._format_binary_size = format_binary_size
             self._get_unnamed_galleries = get_unnamed_galleries
             self._check_if_gallery_exists = check_if_gallery_exists
+            self._find_existing_galleries = find_existing_galleries
             self._timestamp = timestamp
             self._get_central_storage_path = get_central_storage_path
             self._build_gallery_filenames = build_gallery_filenames
@@ -1486,6 +1507,7 @@ class BBDropGUI(QMainWindow):
             self._format_binary_size = lambda size, precision=2: f"{size} B" if size else ""
             self._get_unnamed_galleries = lambda: {}
             self._check_if_gallery_exists = lambda name: []
+            self._find_existing_galleries = lambda paths: {}
             self._timestamp = lambda: time.strftime("%H:%M:%S")
             self._get_central_storage_path = lambda: os.path.expanduser("~/.bbdrop")
             self._build_gallery_filenames = lambda name, id: (f"{name}_{id}.json", f"{name}_{id}.json", f"{name}_{id}_bbcode.txt")
@@ -1744,7 +1766,7 @@ class BBDropGUI(QMainWindow):
         """
         # Pass file_host_manager to settings dialog
         file_host_manager = getattr(self, 'file_host_manager', None)
-        dialog = ComprehensiveSettingsDialog(self, file_host_manager=file_host_manager)
+        dialog = _lazy.ComprehensiveSettingsDialog(self, file_host_manager=file_host_manager)
         # A QPushButton.clicked connection passes `checked` (bool) as the
         # arg — treat that as "no explicit tab" and fall through to the
         # remembered one.
@@ -1972,6 +1994,14 @@ class BBDropGUI(QMainWindow):
             self._scan_status_cache = self.queue_manager.store.get_scan_status_by_gallery_host()
         except Exception:
             self._scan_status_cache = {}
+        table_view = get_model_view(getattr(self, 'gallery_table', None))
+        if table_view is not None:
+            scan_by_path = {}
+            for (path, host_name), status_data in self._scan_status_cache.items():
+                scan_by_path.setdefault(path, {})[host_name] = status_data
+            for path, scan_status in scan_by_path.items():
+                table_view.gallery_model.set_scan_status(path, scan_status)
+            return
         # Trigger repaint of the hosts status column
         if hasattr(self, 'gallery_table'):
             self.gallery_table.viewport().update()
@@ -2493,6 +2523,19 @@ class BBDropGUI(QMainWindow):
         """
         self.table_row_manager._update_size_and_transfer_columns(row, item, theme_mode)
 
+    @property
+    def archive_coordinator(self):
+        """ArchiveCoordinator for ZIP/RAR/7Z extraction, created on first use."""
+        if self._archive_coordinator is None:
+            from src.gui.dialogs.archive_folder_selector import ArchiveFolderSelector
+            temp_dir = Path(get_config_path()).parent / "temp"
+            self._archive_coordinator = _lazy.ArchiveCoordinator(
+                _lazy.ArchiveService(temp_dir),
+                parent_widget=self,
+                folder_selector_factory=ArchiveFolderSelector,
+            )
+        return self._archive_coordinator
+
     def _initialize_table_from_queue(self, progress_callback=None):
         """Initialize table from existing queue items.
 
@@ -3520,20 +3563,3 @@ class BBDropGUI(QMainWindow):
     def _on_table_item_changed(self, item):
         """Handle table item changes to persist custom columns"""
         self.gallery_table_controller._on_table_item_changed(item)
-
-def check_single_instance(folder_path=None):
-    """Check if another instance is running and send folder if needed."""
-    try:
-        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        client_socket.settimeout(1.0)
-        client_socket.connect(('127.0.0.1', COMMUNICATION_PORT))  # Use IP, not 'localhost'
-
-        # Send folder path or empty string to bring window to front
-        message = folder_path if folder_path else ""
-        client_socket.send(message.encode('utf-8'))
-        client_socket.close()
-        return True  # Another instance is running
-    except Exception:
-        # Connection failed = no other instance running (expected on first launch)
-        return False
-
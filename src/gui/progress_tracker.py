@@ -15,6 +15,8 @@ from PyQt6.QtGui import QColor
 
 from src.utils.logger import log
 from src.gui.widgets.gallery_table import GalleryTableWidget
+from src.gui.gallery_table_model import PROGRESS_COLUMNS
+from src.gui.widgets.gallery_table_view import get_model_view
 from src.gui.widgets.custom_widgets import TableProgressWidget, ActionButtonWidget
 
 if TYPE_CHECKING:
@@ -238,6 +240,11 @@ class ProgressTracker(QObject):
         item = mw.queue_manager.get_item(path)
         if item is None:
             return
+        view = get_model_view(mw.gallery_table)
+        if view is not None:
+            # The model computes the same display via compute_item_display()
+            view.gallery_model.refresh_item(path, PROGRESS_COLUMNS)
+            return
         row = mw._get_row_for_path(path)
         if row is None or row < 0 or row >= mw.gallery_table.rowCount():
             return
@@ -1,9 +1,17 @@
-"""Settings dialog package — one module per tab."""
+"""Settings dialog package — one module per tab.
+
+Only TabIndex is imported with the package (menus and buttons need it at
+startup); the dialog and its tabs load when first opened.
+"""
 
-from src.gui.settings.settings_dialog import ComprehensiveSettingsDialog
 from src.gui.settings.tab_index import TabIndex
-from src.gui.settings.host_test_dialog import HostTestDialog  # noqa: F401
-from src.gui.widgets.icon_drop_frame import IconDropFrame  # noqa: F401
+from src.utils.lazy_imports import LazyImports
+
+__getattr__ = LazyImports(__name__, {
+    "ComprehensiveSettingsDialog": "src.gui.settings.settings_dialog",
+    "HostTestDialog": "src.gui.settings.host_test_dialog",
+    "IconDropFrame": "src.gui.widgets.icon_drop_frame",
+}).load
 
 __all__ = [
     "ComprehensiveSettingsDialog",
@@ -35,6 +35,16 @@ ADVANCED_SETTINGS = [
         "min": 6,
         "max": 24
     },
+    {
+        "key": "gui/virtual_gallery_table",
+        "description": (
+            "Draw the gallery table from a model instead of per-row widgets "
+            "(faster with thousands of galleries). Experimental; takes "
+            "effect after restart."
+        ),
+        "default": False,
+        "type": "bool"
+    },
     {
         "key": "uploads/retry_delay_seconds",
         "description": "Seconds to wait before retrying a failed upload",
@@ -76,6 +86,28 @@ ADVANCED_SETTINGS = [
         "min": 1,
         "max": 100
     },
+    # Upload rate limits (BandwidthShaper), applied to running uploads on save
+    {
+        "key": "bandwidth/upload_limit_kbps",
+        "description": (
+            "Total upload limit in KiB/s across all image and file hosts. "
+            "0 = unlimited."
+        ),
+        "default": 0,
+        "type": "int",
+        "min": 0,
+        "max": 10000000
+    },
+    {
+        "key": "bandwidth/host_upload_limits",
+        "description": (
+            "Per-host upload limits as host=KiB/s pairs, e.g. "
+            "'imx=2048, rapidgator=512'. Hosts not listed are only bound "
+            "by the total limit."
+        ),
+        "default": "",
+        "type": "str",
+    },
     # Disk space monitoring thresholds
     {
         "key": "disk_monitor/enabled",
@@ -424,6 +456,12 @@ class AdvancedSettingsWidget(QWidget):
             values["bandwidth/alpha_down"] = float(alpha_down)
         if window_size is not None:
             values["bandwidth/window_size"] = int(window_size)
+        upload_limit = qsettings.value("bandwidth/upload_limit_kbps", None)
+        host_upload_limits = qsettings.value("bandwidth/host_upload_limits", None)
+        if upload_limit is not None:
+            values["bandwidth/upload_limit_kbps"] = int(upload_limit)
+        if host_upload_limits is not None:
+            values["bandwidth/host_upload_limits"] = str(host_upload_limits)
 
         if values:
             self.set_values(values)
@@ -436,7 +474,8 @@ class AdvancedSettingsWidget(QWidget):
     def save_to_config(self, parent_window=None):
         """Save advanced settings to INI file (only non-default values).
 
-        Bandwidth settings are also saved to QSettings for BandwidthManager.
+        Bandwidth settings (smoothing and upload limits) are also saved to
+        QSettings for BandwidthManager.
 
         Args:
             parent_window: Optional parent window for accessing BandwidthManager.
@@ -483,11 +522,17 @@ class AdvancedSettingsWidget(QWidget):
         qsettings.setValue("bandwidth/alpha_down", alpha_down)
         qsettings.setValue("bandwidth/window_size", window_size)
 
+        upload_limit = int(all_values.get('bandwidth/upload_limit_kbps', 0) or 0)
+        host_upload_limits = str(all_values.get('bandwidth/host_upload_limits', '') or '')
+        qsettings.setValue("bandwidth/upload_limit_kbps", upload_limit)
+        qsettings.setValue("bandwidth/host_upload_limits", host_upload_limits)
+
         # Update the running BandwidthManager if available
         if parent_window and hasattr(parent_window, 'worker_signal_handler'):
             handler = parent_window.worker_signal_handler
             if hasattr(handler, 'bandwidth_manager'):
                 handler.bandwidth_manager.update_smoothing(alpha_up, alpha_down, window_size)
+                handler.bandwidth_manager.update_upload_limits(upload_limit, host_upload_limits)
 
         # Route external-backend keys to their dedicated config helpers.
         from src.core.file_host_config import set_family_dedup_enabled
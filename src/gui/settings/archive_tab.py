@@ -93,6 +93,28 @@ class ArchiveSettingsWidget(QWidget):
         self.compression_info_label.setStyleSheet("color: #666;")
         compression_layout.addRow("", self.compression_info_label)
 
+        # Parallel compression workers (ignored for Store/Copy)
+        self.compression_workers_spinbox = QSpinBox()
+        self.compression_workers_spinbox.setRange(0, 64)
+        self.compression_workers_spinbox.setSpecialValueText("Auto (one per CPU)")
+        self.compression_workers_spinbox.setToolTip(
+            "Threads used to compress archive members in parallel.\n"
+            "1 (default) compresses on a single core. Has no effect with Store/Copy."
+        )
+        self.compression_workers_spinbox.valueChanged.connect(self._on_settings_changed)
+        compression_layout.addRow("Workers:", self.compression_workers_spinbox)
+
+        # Store-mode ZIPs can be sent straight from the images
+        self.stream_uploads_checkbox = QCheckBox("Stream uncompressed ZIPs without writing them to disk")
+        self.stream_uploads_checkbox.setToolTip(
+            "With ZIP + Store, archives are assembled from the gallery images\n"
+            "while uploading instead of being written to the temp folder first.\n"
+            "The uploaded files are identical. Other formats and methods are\n"
+            "always written to disk."
+        )
+        self.stream_uploads_checkbox.toggled.connect(self._on_settings_changed)
+        compression_layout.addRow("", self.stream_uploads_checkbox)
+
         layout.addWidget(compression_group)
 
         # Split Archives Group
@@ -334,6 +356,8 @@ class ArchiveSettingsWidget(QWidget):
             if self.compression_combo.itemData(i) == archive_compression:
                 self.compression_combo.setCurrentIndex(i)
                 break
+        self.compression_workers_spinbox.setValue(settings.get('archive_compression_workers', 1))
+        self.stream_uploads_checkbox.setChecked(settings.get('archive_stream_uploads', False))
 
         # Load split settings
         split_enabled = settings.get('archive_split_enabled', False)
@@ -360,6 +384,8 @@ class ArchiveSettingsWidget(QWidget):
         return {
             'archive_format': self.format_combo.currentData(),
             'archive_compression': self.compression_combo.currentData(),
+            'archive_compression_workers': self.compression_workers_spinbox.value(),
+            'archive_stream_uploads': self.stream_uploads_checkbox.isChecked(),
             'archive_split_enabled': self.split_enabled_checkbox.isChecked(),
             'archive_split_mode': self.split_mode_combo.currentData(),
             'archive_split_size_mb': self.split_size_spinbox.value()
@@ -392,6 +418,8 @@ class ArchiveSettingsWidget(QWidget):
         # Save to DEFAULTS section
         config.set('DEFAULTS', 'archive_format', archive_settings['archive_format'])
         config.set('DEFAULTS', 'archive_compression', archive_settings['archive_compression'])
+        config.set('DEFAULTS', 'archive_compression_workers', str(archive_settings['archive_compression_workers']))
+        config.set('DEFAULTS', 'archive_stream_uploads', str(archive_settings['archive_stream_uploads']))
         config.set('DEFAULTS', 'archive_split_enabled', str(archive_settings['archive_split_enabled']))
         config.set('DEFAULTS', 'archive_split_mode', archive_settings['archive_split_mode'])
         config.set('DEFAULTS', 'archive_split_size_mb', str(archive_settings['archive_split_size_mb']))
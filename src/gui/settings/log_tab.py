@@ -140,6 +140,12 @@ class LogSettingsWidget(QWidget):
         self.cmb_log_file_upload_mode.addItems(["none", "file", "gallery", "both"])
         file_grid.addWidget(self.cmb_log_file_upload_mode, 3, 3)
 
+        self.chk_log_async = QCheckBox("Write logs in the background")
+        self.chk_log_async.setToolTip(
+            "Queue log messages and write them on a background thread so uploads never wait on log I/O.\n"
+            "If the queue fills up, the oldest info/debug messages are dropped; errors are always kept.")
+        file_grid.addWidget(self.chk_log_async, 4, 0, 1, 4)
+
         # Note: File logging categories removed since filtering is done elsewhere
         # Store empty file category widgets to maintain compatibility
         for cat_key, _ in cats:
@@ -172,6 +178,7 @@ class LogSettingsWidget(QWidget):
         self.cmb_log_rotation.currentIndexChanged.connect(self.settings_changed.emit)
         self.spn_log_backup.valueChanged.connect(self.settings_changed.emit)
         self.chk_log_compress.toggled.connect(self.settings_changed.emit)
+        self.chk_log_async.toggled.connect(self.settings_changed.emit)
         self.spn_log_max_bytes.valueChanged.connect(self.settings_changed.emit)
         self.cmb_log_gui_level.currentIndexChanged.connect(self.settings_changed.emit)
         self.cmb_log_file_level.currentIndexChanged.connect(self.settings_changed.emit)
@@ -206,6 +213,7 @@ class LogSettingsWidget(QWidget):
         self.cmb_log_rotation.blockSignals(True)
         self.spn_log_backup.blockSignals(True)
         self.chk_log_compress.blockSignals(True)
+        self.chk_log_async.blockSignals(True)
         self.spn_log_max_bytes.blockSignals(True)
         self.cmb_log_gui_level.blockSignals(True)
         self.cmb_log_file_level.blockSignals(True)
@@ -225,6 +233,7 @@ class LogSettingsWidget(QWidget):
         self.spn_log_backup.setValue(int(settings.get('backup_count', 7)))
         self.chk_log_compress.setChecked(bool(settings.get('compress', True)))
         self.spn_log_max_bytes.setValue(int(settings.get('max_bytes', 10485760)))
+        self.chk_log_async.setChecked(bool(settings.get('async_enabled', True)))
 
         levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         try:
@@ -250,6 +259,7 @@ class LogSettingsWidget(QWidget):
         self.cmb_log_rotation.blockSignals(False)
         self.spn_log_backup.blockSignals(False)
         self.chk_log_compress.blockSignals(False)
+        self.chk_log_async.blockSignals(False)
         self.spn_log_max_bytes.blockSignals(False)
         self.cmb_log_gui_level.blockSignals(False)
         self.cmb_log_file_level.blockSignals(False)
@@ -276,6 +286,7 @@ class LogSettingsWidget(QWidget):
                 backup_count=self.spn_log_backup.value(),
                 compress=self.chk_log_compress.isChecked(),
                 max_bytes=self.spn_log_max_bytes.value(),
+                async_enabled=self.chk_log_async.isChecked(),
                 level_gui=self.cmb_log_gui_level.currentText(),
                 level_file=self.cmb_log_file_level.currentText(),
                 upload_success_mode_gui=self.cmb_log_gui_upload_mode.currentText(),
@@ -284,6 +295,8 @@ class LogSettingsWidget(QWidget):
                 show_category_gui=self.chk_show_category_gui.isChecked(),
                 **cat_kwargs,
             )
+            from src.utils.logger import configure_async_logging
+            configure_async_logging()
         except Exception:
             pass
 
@@ -271,6 +271,34 @@ class ScanningTab(QWidget):
         strategy_layout.addWidget(perf_info)
 
         layout.addWidget(strategy_group)
+
+        # --- Parallel Scanning group ---
+        parallel_group = QGroupBox("Parallel Scanning")
+        parallel_layout = QHBoxLayout(parallel_group)
+
+        parallel_layout.addWidget(QLabel("Scan threads:"))
+        self.scan_workers_spin = QSpinBox()
+        self.scan_workers_spin.setToolTip("Galleries scanned at the same time")
+        self.scan_workers_spin.setRange(1, 16)
+        self.scan_workers_spin.setValue(4)
+        parallel_layout.addWidget(self.scan_workers_spin)
+
+        parallel_layout.addWidget(QLabel("Verify processes:"))
+        self.verify_processes_spin = QSpinBox()
+        self.verify_processes_spin.setToolTip("0 = verify images in the scan threads")
+        self.verify_processes_spin.setRange(0, 16)
+        self.verify_processes_spin.setValue(0)
+        parallel_layout.addWidget(self.verify_processes_spin)
+        parallel_layout.addWidget(InfoButton(
+            "<b>Scan threads:</b> how many galleries are scanned at once. Scanning "
+            "is mostly disk I/O, so several threads keep large drops moving.<br><br>"
+            "<b>Verify processes:</b> run the PIL image check in separate "
+            "processes. Only worth it on fast SSDs where the check is CPU-bound. "
+            "0 keeps it in the scan threads.<br><br>Takes effect after restart."
+        ))
+        parallel_layout.addStretch()
+
+        layout.addWidget(parallel_group)
         layout.addStretch()
 
         # --- Connect change signals to dirty ---
@@ -291,6 +319,8 @@ class ScanningTab(QWidget):
         self.stats_exclude_outliers_check.toggled.connect(self.dirty.emit)
         self.avg_mean_radio.toggled.connect(self.dirty.emit)
         self.avg_median_radio.toggled.connect(self.dirty.emit)
+        self.scan_workers_spin.valueChanged.connect(self.dirty.emit)
+        self.verify_processes_spin.valueChanged.connect(self.dirty.emit)
 
     # ------------------------------------------------------------------
     # Load / Reload
@@ -322,6 +352,7 @@ class ScanningTab(QWidget):
                 self.exclude_patterns_check, self.exclude_patterns_edit,
                 self.stats_exclude_outliers_check,
                 self.avg_mean_radio, self.avg_median_radio,
+                self.scan_workers_spin, self.verify_processes_spin,
             ]
             for control in controls_to_block:
                 control.blockSignals(True)
@@ -391,6 +422,14 @@ class ScanningTab(QWidget):
             else:
                 self.avg_mean_radio.setChecked(True)
 
+            # Load scan pool sizes
+            self.scan_workers_spin.setValue(
+                config.getint('SCANNING', 'scan_workers', fallback=4)
+            )
+            self.verify_processes_spin.setValue(
+                config.getint('SCANNING', 'verify_processes', fallback=0)
+            )
+
             # Unblock signals
             for control in controls_to_block:
                 control.blockSignals(False)
@@ -419,6 +458,8 @@ class ScanningTab(QWidget):
         self.exclude_patterns_edit.clear()
         self.stats_exclude_outliers_check.setChecked(False)
         self.avg_median_radio.setChecked(True)
+        self.scan_workers_spin.setValue(4)
+        self.verify_processes_spin.setValue(0)
 
     # ------------------------------------------------------------------
     # Save
@@ -488,6 +529,14 @@ class ScanningTab(QWidget):
                 'SCANNING', 'use_median',
                 str(self.avg_median_radio.isChecked()),
             )
+            config.set(
+                'SCANNING', 'scan_workers',
+                str(self.scan_workers_spin.value()),
+            )
+            config.set(
+                'SCANNING', 'verify_processes',
+                str(self.verify_processes_spin.value()),
+            )
 
             with open(config_file, 'w', encoding='utf-8') as f:
                 config.write(f)
@@ -27,6 +27,7 @@ from src.utils.logger import log
 from src.utils.format_utils import format_binary_size, format_binary_rate
 from src.storage.queue_manager import GalleryQueueItem
 from src.gui.widgets.custom_widgets import TableProgressWidget, ActionButtonWidget
+from src.gui.widgets.gallery_table_view import get_model_view
 from src.gui.icon_manager import get_icon_manager
 from src.processing.tasks import BackgroundTask
 from src.storage.gallery_management import check_gallery_renamed
@@ -689,6 +690,56 @@ class TableRowManager(QObject):
     # Table Loading Methods
     # =========================================================================
 
+    def _model_view(self):
+        """GalleryTableView when the model-based table is enabled, else None."""
+        return get_model_view(self._main_window.gallery_table)
+
+    def _load_model_view(self, view, progress_callback=None):
+        """Load the model-based table: one model reset, no per-row work.
+
+        Fills the model's file host, scan status and rename caches from the
+        same batch queries the QTableWidget path uses, then resets the model
+        over the queue items and applies the current tab filter.
+        """
+        mw = self._main_window
+        model = view.gallery_model
+        items = mw.queue_manager.get_all_items()
+        log(f"Loading {len(items)} galleries into model view", level="info", category="ui")
+
+        try:
+            mw._file_host_uploads_cache = mw.queue_manager.store.get_all_file_host_uploads_batch()
+        except Exception as e:
+            log(f"Failed to batch load file host uploads: {e}", level="warning", category="performance")
+            mw._file_host_uploads_cache = {}
+        try:
+            mw._scan_status_cache = mw.queue_manager.store.get_scan_status_by_gallery_host()
+        except Exception:
+            mw._scan_status_cache = {}
+
+        for path, uploads_list in mw._file_host_uploads_cache.items():
+            model.set_file_host_uploads(path, uploads_list)
+        scan_by_path: Dict[str, Dict[str, Any]] = {}
+        for (path, host_name), status_data in mw._scan_status_cache.items():
+            scan_by_path.setdefault(path, {})[host_name] = status_data
+        for path, scan_status in scan_by_path.items():
+            model.set_scan_status(path, scan_status)
+        try:
+            model.set_unnamed_galleries(mw._get_unnamed_galleries().keys())
+        except Exception as e:
+            log(f"Failed to load unnamed galleries: {e}", level="debug", category="ui")
+
+        model.reload()
+        mw._last_scan_states = {item.path: item.scan_complete for item in items}
+        mw._loading_phase = 3
+        if progress_callback:
+            progress_callback(len(items), len(items))
+
+        if hasattr(mw.gallery_table, 'refresh_filter'):
+            def _apply_initial_filter():
+                mw.gallery_table.refresh_filter()
+                mw.gallery_table.tab_changed.emit(mw.gallery_table.current_tab)
+            QTimer.singleShot(0, _apply_initial_filter)
+
     def _initialize_table_from_queue(self, progress_callback=None):
         """Initialize table from existing queue items - called once on startup.
 
@@ -696,6 +747,11 @@ class TableRowManager(QObject):
             progress_callback: Optional callable(current, total) for progress updates
         """
         mw = self._main_window
+        view = self._model_view()
+        if view is not None:
+            self._load_model_view(view, progress_callback)
+            return
+
         # Clear any existing mappings
         mw.path_to_row.clear()
         mw.row_to_path.clear()
@@ -947,6 +1003,11 @@ class TableRowManager(QObject):
             log("Gallery loading aborted by user", level="info", category="performance")
             return
 
+        view = self._model_view()
+        if view is not None:
+            self._load_model_view(view)
+            return
+
         mw._loading_phase = 1
         log("Phase 1: Loading critical gallery data...", level="info", category="performance")
 
@@ -1388,6 +1449,13 @@ class TableRowManager(QObject):
                 first_visible = max(0, first_visible - 5)
                 last_visible = min(table.rowCount() - 1, last_visible + 5)
 
+                # Model view: delegates repaint from the model; only visible cells redraw
+                view = self._model_view()
+                if view is not None:
+                    view.set_theme_mode(mw._current_theme_mode)
+                    view.gallery_model.refresh_column(_Col.ACTION)
+                    view.gallery_model.refresh_column(_Col.ONLINE_IMX)
+
                 # Update only visible status icons, action button icons, and Online IMX colors
                 for row in range(first_visible, last_visible + 1):
                     name_item = table.item(row, _Col.NAME)
@@ -1448,6 +1516,11 @@ class TableRowManager(QObject):
         # Increment frame (0-6, cycling through 7 frames)
         mw._upload_animation_frame = (mw._upload_animation_frame + 1) % 7
 
+        view = self._model_view()
+        if view is not None:
+            view.gallery_model.set_animation_frame(mw._upload_animation_frame)
+            return
+
         table = mw.gallery_table
         if hasattr(mw.gallery_table, 'table'):
             table = mw.gallery_table.table
@@ -24,6 +24,8 @@ from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
 from src.utils.logger import log
 from src.gui.widgets.custom_widgets import TableProgressWidget, ActionButtonWidget
 from src.gui.widgets.gallery_table import GalleryTableWidget
+from src.gui.gallery_table_model import PROGRESS_COLUMNS
+from src.gui.widgets.gallery_table_view import get_model_view
 
 if TYPE_CHECKING:
     from src.gui.main_window import BBDropGUI
@@ -140,6 +142,11 @@ class UploadLifecycleHandler(QObject):
             if not item:
                 return
 
+            view = get_model_view(mw.gallery_table)
+            if view is not None:
+                self._apply_progress_to_model(view, item, completed, total, progress_percent)
+                return
+
             # Find row (thread-safe lookup)
             matched_row = mw._get_row_for_path(path)
             if matched_row is None or matched_row >= mw.gallery_table.rowCount():
@@ -248,6 +255,28 @@ class UploadLifecycleHandler(QObject):
         except Exception as e:
             log(f"Exception in _process_batched_progress_update: {e}", level="error", category="ui")
 
+    def _apply_progress_to_model(self, view, item, completed: int, total: int, progress_percent: int):
+        """Model-view counterpart of the table writes in _process_batched_progress_update.
+
+        Item fields carry the state; the model repaints the progress columns
+        from them, so only completion bookkeeping happens here.
+        """
+        mw = self._main_window
+        if completed >= total or progress_percent >= 100:
+            if not item.finished_time:
+                item.finished_time = time.time()
+            row_failed = bool(item.total_images and item.uploaded_images is not None
+                              and item.uploaded_images < item.total_images)
+            item.status = "completed" if not row_failed else "failed"
+            try:
+                elapsed = max(float(item.finished_time or time.time()) - float(item.start_time or item.finished_time), 0.001)
+                item.final_kibps = (float(getattr(item, 'uploaded_bytes', 0) or 0) / elapsed) / 1024.0
+                item.current_kibps = 0.0
+            except Exception as e:
+                log(f"Failed to compute final transfer rate: {e}", level="warning", category="ui")
+        view.gallery_model.refresh_item(item.path, PROGRESS_COLUMNS)
+        mw.progress_tracker.update_progress_display()
+
     def on_gallery_completed(self, path: str, results: dict):
         """Handle gallery completion - minimal GUI thread work, everything else deferred"""
         mw = self._main_window
@@ -81,6 +81,17 @@ class GalleryContextMenuHelper(QObject):
         if menu.actions():
             menu.exec(global_pos)
     
+    def show_context_menu_for_view(self, view, position):
+        """Show context menu for a GalleryTableView (model-based table)"""
+        index = view.indexAt(position)
+        if index.isValid() and not view.selectionModel().isRowSelected(index.row(), index.parent()):
+            view.clearSelection()
+            view.selectRow(index.row())
+
+        menu = self.create_context_menu(position, view.selected_paths())
+        if menu.actions():
+            menu.exec(view.viewport().mapToGlobal(position))
+
     def _add_action_items(self, menu, selected_paths):
         """Add start/delete/cancel actions"""
         if not self.main_window:
@@ -90,7 +101,7 @@ class GalleryContextMenuHelper(QObject):
         can_start_any = self._check_can_start(selected_paths)
         start_action = menu.addAction("Start Selected")
         start_action.setEnabled(can_start_any)
-        start_action.triggered.connect(lambda: self._delegate_to_main_window('start_selected_via_menu'))
+        start_action.triggered.connect(lambda: self._delegate_to_main_window('start_selected_via_menu', selected_paths))
         
         # Delete
         delete_action = menu.addAction("Delete Selected")
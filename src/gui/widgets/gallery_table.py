@@ -32,9 +32,14 @@ from src.utils.logger import log
 from src.gui.widgets.custom_widgets import TableProgressWidget, ActionButtonWidget
 from src.gui.icon_manager import get_icon_manager
 
-# Import dialogs
-from src.gui.dialogs.gallery_file_manager import GalleryFileManagerDialog
+# Import dialogs (the gallery file manager loads on first use)
 from src.gui.dialogs.message_factory import show_warning
+from src.utils.lazy_imports import LazyImports
+
+_lazy = LazyImports(__name__, {
+    'GalleryFileManagerDialog': 'src.gui.dialogs.gallery_file_manager',
+})
+__getattr__ = _lazy.load
 
 
 class NumericColumnDelegate(QStyledItemDelegate):
@@ -650,7 +655,7 @@ class GalleryTableWidget(QTableWidget):
 
         if parent_window:
             # Create and show the file manager dialog
-            dialog = GalleryFileManagerDialog(path, parent_window.queue_manager, parent_window)
+            dialog = _lazy.GalleryFileManagerDialog(path, parent_window.queue_manager, parent_window)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 # Refresh the gallery display if files were modified
                 if hasattr(parent_window, 'refresh_filter'):
@@ -897,20 +902,26 @@ class GalleryTableWidget(QTableWidget):
                 return
             widget = widget.parent()
 
-    def start_selected_via_menu(self):
-        """Start selected items in their current visual order"""
-        # Determine selected rows in visual order as shown
-        selected_rows = sorted({it.row() for it in self.selectedItems()})
-        if not selected_rows:
-            return
-        # Gather paths from column 1 for those rows
-        paths_in_order = []
-        for row in selected_rows:
-            name_item = self.item(row, GalleryTableWidget.COL_NAME)
-            if name_item:
-                path = name_item.data(Qt.ItemDataRole.UserRole)
-                if path:
-                    paths_in_order.append(path)
+    def start_selected_via_menu(self, paths=None):
+        """Start selected items in their current visual order
+
+        Args:
+            paths: Gallery paths to start, in order; defaults to this
+                table's selection (the model view passes its own)
+        """
+        paths_in_order = list(paths) if paths is not None else []
+        if paths is None:
+            # Determine selected rows in visual order as shown
+            selected_rows = sorted({it.row() for it in self.selectedItems()})
+            if not selected_rows:
+                return
+            # Gather paths from column 1 for those rows
+            for row in selected_rows:
+                name_item = self.item(row, GalleryTableWidget.COL_NAME)
+                if name_item:
+                    path = name_item.data(Qt.ItemDataRole.UserRole)
+                    if path:
+                        paths_in_order.append(path)
         if not paths_in_order:
             return
         # Delegate to main window to start items individually preserving order
@@ -0,0 +1,189 @@
+"""
+Gallery Table View
+Model-based gallery table: GalleryTableModel + GalleryFilterProxyModel in a QTableView
+"""
+
+import os
+from typing import TYPE_CHECKING, List, Optional
+
+from PyQt6.QtCore import QMimeData, QSize, Qt
+from PyQt6.QtGui import QDrag
+from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+from src.gui.delegates import (
+    ActionButtonDelegate, CoverIndicatorDelegate, FileHostsStatusDelegate, MediaTypeDelegate,
+    ProgressBarDelegate, StatusIconDelegate,
+)
+from src.gui.gallery_table_model import (
+    ANIMATION_FRAME_ROLE, PROGRESS_ROLE, GalleryFilterProxyModel, GalleryTableModel,
+)
+from src.gui.widgets.gallery_table import GalleryTableWidget, NumericColumnDelegate, StatusColorDelegate
+
+if TYPE_CHECKING:
+    from src.storage.queue_manager import QueueManager
+
+
+def model_view_enabled() -> bool:
+    """True if Advanced Settings switch the main window to GalleryTableView.
+
+    Reads ``gui/virtual_gallery_table`` from the ``[Advanced]`` INI section;
+    off by default, so the QTableWidget path stays the default.
+    """
+    import configparser
+    import os
+    from src.utils.paths import get_config_path
+
+    cfg = configparser.ConfigParser()
+    config_file = get_config_path()
+    if not os.path.exists(config_file):
+        return False
+    try:
+        cfg.read(config_file, encoding='utf-8')
+        return cfg.getboolean('Advanced', 'gui/virtual_gallery_table', fallback=False)
+    except (ValueError, configparser.Error):
+        return False
+
+
+def get_model_view(gallery_table) -> Optional['GalleryTableView']:
+    """The GalleryTableView a TabbedGalleryWidget shows, or None in QTableWidget mode."""
+    view = getattr(gallery_table, 'table_view', None)
+    return view if isinstance(view, GalleryTableView) else None
+
+
+class GalleryTableView(QTableView):
+    """Gallery table whose rows come from a GalleryTableModel.
+
+    Uses the same columns, widths and delegates as GalleryTableWidget, but
+    rows have no per-row items or widgets: cells are painted from the model
+    on demand, so memory and repaint cost follow the visible rows. Tabs and
+    text search filter through the proxy; header clicks sort through it.
+    """
+
+    ROW_HEIGHT = 24
+
+    def __init__(self, queue_manager: 'QueueManager', parent=None, progress_provider=None):
+        super().__init__(parent)
+        self.queue_manager = queue_manager
+
+        self.gallery_model = GalleryTableModel(queue_manager, self, progress_provider=progress_provider)
+        self.proxy_model = GalleryFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.gallery_model)
+        self.setModel(self.proxy_model)
+
+        self._setup_header()
+        self._setup_delegates()
+
+        self.setSortingEnabled(True)
+        self.horizontalHeader().setSortIndicatorShown(False)  # Queue order until a header is clicked
+        self.setShowGrid(True)
+        self.setAlternatingRowColors(True)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setIconSize(QSize(20, 20))
+        # Rows drag onto the tab bar like GalleryTableWidget rows
+        self.setDragEnabled(True)
+        self.setDragDropMode(QAbstractItemView.DragDropMode.DragOnly)
+
+        # Fixed row height: the view never measures rows, so scrolling a
+        # 20k-row table only touches the rows on screen
+        vertical = self.verticalHeader()
+        vertical.setVisible(False)
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(self.ROW_HEIGHT)
+
+    def _setup_header(self):
+        header = self.horizontalHeader()
+        header.setStretchLastSection(False)
+        header.setCascadingSectionResizes(False)
+        header.setMinimumSectionSize(24)
+        header.setSectionsClickable(True)
+        header.setSectionsMovable(True)
+        header.setHighlightSections(False)
+        for idx, _, _, width, resize_mode, hidden, _ in GalleryTableWidget.COLUMNS:
+            header.setSectionResizeMode(idx, getattr(QHeaderView.ResizeMode, resize_mode))
+            self.setColumnWidth(idx, width)
+            self.setColumnHidden(idx, hidden)
+
+    def _setup_delegates(self):
+        col = GalleryTableWidget
+        numeric_delegate = NumericColumnDelegate(self)
+        for column in (
+            col.COL_UPLOADED, col.COL_ADDED, col.COL_FINISHED, col.COL_SIZE, col.COL_TRANSFER,
+            col.COL_STATUS_TEXT, col.COL_GALLERY_ID, col.COL_CUSTOM1, col.COL_CUSTOM2,
+            col.COL_CUSTOM3, col.COL_CUSTOM4, col.COL_EXT1, col.COL_EXT2, col.COL_EXT3, col.COL_EXT4,
+        ):
+            self.setItemDelegateForColumn(column, numeric_delegate)
+        self.setItemDelegateForColumn(col.COL_ONLINE_IMX, StatusColorDelegate(self))
+
+        self.progress_delegate = ProgressBarDelegate(PROGRESS_ROLE, self)
+        self.setItemDelegateForColumn(col.COL_PROGRESS, self.progress_delegate)
+        self.status_delegate = StatusIconDelegate(ANIMATION_FRAME_ROLE, self)
+        self.setItemDelegateForColumn(col.COL_STATUS, self.status_delegate)
+
+        self.action_delegate = ActionButtonDelegate(self)
+        self.action_delegate.set_queue_manager(self.queue_manager)
+        self.setItemDelegateForColumn(col.COL_ACTION, self.action_delegate)
+        self.cover_delegate = CoverIndicatorDelegate(self)
+        self.setItemDelegateForColumn(col.COL_COVER, self.cover_delegate)
+        self.hosts_delegate = FileHostsStatusDelegate(self)
+        self.setItemDelegateForColumn(col.COL_HOSTS_STATUS, self.hosts_delegate)
+        self.media_type_delegate = MediaTypeDelegate(self)
+        self.setItemDelegateForColumn(col.COL_MEDIA_TYPE, self.media_type_delegate)
+
+    def set_theme_mode(self, theme_mode: Optional[str]) -> None:
+        """Re-render status icons for a theme change."""
+        self.status_delegate.theme_mode = theme_mode
+        self.gallery_model.refresh_column(GalleryTableWidget.COL_STATUS)
+
+    def switch_to_tab(self, tab_name: str, tab_paths=()) -> None:
+        """Filter to one tab; see GalleryFilterProxyModel.set_tab()."""
+        self.proxy_model.set_tab(tab_name, tab_paths)
+
+    def set_search_text(self, text: str) -> None:
+        """Filter by gallery name or path."""
+        self.proxy_model.set_text_filter(text)
+
+    def selected_paths(self) -> List[str]:
+        """Paths of the selected galleries, in view order."""
+        rows = sorted({index.row() for index in self.selectionModel().selectedRows(GalleryTableWidget.COL_NAME)})
+        paths = (self.proxy_model.source_path(self.proxy_model.index(row, GalleryTableWidget.COL_NAME))
+                 for row in rows)
+        return [path for path in paths if path]
+
+    def keyPressEvent(self, event):
+        """Delete removes the selected galleries, as in GalleryTableWidget."""
+        if event.key() == Qt.Key.Key_Delete:
+            widget = self
+            while widget:
+                if hasattr(widget, 'delete_selected_items'):
+                    widget.delete_selected_items()
+                    return
+                widget = widget.parent()
+        super().keyPressEvent(event)
+
+    def startDrag(self, supported_actions):
+        """Drag the selected galleries with the MIME type the tab bar accepts."""
+        paths = self.selected_paths()
+        if not paths:
+            return
+        mime_data = QMimeData()
+        mime_data.setData("application/x-bbdrop-galleries", "\n".join(paths).encode('utf-8'))
+        if len(paths) == 1:
+            mime_data.setText(f"Gallery: {os.path.basename(paths[0])}")
+        else:
+            mime_data.setText(f"{len(paths)} galleries")
+        drag = QDrag(self)
+        drag.setMimeData(mime_data)
+        drag.exec(Qt.DropAction.MoveAction)
+
+    def select_path(self, path: str) -> bool:
+        """Select and scroll to a gallery; False if it is filtered out or unknown."""
+        row = self.gallery_model.row_for_path(path)
+        if row is None:
+            return False
+        proxy_index = self.proxy_model.mapFromSource(self.gallery_model.index(row, GalleryTableWidget.COL_NAME))
+        if not proxy_index.isValid():
+            return False
+        self.selectRow(proxy_index.row())
+        self.scrollTo(proxy_index, QAbstractItemView.ScrollHint.EnsureVisible)
+        return True
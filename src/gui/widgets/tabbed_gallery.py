@@ -174,7 +174,11 @@ class TabbedGalleryWidget(QWidget):
             'background_updates_processed': 0
         }
         self._perf_start_time = time.time()
-        
+
+        # Model-based table; set by enable_model_view() when the advanced
+        # setting gui/virtual_gallery_table is on, else None
+        self.table_view = None
+
         self._init_ui()
         self._setup_connections()
     
@@ -257,6 +261,54 @@ class TabbedGalleryWidget(QWidget):
         self.action_delegate.button_clicked.connect(action_handler)
         self.hosts_delegate.host_clicked.connect(host_click_handler)
 
+    def enable_model_view(self, queue_manager, progress_provider=None):
+        """Show a GalleryTableView in place of the QTableWidget.
+
+        The QTableWidget stays in place, hidden and empty, so code that
+        still walks its rows finds none. Delegate attributes are re-pointed
+        at the view's delegates, so call this before setup_delegate_handlers().
+
+        Args:
+            queue_manager: QueueManager the model reads rows from
+            progress_provider: Optional callable(item) -> (percent, status)
+                for the progress column
+
+        Returns:
+            The GalleryTableView
+        """
+        from src.gui.widgets.gallery_table_view import GalleryTableView
+
+        if self.table_view is not None:
+            return self.table_view
+        self.table_view = GalleryTableView(queue_manager, self, progress_provider=progress_provider)
+        self.layout().replaceWidget(self.table, self.table_view)
+        self.table.hide()
+        self.action_delegate = self.table_view.action_delegate
+        self.cover_delegate = self.table_view.cover_delegate
+        self.hosts_delegate = self.table_view.hosts_delegate
+        self.media_type_delegate = self.table_view.media_type_delegate
+        return self.table_view
+
+    def selected_gallery_paths(self):
+        """Paths of the selected, visible galleries in display order."""
+        if self.table_view is not None:
+            return self.table_view.selected_paths()
+        paths = []
+        for row in sorted({index.row() for index in self.table.selectionModel().selectedRows()}):
+            if self.table.isRowHidden(row):
+                continue
+            name_item = self.table.item(row, GalleryTableWidget.COL_NAME)
+            path = name_item.data(Qt.ItemDataRole.UserRole) if name_item else None
+            if path:
+                paths.append(path)
+        return paths
+
+    def gallery_count(self):
+        """Number of galleries in the table across all tabs."""
+        if self.table_view is not None:
+            return self.table_view.gallery_model.rowCount()
+        return self.table.rowCount()
+
     def _setup_connections(self):
         """Setup signal connections"""
         self.tab_bar.currentChanged.connect(self._on_tab_changed)
@@ -570,7 +622,12 @@ class TabbedGalleryWidget(QWidget):
         if not tab_name:
             log(f"No tab name specified for filtering", level="debug")
             return
-        
+
+        if self.table_view is not None:
+            # The proxy filters on the fly; no per-row visibility to cache
+            self.table_view.switch_to_tab(tab_name, self._get_cached_tab_paths(tab_name))
+            return
+
         start_time = time.time()
         row_count = self.table.rowCount()
         pass  # Applying filter
@@ -978,7 +1035,7 @@ class TabbedGalleryWidget(QWidget):
             else:
                 gallery_count = 0
         elif base_tab_name == "All Tabs":
-            gallery_count = self.table.rowCount()
+            gallery_count = self.gallery_count()
         
         # Add tab info at top
         info_action = menu.addAction(f"{gallery_count} galleries")
@@ -1228,7 +1285,7 @@ class TabbedGalleryWidget(QWidget):
                 base_name = current_text.split(' (')[0] if ' (' in current_text else current_text
             
                 if base_name == "All Tabs":
-                    total_galleries = self.table.rowCount() if hasattr(self, 'table') else 0
+                    total_galleries = self.gallery_count() if hasattr(self, 'table') else 0
                     # Update tab text with count
                     self.tab_bar.setTabText(i, f"All Tabs ({total_galleries})")
                     self.tab_bar.setTabToolTip(i, 
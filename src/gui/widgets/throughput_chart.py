@@ -0,0 +1,82 @@
+"""Bar chart of upload throughput over time for the statistics dialog."""
+
+from typing import Any, Dict, List
+
+from PyQt6.QtCore import Qt, QRectF, QSize
+from PyQt6.QtGui import QPainter, QPalette
+from PyQt6.QtWidgets import QWidget
+
+from src.utils.format_utils import format_binary_rate
+
+
+class ThroughputChart(QWidget):
+    """Draws average upload speed per time bucket as vertical bars.
+
+    Fed with MetricsStore.get_throughput_series() points; buckets without
+    uploads are left empty so idle periods show as gaps.
+    """
+
+    LABEL_HEIGHT = 16
+    PADDING = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._points: List[Dict[str, Any]] = []
+        self._start_ts = 0
+        self._end_ts = 0
+        self._bucket_seconds = 60
+        self.setMinimumHeight(120)
+
+    def sizeHint(self) -> QSize:
+        return QSize(400, 140)
+
+    def set_series(self, points: List[Dict[str, Any]], start_ts: int, end_ts: int,
+                   bucket_seconds: int) -> None:
+        """Replace the charted data.
+
+        Args:
+            points: Throughput points with bucket_ts and avg_speed (B/s)
+            start_ts: Unix time of the left edge of the chart
+            end_ts: Unix time of the right edge of the chart
+            bucket_seconds: Width of one bucket (one bar) in seconds
+        """
+        self._points = list(points)
+        self._start_ts = start_ts
+        self._end_ts = max(end_ts, start_ts + bucket_seconds)
+        self._bucket_seconds = max(1, bucket_seconds)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        palette = self.palette()
+        plot = QRectF(self.rect()).adjusted(
+            self.PADDING, self.PADDING + self.LABEL_HEIGHT, -self.PADDING, -self.PADDING
+        )
+        painter.setPen(palette.color(QPalette.ColorRole.Mid))
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+
+        painter.setPen(palette.color(QPalette.ColorRole.WindowText))
+        peak = max((point.get('avg_speed', 0) for point in self._points), default=0)
+        if peak <= 0:
+            painter.drawText(QRectF(self.rect()), Qt.AlignmentFlag.AlignCenter,
+                             "No uploads in this period")
+            painter.end()
+            return
+
+        # format_binary_rate expects KiB/s, the series is in B/s
+        label_rect = QRectF(plot.left(), self.PADDING, plot.width(), self.LABEL_HEIGHT)
+        painter.drawText(label_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         f"Peak {format_binary_rate(peak / 1024)}")
+
+        span = self._end_ts - self._start_ts
+        bar_width = max(1.0, plot.width() * self._bucket_seconds / span - 1)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(palette.color(QPalette.ColorRole.Highlight))
+        for point in self._points:
+            speed = point.get('avg_speed', 0)
+            if speed <= 0:
+                continue
+            x = plot.left() + plot.width() * (point['bucket_ts'] - self._start_ts) / span
+            height = plot.height() * speed / peak
+            painter.drawRect(QRectF(x, plot.bottom() - height, bar_width, height))
+        painter.end()
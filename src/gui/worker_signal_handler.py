@@ -40,6 +40,7 @@ class WorkerSignalHandler(QObject):
         # Centralized bandwidth manager for unified tracking
         self.bandwidth_manager = BandwidthManager(self)
         self.bandwidth_manager.total_bandwidth_updated.connect(self._on_total_bandwidth_updated)
+        self._shown_upload_limit = None  # Limit shown in the Speed box tooltip
 
         # Base bytes remaining per file host (from last DB query) for real-time adjustment
         self._filehost_base_bytes: Dict[str, int] = {}
@@ -708,6 +709,13 @@ class WorkerSignalHandler(QObject):
 
             mw.speed_current_value_label.setText(speed_str)
 
+            limit_kbps = self.bandwidth_manager.get_upload_limit()
+            if limit_kbps != self._shown_upload_limit:
+                self._shown_upload_limit = limit_kbps
+                mw.speed_current_value_label.setToolTip(
+                    f"Upload limit: {limit_kbps / 1024.0:.3f} MiB/s" if limit_kbps else ""
+                )
+
             # Update fastest speed record if needed
             # Cap at ~977 MiB/s to reject absurd outliers from measurement glitches
             settings = QSettings("BBDropUploader", "Stats")
@@ -0,0 +1,216 @@
+"""Shared upload bandwidth shaper using token buckets.
+
+Every upload transfer, image host or file host, draws from a global bucket
+and from its host's bucket, so running several hosts at once cannot
+saturate the uplink. Transfers report progress through their curl
+XFERINFOFUNCTION callbacks (ByteCountingCallback for image hosts,
+FileHostClient._xferinfo_callback for file hosts). When a bucket runs dry,
+throttle() sleeps inside that callback. curl makes no progress on the
+handle while its callback blocks, so the average send rate follows the
+bucket's rate, give or take a socket buffer's worth of burst. The sleep
+ends early when the transfer's stop check returns True.
+
+Transfers sharing one CurlMulti loop must not sleep in a callback, since
+that would stall every transfer in the loop. They call reserve() instead,
+pause the over-limit handle for the returned delay and resume it from the
+loop (UploadEngine._run_multi_batch).
+
+Limits can be changed at any time (BandwidthManager.update_upload_limits());
+transfers already waiting pick up the new rate on their next check.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.utils.logger import log
+
+# Seconds of traffic a bucket may bank while idle
+BURST_SECONDS = 0.5
+
+# Smallest burst, so a low limit still lets one curl send buffer through
+MIN_BURST_BYTES = 64 * 1024
+
+# Longest single sleep, so limit changes and stop requests are noticed quickly
+MAX_SLEEP = 0.25
+
+
+class TokenBucket:
+    """Token bucket in bytes; rate 0 means unlimited.
+
+    consume() always succeeds and may leave the bucket in debt; callers
+    wait for wait_time() to reach 0 before sending more.
+    """
+
+    def __init__(self, rate: float = 0):
+        self._lock = threading.Lock()
+        self.rate = 0.0
+        self.capacity = 0.0
+        self._tokens = 0.0
+        self._last = time.monotonic()
+        self.set_rate(rate)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the rate in bytes/s, keeping any debt already owed."""
+        with self._lock:
+            self._refill(time.monotonic())
+            was_unlimited = self.rate <= 0
+            self.rate = max(0.0, float(rate))
+            self.capacity = max(MIN_BURST_BYTES, self.rate * BURST_SECONDS)
+            if was_unlimited:
+                self._tokens = self.capacity
+            else:
+                self._tokens = min(self._tokens, self.capacity)
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def consume(self, nbytes: int) -> None:
+        """Take nbytes from the bucket."""
+        with self._lock:
+            if self.rate <= 0:
+                return
+            self._refill(time.monotonic())
+            self._tokens -= nbytes
+
+    def wait_time(self) -> float:
+        """Seconds until the bucket is out of debt; 0 if unlimited."""
+        with self._lock:
+            if self.rate <= 0:
+                return 0.0
+            self._refill(time.monotonic())
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class BandwidthShaper:
+    """Global and per-host upload rate limits shared by all transfers.
+
+    Thread-safe. Host buckets are created lazily; hosts without a limit
+    only draw from the global bucket.
+    """
+
+    def __init__(self):
+        self._global = TokenBucket()
+        self._hosts: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def set_global_limit(self, rate: float) -> None:
+        """Set the total upload limit in bytes/s (0 = unlimited)."""
+        self._global.set_rate(rate)
+
+    def set_host_limit(self, host_id: str, rate: float) -> None:
+        """Set one host's upload limit in bytes/s (0 = unlimited)."""
+        with self._lock:
+            bucket = self._hosts.get(host_id)
+            if bucket is None:
+                if rate <= 0:
+                    return
+                self._hosts[host_id] = TokenBucket(rate)
+                return
+        bucket.set_rate(rate)
+
+    def configure(self, global_rate: float, host_rates: Dict[str, float]) -> None:
+        """Replace all limits; hosts missing from host_rates become unlimited."""
+        self.set_global_limit(global_rate)
+        with self._lock:
+            known = list(self._hosts)
+        for host_id in set(known) | set(host_rates):
+            self.set_host_limit(host_id, host_rates.get(host_id, 0))
+        per_host = ", ".join(f"{h} {r / 1024:.0f} KiB/s" for h, r in sorted(host_rates.items()) if r > 0)
+        log(f"Upload limits: total {f'{global_rate / 1024:.0f} KiB/s' if global_rate > 0 else 'unlimited'}"
+            f"{f', {per_host}' if per_host else ''}",
+            level="info", category="network")
+
+    def limits(self) -> Tuple[float, Dict[str, float]]:
+        """Current (global rate, {host_id: rate}) in bytes/s; unlimited hosts omitted."""
+        with self._lock:
+            hosts = {h: b.rate for h, b in self._hosts.items() if b.rate > 0}
+        return self._global.rate, hosts
+
+    def is_limited(self, host_id: Optional[str] = None) -> bool:
+        """True if a transfer to host_id is subject to any limit."""
+        if self._global.rate > 0:
+            return True
+        with self._lock:
+            bucket = self._hosts.get(host_id) if host_id else None
+        return bucket is not None and bucket.rate > 0
+
+    def _limited_buckets(self, host_id: Optional[str]) -> List[TokenBucket]:
+        with self._lock:
+            host_bucket = self._hosts.get(host_id) if host_id else None
+        return [b for b in (self._global, host_bucket) if b is not None and b.rate > 0]
+
+    def reserve(self, host_id: Optional[str], nbytes: int) -> float:
+        """Account for nbytes sent to host_id without sleeping.
+
+        Args:
+            host_id: Host the bytes went to; None draws from the global bucket only
+            nbytes: Bytes sent since the transfer's previous call (0 just checks)
+
+        Returns:
+            Seconds the transfer should pause before sending more; 0 if under the limit
+        """
+        buckets = self._limited_buckets(host_id)
+        if not buckets:
+            return 0.0
+        if nbytes > 0:
+            for bucket in buckets:
+                bucket.consume(nbytes)
+        return max(bucket.wait_time() for bucket in buckets)
+
+    def throttle(self, host_id: Optional[str], nbytes: int,
+                 should_stop: Optional[Callable[[], bool]] = None) -> None:
+        """Account for nbytes sent to host_id, sleeping while over the limit.
+
+        Args:
+            host_id: Host the bytes went to; None draws from the global bucket only
+            nbytes: Bytes sent since the transfer's previous call
+            should_stop: Checked between sleeps; returning True ends the wait
+        """
+        if nbytes <= 0:
+            return
+        wait = self.reserve(host_id, nbytes)
+        while wait > 0:
+            if should_stop is not None and should_stop():
+                return
+            time.sleep(min(wait, MAX_SLEEP))
+            wait = self.reserve(host_id, 0)
+
+
+def parse_host_limits(text: str) -> Dict[str, int]:
+    """Parse 'host=KiB/s' pairs separated by commas, e.g. 'imx=2048, rapidgator=512'.
+
+    Malformed and non-positive entries are ignored (logged).
+    """
+    limits: Dict[str, int] = {}
+    for entry in (text or '').split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        host_id, sep, value = entry.partition('=')
+        try:
+            kbps = int(value.strip()) if sep else 0
+        except ValueError:
+            kbps = 0
+        if not host_id.strip() or kbps <= 0:
+            log(f"Ignoring invalid upload limit '{entry}' (expected host=KiB/s)",
+                level="warning", category="network")
+            continue
+        limits[host_id.strip().lower()] = kbps
+    return limits
+
+
+_shaper: Optional[BandwidthShaper] = None
+_shaper_lock = threading.Lock()
+
+
+def get_bandwidth_shaper() -> BandwidthShaper:
+    """Process-wide shaper shared by every upload client."""
+    global _shaper
+    if _shaper is None:
+        with _shaper_lock:
+            if _shaper is None:
+                _shaper = BandwidthShaper()
+    return _shaper
@@ -0,0 +1,184 @@
+"""Per-host pool of reusable keep-alive pycurl handles.
+
+libcurl keeps live connections, the DNS cache and TLS session IDs on the easy
+handle across ``reset()``. Reusing handles for the same host therefore lets
+consecutive requests (e.g. the ``.z01``…``.zNN`` parts of a split archive
+going to the same RapidGator/K2S server) skip the TCP and TLS handshakes that
+a fresh ``pycurl.Curl()`` pays every time.
+
+Handles for one host also share a ``CurlShare`` carrying the DNS cache, TLS
+session cache and connection cache, so a connection opened by one client
+instance can be picked up by another.
+
+Cookies are not shared and do not survive ``release()``. ``reset()`` leaves
+the handle's cookie store in place, and the next client to acquire the
+handle may be a different account or a fresh login. So the store is wiped
+before the handle goes back to the pool.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import pycurl
+
+from src.utils.logger import log
+
+
+class CurlHandlePool:
+    """Registry of idle curl handles and share objects, keyed by host.
+
+    Thread-safe. A handle is owned by exactly one caller between
+    ``acquire()`` and ``release()``; the pool only ever holds idle handles.
+    """
+
+    DEFAULT_MAX_IDLE_PER_HOST = 4
+    # Keep resolved addresses longer than libcurl's 60 s default; upload
+    # servers rarely move and large parts can take minutes each.
+    DNS_CACHE_TIMEOUT = 600
+
+    def __init__(self, max_idle_per_host: int = DEFAULT_MAX_IDLE_PER_HOST):
+        self._max_idle = max(1, max_idle_per_host)
+        self._idle: Dict[str, List[pycurl.Curl]] = {}
+        self._shares: Dict[str, pycurl.CurlShare] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _host_stats(self, host_key: str) -> Dict[str, int]:
+        stats = self._stats.get(host_key)
+        if stats is None:
+            stats = self._stats[host_key] = {
+                'handles_created': 0,
+                'handles_reused': 0,
+                'transfers': 0,
+                'new_connections': 0,
+                'reused_connections': 0,
+            }
+        return stats
+
+    def _get_share(self, host_key: str) -> pycurl.CurlShare:
+        share = self._shares.get(host_key)
+        if share is None:
+            share = pycurl.CurlShare()
+            share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
+            share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
+            try:
+                share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_CONNECT)
+            except (AttributeError, pycurl.error):
+                pass  # libcurl < 7.57: connections stay per handle
+            self._shares[host_key] = share
+        return share
+
+    def acquire(self, host_key: str) -> pycurl.Curl:
+        """Get a clean handle for ``host_key``, reusing an idle one if possible."""
+        with self._lock:
+            idle = self._idle.get(host_key)
+            curl = idle.pop() if idle else None
+            stats = self._host_stats(host_key)
+            if curl is None:
+                curl = pycurl.Curl()
+                stats['handles_created'] += 1
+            else:
+                stats['handles_reused'] += 1
+            share = self._get_share(host_key)
+
+        curl.setopt(pycurl.SHARE, share)
+        curl.setopt(pycurl.DNS_CACHE_TIMEOUT, self.DNS_CACHE_TIMEOUT)
+        curl.setopt(pycurl.TCP_KEEPALIVE, 1)
+        return curl
+
+    def release(self, host_key: str, curl: pycurl.Curl) -> None:
+        """Return a handle after use. Options and cookies are cleared; connections stay."""
+        self._record_transfer(host_key, curl)
+        try:
+            curl.unsetopt(pycurl.SHARE)
+            # reset() keeps the cookie store; don't hand one login's session
+            # cookies to whichever client acquires the handle next.
+            curl.setopt(pycurl.COOKIELIST, "ALL")
+            # Drops every option and Python callback but keeps live
+            # connections and the TLS session cache.
+            curl.reset()
+        except pycurl.error as e:
+            log(f"Discarding curl handle for {host_key}: {e}", level="debug", category="network")
+            curl.close()
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(host_key, [])
+            if len(idle) < self._max_idle:
+                idle.append(curl)
+                return
+        curl.close()
+
+    def _record_transfer(self, host_key: str, curl: pycurl.Curl) -> None:
+        try:
+            new_connections = curl.getinfo(pycurl.NUM_CONNECTS)
+            responded = curl.getinfo(pycurl.RESPONSE_CODE) > 0
+        except pycurl.error:
+            return
+        if not new_connections and not responded:
+            return  # Handle was never performed
+        with self._lock:
+            stats = self._host_stats(host_key)
+            stats['transfers'] += 1
+            if new_connections:
+                stats['new_connections'] += new_connections
+            else:
+                stats['reused_connections'] += 1
+
+    def stats(self, host_key: Optional[str] = None) -> Dict[str, int]:
+        """Return counters for one host, or summed over all hosts.
+
+        ``reused_connections`` counts transfers that ran over an existing
+        connection, i.e. TCP+TLS handshakes saved.
+        """
+        with self._lock:
+            if host_key is not None:
+                result = dict(self._host_stats(host_key))
+                result['idle_handles'] = len(self._idle.get(host_key, []))
+                return result
+            totals: Dict[str, int] = {}
+            for stats in self._stats.values():
+                for key, value in stats.items():
+                    totals[key] = totals.get(key, 0) + value
+            totals['idle_handles'] = sum(len(v) for v in self._idle.values())
+            return totals
+
+    def handshakes_saved(self, host_key: Optional[str] = None) -> int:
+        """Number of transfers that reused a live connection."""
+        return self.stats(host_key).get('reused_connections', 0)
+
+    def close(self, host_key: Optional[str] = None) -> None:
+        """Close idle handles (for one host, or all) and drop their shares.
+
+        Shares are only dereferenced, not closed: handles still checked out
+        hold their own reference and keep the share alive until released.
+        """
+        with self._lock:
+            keys = [host_key] if host_key is not None else list(self._idle.keys() | self._shares.keys())
+            handles: List[pycurl.Curl] = []
+            for key in keys:
+                handles.extend(self._idle.pop(key, []))
+                self._shares.pop(key, None)
+        for curl in handles:
+            try:
+                curl.close()
+            except pycurl.error:
+                pass
+
+
+# Global pool instance
+_curl_pool: Optional[CurlHandlePool] = None
+_curl_pool_lock = threading.Lock()
+
+
+def get_curl_pool() -> CurlHandlePool:
+    """Get or create the global CurlHandlePool instance.
+
+    Returns:
+        Global CurlHandlePool instance
+    """
+    global _curl_pool
+    with _curl_pool_lock:
+        if _curl_pool is None:
+            _curl_pool = CurlHandlePool()
+        return _curl_pool
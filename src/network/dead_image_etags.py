@@ -61,6 +61,20 @@ def is_dead_image_etag(etag: Optional[str]) -> bool:
     return etag in DEAD_IMAGE_ETAGS
 
 
+def classify_head_response(url: str, status_code: int, etag: Optional[str]) -> Dict[str, Any]:
+    """Turn a HEAD response into a check result (see check_thumbnail_head)."""
+    if status_code == 404:
+        return {'url': url, 'status': 'offline', 'etag': etag}
+
+    if status_code == 200:
+        if is_dead_image_etag(etag):
+            return {'url': url, 'status': 'offline', 'etag': etag}
+        return {'url': url, 'status': 'online', 'etag': etag}
+
+    # Other status codes (403, 500, etc.) — treat as error
+    return {'url': url, 'status': 'error', 'error': f'HTTP {status_code}'}
+
+
 def check_thumbnail_head(url: str, timeout: float = 10.0) -> Dict[str, Any]:
     """Perform a HEAD request on a thumbnail URL and check liveness.
 
@@ -76,18 +90,7 @@ def check_thumbnail_head(url: str, timeout: float = 10.0) -> Dict[str, Any]:
     """
     try:
         resp = requests.head(url, timeout=timeout, allow_redirects=True)
-        etag = resp.headers.get('ETag')
-
-        if resp.status_code == 404:
-            return {'url': url, 'status': 'offline', 'etag': etag}
-
-        if resp.status_code == 200:
-            if is_dead_image_etag(etag):
-                return {'url': url, 'status': 'offline', 'etag': etag}
-            return {'url': url, 'status': 'online', 'etag': etag}
-
-        # Other status codes (403, 500, etc.) — treat as error
-        return {'url': url, 'status': 'error', 'error': f'HTTP {resp.status_code}'}
+        return classify_head_response(url, resp.status_code, resp.headers.get('ETag'))
 
     except requests.Timeout as e:
         return {'url': url, 'status': 'error', 'error': str(e)}
@@ -6,7 +6,6 @@ import os
 import pycurl
 import certifi
 import json
-import hashlib
 import time
 import re
 import base64
@@ -21,6 +20,9 @@ from src.core.file_host_config import HostConfig
 from src.core.engine import AtomicCounter
 from src.proxy.pycurl_adapter import PyCurlProxyAdapter
 from src.proxy.models import ProxyEntry
+from src.network.bandwidth_shaper import get_bandwidth_shaper
+from src.network.curl_pool import CurlHandlePool
+from src.utils.archive_manager import hash_file
 from src.core.constants import CHROME_UA as _CHROME_UA
 
 
@@ -56,6 +58,55 @@ def _k2s_default_upload_access() -> str:
     return value if value in _K2S_ACCESS_VALUES else "public"
 
 
+def _form_escape(value: str) -> str:
+    """Escape a multipart name/filename the way libcurl's form encoder does."""
+    return value.replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A')
+
+
+class _StreamedUploadBody:
+    """Request body served to pycurl from a StoredZipPart.
+
+    ``prefix`` and ``suffix`` wrap the part for multipart POSTs; a PUT body
+    is the part alone. An error raised while reading the sources aborts the
+    transfer and is kept in ``error`` so it can be re-raised instead of
+    pycurl's generic "callback aborted".
+    """
+
+    def __init__(self, stream, prefix: bytes = b"", suffix: bytes = b""):
+        self._reader = stream.open()
+        self._prefix = prefix
+        self._suffix = suffix
+        self._data_end = len(prefix) + stream.size
+        self.size = self._data_end + len(suffix)
+        self._pos = 0
+        self.error: Optional[Exception] = None
+
+    def read(self, size: int):
+        pos = self._pos
+        try:
+            if pos < len(self._prefix):
+                chunk = self._prefix[pos:pos + size]
+            elif pos < self._data_end:
+                self._reader.seek(pos - len(self._prefix))
+                chunk = self._reader.read(min(size, self._data_end - pos))
+            else:
+                chunk = self._suffix[pos - self._data_end:pos - self._data_end + size]
+        except (OSError, RuntimeError) as e:
+            self.error = e
+            return pycurl.READFUNC_ABORT
+        self._pos += len(chunk)
+        return chunk
+
+    def seek(self, offset: int, origin: int) -> int:
+        if origin != os.SEEK_SET or not 0 <= offset <= self.size:
+            return pycurl.SEEKFUNC_CANTSEEK
+        self._pos = offset
+        return pycurl.SEEKFUNC_OK
+
+    def close(self) -> None:
+        self._reader.close()
+
+
 class FileHostClient:
     """pycurl-based file host uploader with bandwidth tracking."""
 
@@ -69,7 +120,8 @@ class FileHostClient:
         session_cookies: Optional[Dict[str, str]] = None,
         session_token: Optional[str] = None,
         session_timestamp: Optional[float] = None,
-        proxy: Optional[ProxyEntry] = None
+        proxy: Optional[ProxyEntry] = None,
+        curl_pool: Optional[CurlHandlePool] = None
     ):
         """Initialize file host client.
 
@@ -83,6 +135,9 @@ class FileHostClient:
             session_token: Optional existing session token (sess_id) to reuse
             session_timestamp: Optional timestamp when session was created
             proxy: Optional proxy configuration to use for requests
+            curl_pool: Optional shared handle pool; when set, upload, delete,
+                user-info and generic requests reuse keep-alive handles
+                instead of opening a fresh connection each time
         """
         self.config = host_config
         self.bandwidth_counter = bandwidth_counter
@@ -90,6 +145,8 @@ class FileHostClient:
         self.host_id = host_id
         self._log_callback = log_callback
         self.proxy = proxy
+        self._curl_pool = curl_pool
+        self._pool_key = host_id or getattr(host_config, "name", "") or "default"
 
         # Load timeout settings from INI (overrides JSON defaults)
         if host_id:
@@ -167,6 +224,19 @@ class FileHostClient:
 
     _USER_AGENT = _CHROME_UA
 
+    def _new_curl(self) -> pycurl.Curl:
+        """Get a curl handle, reusing a pooled keep-alive handle when available."""
+        if self._curl_pool is not None:
+            return self._curl_pool.acquire(self._pool_key)
+        return pycurl.Curl()
+
+    def _done_curl(self, curl: pycurl.Curl) -> None:
+        """Release a handle obtained from ``_new_curl``."""
+        if self._curl_pool is not None:
+            self._curl_pool.release(self._pool_key, curl)
+        else:
+            curl.close()
+
     def _configure_ssl(self, curl):
         """Configure SSL/TLS certificate verification for a curl handle."""
         curl.setopt(pycurl.CAINFO, certifi.where())
@@ -192,6 +262,49 @@ class FileHostClient:
         """
         curl.setopt(pycurl.UPLOAD_BUFFERSIZE, self._UPLOAD_BUFFERSIZE)
 
+    def _setopt_streamed_form(self, curl: pycurl.Curl, headers: List[str], file_field: str,
+                              filename: str, stream, fields: List[Tuple[str, str]]) -> _StreamedUploadBody:
+        """Set up a multipart POST whose file part is read from ``stream``.
+
+        pycurl's HTTPPOST can only send files by path, so the form is framed
+        here: the file part first, then ``fields``, the same order HTTPPOST
+        uses.
+        """
+        boundary = "------------------------" + os.urandom(12).hex()
+        prefix = (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{_form_escape(file_field)}"; '
+            f'filename="{_form_escape(filename)}"\r\n'
+            'Content-Type: application/octet-stream\r\n\r\n'
+        ).encode('utf-8')
+        suffix = b"".join(
+            (
+                f'\r\n--{boundary}\r\n'
+                f'Content-Disposition: form-data; name="{_form_escape(key)}"\r\n\r\n'
+                f'{value}'
+            ).encode('utf-8')
+            for key, value in fields
+        ) + f'\r\n--{boundary}--\r\n'.encode('ascii')
+
+        body = _StreamedUploadBody(stream, prefix, suffix)
+        curl.setopt(pycurl.HTTPHEADER, headers + [f"Content-Type: multipart/form-data; boundary={boundary}"])
+        curl.setopt(pycurl.POST, 1)
+        curl.setopt(pycurl.POSTFIELDSIZE_LARGE, body.size)
+        return body
+
+    def _perform_streamed(self, curl: pycurl.Curl, body: _StreamedUploadBody) -> None:
+        """Run a transfer that reads its body from ``body``, then close it."""
+        curl.setopt(pycurl.READFUNCTION, body.read)
+        curl.setopt(pycurl.SEEKFUNCTION, body.seek)
+        try:
+            curl.perform()
+        except pycurl.error:
+            if body.error is not None:
+                raise body.error
+            raise
+        finally:
+            body.close()
+
     def _login_token_based(self, credentials: str) -> str:
         """Login to get authentication token.
 
@@ -465,11 +578,7 @@ class FileHostClient:
         Returns:
             MD5 hash as hex string
         """
-        md5_hash = hashlib.md5()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                md5_hash.update(chunk)
-        return md5_hash.hexdigest()
+        return hash_file(file_path, ('md5',))['md5']
 
     @staticmethod
     def fetch_md5_for_host(host_id: str, file_id: str, log_callback=None) -> Optional[str]:
@@ -487,13 +596,34 @@ class FileHostClient:
         Returns:
             MD5 hex string or None.
         """
+        return FileHostClient.fetch_md5s_for_host(host_id, [file_id], log_callback).get(file_id)
+
+    @staticmethod
+    def fetch_md5s_for_host(host_id: str, file_ids: List[str], log_callback=None) -> Dict[str, str]:
+        """Fetch server MD5s for several files on one K2S-family host.
+
+        Same as fetch_md5_for_host(), but asks for all file_ids in one
+        multi-ID ``getFilesInfo`` call.
+
+        Args:
+            host_id: Host identifier (e.g., "keep2share").
+            file_ids: File IDs on that host.
+            log_callback: Optional (message, level) logger.
+
+        Returns:
+            {file_id: md5} for the files whose MD5 is available; files that
+            are missing or have no MD5 yet are left out.
+        """
         from src.core.file_host_config import get_config_manager
         from src.utils.credentials import get_credential, decrypt_password
 
+        if not file_ids:
+            return {}
+
         mgr = get_config_manager()
         config = mgr.get_host(host_id)
         if not config or not config.upload_init_url:
-            return None
+            return {}
 
         # Load auth token
         encrypted = get_credential(f'file_host_{host_id}_credentials')
@@ -508,7 +638,7 @@ class FileHostClient:
         info_url = f"{api_base}/getFilesInfo"
         body = json.dumps({
             "access_token": auth_token,
-            "ids": [file_id],
+            "ids": list(file_ids),
             "extended_info": True,
         })
 
@@ -547,16 +677,16 @@ class FileHostClient:
             data = json.loads(buf.getvalue().decode('utf-8', errors='replace'))
         except (pycurl.error, json.JSONDecodeError) as e:
             if log_callback:
-                log_callback(f"getFilesInfo({host_id}) failed for {file_id}: {e}", "warning")
-            return None
+                log_callback(f"getFilesInfo({host_id}) failed for {', '.join(file_ids)}: {e}", "warning")
+            return {}
         finally:
             curl.close()
 
         files = data.get("files") or []
-        if not files:
-            return None
-        md5 = files[0].get("md5") or ""
-        return md5 or None
+        if len(file_ids) == 1 and len(files) == 1 and not files[0].get("id"):
+            files[0]["id"] = file_ids[0]
+        wanted = set(file_ids)
+        return {f["id"]: f["md5"] for f in files if f.get("id") in wanted and f.get("md5")}
 
     def _get_clean_filename(self, filename: str) -> str:
         """Extract clean filename without internal ID prefix.
@@ -858,6 +988,8 @@ class FileHostClient:
         if bytes_since_last > 0:
             self.bandwidth_counter.add(bytes_since_last)
             self.last_uploaded = uploaded
+            # Sleeps here while over the global or per-host upload limit
+            get_bandwidth_shaper().throttle(self.host_id, bytes_since_last, self.should_stop_func)
 
         # Calculate speed (bytes per second) - separate tracking to accumulate bytes correctly
         time_delta = current_time - self.last_time
@@ -883,7 +1015,9 @@ class FileHostClient:
         file_path: Path,
         on_progress: Optional[Callable[[int, int, float], None]] = None,
         should_stop: Optional[Callable[[], bool]] = None,
-        md5_hash: Optional[str] = None
+        md5_hash: Optional[str] = None,
+        stream=None,
+        file_hash: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Upload file to file host.
 
@@ -891,6 +1025,11 @@ class FileHostClient:
             file_path: Path to file to upload
             on_progress: Optional progress callback (uploaded_bytes, total_bytes, speed_bps)
             should_stop: Optional cancellation check callback
+            md5_hash: Pre-computed MD5 hash
+            stream: Optional StoredZipPart to send instead of reading file_path,
+                which then only supplies the filename
+            file_hash: MD5 of the bytes being sent, for hosts that require it
+                in the init request; computed here (one extra read) if omitted
 
         Returns:
             Dictionary with upload results
@@ -906,22 +1045,27 @@ class FileHostClient:
         self.current_speed_bps = 0.0
 
         if self._log_callback:
-            size_mb = file_path.stat().st_size / (1024 * 1024) if file_path.exists() else 0
-            md5_str = f" — MD5: {md5_hash}" if md5_hash else ""
+            if stream is not None:
+                size_mb = stream.size / (1024 * 1024)
+            else:
+                size_mb = file_path.stat().st_size / (1024 * 1024) if file_path.exists() else 0
+            md5_str = f" — MD5: {md5_hash or file_hash}" if md5_hash or file_hash else ""
             self._log_callback(f"Uploading {file_path.name} ({size_mb:.1f} MB){md5_str}", "info")
 
         # Handle multi-step uploads (like RapidGator) with automatic token retry
         if self.config.upload_init_url:
-            return self._with_token_retry(self._upload_multistep, file_path, md5_hash=md5_hash)
+            return self._with_token_retry(self._upload_multistep, file_path, md5_hash=md5_hash,
+                                          stream=stream, file_hash=file_hash)
 
         # Standard upload
-        return self._upload_standard(file_path)
+        return self._upload_standard(file_path, stream=stream)
 
-    def _upload_standard(self, file_path: Path) -> Dict[str, Any]:
+    def _upload_standard(self, file_path: Path, stream=None) -> Dict[str, Any]:
         """Perform standard single-step upload.
 
         Args:
             file_path: Path to file
+            stream: Optional StoredZipPart to send instead of the file
 
         Returns:
             Upload result dictionary
@@ -938,7 +1082,7 @@ class FileHostClient:
         if self.config.get_server:
             upload_url, server_sess_id = self._get_upload_server()
 
-        curl = pycurl.Curl()
+        curl = self._new_curl()
         self._configure_ssl(curl)
         self._configure_proxy(curl)
         self._configure_upload_performance(curl)
@@ -997,7 +1141,7 @@ class FileHostClient:
                     
                     if self._log_callback: self._log_callback(f"Visiting upload page to extract session ID: {upload_page_url}", "debug")
 
-                    page_curl = pycurl.Curl()
+                    page_curl = self._new_curl()
                     self._configure_ssl(page_curl)
                     self._configure_proxy(page_curl)
                     page_buffer = BytesIO()
@@ -1028,12 +1172,16 @@ class FileHostClient:
                         else:
                             if self._log_callback: self._log_callback("Could not extract session ID from upload page", "debug")
                     finally:
-                        page_curl.close()
+                        self._done_curl(page_curl)
 
             # Upload file
-            file_size = file_path.stat().st_size
-
-            if self.config.method == "PUT":
+            if self.config.method == "PUT" and stream is not None:
+                body = _StreamedUploadBody(stream)
+                curl.setopt(pycurl.UPLOAD, 1)
+                curl.setopt(pycurl.INFILESIZE_LARGE, body.size)
+                self._perform_streamed(curl, body)
+            elif self.config.method == "PUT":
+                file_size = file_path.stat().st_size
                 with open(file_path, 'rb') as f:
                     curl.setopt(pycurl.UPLOAD, 1)
                     curl.setopt(pycurl.READDATA, f)
@@ -1041,25 +1189,32 @@ class FileHostClient:
                     curl.perform()
             else:
                 # POST with multipart form data
-                # FORM_FILE must be filesystem-encoded bytes — pycurl's str
-                # path goes through PyUnicode_AsEncodedString(ascii, strict)
-                # and blows up on non-ASCII paths (e.g. unicode parent dirs).
-                form_fields = [
-                    (self.config.file_field, (
-                        pycurl.FORM_FILE, os.fsencode(str(file_path)),
-                        pycurl.FORM_FILENAME, self._get_clean_filename(file_path.name)
-                    )),
-                    *[(k, v) for k, v in self.config.extra_fields.items()]
-                ]
-                
+                fields = [(k, v) for k, v in self.config.extra_fields.items()]
+
                 # Add session ID if extracted (from upload page HTML or get_server API)
                 if sess_id:
-                    form_fields.append(('sess_id', sess_id))
+                    fields.append(('sess_id', sess_id))
                 elif server_sess_id:  # Katfile-style: sess_id from get_server API response
-                    form_fields.append(('sess_id', server_sess_id))
-                
-                curl.setopt(pycurl.HTTPPOST, form_fields)
-                curl.perform()
+                    fields.append(('sess_id', server_sess_id))
+
+                clean_name = self._get_clean_filename(file_path.name)
+                if stream is not None:
+                    body = self._setopt_streamed_form(
+                        curl, header_list, self.config.file_field, clean_name, stream, fields)
+                    self._perform_streamed(curl, body)
+                else:
+                    # FORM_FILE must be filesystem-encoded bytes — pycurl's str
+                    # path goes through PyUnicode_AsEncodedString(ascii, strict)
+                    # and blows up on non-ASCII paths (e.g. unicode parent dirs).
+                    form_fields = [
+                        (self.config.file_field, (
+                            pycurl.FORM_FILE, os.fsencode(str(file_path)),
+                            pycurl.FORM_FILENAME, clean_name
+                        )),
+                        *fields
+                    ]
+                    curl.setopt(pycurl.HTTPPOST, form_fields)
+                    curl.perform()
 
             response_code = curl.getinfo(pycurl.RESPONSE_CODE)
 
@@ -1070,7 +1225,7 @@ class FileHostClient:
             return self._parse_response(response_text, response_code)
 
         finally:
-            curl.close()
+            self._done_curl(curl)
 
     def try_create_by_hash(self, md5_hash: str, filename: str) -> Optional[Dict[str, Any]]:
         """Try to create a file by MD5 hash (K2S-family deduplication).
@@ -1104,7 +1259,7 @@ class FileHostClient:
             "access": _k2s_default_upload_access(),
         }).encode('utf-8')
 
-        curl = pycurl.Curl()
+        curl = self._new_curl()
         response_buffer = BytesIO()
         try:
             self._configure_ssl(curl)
@@ -1169,20 +1324,24 @@ class FileHostClient:
                 self._log_callback(f"createFileByHash network error: {e}", "warning")
             return None
         finally:
-            curl.close()
+            self._done_curl(curl)
 
-    def _upload_multistep(self, file_path: Path, md5_hash: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    def _upload_multistep(self, file_path: Path, md5_hash: Optional[str] = None,
+                          stream=None, file_hash: Optional[str] = None,
+                          **kwargs) -> Dict[str, Any]:
         """Perform multi-step upload (init → upload → poll).
 
         Args:
             file_path: Path to file
             md5_hash: Pre-computed MD5 hash (avoids recomputation)
+            stream: Optional StoredZipPart to send instead of the file
+            file_hash: MD5 of the bytes being sent (see upload_file)
             **kwargs: Additional arguments (including _retry_attempted flag)
 
         Returns:
             Upload result dictionary
         """
-        file_size = file_path.stat().st_size
+        file_size = stream.size if stream is not None else file_path.stat().st_size
 
         # Step 1: Ensure we have a file hash for hosts that embed it in the init
         # request (e.g. RapidGator). K2S-family hosts rewrite the file server-side,
@@ -1190,9 +1349,9 @@ class FileHostClient:
         # for those, the caller passes a sibling's server-side md5 (populated by
         # HostFamilyCoordinator's post-upload poller), and we use it to probe
         # createFileByHash before doing any real upload work.
-        file_hash = md5_hash
+        file_hash = file_hash or md5_hash
         if not file_hash and self.config.require_file_hash:
-            file_hash = self._calculate_file_hash(file_path)
+            file_hash = stream.md5() if stream is not None else self._calculate_file_hash(file_path)
             if self._log_callback:
                 self._log_callback(f"Calculated file hash for {file_path.name}: {file_hash}", "debug")
 
@@ -1220,7 +1379,7 @@ class FileHostClient:
         if not init_url:
             raise ValueError("upload_init_url not configured for multi-step upload")
 
-        curl = pycurl.Curl()
+        curl = self._new_curl()
         self._configure_ssl(curl)
 
         self._configure_proxy(curl)
@@ -1336,11 +1495,11 @@ class FileHostClient:
                 self._log_callback(f"Got upload ID for {file_path.name}: {upload_id}", "debug")
 
         finally:
-            curl.close()
+            self._done_curl(curl)
 
         # Step 3: Upload file
 
-        curl = pycurl.Curl()
+        curl = self._new_curl()
         self._configure_ssl(curl)
         self._configure_proxy(curl)
         self._configure_upload_performance(curl)
@@ -1372,22 +1531,26 @@ class FileHostClient:
             curl.setopt(pycurl.NOPROGRESS, False)
             curl.setopt(pycurl.XFERINFOFUNCTION, self._xferinfo_callback)
 
-            # Build form fields: file + form_data (ajax, params, signature for K2S)
-            # FORM_FILE must be filesystem-encoded bytes (see note above).
-            form_fields: List[Any] = [
-                (file_field, (
-                    pycurl.FORM_FILE, os.fsencode(str(file_path)),
-                    pycurl.FORM_FILENAME, self._get_clean_filename(file_path.name)
-                ))
-            ]
-
-            # Add form_data fields if present (K2S: ajax, params, signature)
-            for key, value in form_data.items():
-                form_fields.append((key, str(value)))
-
-            curl.setopt(pycurl.HTTPPOST, form_fields)
+            # Form data fields if present (K2S: ajax, params, signature)
+            fields = [(key, str(value)) for key, value in form_data.items()]
+            clean_name = self._get_clean_filename(file_path.name)
 
-            curl.perform()
+            if stream is not None:
+                body = self._setopt_streamed_form(
+                    curl, ["Expect:"], file_field, clean_name, stream, fields)
+                self._perform_streamed(curl, body)
+            else:
+                # Build form fields: file + form_data
+                # FORM_FILE must be filesystem-encoded bytes (see note above).
+                form_fields: List[Any] = [
+                    (file_field, (
+                        pycurl.FORM_FILE, os.fsencode(str(file_path)),
+                        pycurl.FORM_FILENAME, clean_name
+                    )),
+                    *fields
+                ]
+                curl.setopt(pycurl.HTTPPOST, form_fields)
+                curl.perform()
 
             response_code = curl.getinfo(pycurl.RESPONSE_CODE)
             if response_code not in [200, 201]:
@@ -1401,7 +1564,7 @@ class FileHostClient:
                 upload_data = {}
 
         finally:
-            curl.close()
+            self._done_curl(curl)
 
         # Step 4: Poll for completion
         if self.config.upload_poll_url:
@@ -1411,7 +1574,7 @@ class FileHostClient:
             poll_url = self.config.upload_poll_url.replace("{upload_id}", upload_id).replace("{token}", self.auth_token or "")
 
             for attempt in range(self.config.upload_poll_retries):
-                curl = pycurl.Curl()
+                curl = self._new_curl()
                 self._configure_ssl(curl)
 
                 self._configure_proxy(curl)
@@ -1471,7 +1634,7 @@ class FileHostClient:
                         time.sleep(self.config.upload_poll_delay)
 
                 finally:
-                    curl.close()
+                    self._done_curl(curl)
 
             # If we got here, polling timed out - log the last response
             if self._log_callback:
@@ -1524,7 +1687,7 @@ class FileHostClient:
         if "{token}" in get_server_url and self.auth_token:
             get_server_url = get_server_url.replace("{token}", self.auth_token)
 
-        curl = pycurl.Curl()
+        curl = self._new_curl()
         self._configure_ssl(curl)
 
         self._configure_proxy(curl)
@@ -1579,7 +1742,7 @@ class FileHostClient:
             return (server_url, sess_id)
 
         finally:
-            curl.close()
+            self._done_curl(curl)
 
     def _prepare_headers(self) -> Dict[str, str]:
         """Prepare HTTP headers.
@@ -1705,7 +1868,7 @@ class FileHostClient:
 
         def _delete_impl(**kwargs) -> Dict[str, Any]:
             """Core delete implementation (wrapped for retry)."""
-            curl = pycurl.Curl()
+            curl = self._new_curl()
             self._configure_ssl(curl)
 
             self._configure_proxy(curl)
@@ -1825,7 +1988,7 @@ class FileHostClient:
                 }
 
             finally:
-                curl.close()
+                self._done_curl(curl)
 
         # Wrap delete operation with automatic token refresh/retry
         return self._with_token_retry(_delete_impl)
@@ -1874,7 +2037,7 @@ class FileHostClient:
             else:
                 raise ValueError(f"Unsupported auth type for user info: {self.config.auth_type}")
 
-            curl = pycurl.Curl()
+            curl = self._new_curl()
             self._configure_ssl(curl)
 
             self._configure_proxy(curl)
@@ -1993,7 +2156,7 @@ class FileHostClient:
                 return result
 
             finally:
-                curl.close()
+                self._done_curl(curl)
 
         # Wrap user info operation with automatic token refresh/retry
         return self._with_token_retry(_get_user_info_impl)
@@ -2048,7 +2211,7 @@ class FileHostClient:
             ValueError: On 401/403 so _with_token_retry can trigger reauth.
         """
         def _request_impl(**kwargs) -> Tuple[int, Dict[str, str], bytes]:
-            curl = pycurl.Curl()
+            curl = self._new_curl()
             self._configure_ssl(curl)
             self._configure_proxy(curl)
             response_buffer = BytesIO()
@@ -2120,7 +2283,7 @@ class FileHostClient:
                 return status, response_headers, response_body
 
             finally:
-                curl.close()
+                self._done_curl(curl)
 
         return self._with_token_retry(_request_impl)
 
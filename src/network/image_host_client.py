@@ -67,6 +67,37 @@ class ImageHostClient(ABC):
         """
         return {}
 
+    def supports_multi_upload(self) -> bool:
+        """Whether this host can be driven by the engine's CurlMulti loop.
+
+        Hosts returning True must implement ``prepare_multi_upload`` and
+        ``finish_multi_upload``.
+        """
+        return False
+
+    def prepare_multi_upload(self, curl: Any, image_path: str,
+                             gallery_id: Optional[str] = None,
+                             thumbnail_size: int = 3,
+                             thumbnail_format: int = 2,
+                             progress_callback: Optional[Callable] = None,
+                             gallery_name: Optional[str] = None) -> Any:
+        """Configure ``curl`` for a single image upload without performing it.
+
+        Returns the response buffer the transfer writes into; the engine
+        hands it back to ``finish_multi_upload`` once the transfer ends.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multi upload")
+
+    def finish_multi_upload(self, curl: Any, response_buffer: Any, image_path: str,
+                            curl_error: Optional[tuple] = None) -> Dict[str, Any]:
+        """Turn a finished multi transfer into a normalized response dict.
+
+        ``curl_error`` is the ``(errno, message)`` pair reported by
+        ``CurlMulti.info_read`` for failed transfers. Raises on failure, just
+        like ``upload_image``.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multi upload")
+
     def supports_gallery_rename(self) -> bool:
         """Whether this host supports renaming galleries after creation."""
         return False
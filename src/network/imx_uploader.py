@@ -259,112 +259,159 @@ class ImxToUploader(ImageHostClient):
             log(f"Read {os.path.basename(image_path)} ({len(file_data)/1024/1024:.1f}MB) in {file_read_time:.3f}s", level="debug", category="fileio")
             self._first_read_logged = True
 
-        # Use pycurl for upload with real progress tracking
-        content_type = mimetypes.guess_type(image_path)[0] or 'application/octet-stream'
-
         try:
-            with self._upload_count_lock:
-                self._upload_count += 1
-
-            # Setup progress callback wrapper
-            callback_count = [0]  # Mutable to track in closure
-
-            def curl_progress_callback(download_total, downloaded, upload_total, uploaded):
-                callback_count[0] += 1
-
-                if progress_callback and upload_total > 0:
-                    try:
-                        progress_callback(int(uploaded), int(upload_total))
-                    except Exception:
-                        pass  # Silently ignore callback errors
-                return 0
-
             # Get or create thread-local curl handle (connection reuse)
             curl = self._get_thread_curl()
-
-            # Reset curl handle to clear previous settings (but keep connection alive)
-            curl.reset()
-            curl.setopt(pycurl.NOSIGNAL, 1)
-            curl.setopt(pycurl.CAINFO, certifi.where())
-            curl.setopt(pycurl.SSL_VERIFYPEER, 1)
-            curl.setopt(pycurl.SSL_VERIFYHOST, 2)
-            if self.proxy:
-                PyCurlProxyAdapter.configure_proxy(curl, self.proxy)
-
-            # NOTE: Cookies are cleared per-gallery (via clear_api_cookies()), NOT per-image.
-            # This maintains PHP session continuity within a single gallery upload.
-            # Clearing cookies here would break gallery_id association for subsequent images.
-
-            response_buffer = io.BytesIO()
-
-            # Set URL
-            curl.setopt(pycurl.URL, self.upload_url)
-
-            # Set headers
-            headers_list = [f'{k}: {v}' for k, v in self.headers.items()]
-            curl.setopt(pycurl.HTTPHEADER, headers_list)
-
-            # Prepare multipart form data
-            form_data = [
-                ('image', (
-                    pycurl.FORM_BUFFER, os.path.basename(image_path).replace('\u2014', '-').replace('\u2013', '-').encode('ascii', 'replace').decode('ascii'),
-                    pycurl.FORM_BUFFERPTR, file_data,
-                    pycurl.FORM_CONTENTTYPE, content_type
-                )),
-                ('format', 'all'),
-                ('thumbnail_size', str(thumbnail_size)),
-                ('thumbnail_format', str(thumbnail_format))
-            ]
-
-            if create_gallery:
-                form_data.append(('create_gallery', 'true'))
-            if gallery_id:
-                form_data.append(('gallery_id', gallery_id))
-
-            curl.setopt(pycurl.HTTPPOST, form_data)
-
-            # Set progress tracking
-            if progress_callback:
-                curl.setopt(pycurl.NOPROGRESS, 0)
-                curl.setopt(pycurl.XFERINFOFUNCTION, curl_progress_callback)
-
-            # Capture response
-            curl.setopt(pycurl.WRITEDATA, response_buffer)
-
-            # Set timeouts
-            curl.setopt(pycurl.CONNECTTIMEOUT, self.upload_connect_timeout)
-            curl.setopt(pycurl.TIMEOUT, self.upload_read_timeout)
+            response_buffer = self._configure_upload_curl(
+                curl, image_path, file_data,
+                create_gallery=create_gallery,
+                gallery_id=gallery_id,
+                thumbnail_size=thumbnail_size,
+                thumbnail_format=thumbnail_format,
+                progress_callback=progress_callback,
+            )
 
             # Perform upload
             curl.perform()
 
-            # Get response
-            status_code = curl.getinfo(pycurl.RESPONSE_CODE)
             # NOTE: Don't close curl handle - keep connection alive for reuse
-
-            if status_code == 200:
-                json_response = json.loads(response_buffer.getvalue())
-                # IMX API natively returns {status, data: {image_url, thumb_url, gallery_id}}
-                # Wrap through normalize_response() for standard contract compliance
-                data = json_response.get('data', {}) if isinstance(json_response.get('data'), dict) else {}
-                return self.normalize_response(
-                    status=json_response.get('status', 'error'),
-                    image_url=data.get('image_url', ''),
-                    thumb_url=data.get('thumb_url', ''),
-                    gallery_id=data.get('gallery_id'),
-                    original_filename=data.get('original_filename', os.path.basename(image_path)),
-                    bbcode=data.get('bbcode'),
-                )
-            else:
-                response_text = response_buffer.getvalue().decode('utf-8', errors='replace')
-                raise Exception(f"Upload failed with status code {status_code}: {response_text}")
+            return self._parse_upload_response(curl, response_buffer, image_path)
 
         except pycurl.error as e:
             # pycurl error codes: 28=timeout, 7=connection failed, etc.
             error_code, error_msg = e.args if len(e.args) == 2 else (0, str(e))
-            if error_code == 28:
-                raise Exception(f"Upload timeout (connect={self.upload_connect_timeout}s, read={self.upload_read_timeout}s): {error_msg}")
-            elif error_code == 7:
-                raise Exception(f"Connection error during upload: {error_msg}")
-            else:
-                raise Exception(f"Network error during upload (code {error_code}): {error_msg}")
+            raise Exception(self._describe_curl_error(error_code, error_msg))
+
+    def _configure_upload_curl(self, curl, image_path, file_data,
+                               create_gallery=False, gallery_id=None,
+                               thumbnail_size=3, thumbnail_format=2,
+                               progress_callback=None):
+        """Reset ``curl`` and set every option needed to POST one image.
+
+        Shared by the blocking ``upload_image`` path and the engine's
+        CurlMulti loop. Returns the buffer the response body is written to.
+        """
+        # Use pycurl for upload with real progress tracking
+        content_type = mimetypes.guess_type(image_path)[0] or 'application/octet-stream'
+
+        with self._upload_count_lock:
+            self._upload_count += 1
+
+        def curl_progress_callback(download_total, downloaded, upload_total, uploaded):
+            if progress_callback and upload_total > 0:
+                try:
+                    progress_callback(int(uploaded), int(upload_total))
+                except Exception:
+                    pass  # Silently ignore callback errors
+            return 0
+
+        # Reset curl handle to clear previous settings (but keep connection alive)
+        curl.reset()
+        curl.setopt(pycurl.NOSIGNAL, 1)
+        curl.setopt(pycurl.CAINFO, certifi.where())
+        curl.setopt(pycurl.SSL_VERIFYPEER, 1)
+        curl.setopt(pycurl.SSL_VERIFYHOST, 2)
+        if self.proxy:
+            PyCurlProxyAdapter.configure_proxy(curl, self.proxy)
+
+        # NOTE: Cookies are cleared per-gallery (via clear_api_cookies()), NOT per-image.
+        # This maintains PHP session continuity within a single gallery upload.
+        # Clearing cookies here would break gallery_id association for subsequent images.
+
+        response_buffer = io.BytesIO()
+
+        # Set URL
+        curl.setopt(pycurl.URL, self.upload_url)
+
+        # Set headers
+        headers_list = [f'{k}: {v}' for k, v in self.headers.items()]
+        curl.setopt(pycurl.HTTPHEADER, headers_list)
+
+        # Prepare multipart form data
+        form_data = [
+            ('image', (
+                pycurl.FORM_BUFFER, os.path.basename(image_path).replace('\u2014', '-').replace('\u2013', '-').encode('ascii', 'replace').decode('ascii'),
+                pycurl.FORM_BUFFERPTR, file_data,
+                pycurl.FORM_CONTENTTYPE, content_type
+            )),
+            ('format', 'all'),
+            ('thumbnail_size', str(thumbnail_size)),
+            ('thumbnail_format', str(thumbnail_format))
+        ]
+
+        if create_gallery:
+            form_data.append(('create_gallery', 'true'))
+        if gallery_id:
+            form_data.append(('gallery_id', gallery_id))
+
+        curl.setopt(pycurl.HTTPPOST, form_data)
+
+        # Set progress tracking
+        if progress_callback:
+            curl.setopt(pycurl.NOPROGRESS, 0)
+            curl.setopt(pycurl.XFERINFOFUNCTION, curl_progress_callback)
+
+        # Capture response
+        curl.setopt(pycurl.WRITEDATA, response_buffer)
+
+        # Set timeouts
+        curl.setopt(pycurl.CONNECTTIMEOUT, self.upload_connect_timeout)
+        curl.setopt(pycurl.TIMEOUT, self.upload_read_timeout)
+
+        return response_buffer
+
+    def _parse_upload_response(self, curl, response_buffer, image_path):
+        """Build the normalized response for a completed upload transfer."""
+        status_code = curl.getinfo(pycurl.RESPONSE_CODE)
+
+        if status_code == 200:
+            json_response = json.loads(response_buffer.getvalue())
+            # IMX API natively returns {status, data: {image_url, thumb_url, gallery_id}}
+            # Wrap through normalize_response() for standard contract compliance
+            data = json_response.get('data', {}) if isinstance(json_response.get('data'), dict) else {}
+            return self.normalize_response(
+                status=json_response.get('status', 'error'),
+                image_url=data.get('image_url', ''),
+                thumb_url=data.get('thumb_url', ''),
+                gallery_id=data.get('gallery_id'),
+                original_filename=data.get('original_filename', os.path.basename(image_path)),
+                bbcode=data.get('bbcode'),
+            )
+        else:
+            response_text = response_buffer.getvalue().decode('utf-8', errors='replace')
+            raise Exception(f"Upload failed with status code {status_code}: {response_text}")
+
+    def _describe_curl_error(self, error_code, error_msg):
+        """Map a libcurl error code to the message surfaced in failure details."""
+        if error_code == 28:
+            return f"Upload timeout (connect={self.upload_connect_timeout}s, read={self.upload_read_timeout}s): {error_msg}"
+        elif error_code == 7:
+            return f"Connection error during upload: {error_msg}"
+        return f"Network error during upload (code {error_code}): {error_msg}"
+
+    def supports_multi_upload(self) -> bool:
+        """IMX uploads are plain multipart POSTs and can share a CurlMulti loop."""
+        return True
+
+    def prepare_multi_upload(self, curl, image_path, gallery_id=None,
+                             thumbnail_size=3, thumbnail_format=2,
+                             progress_callback=None, gallery_name=None):
+        """Configure ``curl`` for an upload driven by the engine's CurlMulti loop."""
+        if not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image file not found: {image_path}")
+        with open(image_path, 'rb') as f:
+            file_data = f.read()
+        return self._configure_upload_curl(
+            curl, image_path, file_data,
+            gallery_id=gallery_id,
+            thumbnail_size=thumbnail_size,
+            thumbnail_format=thumbnail_format,
+            progress_callback=progress_callback,
+        )
+
+    def finish_multi_upload(self, curl, response_buffer, image_path, curl_error=None):
+        """Parse a transfer completed by the engine's CurlMulti loop."""
+        if curl_error:
+            error_code, error_msg = curl_error
+            raise Exception(self._describe_curl_error(error_code, error_msg))
+        return self._parse_upload_response(curl, response_buffer, image_path)
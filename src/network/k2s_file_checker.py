@@ -5,13 +5,29 @@ Supports batch checking up to 10,000 file IDs per call.
 """
 
 import json
+import threading
 import pycurl
 import certifi
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from io import BytesIO
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Mapping, Optional, Any
 
 from src.utils.logger import log
 
+# Folders listed concurrently by walk_folders()
+DEFAULT_WALK_WORKERS = 4
+
+
+@dataclass
+class FolderListing:
+    """One folder's contents from a walk_folders() pass."""
+    folder_id: str
+    parent_id: Optional[str]
+    subfolder_ids: List[str] = field(default_factory=list)
+    folders_ok: bool = True  # False if getFoldersList failed (subfolders unknown)
+    files: Optional[List[dict]] = None  # None if getFilesList failed
+
 
 class K2SFileChecker:
     """Checks file availability on K2S-family hosts via getFilesInfo API."""
@@ -65,65 +81,109 @@ class K2SFileChecker:
         finally:
             curl.close()
 
-    def get_all_files(self) -> list[dict]:
-        """Walk all folders recursively and return a flat list of all file dicts.
+    def walk_folders(
+        self,
+        max_workers: int = DEFAULT_WALK_WORKERS,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Iterator[FolderListing]:
+        """Walk the account's folder tree, listing up to max_workers folders at once.
+
+        Subfolders are queued as soon as their parent's getFoldersList returns,
+        so deep and wide trees are listed concurrently instead of one folder
+        after another. Listings are yielded in completion order.
 
-        Uses getFoldersList to enumerate folders and getFilesList to enumerate
-        files within each folder. Starts from the root ('/') and recurses into
-        every subfolder.
+        Args:
+            max_workers: Folders listed concurrently.
+            cancel_event: When set, queued folders are dropped and the walk ends.
+
+        Yields:
+            One FolderListing per folder, starting with the root ('/').
+        """
+        seen = {'/'}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                thread_name_prefix="k2s-walk") as executor:
+            pending = {executor.submit(self._list_folder, '/', None)}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        listing = future.result()
+                        if cancel_event is not None and cancel_event.is_set():
+                            return
+                        for subfolder_id in listing.subfolder_ids:
+                            # Guards against the API echoing a parent back as its own child
+                            if subfolder_id not in seen:
+                                seen.add(subfolder_id)
+                                pending.add(executor.submit(
+                                    self._list_folder, subfolder_id, listing.folder_id))
+                        yield listing
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def get_all_files(self, max_workers: int = DEFAULT_WALK_WORKERS) -> list[dict]:
+        """Walk all folders and return a flat list of all file dicts.
+
+        Args:
+            max_workers: Folders listed concurrently (see walk_folders()).
 
         Returns:
             Flat list of file dicts as returned by getFilesList, each containing
             at minimum: id, name, size, is_available, extended_info.
         """
         all_files: list[dict] = []
-        self._walk_folder('/', all_files)
+        for listing in self.walk_folders(max_workers=max_workers):
+            all_files.extend(listing.files or [])
         return all_files
 
-    def _walk_folder(self, folder_id: str, all_files: list[dict]) -> None:
-        """Recursively collect files from folder_id and all its subfolders.
+    def _list_folder(self, folder_id: str, parent_id: Optional[str]) -> FolderListing:
+        """List the subfolders and files of one folder.
 
         Args:
-            folder_id: Folder ID to walk ('/') for root.
-            all_files: Accumulator list to append file dicts into.
+            folder_id: Folder ID to list ('/') for root.
+            parent_id: Folder the walk reached folder_id from (None for root).
         """
+        listing = FolderListing(folder_id=folder_id, parent_id=parent_id)
+
         # Enumerate subfolders. The API expects 'parent_id' here (NOT 'parent' —
         # that gets silently ignored and returns the root listing, which causes
         # infinite recursion). Root is expressed as an empty body.
         body = {} if folder_id == '/' else {'parent_id': folder_id}
         try:
             resp = self._api_post('getFoldersList', body)
-            subfolder_ids: list[str] = resp.get('foldersIds', [])
+            listing.subfolder_ids = list(resp.get('foldersIds', []))
         except Exception as e:
             log(f"K2S getFoldersList failed for folder '{folder_id}': {e}", level="error", category="scanner")
-            subfolder_ids = []
+            listing.folders_ok = False
 
         # Enumerate files in this folder (skip root — root has no files directly).
         # Paginate with the API's max page size (1000); API rejects larger limits
         # with HTTP 406 "Params limit must be between 1 and 1000".
-        if folder_id != '/':
-            page_size = 1000
-            offset = 0
-            while True:
-                try:
-                    fresp = self._api_post('getFilesList', {
-                        'parent': folder_id,
-                        'limit': page_size,
-                        'offset': offset,
-                        'extended_info': True,
-                    })
-                except Exception as e:
-                    log(f"K2S getFilesList failed for folder '{folder_id}': {e}", level="error", category="scanner")
-                    break
-                page = fresp.get('files', [])
-                all_files.extend(page)
-                if len(page) < page_size:
-                    break
-                offset += page_size
-
-        # Recurse into subfolders
-        for subfolder_id in subfolder_ids:
-            self._walk_folder(subfolder_id, all_files)
+        if folder_id == '/':
+            listing.files = []
+            return listing
+
+        files: list[dict] = []
+        page_size = 1000
+        offset = 0
+        while True:
+            try:
+                fresp = self._api_post('getFilesList', {
+                    'parent': folder_id,
+                    'limit': page_size,
+                    'offset': offset,
+                    'extended_info': True,
+                })
+            except Exception as e:
+                log(f"K2S getFilesList failed for folder '{folder_id}': {e}", level="error", category="scanner")
+                return listing
+            page = fresp.get('files', [])
+            files.extend(page)
+            if len(page) < page_size:
+                break
+            offset += page_size
+        listing.files = files
+        return listing
 
     def calc_storage_used(self, files: list[dict]) -> int:
         """Sum sizes of files where extended_info.storage_object == 'available'.
@@ -144,16 +204,18 @@ class K2SFileChecker:
     def check_gallery_from_inventory(
         self,
         file_id_to_url: dict[str, str],
-        inventory: dict[str, dict],
+        inventory: Mapping[str, dict],
     ) -> dict[str, Any]:
-        """Check gallery availability from a pre-fetched inventory dict.
+        """Check gallery availability from a pre-fetched inventory.
 
-        Avoids making any API calls — uses the inventory built by get_all_files().
+        Avoids making any API calls — uses an inventory built by get_all_files()
+        or looked up from K2SInventoryCache.get_files().
 
         Args:
             file_id_to_url: Dict mapping file_id to its download URL.
-            inventory: Dict mapping file_id to file dict (keyed by 'id').
-                       Build from get_all_files() via {f['id']: f for f in files}.
+            inventory: Mapping of file_id to file dict (keyed by 'id'). Either
+                       {f['id']: f for f in get_all_files()} or the rows
+                       K2SInventoryCache.get_files() returns for these file IDs.
 
         Returns:
             Same shape as check_gallery():
@@ -201,7 +263,8 @@ class K2SFileChecker:
         }
 
     # ---------------------------------------------------------------------------
-    # DEPRECATED — kept for rollback only. Do not use in new code.
+    # getFilesInfo lookups. check_files() verifies IDs missing from a stored
+    # inventory; check_gallery() is DEPRECATED — kept for rollback only.
     # ---------------------------------------------------------------------------
 
     def _api_call(self, file_ids: List[str]) -> Dict[str, Any]:
@@ -250,9 +313,9 @@ class K2SFileChecker:
         Splits into batches of batch_size and calls the API for each batch.
         Files that fail to check (API error, missing from response) get None.
 
-        .. deprecated::
-            Use get_all_files() + check_gallery_from_inventory() instead.
-            Kept for rollback compatibility.
+        Scans check galleries with check_gallery_from_inventory(); this is
+        only used for the few IDs missing from a stored inventory (files
+        uploaded since it was last listed).
 
         Args:
             file_ids: List of K2S file IDs to check.
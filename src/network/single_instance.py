@@ -0,0 +1,28 @@
+"""
+Single instance handoff (client side).
+
+Kept free of Qt and app imports so a second launch can forward its folder
+to the running instance and exit before loading anything heavy. The
+server side is SingleInstanceServer in src.network.client.
+"""
+
+import socket
+
+from src.core.constants import COMMUNICATION_PORT
+
+
+def check_single_instance(folder_path=None, port=COMMUNICATION_PORT):
+    """Check if another instance is running and send folder if needed."""
+    try:
+        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client_socket.settimeout(1.0)
+        client_socket.connect(('127.0.0.1', port))  # Use IP, not 'localhost'
+
+        # Send folder path or empty string to bring window to front
+        message = folder_path if folder_path else ""
+        client_socket.send(message.encode('utf-8'))
+        client_socket.close()
+        return True  # Another instance is running
+    except Exception:
+        # Connection failed = no other instance running (expected on first launch)
+        return False
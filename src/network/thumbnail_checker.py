@@ -3,15 +3,90 @@
 Checks a gallery's thumbnail URLs to determine if images are still online
 on non-IMX image hosts. Uses the dead-image ETag catalog for detection
 since hosts return HTTP 200 with placeholder images for removed content.
+
+``check_gallery`` checks one gallery on a small thread pool.
+``check_galleries`` checks many galleries through one ``pycurl.CurlMulti``
+event loop: HEAD requests from every gallery share a handful of keep-alive
+(HTTP/2 multiplexed where the host supports it) connections, capped at a
+per-host connection budget, and each gallery's result is yielded as soon as
+its last thumbnail is answered. Only as many requests per host are handed to
+libcurl as that host can run at once (one per connection, or several streams
+per connection once it has answered over HTTP/2), so no request sits in
+libcurl's queue while its timeout runs.
 """
 
 import threading
+import time
+from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Hashable, Iterable, Iterator, List, Optional, Callable, Tuple
+from urllib.parse import urlsplit
 
-from src.network.dead_image_etags import check_thumbnail_head, EARLY_EXIT_THRESHOLD
+from src.network.dead_image_etags import (
+    check_thumbnail_head, classify_head_response, EARLY_EXIT_THRESHOLD,
+)
 from src.utils.logger import log
 
+# Requests kept in flight per allowed connection once a host has answered
+# over HTTP/2 (multiplexed as concurrent streams). Until then, and for
+# HTTP/1.1 hosts, it is one request per connection.
+STREAMS_PER_CONNECTION = 8
+
+# Per-request limits for the multiplexed checker (seconds)
+HEAD_TIMEOUT = 10
+CONNECT_TIMEOUT = 10
+
+
+def _gallery_status(online: int, offline: int, errors: int) -> str:
+    if online + offline + errors == 0:
+        return 'unknown'
+    if offline == 0 and errors == 0:
+        return 'online'
+    if online == 0:
+        return 'offline'
+    return 'partial'
+
+
+class _GalleryCheck:
+    """Bookkeeping for one gallery inside ``check_galleries``."""
+
+    __slots__ = ('key', 'total', 'remaining', 'outstanding', 'phase1_left',
+                 'online', 'offline', 'errors', 'checked', 'offline_urls')
+
+    def __init__(self, key: Hashable, thumb_urls: List[str], early_exit_threshold: int):
+        self.key = key
+        self.total = len(thumb_urls)
+        early_exit_threshold = max(0, early_exit_threshold)
+        self.remaining = thumb_urls[early_exit_threshold:]
+        # URLs queued or in flight
+        self.outstanding = 0
+        self.phase1_left = min(self.total, early_exit_threshold)
+        self.online = 0
+        self.offline = 0
+        self.errors = 0
+        self.checked = 0
+        self.offline_urls: List[str] = []
+
+    def record(self, url: str, status: str) -> None:
+        self.checked += 1
+        if status == 'online':
+            self.online += 1
+        elif status == 'offline':
+            self.offline += 1
+            self.offline_urls.append(url)
+        else:
+            self.errors += 1
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            'status': _gallery_status(self.online, self.offline, self.errors),
+            'online': self.online,
+            'offline': self.offline,
+            'errors': self.errors,
+            'total': self.total,
+            'offline_urls': self.offline_urls,
+        }
+
 
 class ThumbnailChecker:
     """Checks thumbnail URLs via HEAD requests with ETag-based dead-image detection.
@@ -25,6 +100,9 @@ class ThumbnailChecker:
 
     def __init__(self, max_workers: int = 4):
         self.max_workers = max_workers
+        # Throughput of the last check_galleries() run:
+        # {'checks', 'galleries', 'elapsed', 'checks_per_sec'}
+        self.last_stats: Dict[str, float] = {}
 
     def check_gallery(
         self,
@@ -103,22 +181,242 @@ class ThumbnailChecker:
                 for f in as_completed(futures):
                     f.result()
 
-        # Determine overall status
-        actual_total = online + offline + errors
-        if actual_total == 0:
-            status = 'unknown'
-        elif offline == 0 and errors == 0:
-            status = 'online'
-        elif online == 0:
-            status = 'offline'
-        else:
-            status = 'partial'
-
         return {
-            'status': status,
+            'status': _gallery_status(online, offline, errors),
             'online': online,
             'offline': offline,
             'errors': errors,
             'total': total,
             'offline_urls': offline_urls,
         }
+
+    def check_galleries(
+        self,
+        galleries: Iterable[Tuple[Hashable, List[str]]],
+        max_connections: int = 2,
+        early_exit_threshold: int = EARLY_EXIT_THRESHOLD,
+        cancel_event: Optional[threading.Event] = None,
+        progress_callback: Optional[Callable[[Hashable, int, int], None]] = None,
+    ) -> Iterator[Tuple[Hashable, Dict[str, Any]]]:
+        """Check many galleries at once through a single CurlMulti loop.
+
+        Runs on the calling thread. Galleries are pulled from ``galleries``
+        lazily, so HEADs for the next gallery start while the previous one is
+        still finishing. Per gallery the early-exit rule matches
+        check_gallery(): if the first ``early_exit_threshold`` thumbnails are
+        all offline the rest are counted offline without being requested.
+
+        Args:
+            galleries: (key, thumb_urls) pairs; ``key`` is echoed back.
+            max_connections: Connection budget per host name.
+            early_exit_threshold: If the first N thumbs are all offline, skip rest.
+            cancel_event: Optional event to signal cancellation. Galleries not
+                finished when it is set are not yielded.
+            progress_callback: Optional callback(key, checked_count, total_count).
+
+        Yields:
+            (key, result) in completion order; result has the same keys as
+            check_gallery()'s return value.
+        """
+        import pycurl
+
+        max_connections = max(1, int(max_connections))
+        # Requests in flight and allowed per host name; raised to
+        # STREAMS_PER_CONNECTION per connection once the host answers over HTTP/2
+        host_active: Dict[str, int] = defaultdict(int)
+        host_limit: Dict[str, int] = defaultdict(lambda: max_connections)
+        gallery_iter = iter(galleries)
+        exhausted = False
+        # (gallery, url) waiting for a handle; phase-2 URLs go to the front so
+        # galleries that passed early-exit finish before new ones start
+        ready: deque = deque()
+        finished: deque = deque()
+        checks = 0
+        gallery_count = 0
+        started = time.monotonic()
+
+        multi = pycurl.CurlMulti()
+        share = pycurl.CurlShare()
+        share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
+        share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
+        multi.setopt(pycurl.M_MAX_HOST_CONNECTIONS, max_connections)
+        try:
+            multi.setopt(pycurl.M_PIPELINING, pycurl.PIPE_MULTIPLEX)
+        except (AttributeError, pycurl.error):
+            pass  # libcurl without HTTP/2: plain keep-alive
+
+        idle_handles: List[Any] = []
+        all_handles: List[Any] = []
+        # curl handle -> (gallery, url, host, header state)
+        active: Dict[Any, Tuple[_GalleryCheck, str, str, Dict[str, Optional[str]]]] = {}
+
+        def cancelled() -> bool:
+            return bool(cancel_event and cancel_event.is_set())
+
+        def take_ready() -> Optional[Tuple[_GalleryCheck, str, str]]:
+            """Pop the first ready URL whose host has a free slot."""
+            for index, (gallery, url) in enumerate(ready):
+                host = urlsplit(url).hostname or ''
+                if host_active[host] < host_limit[host]:
+                    del ready[index]
+                    return gallery, url, host
+            return None
+
+        def admit_next() -> bool:
+            nonlocal exhausted, gallery_count
+            for key, thumb_urls in gallery_iter:
+                gallery_count += 1
+                thumb_urls = list(thumb_urls)
+                gallery = _GalleryCheck(key, thumb_urls, early_exit_threshold)
+                if gallery.total == 0:
+                    finished.append(gallery)
+                    continue
+                if gallery.phase1_left:
+                    first = thumb_urls[:early_exit_threshold]
+                else:
+                    first, gallery.remaining = gallery.remaining, []  # early exit disabled
+                ready.extend((gallery, url) for url in first)
+                gallery.outstanding = len(first)
+                return True
+            exhausted = True
+            return False
+
+        def start(gallery: _GalleryCheck, url: str, host: str) -> None:
+            if idle_handles:
+                curl = idle_handles.pop()
+            else:
+                curl = pycurl.Curl()
+                all_handles.append(curl)
+            headers: Dict[str, Optional[str]] = {'etag': None}
+
+            def on_header(line: bytes) -> None:
+                text = line.decode('iso-8859-1')
+                if text.startswith('HTTP/'):
+                    headers['etag'] = None  # new response after a redirect
+                elif text[:5].lower() == 'etag:':
+                    headers['etag'] = text[5:].strip()
+
+            curl.setopt(pycurl.URL, url)
+            curl.setopt(pycurl.NOBODY, 1)
+            curl.setopt(pycurl.FOLLOWLOCATION, 1)
+            curl.setopt(pycurl.MAXREDIRS, 5)
+            curl.setopt(pycurl.TIMEOUT, HEAD_TIMEOUT)
+            curl.setopt(pycurl.CONNECTTIMEOUT, CONNECT_TIMEOUT)
+            curl.setopt(pycurl.NOSIGNAL, 1)
+            curl.setopt(pycurl.HEADERFUNCTION, on_header)
+            curl.setopt(pycurl.SHARE, share)
+            try:
+                curl.setopt(pycurl.HTTP_VERSION, pycurl.CURL_HTTP_VERSION_2TLS)
+                # Wait for an existing connection to offer a stream rather
+                # than opening another one
+                curl.setopt(pycurl.PIPEWAIT, 1)
+            except (AttributeError, pycurl.error):
+                pass
+            multi.add_handle(curl)
+            active[curl] = (gallery, url, host, headers)
+            host_active[host] += 1
+
+        def complete(gallery: _GalleryCheck) -> None:
+            if gallery.phase1_left == 0 and gallery.outstanding == 0 and not gallery.remaining:
+                finished.append(gallery)
+
+        def finish(curl: Any, error: Optional[str]) -> None:
+            nonlocal checks
+            multi.remove_handle(curl)
+            gallery, url, host, headers = active.pop(curl)
+            host_active[host] -= 1
+            if error is None:
+                status = classify_head_response(url, curl.getinfo(pycurl.RESPONSE_CODE), headers['etag'])['status']
+                try:
+                    if curl.getinfo(pycurl.INFO_HTTP_VERSION) >= pycurl.CURL_HTTP_VERSION_2_0:
+                        host_limit[host] = max_connections * STREAMS_PER_CONNECTION
+                except (AttributeError, pycurl.error):
+                    pass
+            else:
+                status = 'error'
+            curl.unsetopt(pycurl.SHARE)
+            curl.reset()
+            idle_handles.append(curl)
+
+            checks += 1
+            gallery.outstanding -= 1
+            gallery.record(url, status)
+            if progress_callback:
+                progress_callback(gallery.key, gallery.checked, gallery.total)
+
+            if gallery.phase1_left:
+                gallery.phase1_left -= 1
+                if gallery.phase1_left == 0 and gallery.remaining:
+                    if gallery.online == 0:
+                        log(f"Early-exit: first {gallery.checked} thumbnails all offline, "
+                            f"skipping remaining {len(gallery.remaining)}",
+                            level="debug", category="scanner")
+                        gallery.offline += len(gallery.remaining)
+                        gallery.remaining = []
+                        if progress_callback:
+                            progress_callback(gallery.key, gallery.total, gallery.total)
+                    else:
+                        ready.extendleft((gallery, u) for u in reversed(gallery.remaining))
+                        gallery.outstanding += len(gallery.remaining)
+                        gallery.remaining = []
+            complete(gallery)
+
+        try:
+            while True:
+                if cancelled():
+                    break
+                while True:
+                    item = take_ready()
+                    if item is None:
+                        # Admit another gallery only once every queued URL has started
+                        if ready or exhausted or not admit_next():
+                            break
+                        continue
+                    start(*item)
+                while finished:
+                    gallery = finished.popleft()
+                    yield gallery.key, gallery.result()
+                if not active:
+                    if exhausted and not ready:
+                        break
+                    continue
+
+                while True:
+                    ret, _ = multi.perform()
+                    if ret != pycurl.E_CALL_MULTI_PERFORM:
+                        break
+                completed = 0
+                while True:
+                    queued, succeeded, failed = multi.info_read()
+                    for curl in succeeded:
+                        finish(curl, None)
+                    for curl, _errno, errmsg in failed:
+                        finish(curl, errmsg)
+                    completed += len(succeeded) + len(failed)
+                    if not queued:
+                        break
+                # Refill and report before waiting if anything finished
+                if not completed:
+                    multi.select(1.0)
+        finally:
+            for curl in list(active):
+                try:
+                    multi.remove_handle(curl)
+                except pycurl.error:
+                    pass
+            for curl in all_handles:
+                curl.close()
+            multi.close()
+            share.close()
+
+            elapsed = time.monotonic() - started
+            self.last_stats = {
+                'checks': checks,
+                'galleries': gallery_count,
+                'elapsed': elapsed,
+                'checks_per_sec': checks / elapsed if elapsed > 0 else 0.0,
+            }
+            if checks:
+                log(f"Thumbnail check: {checks} HEADs over {gallery_count} galleries in {elapsed:.1f}s "
+                    f"({self.last_stats['checks_per_sec']:.1f} checks/sec, {max_connections} connections)",
+                    level="info", category="scanner")
@@ -6,6 +6,7 @@ after upload completion and for regenerating BBCode when templates change.
 
 Classes:
     CompletionWorker: Background thread for post-upload artifact processing
+    ArtifactRegenWorker: Background thread for batch BBCode regeneration
     ArtifactHandler: Manager for BBCode regeneration and artifact operations
 
 Thread Safety:
@@ -16,12 +17,14 @@ Thread Safety:
 import os
 import json
 import queue
+import threading
 from queue import Queue
 from datetime import datetime
 
-from PyQt6.QtCore import QThread, QTimer, pyqtSignal, QObject
-from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal, QObject, Qt
+from PyQt6.QtWidgets import QMessageBox, QProgressDialog
 
+from src.processing.artifact_regeneration import RegenJob, regenerate_artifacts, results_from_artifact
 from src.utils.logger import log
 
 
@@ -231,6 +234,36 @@ class CompletionWorker(QThread):
             log(f"Background completion processing error: {e}", level="error", category="fileio")
 
 
+class ArtifactRegenWorker(QThread):
+    """Background thread running a batch artifact regeneration.
+
+    Signals:
+        progress(int, int): (done, total) as each gallery finishes
+        regen_finished(object): RegenSummary once the batch completes
+    """
+
+    progress = pyqtSignal(int, int)
+    regen_finished = pyqtSignal(object)
+
+    def __init__(self, store, jobs, parent=None):
+        super().__init__(parent)
+        self._store = store
+        self._jobs = jobs
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def run(self):
+        summary = regenerate_artifacts(
+            self._store,
+            self._jobs,
+            progress_callback=lambda done, total, _path: self.progress.emit(done, total),
+            cancel_event=self._cancel_event,
+        )
+        self.regen_finished.emit(summary)
+
+
 class ArtifactHandler(QObject):
     """Manager for BBCode regeneration and artifact operations.
 
@@ -261,6 +294,7 @@ class ArtifactHandler(QObject):
         self._db_id_to_path = db_id_to_path
         self._parent_widget = parent_widget
         self._pending_regen_timers: dict[int, QTimer] = {}
+        self._regen_worker = None
 
     def regenerate_bbcode_for_gallery(self, gallery_path: str, force: bool = False):
         """Regenerate BBCode for a gallery using its current template.
@@ -287,37 +321,96 @@ class ArtifactHandler(QObject):
     def regenerate_bbcode_for_gallery_multi(self, paths):
         """Regenerate BBCode for multiple completed galleries using their current templates.
 
+        Runs as one batch on an ArtifactRegenWorker thread with a progress
+        dialog; a summary message is shown when it finishes.
+
         Args:
             paths: List of gallery paths to regenerate
         """
-        success_count = 0
-        error_count = 0
+        if self._regen_worker is not None and self._regen_worker.isRunning():
+            log("BBCode regeneration already running", level="info", category="fileio")
+            return
 
+        jobs = []
         for path in paths:
-            try:
-                item = self._queue_manager.get_item(path)
-                if not item or item.status != "completed":
-                    continue
-
-                # Get template for this gallery
-                template_name = item.template_name if item.template_name else "default"
+            item = self._queue_manager.get_item(path)
+            if not item or item.status != "completed":
+                continue
+            # Get template for this gallery
+            jobs.append(self._regen_job_for_item(path, item, item.template_name or "default"))
 
-                # Call the existing regeneration method
-                self.regenerate_gallery_bbcode(path, template_name)
-                success_count += 1
+        if not jobs:
+            QMessageBox.information(self._parent_widget, "No Action", "No completed galleries found to regenerate.")
+            return
 
-            except Exception as e:
-                error_count += 1
-                log(f"Error regenerating BBCode for {path}: {e}", category="fileio", level="warning")
-
-        # Show summary message
-        if success_count > 0 or error_count > 0:
-            if error_count == 0:
-                QMessageBox.information(self._parent_widget, "Success", f"Regenerated BBCode for {success_count} galleries.")
-            else:
-                QMessageBox.warning(self._parent_widget, "Partial Failure", f"Regenerated {success_count}, failed {error_count}")
+        progress = QProgressDialog("Regenerating BBCode...", "Cancel", 0, len(jobs), self._parent_widget)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.setValue(0)
+
+        worker = ArtifactRegenWorker(self._queue_manager.store, jobs)
+        worker.progress.connect(lambda done, _total: progress.setValue(done))
+        progress.canceled.connect(worker.cancel)
+        worker.regen_finished.connect(lambda summary: self._on_regen_finished(summary, progress))
+        self._regen_worker = worker
+        worker.start()
+
+    def _on_regen_finished(self, summary, progress):
+        """Close the progress dialog, notify forum tracking and show the summary."""
+        progress.close()
+        self._regen_worker = None
+
+        for job in summary.regenerated:
+            self._emit_manual_rerender(job.db_id)
+        for job, error in summary.failed:
+            log(f"Error regenerating BBCode for {job.path}: {error}", category="fileio", level="warning")
+
+        success_count = len(summary.regenerated)
+        error_count = len(summary.failed)
+        if error_count == 0:
+            QMessageBox.information(self._parent_widget, "Success", f"Regenerated BBCode for {success_count} galleries.")
         else:
-            QMessageBox.information(self._parent_widget, "No Action", "No completed galleries found to regenerate.")
+            QMessageBox.warning(self._parent_widget, "Partial Failure", f"Regenerated {success_count}, failed {error_count}")
+
+    @staticmethod
+    def _regen_job_for_item(gallery_path, item, template_name) -> RegenJob:
+        """Describe a queue item for artifact regeneration."""
+        gallery_id = getattr(item, 'gallery_id', None)
+        if not gallery_id:
+            # Video items (and hosts that don't return gallery_id) use filename as fallback,
+            # matching the same logic in save_gallery_artifacts
+            gallery_id = os.path.splitext(os.path.basename(gallery_path))[0]
+        db_id = getattr(item, 'db_id', None)
+        return RegenJob(
+            path=gallery_path,
+            template_name=template_name,
+            # Use current gallery name from database (which could be renamed), not from old JSON
+            gallery_name=item.name or '',
+            gallery_id=gallery_id,
+            custom_fields={
+                'custom1': getattr(item, 'custom1', ''),
+                'custom2': getattr(item, 'custom2', ''),
+                'custom3': getattr(item, 'custom3', ''),
+                'custom4': getattr(item, 'custom4', ''),
+                'ext1': getattr(item, 'ext1', ''),
+                'ext2': getattr(item, 'ext2', ''),
+                'ext3': getattr(item, 'ext3', ''),
+                'ext4': getattr(item, 'ext4', '')
+            },
+            db_id=int(db_id) if db_id else None,
+        )
+
+    @staticmethod
+    def _emit_manual_rerender(db_id):
+        """Notify forum-posting hub so any tracked forum_post can be stale-flagged."""
+        if not db_id:
+            return
+        try:
+            from src.utils.forum_signals import emit_manual_rerender
+            emit_manual_rerender(int(db_id))
+        except Exception as e:
+            log(f"forum: manual_rerender emit failed: {e}",
+                level="warning", category="forum")
 
     def regenerate_gallery_bbcode(self, gallery_path, new_template):
         """Regenerate BBCode for an uploaded gallery using its JSON artifact.
@@ -339,15 +432,10 @@ class ArtifactHandler(QObject):
         # Find JSON artifact file by gallery ID
         from src.utils.artifact_finder import find_gallery_json_by_id
 
-        gallery_id = getattr(item, 'gallery_id', None)
-        if not gallery_id:
-            # Video items (and hosts that don't return gallery_id) use filename as fallback,
-            # matching the same logic in save_gallery_artifacts
-            gallery_id = os.path.splitext(os.path.basename(gallery_path))[0]
-
-        json_path = find_gallery_json_by_id(gallery_id, gallery_path)
+        job = self._regen_job_for_item(gallery_path, item, new_template)
+        json_path = find_gallery_json_by_id(job.gallery_id, gallery_path)
         if not json_path:
-            log(f"No JSON artifact file found for gallery ID {gallery_id}", level="warning", category="artifact")
+            log(f"No JSON artifact file found for gallery ID {job.gallery_id}", level="warning", category="artifact")
             return
 
         # Load JSON data
@@ -356,65 +444,20 @@ class ArtifactHandler(QObject):
 
         # Debug: Log the stats section from JSON to diagnose 0x0 dimension issues
         stats = json_data.get('stats', {})
-        avg_width = stats.get('avg_width', 0)
-        avg_height = stats.get('avg_height', 0)
-        if avg_width == 0 or avg_height == 0:
+        if stats.get('avg_width', 0) == 0 or stats.get('avg_height', 0) == 0:
             log(f"Dimensions are 0 for gallery regeneration. "
                 f"JSON path: {json_path}, stats section: {stats}", category="fileio")
 
         # Reuse existing save_gallery_artifacts function with the new template
         # It will handle BBCode generation, file saving, and JSON updates
-        # Use current gallery name from database (which could be renamed), not from old JSON
-        current_gallery_name = item.name if item.name else json_data['meta']['gallery_name']
-        results = {
-            'gallery_id': json_data['meta']['gallery_id'],
-            'gallery_name': current_gallery_name,
-            'images': json_data.get('images', []),
-            'total_size': stats.get('total_size', 0),
-            'successful_count': stats.get('successful_count', 0),
-            'failed_count': stats.get('failed_count', 0),
-            'failed_details': [(img.get('filename', ''), 'Previous failure') for img in json_data.get('failures', [])],
-            'avg_width': avg_width,
-            'avg_height': avg_height,
-            'max_width': stats.get('max_width', 0),
-            'max_height': stats.get('max_height', 0),
-            'min_width': stats.get('min_width', 0),
-            'min_height': stats.get('min_height', 0),
-            # Preserve video fields so Video template renders correctly on regeneration
-            'media_type': json_data['meta'].get('media_type', 'image'),
-            'video_metadata': json_data.get('video_metadata') or {},
-            'video_details_template': json_data.get('settings', {}).get('video_details_template', ''),
-        }
-
-        # Prepare custom fields dict from the item
-        custom_fields = {
-            'custom1': getattr(item, 'custom1', ''),
-            'custom2': getattr(item, 'custom2', ''),
-            'custom3': getattr(item, 'custom3', ''),
-            'custom4': getattr(item, 'custom4', ''),
-            'ext1': getattr(item, 'ext1', ''),
-            'ext2': getattr(item, 'ext2', ''),
-            'ext3': getattr(item, 'ext3', ''),
-            'ext4': getattr(item, 'ext4', '')
-        }
-
-        # Use existing save_gallery_artifacts function to regenerate with new template
         save_gallery_artifacts(
             folder_path=gallery_path,
-            results=results,
+            results=results_from_artifact(json_data, job.gallery_name),
             template_name=new_template,
-            custom_fields=custom_fields
+            custom_fields=job.custom_fields
         )
 
-        # Notify forum-posting hub so any tracked forum_post can be stale-flagged
-        db_id = getattr(item, 'db_id', None)
-        if db_id:
-            try:
-                from src.utils.forum_signals import emit_manual_rerender
-                emit_manual_rerender(int(db_id))
-            except Exception as e:
-                log(f"forum: manual_rerender emit failed: {e}",
-                    level="warning", category="forum")
+        self._emit_manual_rerender(job.db_id)
 
     def should_auto_regenerate_bbcode(self, path: str) -> bool:
         """Check if BBCode should be auto-regenerated for a gallery.
@@ -464,12 +507,17 @@ class ArtifactHandler(QObject):
         """Stop and clear any pending debounced regen timers.
 
         Called from the shutdown path so a pending timer can't fire
-        during teardown and touch a half-dismantled queue manager.
+        during teardown and touch a half-dismantled queue manager. A running
+        batch regeneration is cancelled and waited for.
         """
         for timer in self._pending_regen_timers.values():
             timer.stop()
             timer.deleteLater()
         self._pending_regen_timers.clear()
+        if self._regen_worker is not None:
+            self._regen_worker.cancel()
+            self._regen_worker.wait()
+            self._regen_worker = None
 
     def _run_auto_regen(self, db_id: int):
         """Execute the deferred regen after the debounce window elapses."""
@@ -0,0 +1,234 @@
+"""Batch BBCode/JSON artifact regeneration for completed galleries.
+
+Regenerating galleries one at a time opens a QueueStore, queries file host
+uploads twice and rescans the template directory per gallery.
+regenerate_artifacts() takes the whole set at once:
+
+1. JSON artifacts are located and loaded on a worker pool
+2. File host uploads, image URLs (for galleries with no JSON artifact) and
+   stored image dimensions are fetched in a few set-based queries
+3. Each distinct template is compiled once, then BBCode/JSON files are
+   rendered and written on the worker pool, reporting progress per gallery
+
+This module has no Qt dependency; ArtifactHandler runs it on a QThread.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.logger import log
+
+# Worker threads for artifact loading and writing
+DEFAULT_REGEN_WORKERS = 4
+
+# Called with (done, total, gallery_path) as each gallery finishes, on the
+# thread that called regenerate_artifacts()
+ProgressCallback = Callable[[int, int, str], None]
+
+
+@dataclass
+class RegenJob:
+    """One gallery to regenerate, described from its queue item."""
+    path: str
+    template_name: str = "default"
+    gallery_name: str = ""  # Current (possibly renamed) name; falls back to the artifact's
+    gallery_id: str = ""
+    custom_fields: Dict[str, str] = field(default_factory=dict)
+    db_id: Optional[int] = None
+
+
+@dataclass
+class RegenSummary:
+    """Outcome of a regenerate_artifacts() run."""
+    regenerated: List[RegenJob] = field(default_factory=list)
+    skipped: List[RegenJob] = field(default_factory=list)  # No JSON artifact and no image URLs
+    failed: List[Tuple[RegenJob, str]] = field(default_factory=list)
+    cancelled: bool = False
+
+
+def results_from_artifact(json_data: Dict[str, Any], gallery_name: str = "") -> Dict[str, Any]:
+    """Rebuild the save_gallery_artifacts() results dict from a JSON artifact.
+
+    Args:
+        json_data: Parsed JSON artifact written by save_gallery_artifacts
+        gallery_name: Current gallery name from the database (could be renamed);
+            the artifact's name is used when empty
+    """
+    stats = json_data.get('stats', {})
+    meta = json_data['meta']
+    return {
+        'gallery_id': meta['gallery_id'],
+        'gallery_name': gallery_name or meta['gallery_name'],
+        'images': json_data.get('images', []),
+        'total_size': stats.get('total_size', 0),
+        'successful_count': stats.get('successful_count', 0),
+        'failed_count': stats.get('failed_count', 0),
+        'failed_details': [(img.get('filename', ''), 'Previous failure') for img in json_data.get('failures', [])],
+        'avg_width': stats.get('avg_width', 0),
+        'avg_height': stats.get('avg_height', 0),
+        'max_width': stats.get('max_width', 0),
+        'max_height': stats.get('max_height', 0),
+        'min_width': stats.get('min_width', 0),
+        'min_height': stats.get('min_height', 0),
+        # Preserve video fields so Video template renders correctly on regeneration
+        'media_type': meta.get('media_type', 'image'),
+        'video_metadata': json_data.get('video_metadata') or {},
+        'video_details_template': json_data.get('settings', {}).get('video_details_template', ''),
+    }
+
+
+def _results_from_images(job: RegenJob, images: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Minimal results dict for a gallery whose JSON artifact is missing."""
+    return {
+        'gallery_id': job.gallery_id,
+        'gallery_name': job.gallery_name,
+        'images': [
+            {'original_filename': img['filename'], 'image_url': img['url'], 'thumb_url': img.get('thumb_url', '')}
+            for img in images
+        ],
+        'successful_count': len(images),
+    }
+
+
+def _load_artifact(job: RegenJob) -> Optional[Dict[str, Any]]:
+    """Find and parse a gallery's JSON artifact; None if it has none."""
+    from src.utils.artifact_finder import find_gallery_json_by_id
+
+    gallery_id = job.gallery_id or os.path.splitext(os.path.basename(job.path))[0]
+    json_path = find_gallery_json_by_id(gallery_id, job.path)
+    if not json_path:
+        return None
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return results_from_artifact(json.load(f), job.gallery_name)
+
+
+def regenerate_artifacts(
+    store,
+    jobs: List[RegenJob],
+    max_workers: int = DEFAULT_REGEN_WORKERS,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+    store_in_uploaded: Optional[bool] = None,
+    store_in_central: Optional[bool] = None,
+) -> RegenSummary:
+    """Regenerate BBCode and JSON artifacts for many galleries.
+
+    Args:
+        store: QueueStore used for the batch lookups
+        jobs: Galleries to regenerate
+        max_workers: Worker threads for loading and writing artifacts
+        progress_callback: Called as each gallery finishes
+        cancel_event: When set, galleries not yet started are left untouched
+        store_in_uploaded/store_in_central: Storage overrides; when None the
+            user defaults are read once for the whole batch
+
+    Returns:
+        RegenSummary listing regenerated, skipped and failed galleries
+    """
+    from src.utils.paths import load_user_defaults
+    from src.utils.templates import get_compiled_template, load_post_titles, save_gallery_artifacts
+
+    summary = RegenSummary()
+    jobs = list(jobs)
+    if not jobs:
+        return summary
+    max_workers = max(1, min(max_workers, len(jobs)))
+
+    # Phase 1: JSON artifacts (glob + parse per gallery)
+    loaded: Dict[str, Optional[Dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact-load") as executor:
+        futures = {executor.submit(_load_artifact, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                loaded[job.path] = future.result()
+            except Exception as e:
+                loaded[job.path] = None
+                summary.failed.append((job, f"Could not read JSON artifact: {e}"))
+
+    failed_paths = {job.path for job, _ in summary.failed}
+    jobs = [job for job in jobs if job.path not in failed_paths]
+
+    # Phase 2: set-based lookups shared by the whole batch
+    paths = [job.path for job in jobs]
+    uploads_by_path = store.get_all_file_host_uploads_batch(paths)
+    image_urls = store.get_image_urls_for_galleries(
+        [p for p in paths if loaded.get(p) is None], include_thumbs=True
+    )
+    dimensions = store.get_image_dimensions_for_galleries([
+        p for p in paths
+        if not loaded.get(p) or not loaded[p].get('avg_width') or not loaded[p].get('avg_height')
+    ])
+
+    post_titles = load_post_titles()
+    templates = {}
+    for name in {job.template_name for job in jobs}:
+        templates[name] = get_compiled_template(name)
+        if templates[name] is None:
+            log(f"Template '{name}' not found, using default", level="warning", category="template")
+            templates[name] = get_compiled_template("default")
+
+    if store_in_uploaded is None or store_in_central is None:
+        defaults = load_user_defaults()
+        if store_in_uploaded is None:
+            store_in_uploaded = defaults.get('store_in_uploaded', True)
+        if store_in_central is None:
+            store_in_central = defaults.get('store_in_central', True)
+
+    # Phase 3: render and write
+    def regenerate_one(job: RegenJob) -> Optional[bool]:
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        results = loaded.get(job.path)
+        if results is None:
+            images = image_urls.get(job.path)
+            if not images:
+                log(f"No JSON artifact or image URLs for {job.path}, skipping",
+                    level="warning", category="artifact")
+                return False
+            results = _results_from_images(job, images)
+        dims = dimensions.get(job.path)
+        if dims and (not results.get('avg_width') or not results.get('avg_height')):
+            results = {**results, **dims}
+        save_gallery_artifacts(
+            folder_path=job.path,
+            results=results,
+            template_name=job.template_name,
+            store_in_uploaded=store_in_uploaded,
+            store_in_central=store_in_central,
+            custom_fields=job.custom_fields,
+            file_host_uploads=uploads_by_path.get(job.path, []),
+            post_titles=post_titles,
+            compiled_template=templates[job.template_name],
+        )
+        return True
+
+    total = len(jobs)
+    done = 0
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact-regen") as executor:
+        futures = {executor.submit(regenerate_one, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                log(f"Error regenerating artifacts for {job.path}: {e}", level="warning", category="artifact")
+                summary.failed.append((job, str(e)))
+            else:
+                if outcome is None:
+                    summary.cancelled = True
+                    continue
+                (summary.regenerated if outcome else summary.skipped).append(job)
+            done += 1
+            if progress_callback:
+                progress_callback(done, total, job.path)
+
+    log(f"Regenerated artifacts for {len(summary.regenerated)} galleries "
+        f"({len(summary.skipped)} skipped, {len(summary.failed)} failed"
+        f"{', cancelled' if summary.cancelled else ''})",
+        level="info", category="artifact")
+    return summary
@@ -10,6 +10,7 @@ from typing import Dict, Optional, List, Set
 from contextlib import contextmanager
 
 from src.utils.logger import log
+from src.storage.work_signal import get_file_host_work_signal
 
 
 class FileHostCoordinator:
@@ -140,6 +141,9 @@ class FileHostCoordinator:
             with self.active_uploads_lock:
                 self.active_uploads.discard(upload_key)
 
+            # A global slot is free: wake every idle host worker
+            get_file_host_work_signal().notify()
+
             log(
                 f"Released upload slots for {host_name} (gallery {gallery_id})",
                 level="debug",
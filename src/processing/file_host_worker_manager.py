@@ -217,7 +217,7 @@ class FileHostWorkerManager(QObject):
         Called at application shutdown.
         """
         # Always cancel any in-flight md5 pollers first, even if there are no
-        # workers left — the coordinator's Timers outlive individual workers.
+        # workers left — the coordinator's pollers outlive individual workers.
         self.family_coordinator.shutdown()
 
         if not self.workers:
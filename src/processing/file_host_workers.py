@@ -7,10 +7,9 @@ upload to hosts, and emit progress signals to the GUI.
 
 import time
 import json
-import hashlib
 import threading
 import traceback
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from PyQt6.QtCore import QThread, pyqtSignal, pyqtSlot, QSettings
 
@@ -24,10 +23,12 @@ from src.core.file_host_config import (
     is_family_dedup_enabled,
 )
 from src.network.file_host_client import FileHostClient
+from src.network.curl_pool import get_curl_pool
 from src.processing.file_host_coordinator import get_coordinator
 from src.proxy.resolver import ProxyResolver
 from src.proxy.models import ProxyContext
 from src.storage.database import QueueStore
+from src.storage.work_signal import get_file_host_work_signal
 from src.utils.logger import log
 from src.utils.archive_manager import get_archive_manager
 
@@ -44,6 +45,10 @@ class FileHostWorker(QThread):
     # Default maximum time (seconds) for spinup retry attempts
     SPINUP_RETRY_MAX_TIME_DEFAULT = 600
 
+    # Idle workers block on the work signal; this is only a safety net that
+    # re-checks the DB if a notification was somehow missed.
+    IDLE_RESYNC_INTERVAL = 60.0
+
     # Signals for communication with GUI
     upload_started = pyqtSignal(int, str)  # db_id, host_name
     upload_progress = pyqtSignal(int, str, object, object, float)  # db_id, host_name, uploaded_bytes, total_bytes, speed_bps
@@ -65,15 +70,6 @@ class FileHostWorker(QThread):
     # iterations of the worker's upload loop.
     host_gallery_settled = pyqtSignal(int, str, bool)  # gallery_fk, host_name, success
 
-    @staticmethod
-    def _compute_md5(file_path) -> str:
-        """Compute MD5 hash of a file."""
-        md5 = hashlib.md5()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                md5.update(chunk)
-        return md5.hexdigest()
-
     def __init__(self, host_id: str, queue_store: QueueStore):
         """Initialize file host worker for a specific host.
 
@@ -96,6 +92,7 @@ class FileHostWorker(QThread):
 
         self._stop_event = threading.Event()  # Thread-safe stop signal
         self._pause_event = threading.Event()  # Thread-safe pause signal (set = paused)
+        self._work_signal = get_file_host_work_signal()  # Wakes the idle run() loop
 
         # Bandwidth tracking
         self.bandwidth_counter = AtomicCounter()
@@ -118,12 +115,17 @@ class FileHostWorker(QThread):
         self._test_queue: list[str] = []  # List of credentials to test
         self._test_queue_lock = threading.Lock()
 
-        # Current upload tracking
-        self.current_upload_id: Optional[int] = None
-        self.current_host: Optional[str] = None
-        self.current_db_id: Optional[int] = None
         self._should_stop_current = False
 
+        # Upload lanes: concurrent uploads driven by this worker, keyed by the
+        # head upload row id. Each lane owns one gallery at a time and tracks
+        # the upload it is running (upload_id, db_id, host_name).
+        self._lanes: Dict[int, Dict[str, Any]] = {}
+        self._lanes_lock = threading.Lock()
+        self._lane_local = threading.local()  # .lane = dict of the lane running on this thread
+        # Same tracking for an upload run outside any lane (direct calls)
+        self._inline_upload: Dict[str, Any] = {'upload_id': None, 'db_id': None, 'host_name': None}
+
         # Thread-safe upload throttle state
         self._upload_throttle_state = {}  # {(db_id, host): {'last_emit': time, 'last_progress': (up, total)}}
         self._throttle_lock = threading.Lock()
@@ -221,7 +223,8 @@ class FileHostWorker(QThread):
             session_cookies=session_cookies,
             session_token=session_token,
             session_timestamp=session_timestamp,
-            proxy=proxy  # Inject proxy
+            proxy=proxy,  # Inject proxy
+            curl_pool=get_curl_pool()  # Keep-alive handles shared across clients
         )
 
         return client
@@ -256,21 +259,25 @@ class FileHostWorker(QThread):
         with self._test_queue_lock:
             self._test_queue.append(credentials)
             self._log("Test request queued", level="debug")
+        self._work_signal.notify(self.host_id)
 
     def stop(self) -> None:
         """Stop the worker thread."""
         self._log("Stopping file host worker...", level="debug")
         self._stop_event.set()
+        self._work_signal.notify(self.host_id)
         self.wait()
 
     def pause(self) -> None:
         """Pause processing new uploads."""
         self._pause_event.set()
+        self._work_signal.notify(self.host_id)
         self._log("File host worker paused", level="info")
 
     def resume(self) -> None:
         """Resume processing uploads."""
         self._pause_event.clear()
+        self._work_signal.notify(self.host_id)
         self._log("File host worker resumed", level="info")
 
     def _wait_with_countdown(self, delay: int, status_prefix: str = "retry_pending") -> bool:
@@ -444,14 +451,199 @@ class FileHostWorker(QThread):
             # Cap at maximum delay (300 seconds / 5 minutes)
             return self.SPINUP_RETRY_DELAYS[-1]
 
-    def cancel_current_upload(self) -> None:
-        """Cancel the current upload."""
-        self._should_stop_current = True
+    def _upload_state(self) -> Dict[str, Any]:
+        """Tracking dict of the upload a caller is asking about.
+
+        On a lane thread that is the lane's own upload. Elsewhere (GUI,
+        status queries) it is the longest-running lane, which stays the same
+        until that lane finishes; use get_active_uploads() to see every lane.
+        """
+        lane = self._current_lane()
+        if lane is not None:
+            return lane
+        with self._lanes_lock:
+            for lane in self._lanes.values():  # Insertion order = start order
+                return lane
+        return self._inline_upload
+
+    def _set_upload_field(self, key: str, value: Any) -> None:
+        lane = self._current_lane()
+        if lane is None:
+            self._inline_upload[key] = value
+            return
+        with self._lanes_lock:
+            lane[key] = value
+
+    @property
+    def current_upload_id(self) -> Optional[int]:
+        return self._upload_state()['upload_id']
+
+    @current_upload_id.setter
+    def current_upload_id(self, value: Optional[int]) -> None:
+        self._set_upload_field('upload_id', value)
+
+    @property
+    def current_db_id(self) -> Optional[int]:
+        return self._upload_state()['db_id']
+
+    @current_db_id.setter
+    def current_db_id(self, value: Optional[int]) -> None:
+        self._set_upload_field('db_id', value)
+
+    @property
+    def current_host(self) -> Optional[str]:
+        return self._upload_state()['host_name']
+
+    @current_host.setter
+    def current_host(self, value: Optional[str]) -> None:
+        self._set_upload_field('host_name', value)
+
+    def cancel_current_upload(self, db_id: Optional[int] = None) -> None:
+        """Cancel active uploads.
+
+        Args:
+            db_id: Gallery to cancel; None cancels every active lane.
+        """
+        with self._lanes_lock:
+            lanes = [lane for lane in self._lanes.values() if db_id is None or lane['db_id'] == db_id]
+            for lane in lanes:
+                lane['cancel'].set()
+            galleries = [lane['db_id'] for lane in lanes]
+        if db_id is None:
+            self._should_stop_current = True
+            if not galleries and self._inline_upload['db_id'] is not None:
+                galleries = [self._inline_upload['db_id']]
         self._log(
-            f"Cancel requested for current upload: {self.current_host} (gallery {self.current_db_id})",
+            f"Cancel requested for {self.host_id} uploads of galleries {galleries or [db_id]}",
             level="info"
         )
 
+    def _lane_limit(self) -> int:
+        """Number of uploads this worker may run at once.
+
+        The host's ``max_connections`` setting, capped by the coordinator's
+        per-host limit.
+        """
+        configured = get_file_host_setting(self.host_id, "max_connections", "int") or 1
+        return max(1, min(configured, self.coordinator.per_host_limit))
+
+    def _current_lane(self) -> Optional[Dict[str, Any]]:
+        """Lane running on the calling thread, or None outside a lane."""
+        return getattr(self._lane_local, 'lane', None)
+
+    def _is_cancelled(self) -> bool:
+        """Whether the upload running on this thread was cancelled."""
+        lane = self._current_lane()
+        if lane is not None:
+            return lane['cancel'].is_set()
+        return self._should_stop_current
+
+    def _lane_speed_total(self, speed_bps: float) -> float:
+        """Record this lane's speed and return the summed speed of all lanes."""
+        lane = self._current_lane()
+        if lane is None:
+            return speed_bps
+        with self._lanes_lock:
+            lane['speed_bps'] = speed_bps
+            return sum(l['speed_bps'] for l in self._lanes.values())
+
+    def _start_lane(self, upload: dict, host_config: HostConfig, threaded: bool) -> None:
+        """Register a lane for ``upload`` and run it.
+
+        The lane is registered before it starts so the dispatch loop never
+        hands the same row or gallery to a second lane.
+        """
+        lane = {
+            'key': upload['id'],
+            'upload_id': upload['id'],
+            'db_id': upload['gallery_fk'],
+            'host_name': upload['host_name'],
+            'cancel': threading.Event(),
+            'speed_bps': 0.0,
+            'thread': None,
+        }
+        with self._lanes_lock:
+            self._lanes[lane['key']] = lane
+        if not threaded:
+            self._run_lane(lane, upload, host_config)
+            return
+        thread = threading.Thread(
+            target=self._run_lane, args=(lane, upload, host_config),
+            name=f"{self.host_id}-lane-{lane['key']}", daemon=True,
+        )
+        lane['thread'] = thread
+        thread.start()
+
+    def _run_lane(self, lane: Dict[str, Any], upload: dict, host_config: HostConfig) -> None:
+        """Acquire coordinator slots and process one pending row.
+
+        The lane keeps waiting through slot timeouts (checking for stop and
+        cancel in between) instead of exiting, so the dispatch loop doesn't
+        replace it with a new lane for the same row every few seconds. After
+        a wait the row is re-read, in case it was cancelled or removed.
+        """
+        self._lane_local.lane = lane
+        waited = False
+        try:
+            while not self._stop_event.is_set() and not lane['cancel'].is_set():
+                try:
+                    with self.coordinator.acquire_slot(lane['db_id'], lane['host_name'], timeout=5.0):
+                        if waited and not self._row_still_pending(lane['key']):
+                            self._log(
+                                f"Upload {lane['key']} is no longer pending, dropping it", level="debug")
+                            break
+                        self._process_single_pending_row(upload, host_config=host_config)
+                    break
+                except TimeoutError:
+                    if not waited:
+                        self._log(
+                            f"Waiting for an upload slot for {lane['host_name']} (gallery {lane['db_id']})",
+                            level="debug")
+                    waited = True
+        except Exception as e:
+            self._log(f"Error in upload lane for gallery {lane['db_id']}: {e}", level="error")
+            traceback.print_exc()
+        finally:
+            self._lane_local.lane = None
+            with self._lanes_lock:
+                self._lanes.pop(lane['key'], None)
+                idle = not self._lanes
+            if idle:
+                self._should_stop_current = False
+            # A lane is free again: let the dispatch loop pick up more work
+            self._work_signal.notify(self.host_id)
+
+    def _row_still_pending(self, upload_id: int) -> bool:
+        pending = self.queue_store.get_pending_file_host_uploads(host_name=self.host_id)
+        return any(row['id'] == upload_id for row in pending)
+
+    def _wait_for_work(self, seen: int) -> None:
+        """Block until new work is signalled for this host (or stop/pause/resume).
+
+        Args:
+            seen: Work signal generation read before the caller checked for work
+        """
+        self._work_signal.wait(self.host_id, seen, timeout=self.IDLE_RESYNC_INTERVAL)
+
+    def _join_lanes(self) -> None:
+        """Wait for running lane threads to finish (they observe the stop event)."""
+        with self._lanes_lock:
+            threads = [lane['thread'] for lane in self._lanes.values() if lane['thread']]
+        for thread in threads:
+            thread.join()
+
+    def get_active_uploads(self) -> List[Dict[str, Any]]:
+        """Get the uploads currently running in this worker's lanes.
+
+        Returns:
+            List of dicts with upload_id, db_id and host_name
+        """
+        with self._lanes_lock:
+            return [
+                {'upload_id': l['upload_id'], 'db_id': l['db_id'], 'host_name': l['host_name']}
+                for l in self._lanes.values()
+            ]
+
     def run(self):
         """Main worker thread loop - process uploads for this host only."""
         self.status_updated.emit(self.host_id, "starting")
@@ -566,9 +758,12 @@ class FileHostWorker(QThread):
             self.spinup_complete.emit(self.host_id, "")
 
         while not self._stop_event.is_set():
+            # Read the generation before looking for work so a notification
+            # landing between the DB check and the wait is never lost
+            seen = self._work_signal.generation(self.host_id)
             try:
                 if self._pause_event.is_set():
-                    time.sleep(0.5)
+                    self._wait_for_work(seen)
                     continue
 
                 # Check for test requests (process in worker thread)
@@ -586,16 +781,32 @@ class FileHostWorker(QThread):
                     # Continue loop to check for more tests or uploads
                     continue
 
-                # Get next pending upload for THIS host only
+                # Wait for a free lane before looking for more work
+                lane_limit = self._lane_limit()
+                with self._lanes_lock:
+                    busy_ids = set(self._lanes)
+                    busy_galleries = {lane['db_id'] for lane in self._lanes.values()}
+                if len(busy_ids) >= lane_limit:
+                    self._wait_for_work(seen)
+                    continue
+
+                # Get next pending upload for THIS host only, skipping rows and
+                # galleries already owned by a lane (a gallery's parts always
+                # stay in one lane so host_gallery_settled fires once)
                 pending_uploads = self.queue_store.get_pending_file_host_uploads(host_name=self.host_id)
+                upload = next(
+                    (u for u in pending_uploads
+                     if u['id'] not in busy_ids and u['gallery_fk'] not in busy_galleries),
+                    None,
+                )
 
-                if not pending_uploads:
-                    # No work to do, just wait (don't emit 0 bandwidth)
-                    time.sleep(1.0)
+                if upload is None:
+                    # No work to do: sleep until a pending row is written for
+                    # this host (don't emit 0 bandwidth)
+                    self._wait_for_work(seen)
                     continue
 
                 # Process next upload
-                upload = pending_uploads[0]
                 host_name = upload['host_name']
                 db_id = upload['gallery_fk']
                 upload_id = upload['id']
@@ -652,28 +863,24 @@ class FileHostWorker(QThread):
                     self._log(
                         f"Connection limit reached for {host_name}, waiting...",
                         level="debug")
-                    time.sleep(1.0)
+                    self._wait_for_work(seen)
                     continue
 
-                # Acquire upload slot and process
-                try:
-                    with self.coordinator.acquire_slot(db_id, host_name, timeout=5.0):
-                        self._process_single_pending_row(upload, host_config=host_config)
-                except TimeoutError:
-                    self._log(
-                        f"Could not acquire upload slot for {host_name}, retrying...",
-                        level="debug")
-                    time.sleep(1.0)
+                # Acquire upload slot and process; with a single lane the
+                # upload runs inline on the worker thread
+                self._start_lane(upload, host_config, threaded=lane_limit > 1)
 
             except Exception as e:
                 self._log(f"Error in file host worker loop: {e}", level="error")
                 traceback.print_exc()
                 time.sleep(1.0)
 
+        self._join_lanes()
         self._log("Worker stopped", level="info")
 
     def _get_or_create_archive(self, db_id, folder_path, gallery_name,
-                               archive_format, compression, split_size_mb):
+                               archive_format, compression, split_size_mb,
+                               compression_workers=1):
         """Thin wrapper around ArchiveManager.create_or_reuse_archive.
 
         Exists so tests can monkeypatch archive creation to verify it was (or
@@ -686,6 +893,16 @@ class FileHostWorker(QThread):
             archive_format=archive_format,
             compression=compression,
             split_size_mb=split_size_mb,
+            compression_workers=compression_workers,
+        )
+
+    def _get_streamed_archive(self, db_id, folder_path, gallery_name, split_size_mb):
+        """Thin wrapper around ArchiveManager.create_or_reuse_stream (see above)."""
+        return self.archive_manager.create_or_reuse_stream(
+            db_id=db_id,
+            folder_path=folder_path,
+            gallery_name=gallery_name,
+            split_size_mb=split_size_mb,
         )
 
     def _process_single_pending_row(self, row: dict, client=None, host_config=None):
@@ -810,7 +1027,8 @@ class FileHostWorker(QThread):
         self.current_upload_id = upload_id
         self.current_host = host_name
         self.current_db_id = db_id
-        self._should_stop_current = False
+        if self._current_lane() is None:
+            self._should_stop_current = False
 
         # Initialize timing and size tracking for metrics
         upload_start_time = time.time()
@@ -832,6 +1050,8 @@ class FileHostWorker(QThread):
         )
 
         archive_created = False  # track whether archive_manager needs releasing
+        # Parts planned by ArchiveManager and streamed instead of written: {path: part}
+        archive_streams = {}
         try:
             # Step 1: Determine upload file(s) — raw file or archive
             from src.utils.system_utils import convert_to_wsl_path
@@ -876,6 +1096,11 @@ class FileHostWorker(QThread):
                 defaults = load_user_defaults()
                 archive_format = defaults.get('archive_format', 'zip')
                 archive_compression = defaults.get('archive_compression', 'store')
+                compression_workers = defaults.get('archive_compression_workers', 1)
+                stream_upload = (
+                    defaults.get('archive_stream_uploads', False)
+                    and archive_format == 'zip' and archive_compression == 'store'
+                )
                 split_enabled = defaults.get('archive_split_enabled', False)
                 split_mode = defaults.get('archive_split_mode', 'fixed')
 
@@ -898,38 +1123,61 @@ class FileHostWorker(QThread):
                 else:
                     split_size_mb = defaults.get('archive_split_size_mb', 0)
 
-                # Pre-flight disk space check before archive creation
-                import shutil as _shutil
-                import tempfile as _tempfile
-                try:
-                    temp_free = _shutil.disk_usage(_tempfile.gettempdir()).free
-                    estimated_size = sum(
-                        f.stat().st_size for f in folder_path.iterdir()
-                        if f.is_file()
+                if stream_upload and split_size_mb > 0:
+                    from src.utils.zip_stream import split_streaming_supported
+                    if not split_streaming_supported():
+                        self._log(
+                            "Installed splitzip version cannot stream split archives; "
+                            "writing the archive to disk instead",
+                            level="warning"
+                        )
+                        stream_upload = False
+
+                if stream_upload:
+                    # Nothing is written, so no disk space is needed
+                    streamed_parts = self._get_streamed_archive(
+                        db_id=db_id,
+                        folder_path=folder_path,
+                        gallery_name=gallery_name,
+                        split_size_mb=split_size_mb,
                     )
-                    critical_mb = 512
-                    critical_bytes = critical_mb * 1024 * 1024
-                    if temp_free < estimated_size + critical_bytes:
-                        free_mb = temp_free // (1024 * 1024)
-                        need_mb = (estimated_size + critical_bytes) // (1024 * 1024)
-                        raise OSError(
-                            f"Insufficient disk space for archive: "
-                            f"{free_mb}MB free, need ~{need_mb}MB"
+                    archive_streams = {part.path: part for part in streamed_parts}
+                    archive_paths = [part.path for part in streamed_parts]
+                    archive_created = True
+                else:
+                    # Pre-flight disk space check before archive creation
+                    import shutil as _shutil
+                    import tempfile as _tempfile
+                    try:
+                        temp_free = _shutil.disk_usage(_tempfile.gettempdir()).free
+                        estimated_size = sum(
+                            f.stat().st_size for f in folder_path.iterdir()
+                            if f.is_file()
                         )
-                except OSError:
-                    raise
-                except Exception as e:
-                    self._log(f"Disk space pre-flight check failed: {e}", level="warning")
-
-                archive_paths = self._get_or_create_archive(
-                    db_id=db_id,
-                    folder_path=folder_path,
-                    gallery_name=gallery_name,
-                    archive_format=archive_format,
-                    compression=archive_compression,
-                    split_size_mb=split_size_mb,
-                )
-                archive_created = True
+                        critical_mb = 512
+                        critical_bytes = critical_mb * 1024 * 1024
+                        if temp_free < estimated_size + critical_bytes:
+                            free_mb = temp_free // (1024 * 1024)
+                            need_mb = (estimated_size + critical_bytes) // (1024 * 1024)
+                            raise OSError(
+                                f"Insufficient disk space for archive: "
+                                f"{free_mb}MB free, need ~{need_mb}MB"
+                            )
+                    except OSError:
+                        raise
+                    except Exception as e:
+                        self._log(f"Disk space pre-flight check failed: {e}", level="warning")
+
+                    archive_paths = self._get_or_create_archive(
+                        db_id=db_id,
+                        folder_path=folder_path,
+                        gallery_name=gallery_name,
+                        archive_format=archive_format,
+                        compression=archive_compression,
+                        split_size_mb=split_size_mb,
+                        compression_workers=compression_workers,
+                    )
+                    archive_created = True
 
             # Step 2: Create client (reuses session if available)
             client = self._create_client(host_config)
@@ -965,7 +1213,7 @@ class FileHostWorker(QThread):
                     # Only emit when we have actual speed data - don't emit 0 during
                     # connection setup, SSL handshake, or server response wait
                     if speed_bps > 0:
-                        kbps = speed_bps / 1024.0
+                        kbps = self._lane_speed_total(speed_bps) / 1024.0
                         self._emit_bandwidth_immediate(kbps)
                 except Exception as e:
                     self._log(f"Progress callback error: {e}\n{traceback.format_exc()}", level="error")
@@ -974,7 +1222,7 @@ class FileHostWorker(QThread):
 
             def should_stop():
                 """Check if upload should be cancelled."""
-                return self._should_stop_current or self._stop_event.is_set()
+                return self._is_cancelled() or self._stop_event.is_set()
 
             # For K2S-family siblings: look up the primary's server-side md5 from
             # the DB once, keyed by part_number. We pass it to upload_file so the
@@ -1018,7 +1266,8 @@ class FileHostWorker(QThread):
                 if should_stop():
                     break
 
-                part_size = archive_path.stat().st_size
+                stream = archive_streams.get(archive_path)
+                part_size = stream.size if stream is not None else archive_path.stat().st_size
 
                 # For first part (part_idx=0), use the existing upload_id
                 # For additional parts, create new file_host_upload rows
@@ -1055,17 +1304,21 @@ class FileHostWorker(QThread):
 
                 # Persist file size before upload. MD5 handling:
                 #   - Hosts that embed the md5 in their init request (e.g.
-                #     RapidGator, require_file_hash=True) compute it locally.
+                #     RapidGator, require_file_hash=True) use the local md5,
+                #     which ArchiveManager computed while writing the archive
+                #     (or computes once and shares across hosts). It goes to the
+                #     client as file_hash so the part isn't read again there.
                 #   - K2S-family siblings pass the primary's server-side md5
                 #     (fetched from the DB above) — the client uses it to probe
                 #     createFileByHash before uploading.
-                file_size = archive_path.stat().st_size
+                file_size = part_size
                 md5_hash: Optional[str] = None
+                file_hash: Optional[str] = None
                 if host_config.require_file_hash:
-                    md5_hash = self._compute_md5(archive_path)
+                    file_hash = self.archive_manager.get_part_md5(archive_path)
                     self.queue_store.update_file_host_upload(
                         current_upload_id,
-                        md5_hash=md5_hash,
+                        md5_hash=file_hash,
                         file_size=file_size,
                     )
                 else:
@@ -1083,7 +1336,9 @@ class FileHostWorker(QThread):
                     file_path=archive_path,
                     on_progress=on_progress,
                     should_stop=should_stop,
-                    md5_hash=md5_hash
+                    md5_hash=md5_hash,
+                    stream=stream,
+                    file_hash=file_hash,
                 )
 
                 # Calculate transfer time for metrics
@@ -1095,7 +1350,7 @@ class FileHostWorker(QThread):
                     file_id = result.get('upload_id') or result.get('file_id', '')
                     # md5_hash is NOT populated here for K2S-family primaries —
                     # the server-side md5 is written later by HostFamilyCoordinator's
-                    # background poller (see host_family_coordinator._md5_fetch_worker).
+                    # background poller (see host_family_coordinator._FamilyMd5Poller).
                     # Hosts with require_file_hash=True already wrote their local md5
                     # in the pre-upload update above, so leaving md5_hash untouched
                     # here preserves that value.
@@ -1113,6 +1368,13 @@ class FileHostWorker(QThread):
                             uploaded_bytes=part_size,
                         )
 
+                    pool_stats = get_curl_pool().stats(self.host_id)
+                    self._log(
+                        f"Curl pool: {pool_stats['reused_connections']} of "
+                        f"{pool_stats['transfers']} requests reused a connection",
+                        level="debug",
+                    )
+
                     # Mark deduplication status
                     if result.get('deduplication') and current_upload_id:
                         self.queue_store.update_file_host_upload(
@@ -1161,7 +1423,10 @@ class FileHostWorker(QThread):
 
             # Increment shared K2S family storage counter
             if get_host_family(self.host_id) == 'k2s':
-                total_uploaded = sum(p.stat().st_size for p in archive_paths)
+                total_uploaded = sum(
+                    archive_streams[p].size if p in archive_streams else p.stat().st_size
+                    for p in archive_paths
+                )
                 if total_uploaded > 0:
                     from src.core.file_host_config import (
                         increment_k2s_family_storage, get_family_members
@@ -1194,7 +1459,7 @@ class FileHostWorker(QThread):
             should_retry = (
                 auto_retry and
                 retry_count < max_retries and
-                not self._should_stop_current and
+                not self._is_cancelled() and
                 is_retryable  # Only retry if error is recoverable
             )
 
@@ -1249,11 +1514,11 @@ class FileHostWorker(QThread):
             if archive_created:
                 self.archive_manager.release_archive(db_id)
 
-            # Clear current upload tracking
-            self.current_upload_id = None
-            self.current_host = None
-            self.current_db_id = None
-            self._should_stop_current = False
+            # Clear upload tracking; a lane's tracking goes away with the lane
+            if self._current_lane() is None:
+                if self._inline_upload['upload_id'] == upload_id:
+                    self._inline_upload.update(upload_id=None, db_id=None, host_name=None)
+                self._should_stop_current = False
 
     def _try_family_mirror(self, row: dict, client, family) -> bool:
         """Attempt to mirror a family primary's completed part set via hash dedup.
@@ -1269,7 +1534,7 @@ class FileHostWorker(QThread):
 
         HostFamilyCoordinator guarantees the primary row has a populated
         `md5_hash` before flipping any sibling row from `blocked` to `pending`
-        (see `host_family_coordinator._md5_fetch_worker`). Under normal flow,
+        (see `host_family_coordinator._finish_md5_poll`). Under normal flow,
         by the time this function runs, every sibling part it reads has an
         md5. The NULL-md5 guard below exists only for the cases where that
         contract can't be met:
@@ -1319,7 +1584,7 @@ class FileHostWorker(QThread):
         gallery_path = row.get("gallery_path")
         head_upload_id = row["id"]
 
-        if self._should_stop_current or self._stop_event.is_set():
+        if self._is_cancelled() or self._stop_event.is_set():
             return False
 
         # Probe every sibling part. Any miss aborts immediately — we only
@@ -1327,7 +1592,7 @@ class FileHostWorker(QThread):
         part_results: list = []  # list of (part_number, md5, file_name, result)
         try:
             for part in sibling_parts:
-                if self._should_stop_current or self._stop_event.is_set():
+                if self._is_cancelled() or self._stop_event.is_set():
                     return False
                 md5 = part["md5_hash"]
                 file_name = part["file_name"] or ""
@@ -1462,13 +1727,14 @@ class FileHostWorker(QThread):
         Returns:
             Dictionary with current upload info, or None
         """
-        if self.current_upload_id is None:
+        state = dict(self._upload_state())
+        if state['upload_id'] is None:
             return None
 
         return {
-            'upload_id': self.current_upload_id,
-            'db_id': self.current_db_id,
-            'host_name': self.current_host
+            'upload_id': state['upload_id'],
+            'db_id': state['db_id'],
+            'host_name': state['host_name']
         }
 
     # =========================================================================
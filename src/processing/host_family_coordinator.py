@@ -15,20 +15,25 @@ only the server knows. It takes a variable delay (~10-15s in practice) before
 `getFilesInfo` returns it.
 
 The primary worker does NOT poll for this md5 — it finishes with a NULL
-md5_hash and moves on to the next gallery. Instead, the coordinator spawns a
-single background `threading.Timer` when the primary settles: wait the
-expected propagation window, do one `getFilesInfo` call, write the md5 to the
-primary's row, then unblock siblings so they pick up the now-populated row and
-run `createFileByHash` directly. On the rare miss, the poller backs off
-exponentially; if it ever exhausts attempts, siblings are unblocked anyway and
-fall through to full upload.
-
-This collapses what used to be per-sibling independent polling loops into
-exactly one shared poll per family upload.
+md5_hash and moves on to the next gallery. Instead, when the primary settles
+the coordinator hands its canonical file id to the `_FamilyMd5Poller` of the
+primary's host: wait the expected propagation window, fetch the md5, write it
+to the primary's row, then unblock siblings so they pick up the now-populated
+row and run `createFileByHash` directly. On the rare miss, the file is retried
+with exponential backoff; if it ever exhausts attempts, siblings are unblocked
+anyway and fall through to full upload.
+
+There is one poller per host, not one thread per gallery: a single thread
+keeps every pending file on a deadline-ordered schedule and asks for all
+files that are due in one multi-ID `getFilesInfo` call. Each gallery's
+siblings are unblocked as soon as its own md5 lands.
 """
+import heapq
+import itertools
 import threading
 import time
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
 from PyQt6.QtCore import QObject, pyqtSlot
@@ -48,6 +53,11 @@ K2S_MD5_BACKOFF_BASE_SEC = 10
 K2S_MD5_MAX_BACKOFF_SEC = 60
 K2S_MD5_MAX_ATTEMPTS = 4  # total attempts (1 initial + 3 retries)
 
+# Files due within this window of the earliest one share its getFilesInfo call
+K2S_MD5_BATCH_WINDOW_SEC = 2
+# File ids per getFilesInfo call
+K2S_MD5_BATCH_SIZE = 100
+
 
 def _canonical_file_id_from_url(download_url: Optional[str]) -> Optional[str]:
     """Extract the canonical file id from a K2S-family download URL.
@@ -74,8 +84,8 @@ def _unblock_family_waiters(
     """Flip every row blocked on the primary's row to `pending`.
 
     Used by both the sync path in `_handle_success` (when the primary already
-    has an md5) and the async md5 poller thread (after the poll finishes,
-    whether it landed an md5 or gave up).
+    has an md5) and the md5 poller (after the poll finishes, whether it
+    landed an md5 or gave up).
     """
     members = HOST_FAMILY_PRIORITY.get(family, [])
     if not members:
@@ -86,57 +96,15 @@ def _unblock_family_waiters(
             queue_store.update_file_host_upload(r["id"], status="pending")
 
 
-def _md5_fetch_worker(
+def _finish_md5_poll(
     queue_store: QueueStore,
     gallery_fk: int,
     family: str,
     primary_row_id: int,
-    host_name: str,
-    canonical_file_id: str,
+    md5: Optional[str],
+    tag: str,
 ) -> None:
-    """Background task: poll primary's `getFilesInfo` until md5 lands.
-
-    Runs on a `threading.Timer` thread. Does not touch Qt. All side effects
-    go through `queue_store` (SQLite WAL, safe from any thread). On success,
-    writes the md5 to the primary's row before unblocking siblings so they
-    read the populated value via `get_family_completed_parts`. On permanent
-    miss, unblocks siblings anyway — they will fall through to full upload.
-    """
-    tag = f"[family-md5-poll gallery_fk={gallery_fk} host={host_name}]"
-    md5: Optional[str] = None
-    for attempt in range(K2S_MD5_MAX_ATTEMPTS):
-        try:
-            md5 = FileHostClient.fetch_md5_for_host(
-                host_name,
-                canonical_file_id,
-                log_callback=_make_poll_log_cb(tag),
-            )
-        except Exception as e:
-            log(
-                f"{tag} attempt {attempt + 1} raised: {e}",
-                level="warning",
-                category="file_hosts",
-            )
-            md5 = None
-
-        if md5:
-            break
-
-        if attempt + 1 >= K2S_MD5_MAX_ATTEMPTS:
-            break  # exhausted; don't sleep again
-
-        delay = min(
-            K2S_MD5_BACKOFF_BASE_SEC * (2 ** attempt),
-            K2S_MD5_MAX_BACKOFF_SEC,
-        )
-        log(
-            f"{tag} md5 not ready, retry in {delay}s "
-            f"(attempt {attempt + 2}/{K2S_MD5_MAX_ATTEMPTS})",
-            level="debug",
-            category="file_hosts",
-        )
-        time.sleep(delay)
-
+    """Write a landed md5 to the primary's row, then unblock its siblings."""
     if md5:
         queue_store.update_file_host_upload(primary_row_id, md5_hash=md5)
         log(
@@ -162,6 +130,159 @@ def _make_poll_log_cb(tag: str):
     return _cb
 
 
+def _md5_backoff(attempt: int) -> float:
+    """Delay before retry number attempt + 1 (attempt counts from 0)."""
+    return min(K2S_MD5_BACKOFF_BASE_SEC * (2 ** attempt), K2S_MD5_MAX_BACKOFF_SEC)
+
+
+@dataclass
+class _Md5Job:
+    """One primary row waiting for its server-side md5."""
+    gallery_fk: int
+    family: str
+    primary_row_id: int
+    canonical_file_id: str
+    due: float
+    attempt: int = 0
+
+
+class _FamilyMd5Poller:
+    """Shared md5 poller for one K2S-family host.
+
+    Pending files sit in a heap ordered by when they are next due. One
+    thread sleeps until the earliest deadline, then asks for every file due
+    within K2S_MD5_BATCH_WINDOW_SEC in multi-ID `getFilesInfo` calls. Files
+    whose md5 landed (or that ran out of attempts) are finished right away;
+    the rest go back on the heap with backoff. The thread exits when nothing
+    is pending and is restarted by the next schedule().
+    """
+
+    def __init__(self, queue_store: QueueStore, host_name: str):
+        self.queue_store = queue_store
+        self.host_name = host_name
+        self._jobs: Dict[int, _Md5Job] = {}  # primary_row_id -> job
+        self._heap: list = []  # (due, seq, primary_row_id); stale entries skipped
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def schedule(self, job: _Md5Job) -> None:
+        """Add a job, replacing any pending job for the same primary row."""
+        with self._cond:
+            if self._stopped:
+                return
+            self._jobs[job.primary_row_id] = job
+            heapq.heappush(self._heap, (job.due, next(self._seq), job.primary_row_id))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"Md5Poller-{self.host_name}", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._jobs)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the thread has gone idle (nothing pending, last batch applied).
+
+        Returns:
+            True if the poller is idle, False if ``timeout`` ran out first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                thread = self._thread
+            if thread is None:
+                return True
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            thread.join(remaining)
+            if thread.is_alive():
+                return False
+
+    def stop(self) -> None:
+        """Drop pending jobs; a batch already in flight still finishes."""
+        with self._cond:
+            self._stopped = True
+            self._jobs.clear()
+            self._heap.clear()
+            self._cond.notify()
+
+    def _next_batch(self) -> Optional[List[_Md5Job]]:
+        """Wait for the earliest deadline; None when idle or stopped."""
+        with self._cond:
+            while True:
+                if self._stopped or not self._jobs:
+                    self._thread = None
+                    return None
+                due, _, row_id = self._heap[0]
+                job = self._jobs.get(row_id)
+                if job is None or job.due != due:
+                    heapq.heappop(self._heap)  # Finished or rescheduled
+                    continue
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                batch: List[_Md5Job] = []
+                horizon = time.monotonic() + K2S_MD5_BATCH_WINDOW_SEC
+                while self._heap and self._heap[0][0] <= horizon:
+                    due, _, row_id = heapq.heappop(self._heap)
+                    job = self._jobs.get(row_id)
+                    if job is not None and job.due == due:
+                        batch.append(job)
+                return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            landed: Dict[str, str] = {}
+            ids = list(dict.fromkeys(job.canonical_file_id for job in batch))
+            tag = f"[family-md5-poll host={self.host_name}]"
+            for i in range(0, len(ids), K2S_MD5_BATCH_SIZE):
+                chunk = ids[i:i + K2S_MD5_BATCH_SIZE]
+                try:
+                    landed.update(FileHostClient.fetch_md5s_for_host(
+                        self.host_name, chunk, log_callback=_make_poll_log_cb(tag)
+                    ))
+                except Exception as e:
+                    log(f"{tag} getFilesInfo for {len(chunk)} files raised: {e}",
+                        level="warning", category="file_hosts")
+            log(f"{tag} {len(landed)}/{len(ids)} md5s ready", level="debug", category="file_hosts")
+            for job in batch:
+                self._settle(job, landed.get(job.canonical_file_id))
+
+    def _settle(self, job: _Md5Job, md5: Optional[str]) -> None:
+        """Finish a polled job, or put it back on the schedule with backoff."""
+        tag = f"[family-md5-poll gallery_fk={job.gallery_fk} host={self.host_name}]"
+        with self._cond:
+            if self._jobs.get(job.primary_row_id) is not job:
+                return  # Replaced by a newer schedule, or stopped
+            if not md5 and job.attempt + 1 < K2S_MD5_MAX_ATTEMPTS:
+                delay = _md5_backoff(job.attempt)
+                job.attempt += 1
+                job.due = time.monotonic() + delay
+                heapq.heappush(self._heap, (job.due, next(self._seq), job.primary_row_id))
+                log(
+                    f"{tag} md5 not ready, retry in {delay}s "
+                    f"(attempt {job.attempt + 1}/{K2S_MD5_MAX_ATTEMPTS})",
+                    level="debug",
+                    category="file_hosts",
+                )
+                return
+            del self._jobs[job.primary_row_id]
+        try:
+            _finish_md5_poll(
+                self.queue_store, job.gallery_fk, job.family, job.primary_row_id, md5, tag
+            )
+        except Exception as e:
+            log(f"{tag} failed to apply md5 result: {e}", level="warning", category="file_hosts")
+
+
 class HostFamilyCoordinator(QObject):
     """Single-responsibility coordinator for backend-family upload dedup.
 
@@ -176,25 +297,23 @@ class HostFamilyCoordinator(QObject):
     def __init__(self, queue_store: QueueStore):
         super().__init__()
         self.queue_store = queue_store
-        # primary_row_id → active poller Timer. Entries are removed when
-        # the Timer finishes (via the callback wrapper in _schedule_md5_fetch)
-        # or when shutdown() cancels all pending pollers.
-        self._pending_timers: Dict[int, threading.Timer] = {}
-        self._pending_timers_lock = threading.Lock()
+        # host_name → shared md5 poller, created on first use
+        self._md5_pollers: Dict[str, _FamilyMd5Poller] = {}
+        self._md5_pollers_lock = threading.Lock()
 
     def shutdown(self) -> None:
-        """Cancel any in-flight md5 pollers.
+        """Stop the md5 pollers.
 
         Called from `FileHostWorkerManager.shutdown_all` so we don't leak
         background threads past app exit or race the DB during teardown.
-        Cancels Timers that haven't fired yet; pollers already running get
-        to finish (their DB writes are idempotent — see _md5_fetch_worker).
+        Pending polls are dropped; a batch already in flight gets to finish
+        (its DB writes are idempotent — see _finish_md5_poll).
         """
-        with self._pending_timers_lock:
-            timers = list(self._pending_timers.values())
-            self._pending_timers.clear()
-        for t in timers:
-            t.cancel()
+        with self._md5_pollers_lock:
+            pollers = list(self._md5_pollers.values())
+            self._md5_pollers.clear()
+        for poller in pollers:
+            poller.stop()
 
     @pyqtSlot(int, str, bool)
     def on_host_gallery_settled(
@@ -290,40 +409,24 @@ class HostFamilyCoordinator(QObject):
         host_name: str,
         canonical_file_id: str,
     ) -> None:
-        """Start a background `threading.Timer` for the md5 poll.
+        """Queue the md5 poll on the primary host's shared poller.
 
-        Registers the Timer in `_pending_timers` so shutdown can cancel it
-        and duplicate schedules on the same primary row replace (rather
-        than stack) the pending poller. Overridable by tests that want to
-        run the poller synchronously or replace the thread model entirely.
+        The first poll happens K2S_MD5_INITIAL_DELAY_SEC from now. A second
+        schedule for the same primary row replaces (rather than stacks) the
+        pending one. Overridable by tests that want to defer the poll.
         """
-        # Replace any in-flight Timer for this same primary row — second
-        # schedules are idempotent at the DB level, but stacking them wastes
-        # HTTP calls and log lines.
-        with self._pending_timers_lock:
-            existing = self._pending_timers.pop(primary_row_id, None)
-        if existing is not None:
-            existing.cancel()
-
-        def _run_and_cleanup():
-            try:
-                _md5_fetch_worker(
-                    self.queue_store,
-                    gallery_fk,
-                    family,
-                    primary_row_id,
-                    host_name,
-                    canonical_file_id,
-                )
-            finally:
-                with self._pending_timers_lock:
-                    self._pending_timers.pop(primary_row_id, None)
-
-        t = threading.Timer(K2S_MD5_INITIAL_DELAY_SEC, _run_and_cleanup)
-        t.daemon = True
-        with self._pending_timers_lock:
-            self._pending_timers[primary_row_id] = t
-        t.start()
+        with self._md5_pollers_lock:
+            poller = self._md5_pollers.get(host_name)
+            if poller is None:
+                poller = _FamilyMd5Poller(self.queue_store, host_name)
+                self._md5_pollers[host_name] = poller
+        poller.schedule(_Md5Job(
+            gallery_fk=gallery_fk,
+            family=family,
+            primary_row_id=primary_row_id,
+            canonical_file_id=canonical_file_id,
+            due=time.monotonic() + K2S_MD5_INITIAL_DELAY_SEC,
+        ))
         log(
             f"HostFamilyCoordinator: scheduled md5 poll for {host_name} "
             f"gallery_fk={gallery_fk} in {K2S_MD5_INITIAL_DELAY_SEC}s",
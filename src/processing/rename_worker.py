@@ -5,13 +5,15 @@ Uses EXACT working code from ImxToUploader for renames.
 Extends with image status checking via imx.to/user/moderate endpoint.
 """
 
+import codecs
 import threading
 import queue
 import time
 import re
 import requests
 import os
-from typing import List, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Any, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 from src.utils.logger import log
 from src.utils.credentials import decrypt_password, get_credential
@@ -104,6 +106,76 @@ def clear_session_cookies_from_keyring():
         pass
 
 
+class _ModerateResponseParser:
+    """Incremental parser for imx.to/user/moderate responses.
+
+    Fed the raw response chunks as they arrive; picks up the 'Found: X images'
+    count and the image IDs listed in the imageallcodes textarea while keeping
+    only a small window of the response in memory.
+    """
+
+    _FOUND_RE = re.compile(r'Found:\s*(\d+)\s*images?', re.IGNORECASE)
+    _TEXTAREA_OPEN_RE = re.compile(r'<textarea[^>]*class=["\']imageallcodes["\'][^>]*>', re.IGNORECASE)
+    _TEXTAREA_CLOSE_RE = re.compile(r'</textarea>', re.IGNORECASE)
+    _IMAGE_ID_RE = re.compile(r'/(?:i|thumb)/([a-zA-Z0-9]+)')
+    _HEAD_TAIL = 1024  # Characters kept before the textarea so split tokens still match
+    _DDOS_GUARD_SCAN = 10000  # DDoS-Guard pages are detected within the first bytes
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        self._buffer = ''
+        self._in_textarea = False
+        self.bytes_read = 0
+        self.found_count: Optional[int] = None
+        self.online_ids: set = set()
+        self.ddos_guard = False
+        self.done = False  # Closing </textarea> seen; the rest of the page is not needed
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the response body."""
+        if self.done:
+            return
+        self.bytes_read += len(chunk)
+        self._buffer += self._decoder.decode(chunk)
+        self._scan(final=False)
+
+    def close(self) -> None:
+        """Parse whatever is left once the response has been fully read."""
+        if not self.done:
+            self._buffer += self._decoder.decode(b'', final=True)
+            self._scan(final=True)
+
+    def _scan(self, final: bool) -> None:
+        if not self._in_textarea:
+            if self.found_count is None:
+                match = self._FOUND_RE.search(self._buffer)
+                if match:
+                    self.found_count = int(match.group(1))
+            if self.bytes_read < self._DDOS_GUARD_SCAN and 'DDoS-Guard' in self._buffer:
+                self.ddos_guard = True
+            match = self._TEXTAREA_OPEN_RE.search(self._buffer)
+            if not match:
+                self._buffer = self._buffer[-self._HEAD_TAIL:]
+                return
+            self._in_textarea = True
+            self._buffer = self._buffer[match.end():]
+
+        match = self._TEXTAREA_CLOSE_RE.search(self._buffer)
+        if match:
+            content, self._buffer = self._buffer[:match.start()], ''
+            self.done = True
+        elif final:
+            content, self._buffer = self._buffer, ''
+        else:
+            # Only consume up to the last whitespace so an ID or the closing tag
+            # split across chunks is completed by the next one
+            cut = max(self._buffer.rfind('\n'), self._buffer.rfind(' '))
+            if cut < 0:
+                return
+            content, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        self.online_ids.update(self._IMAGE_ID_RE.findall(content))
+
+
 class RenameWorker(QObject):
     """Background worker that handles gallery renames and image status checking on imx.to.
 
@@ -116,11 +188,18 @@ class RenameWorker(QObject):
     status_check_completed = pyqtSignal(dict)     # results dict
     status_check_error = pyqtSignal(str)          # error_message
     quick_count_available = pyqtSignal(int, int)  # online_found, total_submitted
+    status_check_partial = pyqtSignal(dict)       # results for galleries whose shards finished
 
     # Constants for status check streaming
     STATUS_CHECK_CHUNK_SIZE = 4096  # Bytes per chunk when streaming response
     STATUS_CHECK_MAX_SCAN_SIZE = 100 * 1024  # 100KB - scan limit for finding count
 
+    # Sharded status checks: URL sets larger than one shard are split into
+    # several /user/moderate requests run concurrently on the same session
+    STATUS_CHECK_SHARD_SIZE = 10000  # URLs per request
+    STATUS_CHECK_SHARD_WORKERS = 3  # Concurrent shard requests
+    STATUS_CHECK_SHARD_CHUNK_SIZE = 64 * 1024  # Bytes per chunk when parsing shard responses
+
 
     def __init__(self):
         """Initialize RenameWorker with own web session.
@@ -802,6 +881,8 @@ class RenameWorker(QObject):
         Uses streaming to detect "Found: X images" early and exit without
         downloading the full response (30MB+) when all images are online.
         Falls back to ID-based matching when some images are offline.
+        More than STATUS_CHECK_SHARD_SIZE URLs are checked in shards instead,
+        see _perform_sharded_status_check().
 
         Args:
             galleries_data: List of gallery dicts with image_urls
@@ -851,6 +932,12 @@ class RenameWorker(QObject):
         log(f"Checking status of {total_urls} URLs from {len(gallery_info)} galleries",
             level="info", category="status_check")
 
+        if total_urls > self.STATUS_CHECK_SHARD_SIZE:
+            if self._status_check_cancelled.is_set():
+                log("Status check cancelled before request", level="debug", category="status_check")
+                return {}
+            return self._perform_sharded_status_check(gallery_info, total_urls)
+
         # Emit initial progress
         self.status_check_progress.emit(0, total_urls)
 
@@ -1119,6 +1206,220 @@ class RenameWorker(QObject):
                 except Exception:
                     pass
 
+    def _perform_sharded_status_check(
+        self,
+        gallery_info: Dict[str, Dict[str, Any]],
+        total_urls: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """Check a large URL set as several bounded /user/moderate requests.
+
+        Galleries are packed in order into shards of at most
+        STATUS_CHECK_SHARD_SIZE URLs; a gallery larger than that spans
+        consecutive shards. Up to STATUS_CHECK_SHARD_WORKERS shards run at once
+        on the shared session, each response is parsed while it streams, and
+        status_check_partial is emitted with a gallery's result as soon as all
+        of its shards are done. quick_count_available is not emitted.
+
+        A failed shard only leaves its galleries out of the results;
+        authentication and DDoS-Guard errors abort the whole check.
+
+        Args:
+            gallery_info: path -> {db_id, name, urls} as built by _perform_status_check
+            total_urls: Number of URLs across all galleries
+
+        Returns:
+            Dict mapping gallery path to status results, empty if cancelled
+
+        Raises:
+            Exception: On authentication/DDoS-Guard errors, or when every shard failed
+        """
+        shards: List[List[str]] = []
+        shard_paths: List[List[str]] = []
+        shards_left: Dict[str, int] = {path: 0 for path in gallery_info}
+        for path, info in gallery_info.items():
+            for url in info['urls']:
+                url = url.strip() if isinstance(url, str) else ''
+                if not url:
+                    continue
+                if not shards or len(shards[-1]) >= self.STATUS_CHECK_SHARD_SIZE:
+                    shards.append([])
+                    shard_paths.append([])
+                shards[-1].append(url)
+                if not shard_paths[-1] or shard_paths[-1][-1] != path:
+                    shard_paths[-1].append(path)
+                    shards_left[path] += 1
+
+        log(f"Checking {total_urls} URLs in {len(shards)} shards of up to "
+            f"{self.STATUS_CHECK_SHARD_SIZE}", level="debug", category="status_check")
+        self.status_check_progress.emit(0, total_urls)
+
+        online_urls: set = set()
+        failed_paths: set = set()
+        results: Dict[str, Dict[str, Any]] = {}
+        shard_errors: List[Exception] = []
+        done_urls = 0
+        _t0 = time.perf_counter()
+
+        stop = threading.Event()
+        workers = min(self.STATUS_CHECK_SHARD_WORKERS, len(shards))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ImxStatusShard") as executor:
+            futures = {
+                executor.submit(self._check_status_shard, urls, stop): index
+                for index, urls in enumerate(shards)
+            }
+            try:
+                for future in as_completed(futures):
+                    index = futures[future]
+                    urls = shards[index]
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        if 'DDoS-Guard' in str(e) or 'Authentication' in str(e):
+                            raise
+                        log(f"Status check shard {index + 1}/{len(shards)} failed: {e}",
+                            level="warning", category="status_check")
+                        shard_errors.append(e)
+                        failed_paths.update(shard_paths[index])
+                    else:
+                        if outcome is None:
+                            log("Status check cancelled during sharded check", level="debug", category="status_check")
+                            return {}
+                        found_count, online_ids = outcome
+                        if online_ids is None:
+                            online_urls.update(urls)
+                        else:
+                            for url in urls:
+                                if self._extract_image_id(url) in online_ids:
+                                    online_urls.add(url)
+
+                    done_urls += len(urls)
+                    self.status_check_progress.emit(done_urls, total_urls)
+
+                    finished: Dict[str, Dict[str, Any]] = {}
+                    for path in shard_paths[index]:
+                        shards_left[path] -= 1
+                        if shards_left[path] == 0 and path not in failed_paths:
+                            finished[path] = self._build_gallery_status(gallery_info[path], online_urls)
+                    if finished:
+                        results.update(finished)
+                        self.status_check_partial.emit(finished)
+            finally:
+                # Makes shards still queued or streaming return early on error/cancel
+                stop.set()
+
+        # Galleries whose URLs were all blank never reached a shard
+        for path, count in shards_left.items():
+            if count == 0 and path not in failed_paths:
+                results[path] = self._build_gallery_status(gallery_info[path], online_urls)
+
+        if shard_errors and not results:
+            raise shard_errors[0]
+
+        log(f"Timing: {len(shards)} shards took {time.perf_counter() - _t0:.2f}s "
+            f"({len(shard_errors)} failed)", level="trace", category="status_check")
+        total_online = sum(result['online'] for result in results.values())
+        log(f"Found {total_online} online URLs out of {total_urls} submitted",
+            level="info", category="status_check")
+        return results
+
+    def _build_gallery_status(self, info: Dict[str, Any], online_urls: set) -> Dict[str, Any]:
+        """Build one gallery's status result from the set of online URLs."""
+        online_list = []
+        offline_list = []
+        for url in info['urls']:
+            if isinstance(url, str) and url.strip() in online_urls:
+                online_list.append(url)
+            else:
+                offline_list.append(url)
+        return {
+            'db_id': info['db_id'],
+            'name': info['name'],
+            'total': len(info['urls']),
+            'online': len(online_list),
+            'offline': len(offline_list),
+            'online_urls': online_list,
+            'offline_urls': offline_list
+        }
+
+    def _check_status_shard(
+        self,
+        urls: List[str],
+        stop: threading.Event,
+        is_retry: bool = False
+    ) -> Optional[Tuple[int, Optional[set]]]:
+        """POST one shard to /user/moderate and parse the response as it streams.
+
+        Stops reading as soon as the answer is known: when 'Found: X images'
+        equals the shard size (all online) or once the imageallcodes textarea
+        has been closed.
+
+        Args:
+            urls: Image URLs in this shard
+            stop: Set by the coordinator to abandon the shard
+            is_retry: Whether this is a retry after re-auth
+
+        Returns:
+            (found_count, online_ids) with online_ids None when every URL is
+            online, or None if cancelled
+        """
+        if stop.is_set() or self._status_check_cancelled.is_set():
+            return None
+
+        response = None
+        try:
+            response = self.session.post(
+                f"{self.web_url}/user/moderate",
+                data={'imagesid': '\n'.join(urls)},
+                timeout=(30, 300),  # (connect, read) - 30s connect, 5min read
+                verify=True,
+                stream=True
+            )
+
+            if response.status_code == 403:
+                response.close()
+                response = None
+                if is_retry:
+                    raise Exception("Authentication expired and re-auth failed")
+                log("Status check shard: Session expired (403), attempting re-auth",
+                    level="debug", category="status_check")
+                # Another shard may have just re-authenticated the shared session
+                reauthed = self._attempt_reauth_with_rate_limit() or (
+                    self.login_successful
+                    and time.time() - self.last_reauth_attempt < self.min_reauth_interval
+                )
+                if not reauthed:
+                    raise Exception("Authentication expired and re-auth failed")
+                return self._check_status_shard(urls, stop, is_retry=True)
+
+            if response.status_code != 200:
+                raise Exception(f"Server returned HTTP {response.status_code}")
+
+            parser = _ModerateResponseParser()
+            for chunk in response.iter_content(chunk_size=self.STATUS_CHECK_SHARD_CHUNK_SIZE):
+                if stop.is_set() or self._status_check_cancelled.is_set():
+                    return None
+                parser.feed(chunk)
+                if parser.ddos_guard:
+                    raise Exception("DDoS-Guard protection active - please try again later")
+                if parser.found_count == len(urls):
+                    return parser.found_count, None
+                if parser.done:
+                    break
+            parser.close()
+
+            if parser.found_count == len(urls):
+                return parser.found_count, None
+            log(f"Shard: {parser.found_count or 0}/{len(urls)} found, {len(parser.online_ids)} IDs "
+                f"parsed from {parser.bytes_read} bytes", level="trace", category="status_check")
+            return parser.found_count or 0, parser.online_ids
+
+        finally:
+            if response is not None:
+                try:
+                    response.close()
+                except Exception:
+                    pass
+
     def _process_renames(self):
         """Background thread that processes rename queue."""
         from src.storage.gallery_management import save_unnamed_gallery
@@ -2,24 +2,33 @@
 
 Orchestrates concurrent per-host checking for a set of galleries.
 Groups galleries by host, creates the appropriate checker, runs all host
-checks concurrently, collects results, and writes them to the database.
+checks concurrently, and streams results to the database in small batches as
+each job yields them, so a cancelled or crashed scan keeps its progress.
+
+A checkpoint (scan parameters + start time) is saved in the settings table
+while a scan runs. Restarting a scan with the same parameters after a cancel
+or crash skips galleries the interrupted run already checked.
 
 IMX galleries are checked via the RenameWorker's /user/moderate endpoint
 (single POST, near-instantaneous). Other image hosts (Turbo, etc.) use
-ThumbnailChecker (HEAD requests + ETag matching).
+ThumbnailChecker (HEAD requests + ETag matching), checking all of a host's
+galleries through one multiplexed curl loop sized by the host's free
+ConnectionLimiter slots.
 """
 
 import json
+import sqlite3
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Callable, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Callable, Set, Tuple
 
 from src.network.thumbnail_checker import ThumbnailChecker
 from src.network.k2s_file_checker import K2SFileChecker
 from src.network.rapidgator_file_checker import RapidgatorFileChecker
 from src.network.connection_limiter import ConnectionLimiter
+from src.storage.k2s_inventory_cache import K2SInventoryCache
 from src.utils.logger import log
 
 
@@ -36,6 +45,14 @@ K2S_API_BASES = {
 # File hosts with no checker implementation yet
 UNSUPPORTED_FILE_HOSTS = frozenset({'filedot', 'filespace'})
 
+# Results buffered before each bulk_upsert_scan_results call
+SCAN_RESULT_BATCH_SIZE = 200
+
+# Default age limit for resuming an interrupted scan (seconds)
+CHECKPOINT_MAX_AGE = 86400
+
+ScanResult = Tuple[int, str, str, str, int, int, int, Optional[str]]
+
 
 @dataclass
 class HostScanJob:
@@ -105,6 +122,39 @@ def _load_file_host_credentials() -> Dict[str, str]:
     return credentials
 
 
+class _ScanResultWriter:
+    """Thread-safe buffer that writes scan results to the store in batches."""
+
+    def __init__(self, store: Any, batch_size: int = SCAN_RESULT_BATCH_SIZE):
+        self._store = store
+        self._batch_size = max(1, batch_size)
+        self._buffer: List[ScanResult] = []
+        self._lock = threading.Lock()
+        self.written = 0
+        self.failed = 0
+
+    def add(self, result: ScanResult) -> None:
+        with self._lock:
+            self._buffer.append(result)
+            if len(self._buffer) >= self._batch_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        try:
+            self._store.bulk_upsert_scan_results(batch)
+            self.written += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            log(f"Failed to write {len(batch)} scan results: {e}", level="error", category="scanner")
+
+
 class ScanCoordinator:
     """Orchestrates concurrent per-host link scanning.
 
@@ -112,7 +162,7 @@ class ScanCoordinator:
         coord = ScanCoordinator(store=queue_store, connection_limiter=limiter)
         coord.start_scan(gallery_data, file_upload_data)
         # ... progress via callback ...
-        # results written to host_scan_results table on completion
+        # results stream into the host_scan_results table while the scan runs
     """
 
     def __init__(
@@ -135,9 +185,11 @@ class ScanCoordinator:
         # K2S family per-host inventory cache. keep2share/fileboom/tezfiles are
         # three separate services with three distinct file trees, so each needs
         # its own inventory; they are NOT one shared account.
-        self._k2s_inventory_by_host: Dict[str, Dict[str, dict]] = {}
+        self._k2s_inventory_cache = K2SInventoryCache()
         self._k2s_storage_by_host: Dict[str, int] = {}
         self._k2s_lock = threading.Lock()
+        # Thumbnail HEAD throughput per image host for the last scan
+        self._thumbnail_rates: Dict[str, float] = {}
 
     @property
     def is_cancelled(self) -> bool:
@@ -151,7 +203,20 @@ class ScanCoordinator:
         self,
         image_galleries: List[Dict[str, Any]],
         file_uploads: List[Dict[str, Any]],
+        scan_key: Optional[str] = None,
+        resume_max_age: int = CHECKPOINT_MAX_AGE,
     ) -> None:
+        """Start scanning in a background thread.
+
+        Args:
+            image_galleries: Image host galleries (see get_galleries_for_scan)
+            file_uploads: Completed file host uploads (see get_galleries_for_scan)
+            scan_key: Identifies the scan parameters for checkpointing. If the
+                previous scan with the same key didn't finish, galleries it
+                already checked are skipped. None disables checkpoints.
+            resume_max_age: Only resume a checkpoint started within this many
+                seconds; older ones start over
+        """
         # Load credentials if none were provided
         if not self._credentials:
             self._credentials = _load_file_host_credentials()
@@ -159,21 +224,61 @@ class ScanCoordinator:
         self._cancelled.clear()
         self._scan_thread = threading.Thread(
             target=self._run_scan,
-            args=(image_galleries, file_uploads),
+            args=(image_galleries, file_uploads, scan_key, resume_max_age),
             daemon=True,
             name="ScanCoordinator",
         )
         self._scan_thread.start()
 
+    def _resume_from_checkpoint(
+        self,
+        scan_key: str,
+        image_galleries: List[Dict[str, Any]],
+        file_uploads: List[Dict[str, Any]],
+        resume_max_age: int = CHECKPOINT_MAX_AGE,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Drop galleries an interrupted run of the same scan already checked.
+
+        Saves a fresh checkpoint when there is nothing to resume.
+        """
+        now = int(time.time())
+        checkpoint = self._store.get_scan_checkpoint()
+        if (not checkpoint or checkpoint.get('scan_key') != scan_key
+                or now - int(checkpoint.get('started_ts', 0)) > resume_max_age):
+            self._store.save_scan_checkpoint({'scan_key': scan_key, 'started_ts': now})
+            return image_galleries, file_uploads
+
+        done: Set[Tuple[int, str, str]] = self._store.get_scan_results_checked_since(
+            int(checkpoint.get('started_ts', 0)))
+        remaining_images = [
+            g for g in image_galleries
+            if (g.get('db_id'), 'image', g.get('image_host_id', 'imx')) not in done
+        ]
+        remaining_uploads = [
+            u for u in file_uploads
+            if (u.get('gallery_fk'), 'file', u.get('host_name', '')) not in done
+        ]
+        skipped = (len(image_galleries) - len(remaining_images)) + (len(file_uploads) - len(remaining_uploads))
+        log(f"Resuming interrupted scan: skipping {skipped} items already checked",
+            level="info", category="scanner")
+        return remaining_images, remaining_uploads
+
     def _run_scan(
         self,
         image_galleries: List[Dict[str, Any]],
         file_uploads: List[Dict[str, Any]],
+        scan_key: Optional[str] = None,
+        resume_max_age: int = CHECKPOINT_MAX_AGE,
     ) -> None:
         start_time = time.time()
-        all_results: List[Tuple[int, str, str, str, int, int, int, Optional[str]]] = []
+        writer = _ScanResultWriter(self._store)
+        self._thumbnail_rates = {}
 
         try:
+            if scan_key is not None:
+                image_galleries, file_uploads = self._resume_from_checkpoint(
+                    scan_key, image_galleries, file_uploads, resume_max_age)
+
             imx_job = self._build_imx_job(image_galleries)
             image_jobs = self._build_image_host_jobs(image_galleries)
             file_jobs = self._build_file_host_jobs(file_uploads)
@@ -181,6 +286,8 @@ class ScanCoordinator:
 
             if not all_jobs:
                 log("No scan jobs to run", level="info", category="scanner")
+                if scan_key is not None:
+                    self._store.clear_scan_checkpoint()
                 if self._completion_callback:
                     self._completion_callback({'total_hosts': 0, 'total_galleries': 0, 'elapsed': 0})
                 return
@@ -191,7 +298,7 @@ class ScanCoordinator:
             with ThreadPoolExecutor(max_workers=len(all_jobs), thread_name_prefix="scan") as executor:
                 future_to_job = {}
                 for job in all_jobs:
-                    future = executor.submit(self._run_job, job)
+                    future = executor.submit(self._run_job, job, writer)
                     future_to_job[future] = job
 
                 for future in as_completed(future_to_job):
@@ -199,15 +306,16 @@ class ScanCoordinator:
                         break
                     job = future_to_job[future]
                     try:
-                        results = future.result()
-                        all_results.extend(results)
+                        future.result()
                     except Exception as e:
                         log(f"Scan job failed for {job.host_id}: {e}", level="error", category="scanner")
 
-            if all_results and not self._cancelled.is_set():
-                self._store.bulk_upsert_scan_results(all_results)
-                log(f"Wrote {len(all_results)} scan results to database",
-                    level="info", category="scanner")
+            writer.flush()
+            log(f"Wrote {writer.written} scan results to database",
+                level="info", category="scanner")
+            # A finished scan needs no resume; keep the checkpoint if cancelled
+            if scan_key is not None and not self._cancelled.is_set():
+                self._store.clear_scan_checkpoint()
 
             elapsed = time.time() - start_time
             if self._completion_callback:
@@ -215,17 +323,33 @@ class ScanCoordinator:
                              if self._k2s_storage_by_host else None)
                 self._completion_callback({
                     'total_hosts': len(all_jobs),
-                    'total_galleries': len(all_results),
+                    'total_galleries': writer.written,
                     'elapsed': elapsed,
                     'k2s_storage_used': k2s_total,
+                    'thumbnail_checks_per_sec': dict(self._thumbnail_rates),
                 })
 
         except Exception as e:
             log(f"Scan coordinator error: {e}", level="error", category="scanner")
+        finally:
+            # Whatever was checked before a cancel or error is kept
+            writer.flush()
+
+    def _run_job(self, job: HostScanJob, writer: _ScanResultWriter) -> int:
+        """Run one host job, writing each result as it is produced.
+
+        Returns:
+            Number of results produced
+        """
+        count = 0
+        for result in self._iter_job_results(job):
+            writer.add(result)
+            count += 1
+        return count
 
-    def _run_job(self, job: HostScanJob) -> List[Tuple]:
+    def _iter_job_results(self, job: HostScanJob) -> Iterator[ScanResult]:
         if self._cancelled.is_set():
-            return []
+            return iter(())
 
         if job.host_id == 'imx':
             return self._run_imx_job(job)
@@ -237,92 +361,137 @@ class ScanCoordinator:
             return self._run_rapidgator_job(job)
         elif job.host_id in UNSUPPORTED_FILE_HOSTS:
             log(f"No checker implemented for {job.host_id} yet", level="info", category="scanner")
-            return []
+            return iter(())
         else:
             log(f"No checker for host {job.host_id}, skipping", level="warning", category="scanner")
-            return []
+            return iter(())
 
-    def _run_image_host_job(self, job: HostScanJob) -> List[Tuple]:
-        checker = ThumbnailChecker(max_workers=2)
-        results = []
-        now = int(time.time())
+    def _acquire_connection_budget(self, host_id: str) -> int:
+        """Take as many of ``host_id``'s limiter slots as are free (at least one).
+
+        Blocks for the first slot so scans never exceed what upload workers
+        leave over. Returns 0 if the scan is cancelled while waiting.
+        """
+        try:
+            limit = max(1, int(self._connection_limiter.get_limit(host_id)))
+        except (TypeError, ValueError):
+            limit = ConnectionLimiter.DEFAULT_LIMIT
+        while not self._connection_limiter.acquire(host_id, timeout=0.5):
+            if self._cancelled.is_set():
+                return 0
+        acquired = 1
+        while acquired < limit and self._connection_limiter.acquire(host_id, timeout=0):
+            acquired += 1
+        return acquired
+
+    def _run_image_host_job(self, job: HostScanJob) -> Iterator[ScanResult]:
+        checker = ThumbnailChecker()
 
         # Calculate cumulative total for meaningful progress reporting
         total_for_host = sum(len(g.get('thumb_urls', [])) for g in job.galleries)
+        checked_by_gallery: Dict[int, int] = {}
         cumulative_checked = 0
         cumulative_online = 0
         cumulative_items = 0
 
-        for gallery in job.galleries:
-            if self._cancelled.is_set():
-                break
+        def on_progress(db_id, checked, total):
+            nonlocal cumulative_checked
+            cumulative_checked += checked - checked_by_gallery.get(db_id, 0)
+            checked_by_gallery[db_id] = checked
+            if self._progress_callback:
+                self._progress_callback(job.host_type, job.host_id, cumulative_checked, total_for_host,
+                                        cumulative_online, cumulative_items)
 
-            thumb_urls = gallery.get('thumb_urls', [])
-            db_id = gallery['db_id']
-            gallery_base = cumulative_checked
-
-            _cum_online = cumulative_online
-            _cum_items = cumulative_items
-            def on_progress(checked, total, _base=gallery_base, _host_total=total_for_host,
-                            _online=_cum_online, _items=_cum_items):
-                if self._progress_callback:
-                    self._progress_callback(job.host_type, job.host_id, _base + checked, _host_total,
-                                            _online, _items)
-
-            check_result = checker.check_gallery(
-                thumb_urls,
+        budget = self._acquire_connection_budget(job.host_id)
+        if not budget:
+            return
+        try:
+            galleries = ((g['db_id'], g.get('thumb_urls', [])) for g in job.galleries)
+            for db_id, check_result in checker.check_galleries(
+                galleries,
+                max_connections=budget,
                 cancel_event=self._cancelled,
                 progress_callback=on_progress,
-            )
-
-            cumulative_checked += len(thumb_urls)
-            cumulative_online += check_result.get('online', 0)
-            cumulative_items += check_result.get('online', 0) + check_result.get('offline', 0) + check_result.get('errors', 0)
-
-            detail = None
-            if check_result.get('offline_urls'):
-                detail = json.dumps({'offline_urls': check_result['offline_urls']})
-
-            results.append((
-                db_id,
-                job.host_type,
-                job.host_id,
-                check_result['status'],
-                check_result['online'],
-                check_result.get('online', 0) + check_result.get('offline', 0) + check_result.get('errors', 0),
-                now,
-                detail,
-            ))
-
-        return results
-
-    def _run_k2s_job(self, job: HostScanJob) -> List[Tuple]:
+            ):
+                items = check_result.get('online', 0) + check_result.get('offline', 0) + check_result.get('errors', 0)
+                cumulative_online += check_result.get('online', 0)
+                cumulative_items += items
+
+                detail = None
+                if check_result.get('offline_urls'):
+                    detail = json.dumps({'offline_urls': check_result['offline_urls']})
+
+                yield (
+                    db_id,
+                    job.host_type,
+                    job.host_id,
+                    check_result['status'],
+                    check_result['online'],
+                    items,
+                    int(time.time()),
+                    detail,
+                )
+        finally:
+            for _ in range(budget):
+                self._connection_limiter.release(job.host_id)
+
+        if checker.last_stats.get('checks'):
+            self._thumbnail_rates[job.host_id] = checker.last_stats['checks_per_sec']
+
+    def _run_k2s_job(self, job: HostScanJob) -> Iterator[ScanResult]:
         api_base = K2S_API_BASES.get(job.host_id, '')
         token = self._credentials.get(job.host_id, '')
         if not api_base or not token:
             log(f"Missing API config or credentials for {job.host_id}",
                 level="warning", category="scanner")
-            return []
+            return
 
         checker = K2SFileChecker(api_base=api_base, auth_token=token)
 
         # Each K2S-family host (keep2share/fileboom/tezfiles) has its own file
-        # tree, so walk each host's account once and cache it separately.
+        # tree, so each host's inventory is refreshed and stored separately.
+        # The stored inventory is updated folder by folder; galleries are then
+        # checked against an indexed lookup of just the file IDs they reference.
+        cache = self._k2s_inventory_cache
         with self._k2s_lock:
-            inventory = self._k2s_inventory_by_host.get(job.host_id)
-            if inventory is None:
-                log(f"Walking {job.host_id} account folders",
-                    level="info", category="scanner")
+            try:
+                # A reused or partly listed inventory may lack files uploaded
+                # since; those are verified with getFilesInfo below
+                listed_now = False
+                if cache.is_fresh(job.host_id):
+                    log(f"Using {job.host_id} inventory from the last scan",
+                        level="info", category="scanner")
+                else:
+                    log(f"Walking {job.host_id} account folders",
+                        level="info", category="scanner")
+                    refresh = cache.refresh(
+                        job.host_id,
+                        checker.walk_folders(cancel_event=self._cancelled),
+                        cancel_event=self._cancelled,
+                    )
+                    log(f"{job.host_id} folder walk {'complete' if refresh.complete else 'incomplete'}: "
+                        f"{refresh.folders} folders, {refresh.changed} changed, "
+                        f"{refresh.failed} failed, {refresh.removed} removed",
+                        level="info", category="scanner")
+                    listed_now = refresh.complete
+                self._k2s_storage_by_host[job.host_id] = cache.storage_used(job.host_id)
+                # Only the files these galleries reference, not the whole account
+                wanted = list(dict.fromkeys(
+                    file_id for gallery in job.galleries for file_id in gallery.get('file_ids', {})
+                ))
+                inventory = cache.get_files(job.host_id, wanted)
+            except sqlite3.Error as e:
+                log(f"K2S inventory cache unavailable ({e}); walking {job.host_id} in memory",
+                    level="warning", category="scanner")
                 all_files = checker.get_all_files()
                 inventory = {f['id']: f for f in all_files}
-                self._k2s_inventory_by_host[job.host_id] = inventory
                 self._k2s_storage_by_host[job.host_id] = checker.calc_storage_used(all_files)
-                log(f"{job.host_id} folder walk complete: {len(all_files)} files, "
-                    f"{self._k2s_storage_by_host[job.host_id]} bytes used",
-                    level="info", category="scanner")
+                listed_now = True
+            log(f"{job.host_id}: {self._k2s_storage_by_host[job.host_id]} bytes used",
+                level="debug", category="scanner")
+        if not listed_now:
+            inventory.update(self._verify_missing_k2s_files(job.host_id, checker, wanted, inventory))
 
-        results = []
-        now = int(time.time())
         gallery_count = len(job.galleries)
         cumulative_online = 0
         cumulative_items = 0
@@ -348,28 +517,47 @@ class ScanCoordinator:
             if check_result.get('offline_urls'):
                 detail = json.dumps({'offline_urls': check_result['offline_urls']})
 
-            results.append((
+            yield (
                 db_id,
                 job.host_type,
                 job.host_id,
                 check_result['status'],
                 check_result['online'],
                 check_result['total'],
-                now,
+                int(time.time()),
                 detail,
-            ))
+            )
+
+    def _verify_missing_k2s_files(self, host_id: str, checker: K2SFileChecker,
+                                  file_ids: List[str], inventory: Dict[str, dict]) -> Dict[str, dict]:
+        """Check file IDs missing from a stored inventory with getFilesInfo.
 
-        return results
+        A file uploaded after the last listing is not in the stored inventory
+        yet and would otherwise be reported offline until the next walk.
 
-    def _run_rapidgator_job(self, job: HostScanJob) -> List[Tuple]:
+        Returns:
+            {file_id: inventory-shaped entry} for the missing files the host
+            reports as available
+        """
+        missing = [file_id for file_id in file_ids if file_id not in inventory]
+        if not missing or self._cancelled.is_set():
+            return {}
+        available = {
+            file_id: {'id': file_id, 'is_available': True,
+                      'extended_info': {'storage_object': 'available'}}
+            for file_id, is_available in checker.check_files(missing).items() if is_available
+        }
+        log(f"{host_id}: {len(missing)} file(s) not in the stored inventory, "
+            f"{len(available)} confirmed available", level="debug", category="scanner")
+        return available
+
+    def _run_rapidgator_job(self, job: HostScanJob) -> Iterator[ScanResult]:
         token = self._credentials.get('rapidgator', '')
         if not token:
             log("Missing credentials for rapidgator", level="warning", category="scanner")
-            return []
+            return
 
         checker = RapidgatorFileChecker(auth_token=token)
-        results = []
-        now = int(time.time())
         gallery_count = len(job.galleries)
         cumulative_online = 0
         cumulative_items = 0
@@ -394,18 +582,16 @@ class ScanCoordinator:
             if check_result.get('offline_urls'):
                 detail = json.dumps({'offline_urls': check_result['offline_urls']})
 
-            results.append((
+            yield (
                 db_id,
                 job.host_type,
                 job.host_id,
                 check_result['status'],
                 check_result['online'],
                 check_result['total'],
-                now,
+                int(time.time()),
                 detail,
-            ))
-
-        return results
+            )
 
     def _build_imx_job(self, galleries: List[Dict[str, Any]]) -> Optional[HostScanJob]:
         """Build a single IMX job if there are IMX galleries to scan."""
@@ -414,20 +600,21 @@ class ScanCoordinator:
             return None
         return HostScanJob(host_type='image', host_id='imx', galleries=imx_galleries)
 
-    def _run_imx_job(self, job: HostScanJob) -> List[Tuple]:
+    def _run_imx_job(self, job: HostScanJob) -> Iterator[ScanResult]:
         """Check IMX galleries via the RenameWorker's /user/moderate endpoint.
 
-        This is a single POST with all image URLs — near-instantaneous compared
-        to per-thumbnail HEAD requests.
+        This is a single POST with all image URLs (split into concurrent shards
+        for very large scans) — near-instantaneous compared to per-thumbnail
+        HEAD requests.
         """
         if not self._rename_worker:
             log("No RenameWorker available for IMX scan — skipping", level="warning", category="scanner")
-            return []
+            return
 
         rw = self._rename_worker
         if not getattr(rw, 'login_successful', False):
             log("RenameWorker not authenticated — skipping IMX scan", level="warning", category="scanner")
-            return []
+            return
 
         # Build galleries_data in the format _perform_status_check expects
         galleries_data = []
@@ -443,7 +630,7 @@ class ScanCoordinator:
             })
 
         if not galleries_data:
-            return []
+            return
 
         total_galleries = len(galleries_data)
         if self._progress_callback:
@@ -453,7 +640,7 @@ class ScanCoordinator:
             raw_results = rw._perform_status_check(galleries_data)
         except Exception as e:
             log(f"IMX moderate check failed: {e}", level="error", category="scanner")
-            return []
+            return
 
         imx_online = sum(1 for r in raw_results.values() if r.get('online', 0) > 0
                          and r.get('offline', 0) == 0)
@@ -464,7 +651,6 @@ class ScanCoordinator:
                                     imx_online_items, imx_total_items)
 
         # Convert RenameWorker result format to scan_coordinator tuple format
-        results = []
         now = int(time.time())
         for gal in galleries_data:
             path = gal['path']
@@ -487,9 +673,7 @@ class ScanCoordinator:
             if r.get('offline_urls'):
                 detail = json.dumps({'offline_urls': r['offline_urls']})
 
-            results.append((db_id, 'image', 'imx', status, online, total, now, detail))
-
-        return results
+            yield (db_id, 'image', 'imx', status, online, total, now, detail)
 
     def _build_image_host_jobs(
         self, galleries: List[Dict[str, Any]]
@@ -15,7 +15,7 @@ from src.utils.templates import save_gallery_artifacts
 from src.network.image_host_factory import create_image_host_client
 from src.utils.logger import log
 from src.storage.queue_manager import GalleryQueueItem
-from src.core.engine import UploadEngine, AtomicCounter
+from src.core.engine import UploadEngine, AtomicCounter, ENGINE_MODE_THREADS, ENGINE_MODES
 from src.core.image_host_config import get_image_host_setting, get_image_host_config_manager, is_image_host_enabled, get_enabled_hosts
 from src.processing.hooks_executor import execute_gallery_hooks
 
@@ -335,6 +335,7 @@ class UploadWorker(QThread):
                 thumbnail_format = get_image_host_setting(host_id, 'thumbnail_format', 'int')
                 max_retries = get_image_host_setting(host_id, 'max_retries', 'int')
                 parallel_batch_size = get_image_host_setting(host_id, 'parallel_batch_size', 'int')
+                engine_mode = get_image_host_setting(host_id, 'upload_engine', 'str')
                 # Pass the item directly for precalculated dimensions (engine uses getattr on it)
                 if item.scan_complete and (item.avg_width or item.avg_height):
                     log(f"Using precalculated dimensions for {item.name}: {item.avg_width}x{item.avg_height}", level="debug", category="uploads")
@@ -343,6 +344,7 @@ class UploadWorker(QThread):
                 results = self._run_upload_engine(
                     item, thumbnail_size, thumbnail_format,
                     max_retries, parallel_batch_size,
+                    engine_mode=engine_mode,
                 )
 
             # Handle paused state
@@ -953,7 +955,8 @@ class UploadWorker(QThread):
 
     def _run_upload_engine(self, item: GalleryQueueItem, thumbnail_size: int,
                            thumbnail_format: int, max_retries: int,
-                           parallel_batch_size: int) -> dict:
+                           parallel_batch_size: int,
+                           engine_mode: str = ENGINE_MODE_THREADS) -> dict:
         """Run UploadEngine directly with any ImageHostClient.
 
         Replaces the previous uploader.upload_folder() call so that hosts
@@ -1029,6 +1032,8 @@ class UploadWorker(QThread):
             on_progress=on_progress,
             should_soft_stop=should_soft_stop,
             on_image_uploaded=on_image_uploaded,
+            engine_mode=engine_mode if engine_mode in ENGINE_MODES else ENGINE_MODE_THREADS,
+            should_stop=lambda: not self.running,
         )
 
         # Merge results from this run with previously uploaded images (resume)
@@ -12,9 +12,11 @@ Note: All heavy work should be triggered from worker/manager threads, not GUI.
 
 from __future__ import annotations
 
+import atexit
 import os
 import shutil
 import sqlite3
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -22,6 +24,7 @@ import json
 
 from src.utils.logger import log
 from src.core.constants import HOST_FAMILY_PRIORITY
+from src.storage.work_signal import get_file_host_work_signal
 
 
 def _safe_json_loads(raw: str | None, fallback):
@@ -37,6 +40,16 @@ def _safe_json_loads(raw: str | None, fallback):
 
 _LOW_DISK_THRESHOLD_BYTES = 50 * 1024 * 1024  # 50 MB
 
+# Paths per "WHERE g.path IN (...)" statement; stays under SQLite's bound
+# parameter limit on builds that still default to 999
+_PATH_BATCH_SIZE = 500
+
+
+def _path_batches(paths: List[str]) -> Iterable[List[str]]:
+    """Split a path list into chunks for IN (...) queries."""
+    for start in range(0, len(paths), _PATH_BATCH_SIZE):
+        yield paths[start:start + _PATH_BATCH_SIZE]
+
 
 # Access central data dir path from shared helper
 from src.utils.paths import get_central_store_base_path
@@ -64,8 +77,254 @@ def _connect(db_path: Optional[str] = None) -> sqlite3.Connection:
 _schema_initialized_dbs: set[str] = set()
 
 
+# Per-connection cache of compiled statements. QueueStore issues a few dozen
+# distinct SQL strings, so this keeps every one of them prepared for the life
+# of a pooled connection.
+_POOLED_STATEMENT_CACHE_SIZE = 256
+
+
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that remembers where it points.
+
+    ``db_key`` is the resolved path reported by ``PRAGMA database_list`` so
+    ``_ensure_schema`` can skip that query, and ``file_id`` is the
+    (st_dev, st_ino) of the database file when it was opened, so a pooled
+    connection to a file that was since deleted or replaced gets reopened.
+    ``pool_depth`` counts the owning thread's open uses; ``pool_retired``
+    marks a connection that close_all() found in use, which its thread
+    closes when the last use ends.
+    """
+    db_key: str = ''
+    file_id: Tuple[int, int] = (0, 0)
+    pool_depth: int = 0
+    pool_closed: bool = False
+    pool_retired: bool = False
+
+
+def _file_identity(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return (st.st_dev, st.st_ino)
+
+
+class _ConnectionPool:
+    """Long-lived per-thread SQLite connections shared by QueueStore methods.
+
+    Only databases registered with ``add_database()`` (QueueStore instances
+    created with ``pooled=True``) are pooled; every other path keeps the
+    open-per-call behaviour. Each thread keeps one connection per database
+    path, so repeated calls skip the connect, the four PRAGMAs and the schema
+    check, and reuse statements already compiled in the connection's
+    statement cache. Connections run in autocommit mode like ``_connect``;
+    any transaction left open by a failed call is rolled back on release.
+    Connections owned by threads that have exited are closed the next time a
+    connection is opened.
+
+    ``_lock`` guards ``_connections`` and every ``pool_depth`` /
+    ``pool_closed`` / ``pool_retired`` change, so close_all() never closes a
+    connection another thread has checked out.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = True
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._databases: set[str] = set()
+        # id(conn) -> (owner thread, conn); whoever removes an entry closes it
+        self._connections: Dict[int, Tuple[threading.Thread, _PooledConnection]] = {}
+        self._stats = {'opened': 0, 'reused': 0, 'reopened': 0, 'closed': 0}
+
+    def add_database(self, db_path: str) -> None:
+        """Pool connections to db_path from now on."""
+        with self._lock:
+            self._databases.add(db_path)
+
+    def serves(self, db_path: str) -> bool:
+        return self.enabled and db_path in self._databases
+
+    def _thread_connections(self) -> Dict[str, _PooledConnection]:
+        conns = getattr(self._local, 'conns', None)
+        if conns is None:
+            conns = self._local.conns = {}
+        return conns
+
+    def _same_file(self, conn: _PooledConnection, path: str) -> bool:
+        try:
+            return _file_identity(path) == conn.file_id
+        except OSError:
+            return False
+
+    def _open(self, path: str) -> _PooledConnection:
+        conn = sqlite3.connect(
+            path,
+            timeout=5,
+            isolation_level=None,  # autocommit, same as _connect()
+            check_same_thread=False,  # only so close_all() can close idle connections from any thread
+            cached_statements=_POOLED_STATEMENT_CACHE_SIZE,
+            factory=_PooledConnection,
+        )
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA foreign_keys=ON;")
+        conn.execute("PRAGMA busy_timeout=5000;")
+        conn.db_key = conn.execute("PRAGMA database_list").fetchone()[2]
+        conn.file_id = _file_identity(path)
+        return conn
+
+    def acquire(self, db_path: str) -> sqlite3.Connection:
+        conns = self._thread_connections()
+        conn = conns.get(db_path)
+        if conn is not None:
+            # Nested use on the same thread must keep the connection it started with
+            current = conn.pool_depth > 0 or self._same_file(conn, db_path)
+            with self._lock:
+                if current and not conn.pool_closed and (conn.pool_depth > 0 or not conn.pool_retired):
+                    conn.pool_depth += 1
+                    self._stats['reused'] += 1
+                    return conn
+            self._discard(conn)
+            self._stats['reopened'] += 1
+
+        conn = self._open(db_path)
+        conns[db_path] = conn
+        with self._lock:
+            dead = self._prune_dead_threads()
+            self._connections[id(conn)] = (threading.current_thread(), conn)
+            self._stats['opened'] += 1
+            conn.pool_depth = 1
+        for stale in dead:
+            self._close(stale)
+        return conn
+
+    def release(self, conn: sqlite3.Connection, exc: Optional[BaseException] = None) -> None:
+        if not isinstance(conn, _PooledConnection):
+            conn.close()
+            return
+        broken = False
+        if conn.pool_depth == 1:
+            # Still checked out, so close_all() cannot close it under us
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                broken = True
+        with self._lock:
+            conn.pool_depth = max(0, conn.pool_depth - 1)
+            if conn.pool_depth or conn.pool_closed:
+                return
+            # Operational errors (locked file, I/O error, replaced database) may
+            # leave the connection unusable; start fresh on the next call.
+            if not (broken or conn.pool_retired
+                    or isinstance(exc, sqlite3.OperationalError) or type(exc) is sqlite3.DatabaseError):
+                return
+            self._connections.pop(id(conn), None)
+            conn.pool_closed = True
+        self._forget(conn)
+        self._close(conn)
+
+    def _discard(self, conn: _PooledConnection) -> None:
+        """Drop an idle connection of the current thread, closing it if still open."""
+        self._forget(conn)
+        with self._lock:
+            owned = self._connections.pop(id(conn), None) is not None
+            if owned:
+                conn.pool_closed = True
+        if owned:
+            self._close(conn)
+
+    def _forget(self, conn: _PooledConnection) -> None:
+        conns = self._thread_connections()
+        for path, candidate in list(conns.items()):
+            if candidate is conn:
+                del conns[path]
+
+    def _close(self, conn: _PooledConnection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._stats['closed'] += 1
+
+    def _prune_dead_threads(self) -> List[_PooledConnection]:
+        """Untrack connections of exited threads (caller holds _lock and closes them)."""
+        dead = []
+        for key, (thread, conn) in list(self._connections.items()):
+            if not thread.is_alive():
+                del self._connections[key]
+                conn.pool_closed = True
+                dead.append(conn)
+        return dead
+
+    def close_all(self, db_path: Optional[str] = None) -> int:
+        """Close pooled connections (for one database, or all of them).
+
+        Idle connections are closed now. A connection another thread has
+        checked out is retired instead: that thread finishes its call and
+        closes it on release. Threads transparently reopen on their next
+        call. Returns the number of connections closed or retired.
+        """
+        idle = []
+        retired = 0
+        with self._lock:
+            for key, (thread, conn) in list(self._connections.items()):
+                if db_path is not None and not _is_connection_for(conn, db_path):
+                    continue
+                del self._connections[key]
+                if conn.pool_depth:
+                    conn.pool_retired = True
+                    retired += 1
+                else:
+                    conn.pool_closed = True
+                    idle.append(conn)
+        for conn in idle:
+            self._close(conn)
+        return len(idle) + retired
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, open=len(self._connections))
+
+
+def _is_connection_for(conn: _PooledConnection, db_path: str) -> bool:
+    if conn.db_key == os.path.abspath(db_path):
+        return True
+    try:
+        return _file_identity(db_path) == conn.file_id
+    except OSError:
+        return False
+
+
+_pool = _ConnectionPool()
+atexit.register(_pool.close_all)
+
+
+def set_connection_pooling(enabled: bool) -> None:
+    """Enable or disable pooled connections for QueueStore.
+
+    When disabled, every call opens and closes its own connection (the
+    original behaviour), even for stores created with ``pooled=True``.
+    Existing pooled connections are closed.
+    """
+    _pool.enabled = bool(enabled)
+    if not enabled:
+        _pool.close_all()
+
+
+def close_pooled_connections(db_path: Optional[str] = None) -> int:
+    """Close pooled connections, e.g. before copying or moving the database."""
+    return _pool.close_all(db_path)
+
+
+def get_connection_pool_stats() -> Dict[str, int]:
+    """Return pool counters: opened, reused, reopened, closed and open."""
+    return _pool.stats()
+
+
 class _ConnectionContext:
-    """Context manager that properly closes sqlite3 connections.
+    """Context manager handing out a database connection for one operation.
+
+    Uses the per-thread connection pool for pooled databases; otherwise opens
+    a fresh connection and closes it on exit.
 
     Note: sqlite3.Connection.__exit__ only commits/rollbacks transactions,
     it does NOT close the connection. This context manager ensures proper cleanup.
@@ -73,18 +332,27 @@ class _ConnectionContext:
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
+        self._pooled = False
 
     def __enter__(self) -> sqlite3.Connection:
-        self.conn = _connect(self.db_path)
+        path = self.db_path or _get_db_path()
+        if _pool.serves(path):
+            self.conn = _pool.acquire(path)
+            self._pooled = True
+        else:
+            self.conn = _connect(self.db_path)
         return self.conn
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.conn:
-            self.conn.close()
+            if self._pooled:
+                _pool.release(self.conn, exc_val)
+            else:
+                self.conn.close()
         return False
 
 
-_SCHEMA_VERSION = 16  # Bump this when adding new migrations
+_SCHEMA_VERSION = 18  # Bump this when adding new migrations
 
 
 def _ensure_schema(conn: sqlite3.Connection) -> None:
@@ -93,8 +361,9 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
     Uses a stored schema version to skip migration checks on startup
     when the database is already up to date.
     """
-    # Get database path from connection to track initialization
-    db_path = conn.execute("PRAGMA database_list").fetchone()[2]
+    # Get database path from connection to track initialization (pooled
+    # connections already know it)
+    db_path = getattr(conn, 'db_key', '') or conn.execute("PRAGMA database_list").fetchone()[2]
 
     # Early return if already initialized this process
     if db_path in _schema_initialized_dbs:
@@ -650,6 +919,36 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
         log("Migration 16: forum_targets table created",
             level="info", category="database")
 
+        # Migration 17: per-file scan result cache. A row is only trusted
+        # while the file's size and mtime_ns still match, so unchanged files
+        # skip the header read and content hash on rescans. Keyed by folder
+        # so a gallery's rows come back in one indexed query and evict together.
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS image_scan_cache (
+                folder TEXT NOT NULL,
+                name TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                width INTEGER NOT NULL DEFAULT 0,
+                height INTEGER NOT NULL DEFAULT 0,
+                format TEXT,
+                valid INTEGER NOT NULL,
+                error TEXT,
+                content_hash TEXT,
+                checked_ts INTEGER NOT NULL,
+                PRIMARY KEY (folder, name)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS image_scan_cache_checked_idx
+                ON image_scan_cache(checked_ts);
+        """)
+
+        # Migration 18: scan cache tables created without the content hash
+        scan_cache_columns = {col[1] for col in conn.execute("PRAGMA table_info(image_scan_cache)").fetchall()}
+        if 'content_hash' not in scan_cache_columns:
+            conn.execute("ALTER TABLE image_scan_cache ADD COLUMN content_hash TEXT")
+            log("Migration 18: added content_hash to image_scan_cache",
+                level="info", category="database")
+
     except Exception as e:
         log(f"Warning: Migration failed: {e}", level="warning", category="database")
         # Continue anyway - the app should still work
@@ -743,16 +1042,33 @@ def _migrate_unnamed_galleries_to_db(conn: sqlite3.Connection) -> None:
 class QueueStore:
     """Storage facade for queue state in SQLite."""
 
-    def __init__(self, db_path: Optional[str] = None) -> None:
+    def __init__(self, db_path: Optional[str] = None, pooled: bool = False) -> None:
+        """
+        Args:
+            db_path: Database file (default: bbdrop.db in the data directory)
+            pooled: Keep long-lived per-thread connections to this database
+                instead of opening one per call. Meant for the long-running
+                app store that the GUI polls; short-lived stores don't need it.
+        """
         self.db_path = db_path or _get_db_path()
         # Ensure directory exists
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        if pooled:
+            _pool.add_database(self.db_path)
         # Initialize schema once
         with _ConnectionContext(self.db_path) as conn:
             _ensure_schema(conn)
         # Single writer background pool for non-blocking persistence
         self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="queue-store")
 
+    def close(self) -> None:
+        """Close pooled connections to this store's database.
+
+        Call before copying or moving the database files so the WAL is
+        checkpointed. Later calls on any thread reopen connections as needed.
+        """
+        close_pooled_connections(self.db_path)
+
     # ------------------------------ Migration ------------------------------
     def _is_migrated(self, conn: sqlite3.Connection) -> bool:
         cur = conn.execute("SELECT value_text FROM settings WHERE key = ?", ("queue_migrated_v1",))
@@ -1860,6 +2176,8 @@ class QueueStore:
                     (gallery_id, host_name, status, part_number,
                      blocked_by_upload_id, dedup_only, source_bytes)
                 )
+                if status == 'pending':
+                    get_file_host_work_signal().notify(host_name)
                 return cursor.lastrowid
             except Exception as e:
                 log(f"Error adding file host upload: {e}", level="error", category="database")
@@ -1925,12 +2243,18 @@ class QueueStore:
 
             return uploads
 
-    def get_all_file_host_uploads_batch(self) -> Dict[str, List[Dict[str, Any]]]:
+    def get_all_file_host_uploads_batch(
+        self, gallery_paths: Optional[List[str]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """Get all file host uploads in a single batch query (performance optimization).
 
         This method replaces 989 individual database queries with ONE query during startup,
         reducing database query time from 40-70 seconds to <1 second.
 
+        Args:
+            gallery_paths: Only return uploads for these galleries. None
+                (the default) returns uploads for every gallery.
+
         Returns:
             Dictionary mapping gallery path to list of upload dictionaries.
             Each upload dictionary contains: id, gallery_fk, host_name, status,
@@ -1940,12 +2264,7 @@ class QueueStore:
         """
         uploads_by_path: Dict[str, List[Dict[str, Any]]] = {}
 
-        with _ConnectionContext(self.db_path) as conn:
-            _ensure_schema(conn)
-
-            # Single optimized query with JOIN - fetches ALL uploads for ALL galleries
-            cursor = conn.execute(
-                """
+        select = """
                 SELECT
                     g.path,
                     fh.id, fh.gallery_fk, fh.host_name, fh.status,
@@ -1957,38 +2276,53 @@ class QueueStore:
                     fh.md5_hash, fh.file_size, COALESCE(fh.deduped, 0)
                 FROM file_host_uploads fh
                 JOIN galleries g ON fh.gallery_fk = g.id
-                ORDER BY g.path, fh.host_name ASC, fh.part_number ASC
                 """
-            )
+        order = "ORDER BY g.path, fh.host_name ASC, fh.part_number ASC"
 
-            for row in cursor.fetchall():
-                path = row[0]
-                upload = {
-                    'id': row[1],
-                    'gallery_fk': row[2],
-                    'host_name': row[3],
-                    'status': row[4],
-                    'zip_path': row[5],
-                    'started_ts': row[6],
-                    'finished_ts': row[7],
-                    'uploaded_bytes': row[8],
-                    'total_bytes': row[9],
-                    'download_url': row[10],
-                    'file_id': row[11],
-                    'file_name': row[12],
-                    'error_message': row[13],
-                    'raw_response': row[14],
-                    'retry_count': row[15],
-                    'created_ts': row[16],
-                    'part_number': row[17],
-                    'md5_hash': row[18],
-                    'file_size': row[19],
-                    'deduped': bool(row[20]),
-                }
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
 
-                if path not in uploads_by_path:
-                    uploads_by_path[path] = []
-                uploads_by_path[path].append(upload)
+            if gallery_paths is None:
+                # Single optimized query with JOIN - fetches ALL uploads for ALL galleries
+                cursors = [conn.execute(f"{select} {order}")]
+            else:
+                cursors = (
+                    conn.execute(
+                        f"{select} WHERE g.path IN ({','.join(['?'] * len(batch))}) {order}",
+                        tuple(batch)
+                    )
+                    for batch in _path_batches(list(gallery_paths))
+                )
+
+            for cursor in cursors:
+                for row in cursor.fetchall():
+                    path = row[0]
+                    upload = {
+                        'id': row[1],
+                        'gallery_fk': row[2],
+                        'host_name': row[3],
+                        'status': row[4],
+                        'zip_path': row[5],
+                        'started_ts': row[6],
+                        'finished_ts': row[7],
+                        'uploaded_bytes': row[8],
+                        'total_bytes': row[9],
+                        'download_url': row[10],
+                        'file_id': row[11],
+                        'file_name': row[12],
+                        'error_message': row[13],
+                        'raw_response': row[14],
+                        'retry_count': row[15],
+                        'created_ts': row[16],
+                        'part_number': row[17],
+                        'md5_hash': row[18],
+                        'file_size': row[19],
+                        'deduped': bool(row[20]),
+                    }
+
+                    if path not in uploads_by_path:
+                        uploads_by_path[path] = []
+                    uploads_by_path[path].append(upload)
 
         return uploads_by_path
 
@@ -2038,7 +2372,15 @@ class QueueStore:
                     f"UPDATE file_host_uploads SET {', '.join(updates)} WHERE id = ?",
                     values
                 )
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+                if updated and kwargs.get('status') == 'pending':
+                    # Wake the host's worker (retries, family unblocks)
+                    row = conn.execute(
+                        "SELECT host_name FROM file_host_uploads WHERE id = ?", (upload_id,)
+                    ).fetchone()
+                    if row:
+                        get_file_host_work_signal().notify(row[0])
+                return updated
             except Exception as e:
                 log(f"Error updating file host upload: {e}", level="error", category="database")
                 return False
@@ -2271,7 +2613,9 @@ class QueueStore:
 
     # ----------------------------- IMX Status Tracking ----------------------------
 
-    def get_image_urls_for_galleries(self, gallery_paths: List[str]) -> Dict[str, List[Dict[str, str]]]:
+    def get_image_urls_for_galleries(
+        self, gallery_paths: List[str], include_thumbs: bool = False
+    ) -> Dict[str, List[Dict[str, str]]]:
         """Get image URLs for multiple galleries in a single batch query.
 
         Optimized for checking gallery status on imx.to by fetching all image
@@ -2279,6 +2623,8 @@ class QueueStore:
 
         Args:
             gallery_paths: List of gallery paths to retrieve image URLs for
+            include_thumbs: Also return each image's 'thumb_url' (used when
+                rebuilding BBCode without a JSON artifact)
 
         Returns:
             Dictionary mapping gallery_path to list of image dictionaries.
@@ -2303,29 +2649,83 @@ class QueueStore:
         with _ConnectionContext(self.db_path) as conn:
             _ensure_schema(conn)
 
-            # Build parameterized query for batch lookup
-            placeholders = ','.join(['?'] * len(gallery_paths))
-            cursor = conn.execute(
-                f"""
-                SELECT g.path, i.filename, i.url
-                FROM images i
-                JOIN galleries g ON i.gallery_fk = g.id
-                WHERE g.path IN ({placeholders})
-                  AND i.url IS NOT NULL
-                  AND i.url != ''
-                ORDER BY g.path, i.filename
-                """,
-                tuple(gallery_paths)
-            )
+            for batch in _path_batches(list(gallery_paths)):
+                # Build parameterized query for batch lookup
+                placeholders = ','.join(['?'] * len(batch))
+                cursor = conn.execute(
+                    f"""
+                    SELECT g.path, i.filename, i.url, i.thumb_url
+                    FROM images i
+                    JOIN galleries g ON i.gallery_fk = g.id
+                    WHERE g.path IN ({placeholders})
+                      AND i.url IS NOT NULL
+                      AND i.url != ''
+                    ORDER BY g.path, i.filename
+                    """,
+                    tuple(batch)
+                )
 
-            for row in cursor.fetchall():
-                path, filename, url = row[0], row[1], row[2]
-                if path not in result:
-                    result[path] = []
-                result[path].append({
-                    'filename': filename,
-                    'url': url
-                })
+                for row in cursor.fetchall():
+                    path, filename, url = row[0], row[1], row[2]
+                    if path not in result:
+                        result[path] = []
+                    image = {
+                        'filename': filename,
+                        'url': url
+                    }
+                    if include_thumbs:
+                        image['thumb_url'] = row[3] or ''
+                    result[path].append(image)
+
+        return result
+
+    def get_image_dimensions_for_galleries(self, gallery_paths: List[str]) -> Dict[str, Dict[str, float]]:
+        """Aggregate stored image dimensions for multiple galleries.
+
+        Computed in SQL from the per-image width/height recorded at upload,
+        so callers don't have to re-open the gallery's files from disk.
+        Images without recorded dimensions are ignored; galleries with none
+        are left out of the result.
+
+        Returns:
+            Dictionary mapping gallery_path to a dict with avg_width,
+            avg_height, max_width, max_height, min_width and min_height.
+        """
+        if not gallery_paths:
+            return {}
+
+        result: Dict[str, Dict[str, float]] = {}
+
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+
+            for batch in _path_batches(list(gallery_paths)):
+                placeholders = ','.join(['?'] * len(batch))
+                cursor = conn.execute(
+                    f"""
+                    SELECT g.path,
+                           AVG(i.width), AVG(i.height),
+                           MAX(i.width), MAX(i.height),
+                           MIN(i.width), MIN(i.height)
+                    FROM images i
+                    JOIN galleries g ON i.gallery_fk = g.id
+                    WHERE g.path IN ({placeholders})
+                      AND i.width > 0
+                      AND i.height > 0
+                    GROUP BY g.path
+                    """,
+                    tuple(batch)
+                )
+
+                for row in cursor.fetchall():
+                    result[row[0]] = {
+                        'avg_width': row[1],
+                        'avg_height': row[2],
+                        'max_width': row[3],
+                        'max_height': row[4],
+                        'min_width': row[5],
+                        'min_height': row[6],
+                    }
 
         return result
 
@@ -2414,6 +2814,129 @@ class QueueStore:
             log(f"Failed to upsert scan results: {e}", level="error", category="database")
             raise
 
+    def get_scan_results_checked_since(self, since_ts: int) -> set:
+        """Get (gallery_fk, host_type, host_id) keys checked at or after ``since_ts``."""
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            rows = conn.execute(
+                "SELECT gallery_fk, host_type, host_id FROM host_scan_results WHERE checked_ts >= ?",
+                (since_ts,)
+            ).fetchall()
+        return {(row[0], row[1], row[2]) for row in rows}
+
+    def get_scan_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Get the checkpoint of the last link scan that didn't finish, if any."""
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            row = conn.execute(
+                "SELECT value_text FROM settings WHERE key = 'link_scan_checkpoint'"
+            ).fetchone()
+        return _safe_json_loads(row[0], None) if row else None
+
+    def save_scan_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """Record a running link scan (parameters + start time) for resume."""
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO settings(key, value_text) VALUES('link_scan_checkpoint', ?)",
+                (json.dumps(checkpoint),)
+            )
+
+    def clear_scan_checkpoint(self) -> None:
+        """Forget the link scan checkpoint (scan finished)."""
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            conn.execute("DELETE FROM settings WHERE key = 'link_scan_checkpoint'")
+
+    # ----------------------------- Scan cache ------------------------------
+
+    def get_image_scan_cache(self, folder: str) -> Dict[str, Dict[str, Any]]:
+        """Get cached per-file scan results for one gallery folder.
+
+        Returns:
+            {filename: {'size', 'mtime_ns', 'width', 'height', 'format',
+            'valid', 'error', 'content_hash'}}
+        """
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            rows = conn.execute(
+                """SELECT name, size, mtime_ns, width, height, format, valid, error, content_hash
+                   FROM image_scan_cache WHERE folder = ?""",
+                (folder,)
+            ).fetchall()
+        return {
+            row[0]: {
+                'size': row[1], 'mtime_ns': row[2], 'width': row[3], 'height': row[4],
+                'format': row[5], 'valid': bool(row[6]), 'error': row[7], 'content_hash': row[8],
+            }
+            for row in rows
+        }
+
+    def bulk_upsert_image_scan_cache(self, folder: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Insert or replace cached scan results for files in ``folder``.
+
+        Args:
+            folder: Gallery folder path
+            entries: {filename: dict with the keys returned by get_image_scan_cache}
+        """
+        if not entries:
+            return
+        now = int(time.time())
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            conn.executemany(
+                """INSERT OR REPLACE INTO image_scan_cache
+                   (folder, name, size, mtime_ns, width, height, format, valid, error, content_hash, checked_ts)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (folder, name, e['size'], e['mtime_ns'], e.get('width', 0), e.get('height', 0),
+                     e.get('format'), int(bool(e.get('valid'))), e.get('error'), e.get('content_hash'), now)
+                    for name, e in entries.items()
+                ]
+            )
+
+    def touch_image_scan_cache(self, folder: str) -> None:
+        """Mark a folder's cached rows as used now (keeps them from age eviction)."""
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            conn.execute("UPDATE image_scan_cache SET checked_ts = ? WHERE folder = ?",
+                         (int(time.time()), folder))
+
+    def delete_image_scan_cache(self, folder: str, names: Optional[Iterable[str]] = None) -> int:
+        """Delete cached rows for a folder, or only the given filenames in it."""
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            if names is None:
+                cur = conn.execute("DELETE FROM image_scan_cache WHERE folder = ?", (folder,))
+            else:
+                cur = conn.executemany("DELETE FROM image_scan_cache WHERE folder = ? AND name = ?",
+                                       [(folder, name) for name in names])
+            return cur.rowcount if hasattr(cur, 'rowcount') else 0
+
+    def prune_image_scan_cache(self, max_age_days: int = 30) -> int:
+        """Evict cache rows for folders that no longer exist or weren't used recently.
+
+        Args:
+            max_age_days: Drop folders whose rows haven't been read or written
+                for this many days (0 = only drop missing folders)
+
+        Returns:
+            Number of rows deleted
+        """
+        deleted = 0
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            if max_age_days > 0:
+                cutoff = int(time.time()) - max_age_days * 86400
+                cur = conn.execute("DELETE FROM image_scan_cache WHERE checked_ts < ?", (cutoff,))
+                deleted += cur.rowcount
+            folders = [row[0] for row in conn.execute("SELECT DISTINCT folder FROM image_scan_cache")]
+            missing = [(folder,) for folder in folders if not os.path.isdir(folder)]
+            if missing:
+                cur = conn.executemany("DELETE FROM image_scan_cache WHERE folder = ?", missing)
+                deleted += cur.rowcount
+        return deleted
+
     def get_hosts_with_uploads(self) -> Dict[Tuple[str, str], Dict[str, int]]:
         """Get all hosts that have completed uploads, with gallery and image counts.
 
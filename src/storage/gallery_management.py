@@ -63,16 +63,43 @@ def build_gallery_filenames(gallery_name, gallery_id):
 
 def check_if_gallery_exists(folder_name):
     """Check if gallery files already exist for this folder"""
+    return find_existing_galleries([folder_name]).get(folder_name, [])
+
+def find_existing_galleries(folder_paths):
+    """Check a batch of folders for gallery files from previous uploads.
+
+    One lookup in the gallery index (see src.storage.gallery_index) instead of
+    directory scans per folder. Falls back to scanning if the index is unusable.
+
+    Returns:
+        {folder: [artifact paths]} for the folders that were uploaded before
+    """
+    folder_paths = list(folder_paths)
+    try:
+        from src.storage.gallery_index import get_gallery_index
+        return get_gallery_index().find_existing(folder_paths)
+    except Exception as e:
+        log(f"Gallery index lookup failed, scanning artifact folders: {e}", level="warning", category="queue")
+    existing = {}
+    for folder in folder_paths:
+        files = _scan_gallery_artifacts(folder)
+        if files:
+            existing[folder] = files
+    return existing
+
+def _scan_gallery_artifacts(folder_name):
+    """Glob the central store and the folder's .uploaded subdir (index fallback)"""
     central_path = get_central_storage_path()
+    name = os.path.basename(os.path.normpath(folder_name))
 
     # Check central location
-    central_files = glob.glob(os.path.join(central_path, f"{folder_name}_*_bbcode.txt")) + \
-                    glob.glob(os.path.join(central_path, f"{folder_name}_*.json"))
+    central_files = glob.glob(os.path.join(central_path, f"{glob.escape(name)}_*_bbcode.txt")) + \
+                    glob.glob(os.path.join(central_path, f"{glob.escape(name)}_*.json"))
 
     # Check within .uploaded subfolder directly under this folder
     folder_files = [
-        os.path.join(folder_name, ".uploaded", f"{folder_name}_*.json"),
-        os.path.join(folder_name, ".uploaded", f"{folder_name}_*_bbcode.txt")
+        os.path.join(glob.escape(folder_name), ".uploaded", f"{glob.escape(name)}_*.json"),
+        os.path.join(glob.escape(folder_name), ".uploaded", f"{glob.escape(name)}_*_bbcode.txt")
     ]
 
     existing_files = []
@@ -0,0 +1,290 @@
+"""
+Persistent per-host inventory of K2S-family accounts (Keep2Share, FileBoom,
+TezFiles).
+
+Scanning a K2S-family host used to walk the whole account and hold every
+file in a dict for the length of the scan. ``K2SInventoryCache`` keeps the
+inventory in ``~/.bbdrop/k2s_inventory.db`` instead and refreshes it from
+``K2SFileChecker.walk_folders()``. A refresh still lists every folder and
+page of the account; only the writes are incremental:
+
+- Each folder's file listing is reduced to a signature (file id, storage
+  state and size). A folder whose signature is unchanged costs no writes;
+  a changed folder has its file rows replaced in one transaction.
+- A folder whose file listing failed keeps its previous rows.
+- Folders that have disappeared are only dropped after a walk that listed
+  every folder; an interrupted or partly failed walk never deletes rows.
+
+Gallery checks then look up just the gallery's file IDs on the primary key,
+and storage used is a ``SUM`` over the host's rows. A refresh younger than
+DEFAULT_MAX_AGE is reused without listing; ScanCoordinator then verifies
+IDs missing from it with getFilesInfo before reporting them offline.
+
+Separate DB (not ``bbdrop.db``) by design: this is a cache. If the schema
+ever needs to change, delete the file — the next scan repopulates it. No
+migrations, no coordination with the queue DB schema version.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.paths import get_central_store_base_path
+
+# A host refreshed this recently is not walked again by the next scan
+DEFAULT_MAX_AGE = 300
+
+# File IDs per SELECT ... IN (...) lookup, below SQLite's variable limit
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS k2s_folders (
+    host_name     TEXT NOT NULL,
+    folder_id     TEXT NOT NULL,
+    parent_id     TEXT,
+    signature     TEXT NOT NULL,
+    file_count    INTEGER NOT NULL,
+    refreshed_ts  INTEGER NOT NULL,
+    PRIMARY KEY (host_name, folder_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS k2s_files (
+    host_name       TEXT NOT NULL,
+    file_id         TEXT NOT NULL,
+    folder_id       TEXT NOT NULL,
+    name            TEXT,
+    size            INTEGER NOT NULL DEFAULT 0,
+    storage_object  TEXT,
+    PRIMARY KEY (host_name, file_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS k2s_files_folder ON k2s_files (host_name, folder_id);
+
+CREATE TABLE IF NOT EXISTS k2s_hosts (
+    host_name     TEXT PRIMARY KEY,
+    refreshed_ts  INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class InventoryRefresh:
+    """Outcome of one K2SInventoryCache.refresh() call."""
+    folders: int = 0
+    changed: int = 0  # Folders whose file rows were rewritten
+    failed: int = 0  # Folders whose listing failed (previous rows kept)
+    removed: int = 0  # Folders dropped because they no longer exist
+    complete: bool = False  # Every folder listed, walk not cancelled
+
+
+def _storage_object(file_info: dict) -> Optional[str]:
+    return (file_info.get('extended_info') or {}).get('storage_object')
+
+
+def _folder_signature(files: List[dict]) -> str:
+    """Digest of a folder listing; changes when a file is added, removed or changes state."""
+    digest = hashlib.sha1()
+    for file_id, state, size in sorted(
+        (str(f.get('id', '')), str(_storage_object(f)), int(f.get('size') or 0)) for f in files
+    ):
+        digest.update(f"{file_id}\0{state}\0{size}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class K2SInventoryCache:
+    """SQLite-backed inventory of K2S-family file hosts, one tree per host."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or os.path.join(get_central_store_base_path(), "k2s_inventory.db")
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache DB, ensuring schema and WAL mode."""
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA busy_timeout=5000;")
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(_SCHEMA)
+                self._schema_ready = True
+        return conn
+
+    def is_fresh(self, host_name: str, max_age: float = DEFAULT_MAX_AGE) -> bool:
+        """True if the host's last complete refresh is younger than max_age seconds."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT refreshed_ts FROM k2s_hosts WHERE host_name = ?", (host_name,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return row is not None and time.time() - row[0] < max_age
+
+    def refresh(self, host_name: str, listings: Iterable,
+                cancel_event: Optional[threading.Event] = None) -> InventoryRefresh:
+        """Apply a folder walk to the host's stored inventory.
+
+        Args:
+            host_name: K2S-family host ID (keep2share, fileboom, tezfiles)
+            listings: FolderListing objects, typically K2SFileChecker.walk_folders();
+                the walk is considered complete only if it yields the root and
+                no listing failed
+            cancel_event: The event the walk was given; a cancelled walk is
+                never treated as complete
+
+        Returns:
+            InventoryRefresh counts for logging
+
+        Raises:
+            sqlite3.Error: If the cache DB cannot be read or written
+        """
+        result = InventoryRefresh()
+        conn = self._connect()
+        try:
+            signatures = dict(conn.execute(
+                "SELECT folder_id, signature FROM k2s_folders WHERE host_name = ?", (host_name,)
+            ).fetchall())
+            seen = set()
+            root_listed = False
+            all_ok = True
+            now = int(time.time())
+
+            for listing in listings:
+                result.folders += 1
+                seen.add(listing.folder_id)
+                root_listed = root_listed or listing.folder_id == '/'
+                if not listing.folders_ok:
+                    all_ok = False
+                if listing.files is None:
+                    result.failed += 1
+                    all_ok = False
+                    continue
+                signature = _folder_signature(listing.files)
+                if signatures.get(listing.folder_id) == signature:
+                    continue
+                self._replace_folder(conn, host_name, listing, signature, now)
+                result.changed += 1
+
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            result.complete = root_listed and all_ok and not cancelled
+            if result.complete:
+                gone = [folder_id for folder_id in signatures if folder_id not in seen]
+                if gone:
+                    conn.execute("BEGIN")
+                    conn.executemany(
+                        "DELETE FROM k2s_files WHERE host_name = ? AND folder_id = ?",
+                        [(host_name, folder_id) for folder_id in gone],
+                    )
+                    conn.executemany(
+                        "DELETE FROM k2s_folders WHERE host_name = ? AND folder_id = ?",
+                        [(host_name, folder_id) for folder_id in gone],
+                    )
+                    conn.execute("COMMIT")
+                    result.removed = len(gone)
+                conn.execute(
+                    "INSERT OR REPLACE INTO k2s_hosts (host_name, refreshed_ts) VALUES (?, ?)",
+                    (host_name, now),
+                )
+        finally:
+            conn.close()
+        return result
+
+    @staticmethod
+    def _replace_folder(conn: sqlite3.Connection, host_name: str, listing,
+                        signature: str, now: int) -> None:
+        """Rewrite one folder's file rows and signature in a single transaction."""
+        conn.execute("BEGIN")
+        try:
+            conn.execute(
+                "DELETE FROM k2s_files WHERE host_name = ? AND folder_id = ?",
+                (host_name, listing.folder_id),
+            )
+            # OR REPLACE: a file moved here from a folder not yet re-listed
+            conn.executemany(
+                "INSERT OR REPLACE INTO k2s_files "
+                "(host_name, file_id, folder_id, name, size, storage_object) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (host_name, str(f['id']), listing.folder_id, f.get('name'),
+                     int(f.get('size') or 0), _storage_object(f))
+                    for f in listing.files if f.get('id')
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO k2s_folders "
+                "(host_name, folder_id, parent_id, signature, file_count, refreshed_ts) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (host_name, listing.folder_id, listing.parent_id, signature,
+                 len(listing.files), now),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get_files(self, host_name: str, file_ids: Iterable[str]) -> Dict[str, dict]:
+        """Look up stored files by ID.
+
+        Returns:
+            {file_id: file dict} for the IDs present in the inventory, shaped like
+            getFilesList entries (id, name, size, is_available, extended_info) so
+            the result can be passed to K2SFileChecker.check_gallery_from_inventory()
+
+        Raises:
+            sqlite3.Error: If the cache DB cannot be read
+        """
+        ids = list(dict.fromkeys(file_ids))
+        found: Dict[str, dict] = {}
+        if not ids:
+            return found
+        conn = self._connect()
+        try:
+            for start in range(0, len(ids), _LOOKUP_CHUNK):
+                chunk = ids[start:start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                for file_id, name, size, state in conn.execute(
+                    "SELECT file_id, name, size, storage_object FROM k2s_files "
+                    f"WHERE host_name = ? AND file_id IN ({placeholders})",
+                    [host_name, *chunk],
+                ):
+                    found[file_id] = {
+                        'id': file_id,
+                        'name': name,
+                        'size': size,
+                        'is_available': state == 'available',
+                        'extended_info': {'storage_object': state},
+                    }
+        finally:
+            conn.close()
+        return found
+
+    def storage_used(self, host_name: str) -> int:
+        """Total bytes of the host's available files (same rule as calc_storage_used)."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM k2s_files "
+                "WHERE host_name = ? AND storage_object = 'available'",
+                (host_name,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return int(row[0])
+
+    def file_count(self, host_name: str) -> int:
+        """Number of files stored for the host."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM k2s_files WHERE host_name = ?", (host_name,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return int(row[0])
@@ -7,6 +7,9 @@ import os
 import time
 import threading
 import queue
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from queue import Queue
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
@@ -15,7 +18,9 @@ from contextlib import contextmanager
 from PyQt6.QtCore import QObject, pyqtSignal, QMutex, QMutexLocker, QSettings, QTimer
 
 from src.storage.database import QueueStore
-from src.utils.paths import load_user_defaults
+from src.storage.scan_cache import ImageScanCache
+from src.utils.paths import load_user_defaults, read_config
+from src.utils.image_header import ImageHeader, read_image_header
 from src.utils.logger import log
 from src.core.constants import (
     QUEUE_STATE_READY, QUEUE_STATE_QUEUED, QUEUE_STATE_UPLOADING,
@@ -219,9 +224,15 @@ class QueueManager(QObject):
     
     # Signals
     status_changed = pyqtSignal(str, str, str)  # path, old_status, new_status
-    scan_status_changed = pyqtSignal(int, int)  # queue_size, items_pending
+    scan_status_changed = pyqtSignal(int, int, float, float)  # queue_size, items_pending, galleries/s, files/s
     queue_loaded = pyqtSignal()
     log_message = pyqtSignal(str)
+
+    # Scan worker pool ([SCANNING] scan_workers / verify_processes in the INI)
+    DEFAULT_SCAN_WORKERS = 4
+    MAX_SCAN_WORKERS = 16
+    # Sliding window (seconds) for the scan throughput reported in scan_status_changed
+    SCAN_RATE_WINDOW = 10.0
     
     def __init__(self):
         super().__init__()
@@ -229,7 +240,7 @@ class QueueManager(QObject):
         self.queue = Queue()
         self.mutex = QMutex()
         self.settings = QSettings("BBDropUploader", "QueueManager")
-        self.store = QueueStore()
+        self.store = QueueStore(pooled=True)
         self._next_order = 0
         self._next_db_id = 1  # Track next database ID for predictive assignment
         self._version = 0
@@ -254,10 +265,20 @@ class QueueManager(QObject):
             QUEUE_STATE_VALIDATING: 0
         }
         
-        # Sequential scan worker
+        # Scan pipeline: a dispatcher thread (_scan_worker) feeds paths from
+        # _scan_queue to a pool of scan threads. Scans of the same path never
+        # overlap; repeat requests wait for the running one and run in order.
         self._scan_worker = None
         self._scan_queue = Queue()
         self._scan_worker_running = False
+        self._scan_pool: Optional[ThreadPoolExecutor] = None
+        self._scan_slots: Optional[threading.Semaphore] = None
+        self._verify_pool: Optional[ProcessPoolExecutor] = None
+        self._scan_lock = threading.Lock()
+        self._scan_active_paths: Dict[str, int] = {}  # path -> repeat scans waiting behind it
+        self._scan_completions: deque = deque()  # (monotonic finish time, file count)
+        self._scan_burst_start = 0.0
+        self._scan_cache: Optional[ImageScanCache] = ImageScanCache(self.store)
         
         # Migration and initialization
         try:
@@ -268,39 +289,133 @@ class QueueManager(QObject):
         self._start_scan_worker()
     
     def _start_scan_worker(self):
-        """Start the sequential scan worker thread"""
+        """Start the scan dispatcher thread"""
         #log(f" _start_scan_worker called, running={self._scan_worker_running}")
         if not self._scan_worker_running:
             self._scan_worker_running = True
             self._scan_worker = threading.Thread(
-                target=self._sequential_scan_worker,
+                target=self._scan_dispatcher,
                 daemon=True
             )
             self._scan_worker.start()
-    
-    def _sequential_scan_worker(self):
-        """Worker that processes galleries sequentially"""
-        #log(f" Scan worker starting")
-        while self._scan_worker_running:
+
+    def _get_scan_pool_config(self) -> tuple:
+        """Read scan pool sizes from the [SCANNING] INI section.
+
+        Returns:
+            (scan_workers, verify_processes); verify_processes 0 = verify in the scan threads
+        """
+        try:
+            config = read_config()
+            workers = config.getint('SCANNING', 'scan_workers', fallback=self.DEFAULT_SCAN_WORKERS)
+            processes = config.getint('SCANNING', 'verify_processes', fallback=0)
+        except Exception:
+            workers, processes = self.DEFAULT_SCAN_WORKERS, 0
+        return max(1, min(workers, self.MAX_SCAN_WORKERS)), max(0, processes)
+
+    def _scan_dispatcher(self):
+        """Hand queued paths to the scan pool, at most one scan per path at a time"""
+        workers, verify_processes = self._get_scan_pool_config()
+        self._scan_slots = threading.Semaphore(workers)
+        self._scan_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan")
+        if verify_processes:
             try:
-                path = self._scan_queue.get(timeout=1.0)
+                self._verify_pool = ProcessPoolExecutor(max_workers=verify_processes)
+            except Exception as e:
+                log(f"Scan Worker: Verify process pool unavailable, verifying in threads: {e}",
+                    level="warning", category="scan")
+        if self._scan_cache is not None:
+            # Stats every cached folder: keep it off the dispatch path
+            threading.Thread(target=self._scan_cache.prune, name="scan-cache-prune", daemon=True).start()
+        log(f"Scan Worker: Started with {workers} scan threads"
+            f"{f', {verify_processes} verify processes' if self._verify_pool else ''}",
+            level="debug", category="scan")
+
+        try:
+            while self._scan_worker_running:
+                # Only take a path off the queue once a scan thread is free, so
+                # qsize() keeps reporting what is still waiting
+                if not self._scan_slots.acquire(timeout=1.0):
+                    continue
+                try:
+                    path = self._scan_queue.get(timeout=1.0)
+                except queue.Empty:
+                    self._scan_slots.release()
+                    continue
                 if path is None:  # Shutdown signal
+                    self._scan_slots.release()
+                    break
+
+                with self._scan_lock:
+                    if path in self._scan_active_paths:
+                        # Same path already scanning: run this request after it
+                        self._scan_active_paths[path] += 1
+                        self._scan_slots.release()
+                        continue
+                    self._scan_active_paths[path] = 0
+                    if len(self._scan_active_paths) == 1 and not self._scan_completions:
+                        self._scan_burst_start = time.monotonic()
+                self._scan_pool.submit(self._run_scan_task, path)
+        finally:
+            self._scan_pool.shutdown(wait=True, cancel_futures=True)
+            if self._verify_pool:
+                self._verify_pool.shutdown(wait=True, cancel_futures=True)
+                self._verify_pool = None
+
+    def _run_scan_task(self, path: str):
+        """Scan ``path`` on a pool thread, then any repeat requests queued behind it"""
+        try:
+            while True:
+                self._scan_one(path)
+                with self._scan_lock:
+                    if self._scan_active_paths.get(path, 0) > 0 and self._scan_worker_running:
+                        self._scan_active_paths[path] -= 1
+                        continue
+                    self._scan_active_paths.pop(path, None)
                     break
-                self._comprehensive_scan_item(path)
-                #log(f" Scan completed for {path}")
-                log(f"Scan Worker: Scan completed for {path}", category="scan", level="debug")
+        finally:
+            self._scan_slots.release()
+
+    def _scan_one(self, path: str):
+        """Run one gallery scan and record it for throughput reporting"""
+        try:
+            self._comprehensive_scan_item(path)
+            #log(f" Scan completed for {path}")
+            log(f"Scan Worker: Scan completed for {path}", category="scan", level="debug")
+        except Exception as e:
+            # Already logged above with log()
+            log(f"Scan Worker: Error scanning {path}: {e}", level="error", category="scan")
+        finally:
+            with QMutexLocker(self.mutex):
+                item = self.items.get(path)
+                file_count = item.total_images if item else 0
+            with self._scan_lock:
+                self._scan_completions.append((time.monotonic(), file_count))
+            try:
                 self._scan_queue.task_done()
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                # Already logged above with log()
-                log(f"Scan Worker: Error scanning {path}: {e}", level="error", category="scan")
-                try:
-                    self._scan_queue.task_done()
-                except ValueError:
-                    pass
-    
+            except ValueError:
+                pass
+            self._emit_scan_status()
+
+    def get_scan_cache_stats(self) -> Dict[str, float]:
+        """Scan cache hit/miss/eviction counters since startup."""
+        if self._scan_cache is None:
+            return {}
+        return self._scan_cache.stats()
+
+    def _scan_rates(self) -> tuple:
+        """Galleries/s and files/s over the last SCAN_RATE_WINDOW seconds."""
+        now = time.monotonic()
+        with self._scan_lock:
+            while self._scan_completions and now - self._scan_completions[0][0] > self.SCAN_RATE_WINDOW:
+                self._scan_completions.popleft()
+            if not self._scan_completions:
+                return 0.0, 0.0
+            span = min(self.SCAN_RATE_WINDOW, max(0.5, now - self._scan_burst_start))
+            galleries = len(self._scan_completions)
+            files = sum(count for _, count in self._scan_completions)
+        return galleries / span, files / span
+
     def _comprehensive_scan_item(self, path: str):
         """Scan and validate a gallery item"""
         try:
@@ -724,28 +839,28 @@ class QueueManager(QObject):
             level="debug", category="scan"
         )
         
-        # Scan files
-        if use_fast:
-            from PIL import Image
-
-            for i, f in enumerate(files):
-                fp = os.path.join(path, f)
-                try:
-                    file_size = os.path.getsize(fp)
-                    result['total_size'] += file_size
-                    result['file_sizes'][f] = file_size
+        # Scan files: one header read per file gives size, dimensions, the
+        # validity verdict and the content hash, so nothing below reopens them.
+        # Unchanged files (same size and mtime) come from the scan cache in
+        # both modes and are never opened at all.
+        headers: Dict[str, ImageHeader] = {}
+        file_stats: Dict[str, Any] = {}
+        if self._scan_cache is not None:
+            headers, file_stats = self._scan_cache.lookup(path, files)
+            if headers:
+                log(f"Scan Worker: {len(headers)}/{len(files)} files unchanged since last scan of '{gallery_name}'",
+                    level="debug", category="scan")
 
-                    try:
-                        with Image.open(fp) as pil_img:
-                            pil_img.verify()
-                    except Exception as pil_error:
-                        result['failed_files'].append((f, f"Invalid image: {str(pil_error)}"))
+        if use_fast:
+            self._read_headers(path, [f for f in files if f not in headers], headers, file_stats)
 
-                except Exception as e:
-                    result['failed_files'].append((f, str(e)))
-
-                if i % 10 == 0:
-                    time.sleep(0.001)  # Yield
+            for f in files:
+                header = headers[f]
+                if header.size is not None:
+                    result['total_size'] += header.size
+                    result['file_sizes'][f] = header.size
+                if header.error:
+                    result['failed_files'].append((f, header.error))
 
         # Log validation results
         failed_count = len(result['failed_files'])
@@ -762,7 +877,15 @@ class QueueManager(QObject):
 
         # Calculate dimensions with sampling
         if not result['failed_files']:
-            dims = self._calculate_dimensions(path, files, sampling)
+            # Per-file dimensions for cover detection and sampling; with fast
+            # scan off this is the first read of the files the cache missed
+            self._read_headers(path, [f for f in files if f not in headers], headers, file_stats)
+            for f in files:
+                header = headers[f]
+                if header.valid:
+                    result['file_dimensions'][f] = header.dimensions
+
+            dims = self._calculate_dimensions(path, files, sampling, result['file_dimensions'])
             if dims:
                 # Use the outlier exclusion utility if configured
                 from src.utils.sampling_utils import calculate_dimensions_with_outlier_exclusion
@@ -778,30 +901,57 @@ class QueueManager(QObject):
                 result['min_width'] = stats['min_width']
                 result['min_height'] = stats['min_height']
 
-            # Collect per-file dimensions for cover detection
-            # PIL Image.open().size only reads the header — very fast
-            try:
-                from PIL import Image
-                for f in files:
-                    fp = os.path.join(path, f)
-                    try:
-                        with Image.open(fp) as img:
-                            result['file_dimensions'][f] = img.size
-                    except (OSError, IOError):
-                        pass  # Skip files PIL can't read
-            except ImportError:
-                pass
-
         return result
     
-    def _calculate_dimensions(self, path: str, files: List[str], sampling: int) -> List[tuple]:
-        """Calculate image dimensions with sampling"""
+    def _read_headers(self, path: str, to_read: List[str], headers: Dict[str, ImageHeader],
+                      file_stats: Dict[str, Any]) -> None:
+        """Read headers and content hashes for ``to_read`` into ``headers``.
+
+        Fresh results are saved to the scan cache with the stats its lookup
+        took, so the next scan of an unchanged file skips the read.
+
+        Args:
+            path: Gallery folder
+            to_read: Filenames in ``path`` the cache did not answer
+            headers: {filename: ImageHeader}, updated in place
+            file_stats: Stats from ImageScanCache.lookup() for the misses
+        """
+        if not to_read:
+            return
+        hash_content = self._scan_cache is not None
+        paths = [os.path.join(path, f) for f in to_read]
+        header_list = None
+        if self._verify_pool is not None:
+            # Verdicts that fall back to PIL are CPU-bound: fan out to worker processes
+            try:
+                header_list = list(self._verify_pool.map(
+                    partial(read_image_header, hash_content=hash_content), paths, chunksize=16))
+            except Exception as e:
+                log(f"Scan Worker: Verify process pool failed, verifying in thread: {e}",
+                    level="warning", category="scan")
+        if header_list is None:
+            header_list = []
+            for i, fp in enumerate(paths):
+                header_list.append(read_image_header(fp, hash_content=hash_content))
+                if i % 10 == 0:
+                    time.sleep(0.001)  # Yield
+
+        headers.update(zip(to_read, header_list))
+        if self._scan_cache is not None:
+            self._scan_cache.store_results(path, {f: (file_stats.get(f), headers[f]) for f in to_read})
+
+    def _calculate_dimensions(self, path: str, files: List[str], sampling: int,
+                              file_dimensions: Optional[Dict[str, tuple]] = None) -> List[tuple]:
+        """Calculate image dimensions with sampling
+
+        ``file_dimensions`` ({filename: (width, height)} of every valid file)
+        from an earlier header pass is used instead of reopening the sampled
+        files.
+        """
         gallery_name = os.path.basename(path)
         dims = []
 
         try:
-            from PIL import Image
-
             # Use new sampling utility
             from src.utils.sampling_utils import get_sample_indices
 
@@ -820,7 +970,7 @@ class QueueManager(QObject):
             }
 
             # Get sample indices using new logic
-            sample_indices = get_sample_indices(files, enhanced_config, path)
+            sample_indices = get_sample_indices(files, enhanced_config, path, file_dimensions)
             samples = [files[i] for i in sample_indices]
 
             log(
@@ -835,12 +985,14 @@ class QueueManager(QObject):
 
             # Process samples
             for f in samples:
-                fp = os.path.join(path, f)
-                try:
-                    with Image.open(fp) as img:
-                        dims.append(img.size)
-                except (OSError, IOError):
+                if file_dimensions is not None:
+                    # Files missing from the header pass are invalid images
+                    if f in file_dimensions:
+                        dims.append(file_dimensions[f])
                     continue
+                header = read_image_header(os.path.join(path, f))
+                if header.valid:
+                    dims.append(header.dimensions)
 
             log(
                 f"Scan Worker: Successfully read dimensions from"
@@ -1171,7 +1323,8 @@ class QueueManager(QObject):
         queue_size = self._scan_queue.qsize()
         pending = (self._status_counts.get(QUEUE_STATE_SCANNING, 0) +
                    self._status_counts.get(QUEUE_STATE_VALIDATING, 0))
-        self.scan_status_changed.emit(queue_size, pending)
+        galleries_per_s, files_per_s = self._scan_rates()
+        self.scan_status_changed.emit(queue_size, pending, galleries_per_s, files_per_s)
     
     def _schedule_debounced_save(self, paths: List[str]):
         """Schedule a debounced save to prevent overlapping database operations"""
@@ -1705,4 +1858,9 @@ class QueueManager(QObject):
         except (queue.Full, AttributeError):
             pass
         if self._scan_worker and self._scan_worker.is_alive():
-            self._scan_worker.join(timeout=2.0)
\ No newline at end of file
+            self._scan_worker.join(timeout=2.0)
+        # Release pooled SQLite connections so the WAL is checkpointed
+        try:
+            self.store.close()
+        except Exception as e:
+            log(f"Failed to close database connections: {e}", level="warning", category="database")
@@ -0,0 +1,154 @@
+"""
+Persistent per-file cache of gallery scan results.
+
+Rescans (``rescan_gallery_additive``, ``rescan_failed_folder``,
+``retry_failed_upload``, startup re-queues) used to read every image header
+again. ``ImageScanCache`` keeps each file's header result and content hash
+in the ``image_scan_cache`` table keyed by folder + filename, and only
+trusts a row while the file's ``st_size`` and ``st_mtime_ns`` are
+unchanged, so an unchanged file costs one ``stat`` instead of an open and
+read.
+
+Both scan modes use the cache: the fast scan for its validation pass, and
+the full scan (``scanning/fast_scan`` off) for its dimension pass.
+
+Eviction: rows for folders that no longer exist, and folders not scanned
+for ``max_age_days``, are removed by ``prune()`` (run when the scan
+dispatcher starts).
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.image_header import ImageHeader
+from src.utils.logger import log
+
+
+class ImageScanCache:
+    """Stat-validated scan result cache backed by a QueueStore."""
+
+    DEFAULT_MAX_AGE_DAYS = 30
+
+    def __init__(self, store, max_age_days: int = DEFAULT_MAX_AGE_DAYS):
+        self.store = store
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+
+    def lookup(self, folder: str, files: List[str]) -> Tuple[Dict[str, ImageHeader], Dict[str, Optional[os.stat_result]]]:
+        """Split ``files`` into cached results and files that must be read.
+
+        Args:
+            folder: Gallery folder
+            files: Filenames in ``folder``
+
+        Returns:
+            (hits, misses): hits maps filename -> cached ImageHeader, including
+            its content_hash; misses maps filename -> stat taken now (None if
+            stat failed), to pass to store_results(). Rows written before
+            content hashes were stored count as misses.
+        """
+        try:
+            cached = self.store.get_image_scan_cache(folder)
+        except Exception as e:
+            log(f"Scan cache: lookup failed for {folder}: {e}", level="warning", category="scan")
+            cached = {}
+
+        hits: Dict[str, ImageHeader] = {}
+        misses: Dict[str, Optional[os.stat_result]] = {}
+        for f in files:
+            try:
+                st = os.stat(os.path.join(folder, f))
+            except OSError:
+                misses[f] = None
+                continue
+            row = cached.get(f)
+            if (row and row['size'] == st.st_size and row['mtime_ns'] == st.st_mtime_ns
+                    and row.get('content_hash')):
+                hits[f] = ImageHeader(
+                    size=row['size'], format=row['format'],
+                    width=row['width'], height=row['height'],
+                    error=None if row['valid'] else (row['error'] or "Invalid image"),
+                    content_hash=row['content_hash'],
+                )
+            else:
+                misses[f] = st
+
+        with self._lock:
+            self._hits += len(hits)
+            self._misses += len(misses)
+        if hits:
+            try:
+                self.store.touch_image_scan_cache(folder)
+            except Exception:
+                pass
+        return hits, misses
+
+    def store_results(self, folder: str, results: Dict[str, Tuple[Optional[os.stat_result], ImageHeader]]) -> None:
+        """Save freshly read headers for ``folder``.
+
+        The stat must be the one taken *before* reading the file: if the file
+        changes during the read, the next lookup sees a different mtime and
+        reads it again. Files that could not be opened are not cached.
+        Headers should be read with ``hash_content=True`` so the row carries
+        a content hash; rows without one are read again on the next lookup.
+
+        Args:
+            folder: Gallery folder
+            results: {filename: (stat from lookup(), header)}
+        """
+        entries = {}
+        for f, (st, header) in results.items():
+            if st is None or header.size is None:
+                continue
+            entries[f] = {
+                'size': st.st_size,
+                'mtime_ns': st.st_mtime_ns,
+                'width': header.width,
+                'height': header.height,
+                'format': header.format,
+                'valid': header.valid,
+                'error': header.error,
+                'content_hash': header.content_hash,
+            }
+        try:
+            self.store.bulk_upsert_image_scan_cache(folder, entries)
+        except Exception as e:
+            log(f"Scan cache: failed to save results for {folder}: {e}", level="warning", category="scan")
+
+    def invalidate(self, folder: str) -> None:
+        """Forget everything cached for ``folder``."""
+        try:
+            self._count_evicted(int(self.store.delete_image_scan_cache(folder)))
+        except Exception as e:
+            log(f"Scan cache: failed to invalidate {folder}: {e}", level="warning", category="scan")
+
+    def prune(self) -> int:
+        """Evict rows for deleted folders and folders unused for max_age_days."""
+        try:
+            deleted = int(self.store.prune_image_scan_cache(self.max_age_days))
+        except Exception as e:
+            log(f"Scan cache: prune failed: {e}", level="warning", category="scan")
+            return 0
+        self._count_evicted(deleted)
+        if deleted:
+            log(f"Scan cache: evicted {deleted} stale entries", level="debug", category="scan")
+        return deleted
+
+    def _count_evicted(self, count: int) -> None:
+        with self._lock:
+            self._evicted += max(0, count)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss/eviction counters since startup."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evicted': self._evicted,
+                'hit_rate': self._hits / total if total else 0.0,
+            }
@@ -0,0 +1,77 @@
+"""
+In-process work notifications for file host workers.
+
+Workers used to poll ``get_pending_file_host_uploads`` once a second while
+idle. Instead, writers that create dispatchable work (new pending rows,
+rows flipped back to pending, freed upload slots) bump a per-channel
+generation counter here, and idle workers block on a condition variable
+until their channel's generation changes.
+
+Usage (lost-wakeup free)::
+
+    signal = get_file_host_work_signal()
+    seen = signal.generation(host_id)   # read BEFORE checking for work
+    if not has_work():
+        signal.wait(host_id, seen, timeout=60)
+"""
+
+import threading
+from typing import Dict, Optional
+
+
+class WorkSignal:
+    """Per-channel generation counters sharing one condition variable."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._generations: Dict[str, int] = {}
+        self._broadcasts = 0
+
+    def _generation(self, channel: str) -> int:
+        return self._generations.get(channel, 0) + self._broadcasts
+
+    def generation(self, channel: str) -> int:
+        """Current generation for ``channel`` (includes broadcasts)."""
+        with self._cond:
+            return self._generation(channel)
+
+    def notify(self, channel: Optional[str] = None) -> None:
+        """Signal new work on ``channel``, or on every channel when None."""
+        with self._cond:
+            if channel is None:
+                self._broadcasts += 1
+            else:
+                self._generations[channel] = self._generations.get(channel, 0) + 1
+            self._cond.notify_all()
+
+    def wait(self, channel: str, seen: int, timeout: Optional[float] = None) -> bool:
+        """Block until ``channel`` moves past generation ``seen``.
+
+        Args:
+            channel: Channel to watch (file host id)
+            seen: Generation observed before the caller last checked for work
+            timeout: Maximum seconds to wait (None = forever)
+
+        Returns:
+            True if notified, False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._generation(channel) != seen, timeout)
+
+
+# Global file host work signal
+_file_host_work_signal: Optional[WorkSignal] = None
+_file_host_work_signal_lock = threading.Lock()
+
+
+def get_file_host_work_signal() -> WorkSignal:
+    """Get or create the global file host WorkSignal instance.
+
+    Returns:
+        Global WorkSignal instance (channels are file host ids)
+    """
+    global _file_host_work_signal
+    with _file_host_work_signal_lock:
+        if _file_host_work_signal is None:
+            _file_host_work_signal = WorkSignal()
+        return _file_host_work_signal
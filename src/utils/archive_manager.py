@@ -5,18 +5,59 @@ Generalized archive creation supporting multiple formats (ZIP, 7Z),
 configurable compression, and split archive support.
 
 Replaces the ZIP-only ZIPManager with format-agnostic archive creation.
+
+Part hashes: ZIPs, single and split, are hashed while they are written
+(see ``_HashingWriter``), so uploads that need an MD5 do not re-read the
+archive. This changed the single-file layout: entries are now streamed with
+data descriptors (general purpose flag bit 3) instead of having their local
+headers patched after the data, so a ZIP of the same images is no longer
+byte-identical to one built by earlier versions, and its MD5 differs from
+MD5s stored for those uploads. The members and their contents are unchanged.
+Split ZIPs are written by ``PrecompressedSplitZipWriter``, which produces
+the same bytes splitzip did without seeking, one hashing writer per volume.
+7Z archives are written by py7zr or the 7z CLI, which rewrite the start
+header once the archive is complete, so their parts are hashed once on
+first request instead. Either way the digests are cached with the archive
+and dropped when it is deleted.
+
+Streamed parts: ``create_or_reuse_stream`` plans a store-mode ZIP (split or
+not) without writing it; see ``src.utils.zip_stream``. Plans are cached per
+gallery like archives, and replanned when a source image changes.
+
+Parallel compression (opt-in, ``compression_workers`` > 1): with a
+compressing method, ZIP members (single or split) are compressed on a
+thread pool and written to the container in order as they finish (see
+``src.utils.zip_precompressed``), and single 7Z archives go to the
+multi-threaded 7z CLI when it is installed.
+Builds are serialized per gallery, not globally.
 """
 
+import hashlib
+import io
 import os
 import shutil
 import subprocess
 import tempfile
 import threading
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from src.utils.logger import log
+from src.utils.zip_precompressed import (
+    CompressedMember,
+    PrecompressedSplitZipWriter,
+    PrecompressedZipWriter,
+    compress_member,
+    stored_member,
+)
+
+if TYPE_CHECKING:
+    # Imported on first use: planning pulls in splitzip (see create_or_reuse_stream)
+    from src.utils.zip_stream import StoredZipPart
 
 try:
     import py7zr
@@ -76,25 +117,106 @@ SEVENZ_COMPRESSION_MAP = {
 }
 
 
+# Hashes computed for every archive part ('sha256' may be added)
+DEFAULT_HASH_ALGORITHMS = ('md5',)
+
+# Read size when hashing a finished part
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Compressed bytes a parallel member keeps in memory before spilling to a
+# temp file; at most workers * PARALLEL_READAHEAD members are held at once
+PARALLEL_SPOOL_BYTES = 32 * 1024 * 1024
+
+# Members submitted ahead of the one being written, per worker
+PARALLEL_READAHEAD = 2
+
+
+def hash_file(file_path: Path, algorithms: Iterable[str] = DEFAULT_HASH_ALGORITHMS) -> Dict[str, str]:
+    """Compute several digests of a file in one read pass.
+
+    Returns:
+        {algorithm: hex digest}
+    """
+    hashers = {name: hashlib.new(name) for name in algorithms}
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+
+class _HashingWriter:
+    """Write-only file wrapper that hashes bytes on their way to disk.
+
+    ``seek()`` is refused, which makes zipfile stream each entry with a
+    data descriptor instead of seeking back to patch its local header.
+    The bytes written are therefore final, and so are the digests. (Files
+    written this way differ byte-for-byte from seekable-output ZIPs; see
+    the module docstring.)
+    """
+
+    def __init__(self, fp, algorithms: Iterable[str]):
+        self._fp = fp
+        self._hashers = {name: hashlib.new(name) for name in algorithms}
+        self._position = 0
+
+    def write(self, data) -> int:
+        written = self._fp.write(data)
+        for hasher in self._hashers.values():
+            hasher.update(data)
+        self._position += len(data)
+        return written
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+    def seekable(self) -> bool:
+        return False
+
+    def flush(self) -> None:
+        self._fp.flush()
+
+    def hexdigests(self) -> Dict[str, str]:
+        return {name: hasher.hexdigest() for name, hasher in self._hashers.items()}
+
+
 class ArchiveManager:
     """Manages temporary archive files with reference counting for reuse across hosts.
 
     Supports ZIP and 7Z formats with configurable compression and optional
-    split archive creation via splitzip and 7z CLI.
+    split archive creation (split ZIPs written here, split 7z via the 7z CLI).
     """
 
-    def __init__(self, temp_dir: Optional[Path] = None):
+    def __init__(self, temp_dir: Optional[Path] = None,
+                 hash_algorithms: Iterable[str] = DEFAULT_HASH_ALGORITHMS):
         """Initialize archive manager.
 
         Args:
             temp_dir: Directory for temporary archives. If None, uses system temp.
+            hash_algorithms: hashlib names computed for each archive part.
         """
         self.temp_dir = temp_dir or Path(tempfile.gettempdir())
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.hash_algorithms = tuple(hash_algorithms)
 
         # Cache: {gallery_id: (archive_paths, ref_count)}
         self.archive_cache: Dict[int, Tuple[List[Path], int]] = {}
+        # Part digests, kept alongside archive_cache: {gallery_id: {part_path: {algorithm: hex}}}
+        self.archive_hashes: Dict[int, Dict[Path, Dict[str, str]]] = {}
+        # Planned, never-written store-mode ZIPs: {gallery_id: parts}
+        self.stream_cache: Dict[int, List['StoredZipPart']] = {}
+        # Guards the dicts above; never held while an archive is written
         self.lock = threading.Lock()
+        # One build at a time per gallery: {gallery_id: (lock, holders + waiters)}.
+        # Entries are dropped when the count reaches 0 (see _build_lock)
+        self._build_locks: Dict[int, Tuple[threading.Lock, int]] = {}
+
+        self._compress_pool: Optional[ThreadPoolExecutor] = None
+        self._compress_pool_workers = 0
+        self._compress_pool_lock = threading.Lock()
 
     def create_or_reuse_archive(
         self,
@@ -105,6 +227,7 @@ class ArchiveManager:
         compression: str = 'store',
         split_size_mb: int = 0,
         media_type: str = 'image',
+        compression_workers: int = 1,
     ) -> List[Path]:
         """Create a new archive or return existing cached archive paths.
 
@@ -118,6 +241,8 @@ class ArchiveManager:
             media_type: 'image' or 'video'. When 'video' and no split is
                 needed, the raw video file(s) are returned directly without
                 creating an archive.
+            compression_workers: Threads for parallel compression
+                (1 = compress on the calling thread, 0 = one per CPU)
 
         Returns:
             List of archive file paths (1 for non-split, N for split)
@@ -141,39 +266,42 @@ class ArchiveManager:
             # No video files found -- fall through to normal archive path
             # so _get_image_files can raise the appropriate error.
 
-        with self.lock:
-            if db_id in self.archive_cache:
-                paths, ref_count = self.archive_cache[db_id]
-                if paths and all(p.exists() for p in paths):
-                    self.archive_cache[db_id] = (paths, ref_count + 1)
-                    log(
-                        f"Reusing existing archive for gallery {db_id} (refs: {ref_count + 1})",
-                        level="debug", category="file_hosts"
-                    )
-                    return paths
-                else:
-                    log(
-                        f"Cached archive no longer exists for gallery {db_id}, recreating...",
-                        level="warning", category="file_hosts"
-                    )
-                    del self.archive_cache[db_id]
+        with self._build_lock(db_id):
+            with self.lock:
+                paths = self._reuse_cached(db_id)
+            if paths:
+                return paths
 
             # Create new archive
             base_name = self._generate_archive_name(db_id, gallery_name)
             log(f"Creating {archive_format.upper()} archive for gallery {db_id}: {base_name}",
                 level="debug", category="file_hosts")
 
+            workers = compression_workers or os.cpu_count() or 1
+            parallel = workers > 1 and compression not in ('store', 'copy')
             try:
+                hashes: Dict[Path, Dict[str, str]] = {}
                 if split_size_mb > 0:
-                    paths = self._create_split_archive(
-                        folder_path, base_name, archive_format, compression, split_size_mb
+                    paths, hashes = self._create_split_archive(
+                        folder_path, base_name, archive_format, compression, split_size_mb,
+                        workers if parallel else 1,
                     )
                 elif archive_format == '7z':
-                    paths = [self._create_7z(folder_path, base_name, compression)]
+                    if parallel and _find_7z_binary():
+                        paths = [self._create_7z_cli(folder_path, base_name, compression)]
+                    else:
+                        paths = [self._create_7z(folder_path, base_name, compression)]
+                elif parallel:
+                    zip_path, hashes[zip_path] = self._create_zip_parallel(
+                        folder_path, base_name, compression, workers)
+                    paths = [zip_path]
                 else:
-                    paths = [self._create_zip(folder_path, base_name, compression)]
+                    zip_path, hashes[zip_path] = self._create_zip_hashed(folder_path, base_name, compression)
+                    paths = [zip_path]
 
-                self.archive_cache[db_id] = (paths, 1)
+                with self.lock:
+                    self.archive_cache[db_id] = (paths, 1)
+                    self.archive_hashes[db_id] = hashes
 
                 total_size = sum(p.stat().st_size for p in paths)
                 size_mb = total_size / (1024 * 1024)
@@ -188,6 +316,112 @@ class ArchiveManager:
                     level="error", category="file_hosts")
                 raise
 
+    def create_or_reuse_stream(
+        self,
+        db_id: int,
+        folder_path: Path,
+        gallery_name: Optional[str] = None,
+        split_size_mb: int = 0,
+    ) -> List['StoredZipPart']:
+        """Plan a store-mode ZIP for streaming, or return the cached plan.
+
+        The parts read back byte-for-byte what create_or_reuse_archive would
+        write with archive_format='zip' and compression='store', but nothing
+        is written to disk. Each part's ``path`` lies under a ``streamed``
+        directory in temp_dir that is never created.
+
+        Args:
+            db_id: Unique database ID
+            folder_path: Path to gallery folder
+            gallery_name: Optional gallery name for archive filename
+            split_size_mb: Split size in MB (0 = no split)
+
+        Returns:
+            List of parts (1 for non-split, N for split)
+
+        Raises:
+            RuntimeError: If split_size_mb is set and the installed splitzip
+                is not one split planning supports (see split_streaming_supported)
+        """
+        from src.utils.zip_stream import plan_split_stored_zip, plan_stored_zip
+
+        with self._build_lock(db_id):
+            with self.lock:
+                parts = self.stream_cache.get(db_id)
+            if parts and all(part.is_current() for part in parts):
+                log(f"Reusing streamed archive plan for gallery {db_id}",
+                    level="debug", category="file_hosts")
+                return parts
+
+            base_name = self._generate_archive_name(db_id, gallery_name)
+            archive_path = self.temp_dir / "streamed" / f"{base_name}.zip"
+            image_files = self._get_image_files(Path(folder_path))
+            if not image_files:
+                raise ValueError(f"No image files found in: {folder_path}")
+
+            try:
+                if split_size_mb > 0:
+                    parts = plan_split_stored_zip(
+                        image_files, archive_path, split_size_mb * 1024 * 1024)
+                else:
+                    parts = [plan_stored_zip(image_files, archive_path)]
+            except Exception as e:
+                log(f"Failed to plan streamed archive for gallery {db_id}: {e}",
+                    level="error", category="file_hosts")
+                raise
+
+            with self.lock:
+                self.stream_cache[db_id] = parts
+            size_mb = sum(part.size for part in parts) / (1024 * 1024)
+            log(
+                f"Planned streamed archive: {len(parts)} part(s), {size_mb:.2f} MiB total",
+                level="debug", category="file_hosts"
+            )
+            return parts
+
+    @contextmanager
+    def _build_lock(self, db_id: int) -> Iterator[None]:
+        """Hold the gallery's build lock.
+
+        The lock is counted while held or waited on and removed when the
+        last user leaves, so _build_locks only holds galleries being built.
+        """
+        with self.lock:
+            lock, users = self._build_locks.get(db_id, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            self._build_locks[db_id] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self.lock:
+                users = self._build_locks[db_id][1] - 1
+                if users:
+                    self._build_locks[db_id] = (lock, users)
+                else:
+                    del self._build_locks[db_id]
+
+    def _reuse_cached(self, db_id: int) -> Optional[List[Path]]:
+        """Take a reference on a cached archive if its files still exist. Caller holds self.lock."""
+        if db_id not in self.archive_cache:
+            return None
+        paths, ref_count = self.archive_cache[db_id]
+        if paths and all(p.exists() for p in paths):
+            self.archive_cache[db_id] = (paths, ref_count + 1)
+            log(
+                f"Reusing existing archive for gallery {db_id} (refs: {ref_count + 1})",
+                level="debug", category="file_hosts"
+            )
+            return paths
+        log(
+            f"Cached archive no longer exists for gallery {db_id}, recreating...",
+            level="warning", category="file_hosts"
+        )
+        del self.archive_cache[db_id]
+        self.archive_hashes.pop(db_id, None)
+        return None
+
     def release_archive(self, db_id: int, force_delete: bool = False) -> bool:
         """Release a reference to an archive. Deletes when ref_count reaches 0.
 
@@ -200,6 +434,11 @@ class ArchiveManager:
         """
         with self.lock:
             if db_id not in self.archive_cache:
+                if db_id in self.stream_cache:
+                    # Nothing on disk; keep the plan for retries unless forced
+                    if force_delete:
+                        del self.stream_cache[db_id]
+                    return False
                 log(f"Attempted to release non-existent archive for gallery {db_id}",
                     level="warning", category="file_hosts")
                 return False
@@ -216,6 +455,8 @@ class ArchiveManager:
                     except (OSError, PermissionError) as e:
                         log(f"Failed to delete {p}: {e}", level="error", category="file_hosts")
                 del self.archive_cache[db_id]
+                self.archive_hashes.pop(db_id, None)
+                self.stream_cache.pop(db_id, None)
                 return deleted
             elif ref_count <= 1:
                 self.archive_cache[db_id] = (paths, 0)
@@ -239,14 +480,73 @@ class ArchiveManager:
             Number of archives deleted
         """
         with self.lock:
-            gallery_ids = list(self.archive_cache.keys())
+            gallery_ids = list(self.archive_cache.keys() | self.stream_cache.keys())
 
         deleted_count = 0
         for gallery_id in gallery_ids:
             if self.release_archive(gallery_id, force_delete=True):
                 deleted_count += 1
+
+        with self._compress_pool_lock:
+            if self._compress_pool is not None:
+                self._compress_pool.shutdown(wait=False, cancel_futures=True)
+                self._compress_pool = None
         return deleted_count
 
+    def get_part_hashes(self, part_path: Path) -> Dict[str, str]:
+        """Digests of an archive part, computed at most once per archive.
+
+        ZIPs built by this manager (split or not) are hashed while written,
+        so this is a dictionary lookup. Streamed parts are read once and
+        cache their own digests. 7Z parts are hashed on first call and cached
+        with their archive. Files this manager does not own (e.g. passthrough
+        videos) are hashed but not cached.
+
+        Returns:
+            {algorithm: hex digest} for every algorithm in ``hash_algorithms``
+        """
+        part_path = Path(part_path)
+        with self.lock:
+            streamed = self._find_streamed_part(part_path)
+        if streamed is not None:
+            return streamed.hexdigests(self.hash_algorithms)
+
+        with self.lock:
+            owner = None
+            for db_id, (paths, _) in self.archive_cache.items():
+                if part_path in paths:
+                    owner = db_id
+                    cached = self.archive_hashes.get(db_id, {}).get(part_path)
+                    if cached:
+                        return dict(cached)
+                    break
+
+        digests = hash_file(part_path, self.hash_algorithms)
+        if owner is not None:
+            with self.lock:
+                if owner in self.archive_cache and part_path in self.archive_cache[owner][0]:
+                    self.archive_hashes.setdefault(owner, {})[part_path] = digests
+        return dict(digests)
+
+    def get_part_md5(self, part_path: Path) -> str:
+        """MD5 hex digest of an archive part (see get_part_hashes)."""
+        digests = self.get_part_hashes(part_path)
+        if 'md5' in digests:
+            return digests['md5']
+        with self.lock:
+            streamed = self._find_streamed_part(Path(part_path))
+        if streamed is not None:
+            return streamed.md5()
+        return hash_file(part_path, ('md5',))['md5']
+
+    def _find_streamed_part(self, part_path: Path) -> Optional['StoredZipPart']:
+        """Planned part with this path, if any. Caller holds self.lock."""
+        for parts in self.stream_cache.values():
+            for part in parts:
+                if part.path == part_path:
+                    return part
+        return None
+
     def get_cache_info(self) -> Dict[int, Dict]:
         """Get information about cached archives."""
         with self.lock:
@@ -301,6 +601,15 @@ class ArchiveManager:
 
     def _create_zip(self, folder_path: Path, base_name: str, compression: str) -> Path:
         """Create a single ZIP archive."""
+        return self._create_zip_hashed(folder_path, base_name, compression)[0]
+
+    def _create_zip_hashed(self, folder_path: Path, base_name: str,
+                           compression: str) -> Tuple[Path, Dict[str, str]]:
+        """Create a single ZIP archive, hashing it as it is written.
+
+        Returns:
+            (zip_path, {algorithm: hex digest})
+        """
         zip_path = self.temp_dir / f"{base_name}.zip"
         compression_type = ZIP_COMPRESSION_MAP.get(compression, zipfile.ZIP_STORED)
 
@@ -308,14 +617,102 @@ class ArchiveManager:
         if not image_files:
             raise ValueError(f"No image files found in: {folder_path}")
 
-        with zipfile.ZipFile(zip_path, 'w', compression_type) as zf:
-            for image_file in image_files:
-                zf.write(image_file, arcname=image_file.name)
+        with open(zip_path, 'wb') as raw:
+            writer = _HashingWriter(raw, self.hash_algorithms)
+            with zipfile.ZipFile(writer, 'w', compression_type) as zf:
+                for image_file in image_files:
+                    zf.write(image_file, arcname=image_file.name)
 
         if not zip_path.exists():
             raise RuntimeError(f"ZIP file was not created: {zip_path}")
 
-        return zip_path
+        return zip_path, writer.hexdigests()
+
+    def _get_compress_pool(self, workers: int) -> ThreadPoolExecutor:
+        """Shared thread pool for member compression, resized on demand."""
+        with self._compress_pool_lock:
+            if self._compress_pool is None or self._compress_pool_workers != workers:
+                if self._compress_pool is not None:
+                    self._compress_pool.shutdown(wait=False)
+                self._compress_pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="archive-compress")
+                self._compress_pool_workers = workers
+            return self._compress_pool
+
+    def _create_zip_parallel(self, folder_path: Path, base_name: str, compression: str,
+                             workers: int) -> Tuple[Path, Dict[str, str]]:
+        """Create a single ZIP, compressing members on a thread pool.
+
+        Members are written in sorted order as soon as each is ready, with
+        ``workers * PARALLEL_READAHEAD`` compressions in flight. The output
+        is hashed while written, like _create_zip_hashed(). Falls back to
+        that if the pool cannot be used.
+
+        Returns:
+            (zip_path, {algorithm: hex digest})
+        """
+        image_files = self._get_image_files(folder_path)
+        if not image_files:
+            raise ValueError(f"No image files found in: {folder_path}")
+        if len(image_files) < 2:
+            return self._create_zip_hashed(folder_path, base_name, compression)
+
+        zip_path = self.temp_dir / f"{base_name}.zip"
+        compression_type = ZIP_COMPRESSION_MAP.get(compression, zipfile.ZIP_STORED)
+        try:
+            with open(zip_path, 'wb') as raw:
+                writer = _HashingWriter(raw, self.hash_algorithms)
+                with PrecompressedZipWriter(writer) as zf:
+                    for member in self._compress_parallel(image_files, compression_type, workers):
+                        zf.write_member(member)
+        except RuntimeError as e:
+            self._drop_compress_pool(e)
+            return self._create_zip_hashed(folder_path, base_name, compression)
+
+        return zip_path, writer.hexdigests()
+
+    def _compress_parallel(self, image_files: List[Path], compression_type: int,
+                           workers: int) -> Iterator[CompressedMember]:
+        """Compress members on the shared pool, yielding them in archive order.
+
+        ``workers * PARALLEL_READAHEAD`` compressions stay in flight ahead of
+        the member being written. Members not taken are discarded when the
+        generator is closed.
+
+        Raises:
+            RuntimeError: If the pool was shut down under us (cleanup_all)
+        """
+        pending = deque()  # Futures, in archive order
+        pool = self._get_compress_pool(workers)
+        remaining = iter(image_files)
+
+        def submit_next() -> bool:
+            image_file = next(remaining, None)
+            if image_file is None:
+                return False
+            pending.append(pool.submit(
+                compress_member, image_file, compression_type, PARALLEL_SPOOL_BYTES))
+            return True
+
+        try:
+            while len(pending) < workers * PARALLEL_READAHEAD and submit_next():
+                pass
+            while pending:
+                member = pending.popleft().result()
+                submit_next()
+                yield member
+        finally:
+            for future in pending:
+                if not future.cancel() and future.exception() is None:
+                    future.result().close()
+
+    def _drop_compress_pool(self, error: Exception) -> None:
+        """Forget a pool that was shut down under a build; the caller retries on its own thread."""
+        # Missing files etc. are not RuntimeErrors and propagate
+        log(f"Parallel compression unavailable, compressing on this thread: {error}",
+            level="warning", category="file_hosts")
+        with self._compress_pool_lock:
+            self._compress_pool = None
 
     def _create_7z(self, folder_path: Path, base_name: str, compression: str) -> Path:
         """Create a single 7Z archive using py7zr."""
@@ -354,11 +751,16 @@ class ArchiveManager:
         archive_format: str,
         compression: str,
         split_size_mb: int,
-    ) -> List[Path]:
+        workers: int = 1,
+    ) -> Tuple[List[Path], Dict[Path, Dict[str, str]]]:
         """Create a split archive.
 
-        ZIP: uses splitzip (pure Python, proper split ZIP spec).
-        7z: uses 7z CLI (requires 7-Zip installed).
+        ZIP: written by PrecompressedSplitZipWriter (splitzip's layout,
+        hashed while written), compressed on ``workers`` threads.
+        7z: uses 7z CLI (requires 7-Zip installed); not hashed here.
+
+        Returns:
+            (part paths, {part path: {algorithm: hex digest}})
         """
         image_files = self._get_image_files(folder_path)
         if not image_files:
@@ -367,44 +769,88 @@ class ArchiveManager:
         split_size_bytes = split_size_mb * 1024 * 1024
 
         if archive_format == 'zip':
-            return self._create_split_zip(image_files, base_name, compression, split_size_bytes)
+            return self._create_split_zip_hashed(
+                image_files, base_name, compression, split_size_bytes, workers)
         else:
-            return self._create_split_7z(image_files, base_name, compression, split_size_mb)
+            return self._create_split_7z(image_files, base_name, compression, split_size_mb), {}
 
     def _create_split_zip(
         self, image_files: List[Path], base_name: str,
         compression: str, split_size_bytes: int
     ) -> List[Path]:
-        """Create a split ZIP using splitzip (proper split ZIP spec)."""
-        from splitzip import SplitZipWriter, STORED, DEFLATED
+        """Create a split ZIP (.z01, .z02, ..., .zip)."""
+        return self._create_split_zip_hashed(image_files, base_name, compression, split_size_bytes)[0]
 
-        compression_map = {
-            'store': STORED,
-            'deflate': DEFLATED,
-        }
-        comp = compression_map.get(compression, STORED)
+    def _create_split_zip_hashed(
+        self, image_files: List[Path], base_name: str,
+        compression: str, split_size_bytes: int, workers: int = 1
+    ) -> Tuple[List[Path], Dict[Path, Dict[str, str]]]:
+        """Create a split ZIP, hashing each volume as it is written.
 
-        archive_path = self.temp_dir / f"{base_name}.zip"
-        with SplitZipWriter(str(archive_path), split_size=split_size_bytes, compression=comp) as zf:
-            for image_file in image_files:
-                zf.write(str(image_file), arcname=image_file.name)
+        Only 'store' and 'deflate' are supported for split archives; other
+        methods are stored. With ``workers`` > 1, deflated members are
+        compressed on the shared pool like _create_zip_parallel().
 
-        # splitzip creates: .z01, .z02, ..., .zip (final volume)
-        # Collect all parts in order
-        parts = sorted(self.temp_dir.glob(f"{base_name}.z[0-9]*"))
-        zip_final = self.temp_dir / f"{base_name}.zip"
-        if zip_final.exists():
-            parts.append(zip_final)
+        Returns:
+            (part paths in order, {part path: {algorithm: hex digest}})
+        """
+        compression_type = zipfile.ZIP_DEFLATED if compression == 'deflate' else zipfile.ZIP_STORED
+        parallel = compression_type != zipfile.ZIP_STORED and workers > 1 and len(image_files) > 1
+        if compression_type == zipfile.ZIP_STORED:
+            members = (stored_member(f) for f in image_files)
+        elif parallel:
+            members = self._compress_parallel(image_files, compression_type, workers)
+        else:
+            members = (compress_member(f, compression_type, PARALLEL_SPOOL_BYTES) for f in image_files)
 
-        if not parts:
-            raise RuntimeError(f"No archive files found for {base_name}")
-        return parts
+        archive_path = self.temp_dir / f"{base_name}.zip"
+        try:
+            with PrecompressedSplitZipWriter(
+                archive_path, split_size_bytes,
+                wrap=lambda fp: _HashingWriter(fp, self.hash_algorithms),
+            ) as zf:
+                for member in members:
+                    zf.write_member(member)
+        except RuntimeError as e:
+            if not parallel:
+                raise
+            self._drop_compress_pool(e)
+            return self._create_split_zip_hashed(image_files, base_name, compression, split_size_bytes)
+        finally:
+            members.close()
+
+        hashes = {path: writer.hexdigests() for path, writer in zf.volumes}
+        return list(hashes), hashes
 
     def _create_split_7z(
         self, image_files: List[Path], base_name: str,
         compression: str, split_size_mb: int
     ) -> List[Path]:
         """Create a split 7z archive using the 7z CLI."""
+        archive_path = self.temp_dir / f"{base_name}.7z"
+        self._run_7z_cli(image_files, archive_path, compression, [f'-v{split_size_mb}m'])
+
+        parts = sorted(self.temp_dir.glob(f"{base_name}.7z.*"))
+        if not parts:
+            if archive_path.exists():
+                return [archive_path]
+            raise RuntimeError(f"No archive files found for {base_name}")
+        return parts
+
+    def _create_7z_cli(self, folder_path: Path, base_name: str, compression: str) -> Path:
+        """Create a single 7Z archive with the multi-threaded 7z CLI."""
+        image_files = self._get_image_files(folder_path)
+        if not image_files:
+            raise ValueError(f"No image files found in: {folder_path}")
+
+        archive_path = self.temp_dir / f"{base_name}.7z"
+        self._run_7z_cli(image_files, archive_path, compression, ['-mmt=on'])
+        if not archive_path.exists():
+            raise RuntimeError(f"7Z file was not created: {archive_path}")
+        return archive_path
+
+    def _run_7z_cli(self, image_files: List[Path], archive_path: Path,
+                    compression: str, extra_args: List[str]) -> None:
         sz_bin = _find_7z_binary()
         if not sz_bin:
             raise RuntimeError(
@@ -412,8 +858,6 @@ class ArchiveManager:
                 "Install from: https://www.7-zip.org/download.html"
             )
 
-        archive_path = self.temp_dir / f"{base_name}.7z"
-
         compression_map = {
             'store': '0', 'copy': '0',
             'deflate': '5', 'lzma': '9', 'lzma2': '9', 'bzip2': '7',
@@ -424,7 +868,7 @@ class ArchiveManager:
             sz_bin, 'a',
             '-t7z',
             f'-mx{mx_level}',
-            f'-v{split_size_mb}m',
+            *extra_args,
             str(archive_path),
         ]
         for image_file in image_files:
@@ -438,13 +882,6 @@ class ArchiveManager:
                 f"7z failed (exit {result.returncode}): {result.stderr or result.stdout}"
             )
 
-        parts = sorted(self.temp_dir.glob(f"{base_name}.7z.*"))
-        if not parts:
-            if archive_path.exists():
-                return [archive_path]
-            raise RuntimeError(f"No archive files found for {base_name}")
-        return parts
-
     def _get_image_files(self, folder_path: Path) -> List[Path]:
         """Get sorted list of image files in a folder."""
         if not folder_path.exists():
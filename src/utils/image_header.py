@@ -0,0 +1,193 @@
+"""
+Single-pass image header reader used by the gallery scanner.
+
+``read_image_header`` opens a file once and returns its size, format,
+dimensions and a validity verdict. JPEG (SOF marker), PNG (IHDR chunk) and
+GIF (logical screen descriptor) headers are parsed directly, skipping PIL's
+plugin dispatch; anything else, or anything the fast parser rejects, is
+handed to PIL on the same open file so the verdict never gets stricter
+than ``Image.open().verify()``.
+
+Fast-path validity checks:
+- JPEG: markers up to the first SOF segment are well formed (PIL's verify
+  is a no-op for JPEG, so this matches it)
+- PNG: IHDR CRC is correct and the chunk chain reaches IEND (detects
+  truncation; unlike PIL it does not CRC every IDAT chunk)
+- GIF: signature and screen descriptor are present
+
+With ``hash_content=True`` the rest of the file is streamed through MD5 on
+the same open, so a scan that caches its results never has to reopen an
+unchanged file to learn its content hash.
+"""
+
+import hashlib
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO, Optional, Tuple
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# SOF0-SOF15 minus DHT (C4), JPG (C8) and DAC (CC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers without a length field: TEM, RST0-RST7
+_JPEG_STANDALONE_MARKERS = frozenset([0x01, *range(0xD0, 0xD8)])
+
+
+class _HeaderError(Exception):
+    """Fast parser could not make sense of the header."""
+
+
+@dataclass
+class ImageHeader:
+    """Result of reading one image file."""
+    size: Optional[int] = None          # bytes; None if the file could not be opened
+    format: Optional[str] = None        # 'JPEG', 'PNG', 'GIF' or PIL's format name
+    width: int = 0
+    height: int = 0
+    error: Optional[str] = None         # None when the image is valid
+    content_hash: Optional[str] = None  # MD5 hex of the whole file, if requested
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+    @property
+    def dimensions(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+
+def _read_exact(fp: BinaryIO, count: int) -> bytes:
+    data = fp.read(count)
+    if len(data) != count:
+        raise _HeaderError("unexpected end of file")
+    return data
+
+
+def _parse_jpeg(fp: BinaryIO) -> Tuple[int, int]:
+    """Walk JPEG markers after SOI until a SOF segment."""
+    while True:
+        byte = _read_exact(fp, 1)
+        if byte != b'\xff':
+            raise _HeaderError("bad JPEG marker")
+        marker = _read_exact(fp, 1)[0]
+        while marker == 0xFF:  # fill bytes
+            marker = _read_exact(fp, 1)[0]
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+        if marker in (0xD8, 0xD9, 0xDA):
+            raise _HeaderError("no SOF marker before scan data")
+        length = struct.unpack('>H', _read_exact(fp, 2))[0]
+        if length < 2:
+            raise _HeaderError("bad JPEG segment length")
+        if marker in _JPEG_SOF_MARKERS:
+            _precision, height, width = struct.unpack('>BHH', _read_exact(fp, 5))
+            if width == 0 or height == 0:
+                raise _HeaderError("zero JPEG dimensions")
+            return width, height
+        fp.seek(length - 2, os.SEEK_CUR)
+
+
+def _parse_png(fp: BinaryIO, file_size: int) -> Tuple[int, int]:
+    """Check IHDR and walk the chunk chain to IEND without reading chunk data."""
+    length, chunk_type = struct.unpack('>I4s', _read_exact(fp, 8))
+    if chunk_type != b'IHDR' or length != 13:
+        raise _HeaderError("missing PNG IHDR")
+    ihdr = _read_exact(fp, 13)
+    crc = struct.unpack('>I', _read_exact(fp, 4))[0]
+    if zlib.crc32(b'IHDR' + ihdr) != crc:
+        raise _HeaderError("PNG IHDR CRC mismatch")
+    width, height = struct.unpack('>II', ihdr[:8])
+    if width == 0 or height == 0:
+        raise _HeaderError("zero PNG dimensions")
+
+    position = 8 + 8 + 13 + 4
+    while True:
+        if position + 12 > file_size:
+            raise _HeaderError("truncated PNG")
+        fp.seek(position)
+        length, chunk_type = struct.unpack('>I4s', _read_exact(fp, 8))
+        if chunk_type == b'IEND':
+            return width, height
+        position += 12 + length
+
+
+def _parse_gif(head: bytes) -> Tuple[int, int]:
+    if len(head) < 10:
+        raise _HeaderError("truncated GIF")
+    width, height = struct.unpack('<HH', head[6:10])
+    if width == 0 or height == 0:
+        raise _HeaderError("zero GIF dimensions")
+    return width, height
+
+
+def _read_with_pil(fp: BinaryIO, header: ImageHeader) -> None:
+    """Fill ``header`` from PIL: open for size/format, then verify."""
+    from PIL import Image
+    fp.seek(0)
+    try:
+        with Image.open(fp) as img:
+            header.format = img.format
+            header.width, header.height = img.size
+            img.verify()
+    except Exception as pil_error:
+        header.error = f"Invalid image: {str(pil_error)}"
+
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def read_image_header(file_path: str, hash_content: bool = False) -> ImageHeader:
+    """Read size, format, dimensions and validity from one open of ``file_path``.
+
+    Module-level and returns a plain dataclass so it can be shipped to a
+    ProcessPoolExecutor.
+
+    Args:
+        file_path: Image file to read
+        hash_content: Also compute ``content_hash`` (MD5 of the whole file)
+
+    Returns:
+        ImageHeader; ``error`` is set if the file cannot be opened or is not
+        a valid image
+    """
+    header = ImageHeader()
+    try:
+        fp = open(file_path, 'rb')
+    except OSError as e:
+        header.error = str(e)
+        return header
+
+    with fp:
+        try:
+            header.size = os.fstat(fp.fileno()).st_size
+            head = fp.read(10)
+            try:
+                if head[:3] == b'\xff\xd8\xff':
+                    fp.seek(2)
+                    header.width, header.height = _parse_jpeg(fp)
+                    header.format = 'JPEG'
+                elif head[:8] == _PNG_SIGNATURE:
+                    fp.seek(8)
+                    header.width, header.height = _parse_png(fp, header.size)
+                    header.format = 'PNG'
+                elif head[:6] in (b'GIF87a', b'GIF89a'):
+                    header.width, header.height = _parse_gif(head)
+                    header.format = 'GIF'
+                else:
+                    _read_with_pil(fp, header)
+            except (_HeaderError, struct.error):
+                # Unusual but possibly valid file: let PIL decide
+                header.width = header.height = 0
+                header.format = None
+                _read_with_pil(fp, header)
+            if hash_content:
+                fp.seek(0)
+                digest = hashlib.md5()
+                for chunk in iter(lambda: fp.read(_HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                header.content_hash = digest.hexdigest()
+        except OSError as e:
+            header.error = str(e)
+    return header
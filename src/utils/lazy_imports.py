@@ -0,0 +1,51 @@
+"""
+Module attributes that are imported on first use.
+
+Lets a module keep re-exporting a heavy dependency (and keep it patchable
+as ``module.Name`` in tests) without importing it at module import time:
+
+    _lazy = LazyImports(__name__, {
+        'ComprehensiveSettingsDialog': 'src.gui.settings',
+    })
+    __getattr__ = _lazy.load           # PEP 562 module __getattr__
+
+    def open_settings(self):
+        dialog = _lazy.ComprehensiveSettingsDialog(self)
+
+The first access imports the source module and stores the attribute on the
+importing module, so later lookups are plain attribute reads. A value
+patched onto the module wins over the lazy import.
+
+Source modules are named by string, which PyInstaller's import scanner
+cannot follow; bbdrop.spec bundles them via ``collect_submodules('src')``.
+Sources outside ``src`` must be added to its hiddenimports.
+"""
+
+import importlib
+import sys
+from typing import Dict
+
+
+class LazyImports:
+    """Attribute map for one module; see the module docstring."""
+
+    def __init__(self, module_name: str, attributes: Dict[str, str]):
+        self._module_name = module_name
+        self._attributes = dict(attributes)
+
+    def load(self, name: str):
+        """Import `name` from its source module and cache it (module __getattr__)."""
+        source = self._attributes.get(name)
+        if source is None:
+            raise AttributeError(f"module {self._module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source), name)
+        setattr(sys.modules[self._module_name], name, value)
+        return value
+
+    def names(self):
+        return list(self._attributes)
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(sys.modules[self._module_name], name)
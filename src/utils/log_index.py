@@ -0,0 +1,502 @@
+"""
+Searchable index over the application log and its rotated files.
+
+The file log (``bbdrop.log``) rotates into ``bbdrop.log.<suffix>`` and, with
+compression on, ``.gz`` files. Finding one gallery's history across a week
+of logs used to mean decompressing and scanning all of them. ``LogIndex``
+splits every log file into blocks of about BLOCK_SIZE uncompressed bytes,
+always cut at a record boundary, and stores per block:
+
+- the uncompressed byte offset and length,
+- the first and last record timestamp,
+- a bit mask of the levels and the set of categories it contains,
+- the words of its messages (gallery names, host IDs, file names, ...).
+
+A query first selects blocks from the index, then reads and filters only
+those blocks, so a search touches a few chunks instead of whole files.
+
+Files are keyed by their first line rather than their path. Rotation only
+renames (and maybe gzips) a file, so the blocks indexed while it was the
+current log stay valid under its new name. Indexing is incremental: the
+current log is only read from where the previous update stopped.
+
+Word search matches by word prefix ("gall" finds "gallery_12"). The search
+text may also begin inside a word ("allery_12"), so its first word matches
+any indexed word containing it; that is a scan of the word table, not of
+the logs. Matched blocks are then checked for the full text as a substring.
+
+Separate DB (``<logs dir>/log_index.db``) by design: this is a cache. If
+the schema ever needs to change, delete the file and it is rebuilt.
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import sqlite3
+import struct
+import threading
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from src.utils.logger import log
+
+# Uncompressed bytes per index block
+BLOCK_SIZE = 64 * 1024
+
+# Bytes read per chunk while indexing
+_READ_CHUNK = 1024 * 1024
+
+LEVELS = ("trace", "debug", "info", "warning", "error", "critical")
+LEVEL_VALUES = {"trace": 5, "debug": 10, "info": 20, "warning": 30, "error": 40, "critical": 50}
+_LEVEL_BITS = {name: 1 << i for i, name in enumerate(LEVELS)}
+_LEVEL_PREFIXES = tuple((f"{name.upper()}:", name) for name in LEVELS)
+
+# Indexed words: 3+ characters with at least one letter (pure numbers are
+# mostly sizes and counters; they are still found by the substring check)
+_WORD_RE = re.compile(r"[a-z0-9_]{3,}")
+_HAS_LETTER_RE = re.compile(r"[a-z_]")
+
+# Sorts after every character a word can contain, for prefix range scans
+_PREFIX_END = "\x7f"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS log_files (
+    file_key       TEXT PRIMARY KEY,
+    path           TEXT NOT NULL,
+    indexed_bytes  INTEGER NOT NULL,
+    ts_first       TEXT,
+    ts_last        TEXT
+);
+
+CREATE TABLE IF NOT EXISTS log_blocks (
+    block_id    INTEGER PRIMARY KEY,
+    file_key    TEXT NOT NULL,
+    offset      INTEGER NOT NULL,
+    length      INTEGER NOT NULL,
+    ts_first    TEXT,
+    ts_last     TEXT,
+    level_mask  INTEGER NOT NULL,
+    categories  TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS log_blocks_file ON log_blocks (file_key, offset);
+
+CREATE TABLE IF NOT EXISTS log_words (
+    word      TEXT NOT NULL,
+    block_id  INTEGER NOT NULL,
+    PRIMARY KEY (word, block_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS log_words_block ON log_words (block_id);
+"""
+
+
+@dataclass
+class LogQuery:
+    """Filters for LogIndex.search(); empty fields match everything."""
+    text: str = ""
+    min_level: str = ""  # e.g. 'warning' keeps WARNING, ERROR and CRITICAL
+    categories: Optional[Set[str]] = None  # None = all categories
+    since: str = ""  # 'YYYY-MM-DD HH:MM:SS', inclusive
+    until: str = ""  # 'YYYY-MM-DD HH:MM:SS', inclusive
+
+
+@dataclass
+class LogMatch:
+    """One matching log line."""
+    path: str
+    timestamp: str
+    level: str
+    category: str
+    message: str
+
+
+def parse_record_start(line: str) -> Optional[Tuple[str, str, str, str]]:
+    """Split a file log line into (timestamp, level, category, message).
+
+    Returns None for lines that do not start a record (traceback and other
+    continuation lines), which belong to the record above them.
+    """
+    if not (len(line) >= 19 and line[4] == '-' and line[7] == '-' and line[10] == ' '
+            and line[13] == ':' and line[16] == ':'):
+        return None
+    rest = line[20:].lstrip()
+    level = "info"
+    for prefix, name in _LEVEL_PREFIXES:
+        if rest.startswith(prefix):
+            level = name
+            rest = rest[len(prefix):].lstrip()
+            break
+    category = "general"
+    if rest.startswith("[") and "]" in rest:
+        close_idx = rest.find("]")
+        category = rest[1:close_idx].split(":", 1)[0] or "general"
+        rest = rest[close_idx + 1:].lstrip()
+    return line[:19], level, category, rest
+
+
+def _words(text: str) -> Set[str]:
+    return {w for w in _WORD_RE.findall(text.lower()) if _HAS_LETTER_RE.search(w)}
+
+
+def _open_log(path: str):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def _file_key(path: str) -> Optional[str]:
+    """Identity of a log file's content: digest of its first line."""
+    try:
+        with _open_log(path) as f:
+            first = f.readline(4096)
+    except (OSError, EOFError):
+        return None
+    if not first.endswith(b"\n"):
+        return None  # Empty, or first record still being written
+    return hashlib.sha1(first).hexdigest()
+
+
+def _content_size(path: str) -> int:
+    """Uncompressed size; for .gz read from the trailer (modulo 4 GiB)."""
+    if not path.endswith(".gz"):
+        return os.path.getsize(path)
+    with open(path, "rb") as f:
+        f.seek(-4, os.SEEK_END)
+        return struct.unpack("<I", f.read(4))[0]
+
+
+class _BlockBuilder:
+    """Accumulates records into one index block."""
+
+    def __init__(self, offset: int):
+        self.offset = offset
+        self.length = 0
+        self.ts_first: Optional[str] = None
+        self.ts_last: Optional[str] = None
+        self.level_mask = 0
+        self.categories: Set[str] = set()
+        self.words: Set[str] = set()
+
+    def add_line(self, raw: bytes) -> None:
+        self.length += len(raw)
+        line = raw.decode("utf-8", errors="replace")
+        record = parse_record_start(line)
+        if record is None:
+            self.words |= _words(line)
+            return
+        timestamp, level, category, message = record
+        if self.ts_first is None:
+            self.ts_first = timestamp
+        self.ts_last = timestamp
+        self.level_mask |= _LEVEL_BITS[level]
+        self.categories.add(category)
+        self.words |= _words(message)
+
+
+class LogIndex:
+    """SQLite-backed block index over one log file family."""
+
+    def __init__(self, logs_dir: str, base_name: str = "bbdrop.log", db_path: Optional[str] = None):
+        self.logs_dir = logs_dir
+        self.base_name = base_name
+        self.db_path = db_path or os.path.join(logs_dir, "log_index.db")
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self._update_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index DB, ensuring schema and WAL mode."""
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA busy_timeout=5000;")
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(_SCHEMA)
+                self._schema_ready = True
+        return conn
+
+    def log_files(self) -> List[str]:
+        """Paths of the current log and its rotated files."""
+        try:
+            names = [n for n in os.listdir(self.logs_dir) if n.startswith(self.base_name)]
+        except OSError:
+            return []
+        return [os.path.join(self.logs_dir, n) for n in sorted(names)]
+
+    # ----------------------------------------------------------------- indexing
+
+    def update(self, cancel_event: Optional[threading.Event] = None, wait: bool = True) -> int:
+        """Bring the index up to date with the log files on disk.
+
+        Only data not indexed yet is read. Entries for files that no longer
+        exist are dropped.
+
+        Args:
+            cancel_event: Set to stop early; what was indexed so far is kept
+            wait: If another update is running, wait for it and then run
+                (False: return 0 at once)
+
+        Returns:
+            Number of uncompressed bytes indexed
+        """
+        if not self._update_lock.acquire(blocking=wait):
+            return 0
+        try:
+            conn = self._connect()
+            try:
+                return self._update(conn, cancel_event)
+            finally:
+                conn.close()
+        finally:
+            self._update_lock.release()
+
+    def start_background_update(self) -> threading.Thread:
+        """Run update() on a daemon thread (e.g. when the log viewer opens)."""
+        def run():
+            try:
+                self.update(wait=False)
+            except Exception as e:
+                log(f"Log indexing failed: {e}", level="warning", category="fileio")
+
+        thread = threading.Thread(target=run, name="LogIndexer", daemon=True)
+        thread.start()
+        return thread
+
+    def _update(self, conn: sqlite3.Connection, cancel_event: Optional[threading.Event]) -> int:
+        known = {row[0]: (row[1], row[2]) for row in conn.execute(
+            "SELECT file_key, path, indexed_bytes FROM log_files")}
+        seen: Set[str] = set()
+        indexed = 0
+        for path in self.log_files():
+            if cancel_event is not None and cancel_event.is_set():
+                return indexed
+            key = _file_key(path)
+            if key is None or key in seen:
+                continue
+            seen.add(key)
+            try:
+                size = _content_size(path)
+            except OSError:
+                continue
+            old_path, done = known.get(key, (None, 0))
+            if old_path is not None and old_path != path:
+                conn.execute("UPDATE log_files SET path = ? WHERE file_key = ?", (path, key))
+            if old_path is not None and size % (1 << 32) == done % (1 << 32):
+                continue
+            try:
+                indexed += self._index_file(conn, key, path, done if old_path is not None else 0,
+                                            cancel_event)
+            except (OSError, EOFError, zlib.error):
+                continue
+
+        if cancel_event is None or not cancel_event.is_set():
+            for key in set(known) - seen:
+                self._drop_file(conn, key)
+        return indexed
+
+    def _drop_file(self, conn: sqlite3.Connection, key: str) -> None:
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM log_words WHERE block_id IN "
+                         "(SELECT block_id FROM log_blocks WHERE file_key = ?)", (key,))
+            conn.execute("DELETE FROM log_blocks WHERE file_key = ?", (key,))
+            conn.execute("DELETE FROM log_files WHERE file_key = ?", (key,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _index_file(self, conn: sqlite3.Connection, key: str, path: str, start: int,
+                    cancel_event: Optional[threading.Event]) -> int:
+        """Index path from uncompressed offset start to its last complete line."""
+        # Re-read a trailing partial block so blocks stay BLOCK_SIZE-sized
+        # when the current log is indexed in many small increments
+        row = conn.execute(
+            "SELECT block_id, offset, length FROM log_blocks WHERE file_key = ? "
+            "ORDER BY offset DESC LIMIT 1", (key,)).fetchone()
+        replace_block = None
+        if row is not None and row[1] + row[2] == start and row[2] < BLOCK_SIZE:
+            replace_block, start = row[0], row[1]
+
+        blocks: List[_BlockBuilder] = []
+        block = _BlockBuilder(start)
+        position = start
+        pending = b""
+        with _open_log(path) as f:
+            f.seek(start)
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    return 0
+                chunk = f.read(_READ_CHUNK)
+                if not chunk:
+                    break
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    raw = line + b"\n"
+                    # Cut only where a new record starts, so tracebacks stay
+                    # with the line that logged them
+                    if block.length >= BLOCK_SIZE and raw[:1].isdigit() \
+                            and parse_record_start(raw[:32].decode("ascii", "replace")):
+                        blocks.append(block)
+                        block = _BlockBuilder(position)
+                    block.add_line(raw)
+                    position += len(raw)
+        if block.length:
+            blocks.append(block)
+        if not blocks:
+            return 0
+
+        conn.execute("BEGIN")
+        try:
+            if replace_block is not None:
+                conn.execute("DELETE FROM log_words WHERE block_id = ?", (replace_block,))
+                conn.execute("DELETE FROM log_blocks WHERE block_id = ?", (replace_block,))
+            for b in blocks:
+                cursor = conn.execute(
+                    "INSERT INTO log_blocks (file_key, offset, length, ts_first, ts_last, level_mask, categories) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, b.offset, b.length, b.ts_first, b.ts_last, b.level_mask,
+                     " ".join(sorted(b.categories))))
+                block_id = cursor.lastrowid
+                conn.executemany("INSERT OR IGNORE INTO log_words (word, block_id) VALUES (?, ?)",
+                                 ((w, block_id) for w in b.words))
+            ts_first, ts_last = conn.execute(
+                "SELECT MIN(ts_first), MAX(ts_last) FROM log_blocks WHERE file_key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO log_files (file_key, path, indexed_bytes, ts_first, ts_last) "
+                "VALUES (?, ?, ?, ?, ?)", (key, path, position, ts_first, ts_last))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return position - start
+
+    # -------------------------------------------------------------------- query
+
+    def _candidate_blocks(self, conn: sqlite3.Connection,
+                          query: LogQuery) -> Dict[str, List[Tuple[int, int]]]:
+        """{file_key: [(offset, length), ...]} of blocks that may hold matches."""
+        sql = "SELECT block_id, file_key, offset, length, categories FROM log_blocks WHERE 1 = 1"
+        params: list = []
+        if query.min_level:
+            min_value = LEVEL_VALUES.get(query.min_level.lower(), 0)
+            mask = sum(bit for name, bit in _LEVEL_BITS.items() if LEVEL_VALUES[name] >= min_value)
+            sql += " AND (level_mask & ?) != 0"
+            params.append(mask)
+        if query.since:
+            sql += " AND ts_last >= ?"
+            params.append(query.since)
+        if query.until:
+            sql += " AND ts_first <= ?"
+            params.append(query.until)
+
+        allowed: Optional[Set[int]] = None
+        for match in _WORD_RE.finditer(query.text.strip().lower()):
+            word = match.group()
+            if not _HAS_LETTER_RE.search(word):
+                continue
+            if match.start() == 0:
+                # The substring may start mid-word: "allery" must find "gallery_12"
+                rows = conn.execute(
+                    "SELECT DISTINCT block_id FROM log_words WHERE instr(word, ?) > 0", (word,))
+            else:
+                rows = conn.execute(
+                    "SELECT block_id FROM log_words WHERE word >= ? AND word < ?",
+                    (word, word + _PREFIX_END))
+            ids = {row[0] for row in rows}
+            allowed = ids if allowed is None else allowed & ids
+            if not allowed:
+                return {}
+
+        wanted_cats = {c.lower() for c in query.categories} if query.categories is not None else None
+        blocks: Dict[str, List[Tuple[int, int]]] = {}
+        for block_id, key, offset, length, categories in conn.execute(sql + " ORDER BY offset", params):
+            if allowed is not None and block_id not in allowed:
+                continue
+            if wanted_cats is not None and not wanted_cats & set(categories.split()):
+                continue
+            blocks.setdefault(key, []).append((offset, length))
+        return blocks
+
+    def search(self, query: LogQuery, limit: int = 5000,
+               cancel_event: Optional[threading.Event] = None) -> List[LogMatch]:
+        """Lines matching query across all indexed files, newest first.
+
+        Only blocks selected by the index are read. At most limit lines are
+        returned; with query.until set this is a jump to that time.
+        """
+        conn = self._connect()
+        try:
+            blocks = self._candidate_blocks(conn, query)
+            files = conn.execute(
+                "SELECT file_key, path FROM log_files ORDER BY ts_last DESC").fetchall()
+        finally:
+            conn.close()
+
+        matches: List[LogMatch] = []
+        for key, path in files:
+            if len(matches) >= limit or (cancel_event is not None and cancel_event.is_set()):
+                break
+            if key not in blocks:
+                continue
+            # Read forward (cheap for .gz), keep only the newest lines we can still use
+            newest: deque = deque(maxlen=limit - len(matches))
+            try:
+                newest.extend(self._scan_blocks(path, blocks[key], query, cancel_event))
+            except (OSError, EOFError, zlib.error):
+                continue
+            matches.extend(reversed(newest))
+        return matches
+
+    def _scan_blocks(self, path: str, blocks: List[Tuple[int, int]], query: LogQuery,
+                     cancel_event: Optional[threading.Event]) -> Iterator[LogMatch]:
+        text = query.text.strip().lower()
+        min_value = LEVEL_VALUES.get(query.min_level.lower(), 0) if query.min_level else 0
+        wanted_cats = {c.lower() for c in query.categories} if query.categories is not None else None
+        with _open_log(path) as f:
+            for offset, length in blocks:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                f.seek(offset)
+                data = f.read(length).decode("utf-8", errors="replace")
+                record = None
+                for line in data.splitlines():
+                    start = parse_record_start(line)
+                    if start is not None:
+                        record = start
+                    if record is None:
+                        continue
+                    timestamp, level, category, message = record
+                    if start is None:
+                        message = line  # Continuation line keeps its record's metadata
+                    if LEVEL_VALUES[level] < min_value:
+                        continue
+                    if wanted_cats is not None and category not in wanted_cats:
+                        continue
+                    if (query.since and timestamp < query.since) or (query.until and timestamp > query.until):
+                        continue
+                    if text and text not in line.lower():
+                        continue
+                    yield LogMatch(path, timestamp, level, category, message)
+
+
+_index: Optional[LogIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_log_index() -> LogIndex:
+    """Index over the AppLogger's log directory."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                from src.utils.logging import get_logger
+                app_logger = get_logger()
+                base_name = app_logger.get_settings().get("filename") or "bbdrop.log"
+                _index = LogIndex(app_logger.get_logs_dir(), base_name)
+    return _index
@@ -31,13 +31,34 @@ The logger automatically:
 - Adds timestamps
 - Detects categories from [tags] for backwards compatibility
 - Detects log levels from message prefixes for backwards compatibility
+- Drops records no sink wants before formatting them
+
+Background mode (start_async_logging(), enabled from [LOGGING] async_enabled
+by configure_async_logging()): log() only queues a small record (message
+template, args, level, category, time) and returns. One consumer thread
+formats the records, writes the file log (including rotation) and feeds the
+GUI, log viewers and console, so upload threads no longer take turns on the
+logger lock and the disk. Pass values through args to defer %-formatting to
+that thread:
+
+    log("Uploaded %s in %.1fs", level="debug", category="uploads", args=(name, secs))
+
+When the queue is full the overflow policy applies: block (the default)
+makes log() wait for room, drop_oldest and drop_newest discard records and
+log a "dropped N log records" warning. ERROR and CRITICAL records are never
+dropped, and log() waits (up to URGENT_FLUSH_TIMEOUT) until they have been
+written, so a crash right after an error does not lose it. get_log_stats()
+reports queue depth and dropped-record counters.
 """
 
 from __future__ import annotations
+import atexit
 import threading
 import logging
 import sys
-from typing import Optional, TYPE_CHECKING
+import time
+from collections import deque
+from typing import Any, Dict, NamedTuple, Optional, TYPE_CHECKING
 from datetime import datetime
 
 if TYPE_CHECKING:
@@ -78,6 +99,14 @@ LEVEL_MAP = {
 }
 
 
+# Background logging defaults
+DEFAULT_ASYNC_QUEUE_SIZE = 10000
+DEFAULT_OVERFLOW_POLICY = "block"
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+# Longest log() waits for an ERROR/CRITICAL record to reach the sinks
+URGENT_FLUSH_TIMEOUT = 2.0
+
+
 def timestamp() -> str:
     """Return current timestamp in HH:MM:SS format."""
     return datetime.now().strftime("%H:%M:%S")
@@ -198,19 +227,49 @@ def _detect_category_from_message(message: str) -> tuple[str, Optional[str], str
     return "general", None, message
 
 
+class _LogRecord(NamedTuple):
+    """What log() hands to the background consumer; formatted there."""
+    message: str
+    level: Optional[str]
+    category: Optional[str]
+    args: tuple
+    created: float
+
+
+def _is_wanted(log_level: int, category: str) -> bool:
+    """Cheap pre-check: False if no sink would show a record.
+
+    Mirrors the routing in _emit(): viewers, debug mode and CLI mode see
+    everything and errors always reach the console; otherwise the record
+    must pass the file or GUI filter. Lets filtered-out debug/trace calls
+    return before any formatting, locking or queueing.
+    """
+    if _debug_mode or _log_viewers or _main_window is None or log_level >= logging.ERROR:
+        return True
+    app_logger = _get_app_logger()
+    if app_logger is None:
+        return True
+    category = category.split(":", 1)[0]
+    return app_logger.should_emit_file(category, log_level) or app_logger.should_emit_gui(category, log_level)
+
+
 def log(message: str,
         level: Optional[str] = None,
-        category: Optional[str] = None) -> None:
+        category: Optional[str] = None,
+        args: tuple = ()) -> None:
     """
     Universal logging function that works everywhere.
 
     Args:
-        message: The log message to output
+        message: The log message to output (a %-format template if args is given)
         level: Log level (trace/debug/info/warning/error/critical).
                If None, auto-detects from message or defaults to 'info'
                NOTE: 'trace' level is never written to log files
         category: Category for filtering (general/auth/uploads/network/etc).
                   If None, auto-detects from [tag] or defaults to 'general'
+        args: Values for %-formatting message; formatting is skipped for
+              filtered-out records and, in background mode, done on the
+              logging thread (so pass values that will not change)
 
     Examples:
         log("Starting application")
@@ -219,6 +278,7 @@ def log(message: str,
         log("[uploads] File uploaded successfully")  # Auto-detects category
         log("ERROR: Database connection lost")       # Auto-detects level
         log("Verbose details", level="trace")        # TRACE: console/GUI only, never to file
+        log("Sent %d bytes", level="debug", category="network", args=(n,))
 
     The function will:
         - Add timestamp if not present
@@ -227,159 +287,369 @@ def log(message: str,
         - Write to file log if enabled (EXCEPT trace level)
         - Handle thread safety automatically
     """
+    if level is not None and category is not None:
+        log_level = LEVEL_MAP.get(level.lower(), logging.INFO)
+        if not _is_wanted(log_level, category):
+            return
+
+    pipeline = _async_pipeline
+    if pipeline is not None:
+        pipeline.submit(_LogRecord(message, level, category, args, time.time()))
+        if _is_urgent_level(level, message):
+            # Don't leave errors queued in memory where a crash would lose them
+            pipeline.flush(URGENT_FLUSH_TIMEOUT)
+        return
+
     with _lock:
-        # Auto-detect level if not provided
-        if level is None:
-            detected_level = _detect_level_from_message(message)
-            level = detected_level or "info"
-
-        # Normalize level
-        level = level.lower()
-        if level not in LEVEL_MAP:
-            level = "info"
-
-        # Get numeric log level
-        log_level = LEVEL_MAP[level]
-
-        # Auto-detect category if not provided
-        if category is None:
-            detected_cat, subtype, cleaned_msg = _detect_category_from_message(message)
-            category = detected_cat
-            # Don't clean the message if category was explicitly provided
-            # This preserves backwards compatibility with [tag] format
+        _emit(message, level, category, args, None)
+
+
+def _emit(message: str, level: Optional[str], category: Optional[str],
+          args: tuple, created: Optional[float]) -> None:
+    """Format one record and route it to file, console, GUI and viewers.
+
+    Caller must hold _lock. created is the time log() was called (background
+    mode); None means now.
+    """
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            message = f"{message} {args!r}"
+
+    # Auto-detect level if not provided
+    if level is None:
+        detected_level = _detect_level_from_message(message)
+        level = detected_level or "info"
+
+    # Normalize level
+    level = level.lower()
+    if level not in LEVEL_MAP:
+        level = "info"
+
+    # Get numeric log level
+    log_level = LEVEL_MAP[level]
+
+    # Auto-detect category if not provided
+    if category is None:
+        detected_cat, subtype, cleaned_msg = _detect_category_from_message(message)
+        category = detected_cat
+        # Don't clean the message if category was explicitly provided
+        # This preserves backwards compatibility with [tag] format
+    else:
+        # Parse category:subtype if colon is present (e.g., "uploads:file")
+        if ":" in category:
+            category, subtype = category.split(":", 1)
         else:
-            # Parse category:subtype if colon is present (e.g., "uploads:file")
-            if ":" in category:
-                category, subtype = category.split(":", 1)
-            else:
-                subtype = None
-            cleaned_msg = message
-
-        # Add log level prefix (unless already present)
-        level_prefix = ""
-        # Check if message already has the level prefix anywhere in first 50 chars
-        msg_upper = cleaned_msg.upper()[:50]
-        if level == "trace" and "TRACE:" not in msg_upper:
-            level_prefix = "TRACE: "
-        elif level == "debug" and "DEBUG:" not in msg_upper:
-            level_prefix = "DEBUG: "
-        elif level == "info" and "INFO:" not in msg_upper:
-            level_prefix = "INFO: "
-        elif level == "warning" and "WARNING:" not in msg_upper and "WARN:" not in msg_upper:
-            level_prefix = "WARNING: "
-        elif level == "error" and "ERROR:" not in msg_upper:
-            level_prefix = "ERROR: "
-        elif level == "critical" and "CRITICAL:" not in msg_upper:
-            level_prefix = "CRITICAL: "
-
-        # Ensure timestamp
-        if not (cleaned_msg and len(cleaned_msg) > 8 and cleaned_msg[2] == ":" and cleaned_msg[5] == ":"):
-            # No timestamp detected, add one
-            formatted_message = f"{timestamp()} {level_prefix}{cleaned_msg}"
+            subtype = None
+        cleaned_msg = message
+
+    # Add log level prefix (unless already present)
+    level_prefix = ""
+    # Check if message already has the level prefix anywhere in first 50 chars
+    msg_upper = cleaned_msg.upper()[:50]
+    if level == "trace" and "TRACE:" not in msg_upper:
+        level_prefix = "TRACE: "
+    elif level == "debug" and "DEBUG:" not in msg_upper:
+        level_prefix = "DEBUG: "
+    elif level == "info" and "INFO:" not in msg_upper:
+        level_prefix = "INFO: "
+    elif level == "warning" and "WARNING:" not in msg_upper and "WARN:" not in msg_upper:
+        level_prefix = "WARNING: "
+    elif level == "error" and "ERROR:" not in msg_upper:
+        level_prefix = "ERROR: "
+    elif level == "critical" and "CRITICAL:" not in msg_upper:
+        level_prefix = "CRITICAL: "
+
+    # Ensure timestamp
+    if not (cleaned_msg and len(cleaned_msg) > 8 and cleaned_msg[2] == ":" and cleaned_msg[5] == ":"):
+        # No timestamp detected, add one
+        stamp = timestamp() if created is None else datetime.fromtimestamp(created).strftime("%H:%M:%S")
+        formatted_message = f"{stamp} {level_prefix}{cleaned_msg}"
+    else:
+        # Timestamp exists, insert level prefix after it
+        parts = cleaned_msg.split(" ", 1)
+        if len(parts) > 1:
+            formatted_message = f"{parts[0]} {level_prefix}{parts[1]}"
         else:
-            # Timestamp exists, insert level prefix after it
-            parts = cleaned_msg.split(" ", 1)
-            if len(parts) > 1:
-                formatted_message = f"{parts[0]} {level_prefix}{parts[1]}"
+            formatted_message = f"{cleaned_msg} {level_prefix}"
+
+    # Add category tag if it's not general and wasn't in original
+    if category != "general" and not message.startswith("["):
+        # Build tag with subtype if present
+        tag = f"[{category}:{subtype}]" if subtype else f"[{category}]"
+        # Find where to insert the tag (after timestamp and level prefix)
+        parts = formatted_message.split(" ", 2)
+        if len(parts) >= 2 and parts[0].count(":") == 2:
+            # Has timestamp
+            if parts[1].endswith(":"):
+                # Has level prefix
+                formatted_message = f"{parts[0]} {parts[1]} {tag} {' '.join(parts[2:])}"
             else:
-                formatted_message = f"{cleaned_msg} {level_prefix}"
-
-        # Add category tag if it's not general and wasn't in original
-        if category != "general" and not message.startswith("["):
-            # Build tag with subtype if present
-            tag = f"[{category}:{subtype}]" if subtype else f"[{category}]"
-            # Find where to insert the tag (after timestamp and level prefix)
-            parts = formatted_message.split(" ", 2)
-            if len(parts) >= 2 and parts[0].count(":") == 2:
-                # Has timestamp
-                if parts[1].endswith(":"):
-                    # Has level prefix
-                    formatted_message = f"{parts[0]} {parts[1]} {tag} {' '.join(parts[2:])}"
+                # No level prefix
+                formatted_message = f"{parts[0]} {tag} {' '.join(parts[1:])}"
+        else:
+            formatted_message = f"{tag} {formatted_message}"
+
+    # Get AppLogger for file logging
+    app_logger = _get_app_logger()
+
+    # Check upload success filtering EARLY (applies to ALL outputs: file, console, GUI)
+    if category == "uploads" and subtype and app_logger:
+        if subtype == "file" and not app_logger.should_log_upload_file_success("gui"):
+            return  # Block file-level upload success messages everywhere
+        if subtype == "gallery" and not app_logger.should_log_upload_gallery_success("gui"):
+            return  # Block gallery-level upload success messages everywhere
+
+    # 1. Always try file logging (if enabled)
+    if app_logger:
+        try:
+            if app_logger.should_emit_file(category, log_level):
+                app_logger.log_to_file(formatted_message, log_level, category)
+        except Exception:
+            # Don't let file logging errors break the app
+            pass
+
+    # 2. Route to appropriate display
+    # Dedup helper: suppress identical consecutive console messages
+    def _console_print(msg, **kwargs):
+        global _last_console_msg
+        # Strip timestamp (HH:MM:SS ) for comparison
+        body = msg.split(" ", 1)[1] if len(msg) > 9 and msg[2] == ":" and msg[5] == ":" else msg
+        if body == _last_console_msg:
+            return  # Suppress duplicate
+        _last_console_msg = body
+        print(msg, **kwargs)
+
+    # Debug mode: print everything to console
+    if _debug_mode:
+        _console_print(formatted_message, file=sys.stderr if log_level >= logging.WARNING else sys.stdout, flush=True)
+
+    # CRITICAL: Always print ERROR and CRITICAL to console, even in GUI mode
+    # This ensures crash messages are always visible
+    elif log_level >= logging.ERROR:
+        _console_print(formatted_message, file=sys.stderr, flush=True)
+
+    # Also print WARNING to console so issues are visible
+    elif log_level == logging.WARNING and not _main_window:
+        _console_print(formatted_message, file=sys.stderr, flush=True)
+
+    if _main_window:
+        # GUI is available: Send to main window's simple log display
+        try:
+            # Check if should show in GUI based on filters
+            if app_logger and not app_logger.should_emit_gui(category, log_level):
+                return
+
+            # Send to main window's simple log display (Qt handles cross-thread signals safely)
+            if hasattr(_main_window, 'add_log_message'):
+                _main_window.add_log_message(formatted_message)
+        except Exception:
+            # Fallback to console if GUI logging fails
+            print(formatted_message, file=sys.stderr if log_level >= logging.WARNING else sys.stdout, flush=True)
+
+    # Send to all registered log viewers with metadata (independent of main window)
+    for viewer in _log_viewers[:]:  # Copy to avoid modification during iteration
+        try:
+            if hasattr(viewer, 'append_message'):
+                viewer.append_message(
+                    message=formatted_message,
+                    level=level,
+                    category=category
+                )
+        except Exception:
+            # Viewer may have been closed/deleted, remove it (_lock is already held)
+            if viewer in _log_viewers:
+                _log_viewers.remove(viewer)
+
+    # Only print to console if there's NO GUI at all (CLI mode)
+    if not _main_window and not _debug_mode and log_level < logging.WARNING:
+        # CLI mode - print info/debug to console
+        _console_print(formatted_message, flush=True)
+
+
+def _is_urgent_level(level: Optional[str], message: str) -> bool:
+    """True for ERROR and CRITICAL records, including ones marked by a message prefix."""
+    if level is None:
+        level = _detect_level_from_message(message[:20])  # Only the first 20 chars are checked
+    return LEVEL_MAP.get((level or "").lower(), logging.INFO) >= logging.ERROR
+
+
+class _AsyncLogPipeline:
+    """Bounded record queue drained by one background thread.
+
+    submit() only appends under a short condition lock. The consumer takes
+    the whole backlog at once and emits it under _lock, so producers never
+    wait on formatting or disk I/O (unless the overflow policy is 'block').
+    """
+
+    def __init__(self, max_queue: int, overflow: str):
+        self.max_queue = max(1, int(max_queue))
+        self.overflow = overflow if overflow in OVERFLOW_POLICIES else DEFAULT_OVERFLOW_POLICY
+        self._records: deque = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._unfinished = 0
+        self._stopping = False
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self.dropped_by_level: Dict[str, int] = {}
+        self._reported_dropped = 0
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def _count_drop(self, record: _LogRecord) -> None:
+        self.dropped += 1
+        level = (record.level or "info").lower()
+        self.dropped_by_level[level] = self.dropped_by_level.get(level, 0) + 1
+
+    @staticmethod
+    def _is_urgent(record: _LogRecord) -> bool:
+        return _is_urgent_level(record.level, record.message)
+
+    def submit(self, record: _LogRecord) -> None:
+        urgent = self._is_urgent(record)
+        on_writer = threading.current_thread() is self._thread
+        with self._cond:
+            if len(self._records) >= self.max_queue and not urgent and not on_writer:
+                if self.overflow == "block":
+                    while len(self._records) >= self.max_queue and not self._stopping:
+                        self._cond.wait(0.1)
+                elif self.overflow == "drop_newest" or self._is_urgent(self._records[0]):
+                    self._count_drop(record)
+                    return
                 else:
-                    # No level prefix
-                    formatted_message = f"{parts[0]} {tag} {' '.join(parts[1:])}"
-            else:
-                formatted_message = f"{tag} {formatted_message}"
-
-        # Get AppLogger for file logging
-        app_logger = _get_app_logger()
-
-        # Check upload success filtering EARLY (applies to ALL outputs: file, console, GUI)
-        if category == "uploads" and subtype and app_logger:
-            if subtype == "file" and not app_logger.should_log_upload_file_success("gui"):
-                return  # Block file-level upload success messages everywhere
-            if subtype == "gallery" and not app_logger.should_log_upload_gallery_success("gui"):
-                return  # Block gallery-level upload success messages everywhere
-
-        # 1. Always try file logging (if enabled)
-        if app_logger:
-            try:
-                if app_logger.should_emit_file(category, log_level):
-                    app_logger.log_to_file(formatted_message, log_level, category)
-            except Exception:
-                # Don't let file logging errors break the app
-                pass
-
-        # 2. Route to appropriate display
-        # Dedup helper: suppress identical consecutive console messages
-        def _console_print(msg, **kwargs):
-            global _last_console_msg
-            # Strip timestamp (HH:MM:SS ) for comparison
-            body = msg.split(" ", 1)[1] if len(msg) > 9 and msg[2] == ":" and msg[5] == ":" else msg
-            if body == _last_console_msg:
-                return  # Suppress duplicate
-            _last_console_msg = body
-            print(msg, **kwargs)
-
-        # Debug mode: print everything to console
-        if _debug_mode:
-            _console_print(formatted_message, file=sys.stderr if log_level >= logging.WARNING else sys.stdout, flush=True)
-
-        # CRITICAL: Always print ERROR and CRITICAL to console, even in GUI mode
-        # This ensures crash messages are always visible
-        elif log_level >= logging.ERROR:
-            _console_print(formatted_message, file=sys.stderr, flush=True)
-
-        # Also print WARNING to console so issues are visible
-        elif log_level == logging.WARNING and not _main_window:
-            _console_print(formatted_message, file=sys.stderr, flush=True)
-
-        if _main_window:
-            # GUI is available: Send to main window's simple log display
-            try:
-                # Check if should show in GUI based on filters
-                if app_logger and not app_logger.should_emit_gui(category, log_level):
+                    self._count_drop(self._records.popleft())
+                    self._unfinished -= 1
+            self._records.append(record)
+            self._unfinished += 1
+            self.submitted += 1
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._records and not self._stopping:
+                    self._cond.wait()
+                if not self._records and self._stopping:
                     return
+                batch = self._records
+                self._records = deque()
+                dropped = self.dropped
+                self._cond.notify_all()  # Wake producers blocked on a full queue
+
+            with _lock:
+                if dropped > self._reported_dropped:
+                    _emit(f"Log queue full ({self.overflow}): dropped "
+                          f"{dropped - self._reported_dropped} log records", "warning", "general", (), None)
+                    self._reported_dropped = dropped
+                for record in batch:
+                    try:
+                        _emit(record.message, record.level, record.category, record.args, record.created)
+                    except Exception:
+                        pass
+
+            with self._cond:
+                self.processed += len(batch)
+                self._unfinished -= len(batch)
+                self._cond.notify_all()
+
+    def flush(self, timeout: float) -> bool:
+        """Wait until every queued record has been emitted."""
+        if threading.current_thread() is self._thread:
+            return False
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._unfinished > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, timeout: float) -> None:
+        self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "async": True,
+                "queued": len(self._records),
+                "max_queue": self.max_queue,
+                "overflow": self.overflow,
+                "submitted": self.submitted,
+                "processed": self.processed,
+                "dropped": self.dropped,
+                "dropped_by_level": dict(self.dropped_by_level),
+            }
+
+
+_async_pipeline: Optional[_AsyncLogPipeline] = None
+_async_control_lock = threading.Lock()
+_atexit_registered = False
+
+
+def start_async_logging(max_queue: int = DEFAULT_ASYNC_QUEUE_SIZE, overflow: str = DEFAULT_OVERFLOW_POLICY) -> None:
+    """
+    Switch log() to background mode (see module docstring).
 
-                # Send to main window's simple log display (Qt handles cross-thread signals safely)
-                if hasattr(_main_window, 'add_log_message'):
-                    _main_window.add_log_message(formatted_message)
-            except Exception:
-                # Fallback to console if GUI logging fails
-                print(formatted_message, file=sys.stderr if log_level >= logging.WARNING else sys.stdout, flush=True)
-
-        # Send to all registered log viewers with metadata (independent of main window)
-        for viewer in _log_viewers[:]:  # Copy to avoid modification during iteration
-            try:
-                if hasattr(viewer, 'append_message'):
-                    viewer.append_message(
-                        message=formatted_message,
-                        level=level,
-                        category=category
-                    )
-            except Exception:
-                # Viewer may have been closed/deleted, remove it
-                try:
-                    with _lock:
-                        if viewer in _log_viewers:
-                            _log_viewers.remove(viewer)
-                except Exception:
-                    pass
-
-        # Only print to console if there's NO GUI at all (CLI mode)
-        if not _main_window and not _debug_mode and log_level < logging.WARNING:
-            # CLI mode - print info/debug to console
-            _console_print(formatted_message, flush=True)
+    Args:
+        max_queue: Records held before the overflow policy applies
+        overflow: 'block' (wait for room), 'drop_oldest' or 'drop_newest'
+    """
+    global _async_pipeline, _atexit_registered
+    with _async_control_lock:
+        current = _async_pipeline
+        if current is not None and current.max_queue == max_queue and current.overflow == overflow:
+            return
+        pipeline = _AsyncLogPipeline(max_queue, overflow)
+        _async_pipeline = pipeline
+        if current is not None:
+            current.stop(timeout=5.0)
+        if not _atexit_registered:
+            atexit.register(stop_async_logging)
+            _atexit_registered = True
+
+
+def stop_async_logging(timeout: float = 5.0) -> None:
+    """Emit everything still queued and return log() to synchronous mode."""
+    global _async_pipeline
+    with _async_control_lock:
+        pipeline = _async_pipeline
+        _async_pipeline = None
+    if pipeline is not None:
+        pipeline.stop(timeout)
+
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    """Wait for queued records to be emitted; True if the queue drained in time."""
+    pipeline = _async_pipeline
+    return pipeline.flush(timeout) if pipeline is not None else True
+
+
+def get_log_stats() -> Dict[str, Any]:
+    """Queue depth and dropped-record counters of the background logger."""
+    pipeline = _async_pipeline
+    if pipeline is None:
+        return {"async": False, "queued": 0, "dropped": 0, "dropped_by_level": {}}
+    return pipeline.stats()
+
+
+def configure_async_logging() -> None:
+    """Start or stop background mode from the [LOGGING] settings."""
+    app_logger = _get_app_logger()
+    if app_logger is None:
+        return
+    settings = app_logger.get_settings()
+    if settings.get("async_enabled", True):
+        start_async_logging(settings.get("async_queue_size", DEFAULT_ASYNC_QUEUE_SIZE),
+                            settings.get("async_overflow", DEFAULT_OVERFLOW_POLICY))
+    else:
+        stop_async_logging()
 
 
 # Convenience functions for specific log levels
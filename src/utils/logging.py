@@ -146,6 +146,10 @@ class AppLogger:
         # GUI display formatting preferences
         "show_log_level_gui": "false",  # Show level prefix (DEBUG:, ERROR:, etc.) in GUI log
         "show_category_gui": "false",  # Show category tags ([network], [uploads], etc.) in GUI log
+        # Background logging (see src.utils.logger.start_async_logging)
+        "async_enabled": "true",
+        "async_queue_size": "10000",
+        "async_overflow": "block",  # block | drop_oldest | drop_newest
     }
 
     TIME_ONLY_RE = re.compile(r"^(\d{2}:\d{2}:\d{2})\s+")
@@ -177,6 +181,8 @@ class AppLogger:
 
         self._gui_level = logging.INFO
         self._file_level = logging.INFO
+        self._file_enabled = True
+        self._category_flags: Dict[str, bool] = {}
 
         self._settings = self._load_settings()
         self._apply_settings()
@@ -300,8 +306,20 @@ class AppLogger:
     def _apply_settings(self) -> None:
         self._file_level = self.LEVEL_MAP.get(self._settings.get("level_file", "INFO"), logging.INFO)
         self._gui_level = self.LEVEL_MAP.get(self._settings.get("level_gui", "INFO"), logging.INFO)
+        self._refresh_filter_flags()
         self._ensure_file_handler()
 
+    def _refresh_filter_flags(self) -> None:
+        """Cache the enabled flag and category toggles read by should_emit_*.
+
+        Those checks run for every log() call, so they must not rebuild the
+        settings dict each time.
+        """
+        self._file_enabled = str(self._settings.get("enabled", "true")).lower() == "true"
+        self._category_flags = {
+            k: str(v).lower() == "true" for k, v in self._settings.items() if k.startswith("cats_")
+        }
+
     def update_settings(self, **kwargs: Any) -> None:
         for k, v in kwargs.items():
             if k in self.DEFAULTS:
@@ -337,6 +355,13 @@ class AppLogger:
         # Normalize GUI display formatting options
         s["show_log_level_gui"] = str(s.get("show_log_level_gui", "false")).lower() == "true"
         s["show_category_gui"] = str(s.get("show_category_gui", "false")).lower() == "true"
+        s["async_enabled"] = str(s.get("async_enabled", "true")).lower() == "true"
+        try:
+            s["async_queue_size"] = max(100, int(s.get("async_queue_size", 10000)))
+        except Exception:
+            s["async_queue_size"] = 10000
+        if s.get("async_overflow") not in ("drop_oldest", "drop_newest", "block"):
+            s["async_overflow"] = "block"
         return s
 
     @classmethod
@@ -353,26 +378,21 @@ class AppLogger:
                 return False
         except Exception:
             pass
-        cat_key = f"cats_gui_{category.lower()}"
-        cats = self.get_settings()
-        return bool(cats.get(cat_key, True))
+        return self._category_flags.get(f"cats_gui_{category.lower()}", True)
 
     def should_emit_file(self, category: str, level: int) -> bool:
         # TRACE level is NEVER logged to file
         if level <= self.TRACE:
             return False
 
-        enabled = str(self._settings.get("enabled", "true")).lower() == "true"
-        if not enabled:
+        if not self._file_enabled:
             return False
         try:
             if level < self._file_level:
                 return False
         except Exception:
             pass
-        cat_key = f"cats_file_{category.lower()}"
-        cats = self.get_settings()
-        return bool(cats.get(cat_key, True))
+        return self._category_flags.get(f"cats_file_{category.lower()}", True)
 
     def should_log_upload_file_success(self, target: str) -> bool:
         # target: 'gui' or 'file'
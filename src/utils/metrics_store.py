@@ -5,6 +5,15 @@ Provides persistent storage and real-time tracking of upload metrics
 across different time periods (session, daily, all-time).
 
 Uses buffered writes for performance and PyQt6 signals for UI updates.
+Transfers queued by record_transfer() are coalesced per (host, day) and per
+(host, minute) by the writer thread and flushed in a single transaction,
+either every WRITE_FLUSH_INTERVAL seconds or once WRITE_BATCH_SIZE transfers
+are pending.
+
+Besides the daily/all-time totals in host_metrics, a compact time series is
+kept in host_metrics_series: minute buckets for the last two days, downsampled
+into hourly buckets kept for a month, so throughput charts read a few hundred
+pre-aggregated rows instead of aggregating raw transfers.
 """
 
 from __future__ import annotations
@@ -26,6 +35,18 @@ from src.utils.paths import get_central_store_base_path
 
 logger = logging.getLogger(__name__)
 
+# Coalescing writer: flush pending transfers after this many seconds or once
+# this many transfers are waiting, whichever comes first
+WRITE_FLUSH_INTERVAL = 2.0
+WRITE_BATCH_SIZE = 200
+
+# Time series resolutions (bucket width in seconds) and retention
+SERIES_MINUTE = 60
+SERIES_HOUR = 3600
+SERIES_MINUTE_RETENTION = 48 * 3600  # Minute buckets older than this are downsampled
+SERIES_HOUR_RETENTION = 30 * 86400   # Hourly buckets older than this are dropped
+SERIES_COMPACT_INTERVAL = 600        # Seconds between downsampling passes
+
 
 # Alias map: old display-name keys -> canonical host_id
 _HOST_NAME_ALIASES: Dict[str, str] = {
@@ -247,6 +268,15 @@ class MetricsStore:
             self._worker_thread = None
             self._running = True
 
+            # Transfers coalesced by the writer thread, waiting to be flushed
+            # (only touched by the writer thread)
+            # _pending_daily: {(host_name, 'YYYY-MM-DD'): totals}
+            # _pending_series: {(host_name, minute_bucket_ts): totals}
+            self._pending_daily: Dict[tuple, Dict[str, Any]] = {}
+            self._pending_series: Dict[tuple, Dict[str, Any]] = {}
+            self._pending_count = 0
+            self._last_compact = 0.0
+
             # PyQt signals
             self.signals = MetricsSignals()
 
@@ -362,6 +392,23 @@ class MetricsStore:
                         ON host_metrics(updated_ts DESC);
                     CREATE INDEX IF NOT EXISTS idx_host_metrics_host_period
                         ON host_metrics(host_name, period_type, period_date);
+
+                    -- Throughput time series: resolution is the bucket width in
+                    -- seconds (60 or 3600), bucket_ts the bucket start (unix time)
+                    CREATE TABLE IF NOT EXISTS host_metrics_series (
+                        host_name TEXT NOT NULL,
+                        resolution INTEGER NOT NULL,
+                        bucket_ts INTEGER NOT NULL,
+                        bytes_uploaded INTEGER DEFAULT 0,
+                        files_uploaded INTEGER DEFAULT 0,
+                        files_failed INTEGER DEFAULT 0,
+                        total_transfer_time REAL DEFAULT 0,
+                        peak_speed REAL DEFAULT 0,
+                        PRIMARY KEY (host_name, resolution, bucket_ts)
+                    ) WITHOUT ROWID;
+
+                    CREATE INDEX IF NOT EXISTS idx_host_metrics_series_bucket
+                        ON host_metrics_series(resolution, bucket_ts);
                 """)
 
                 # Migrate: add columns if missing (existing DBs)
@@ -940,60 +987,169 @@ class MetricsStore:
         return result
 
     def _write_worker(self) -> None:
-        """Background worker that processes buffered writes."""
+        """Background worker that coalesces buffered writes and flushes them in batches."""
+        last_flush = time.monotonic()
         while self._running:
             try:
-                # Wait for items with timeout
+                # Wait for items, waking up in time for the next timed flush
+                timeout = 1.0
+                if self._pending_count:
+                    timeout = max(0.05, WRITE_FLUSH_INTERVAL - (time.monotonic() - last_flush))
                 try:
-                    item = self._write_queue.get(timeout=1.0)
+                    item = self._write_queue.get(timeout=timeout)
                 except Empty:
-                    continue
+                    item = None
+                    got_item = False
+                else:
+                    got_item = True
 
-                if item is None:  # Shutdown signal
+                if got_item and item is None:  # Shutdown signal
+                    self._write_queue.task_done()
                     break
 
-                self._process_write(item)
-                self._write_queue.task_done()
+                flush_requested = False
+                if got_item:
+                    try:
+                        if item.get('type') == 'flush':
+                            flush_requested = True
+                        else:
+                            self._process_write(item)
+                    finally:
+                        self._write_queue.task_done()
+
+                if self._pending_count and (
+                    flush_requested
+                    or self._pending_count >= WRITE_BATCH_SIZE
+                    or time.monotonic() - last_flush >= WRITE_FLUSH_INTERVAL
+                ):
+                    self._flush_pending()
+                    last_flush = time.monotonic()
+                elif not self._pending_count:
+                    last_flush = time.monotonic()
+
+                if flush_requested:
+                    item['event'].set()
 
             except Exception as e:
                 logger.error(f"Error in metrics write worker: {e}")
 
         # Process remaining items on shutdown
+        flush_events = []
         while not self._write_queue.empty():
             try:
                 item = self._write_queue.get_nowait()
                 if item is not None:
-                    self._process_write(item)
+                    if item.get('type') == 'flush':
+                        flush_events.append(item['event'])
+                    else:
+                        self._process_write(item)
                 self._write_queue.task_done()
             except Empty:
                 break
             except Exception as e:
                 logger.error(f"Error processing remaining writes: {e}")
 
+        try:
+            self._flush_pending()
+        except Exception as e:
+            logger.error(f"Error flushing metrics on shutdown: {e}")
+        for event in flush_events:
+            event.set()
 
     def _process_write(self, item: Dict[str, Any]) -> None:
-        """Process a single write item from the queue."""
+        """Merge a single write item from the queue into the pending batch."""
         if item['type'] != 'transfer':
             return
 
         host_name = item['host_name']
-        bytes_uploaded = item['bytes_uploaded']
-        bytes_saved = item.get('bytes_saved', 0)
-        transfer_time = item['transfer_time']
         success = item['success']
-        is_deduped = item.get('deduped', False)
         speed = item['speed']
-        today = datetime.now().strftime('%Y-%m-%d')
+        timestamp = item.get('timestamp') or time.time()
+        when = datetime.fromtimestamp(timestamp)
+
+        daily = self._pending_daily.get((host_name, when.strftime('%Y-%m-%d')))
+        if daily is None:
+            daily = self._pending_daily[(host_name, when.strftime('%Y-%m-%d'))] = {
+                'bytes_uploaded': 0,
+                'bytes_saved': 0,
+                'files_uploaded': 0,
+                'files_failed': 0,
+                'files_deduped': 0,
+                'total_transfer_time': 0.0,
+                'peak_speed': 0.0,
+                'peak_speed_date': None,
+            }
+        daily['bytes_uploaded'] += item['bytes_uploaded']
+        daily['bytes_saved'] += item.get('bytes_saved', 0)
+        daily['files_uploaded'] += 1 if success else 0
+        daily['files_failed'] += 0 if success else 1
+        daily['files_deduped'] += 1 if item.get('deduped', False) else 0
+        daily['total_transfer_time'] += item['transfer_time']
+        if daily['peak_speed_date'] is None or speed > daily['peak_speed']:
+            daily['peak_speed'] = speed
+            daily['peak_speed_date'] = when.strftime('%Y-%m-%d %H:%M:%S')
+
+        bucket_ts = int(timestamp // SERIES_MINUTE) * SERIES_MINUTE
+        bucket = self._pending_series.get((host_name, bucket_ts))
+        if bucket is None:
+            bucket = self._pending_series[(host_name, bucket_ts)] = {
+                'bytes_uploaded': 0,
+                'files_uploaded': 0,
+                'files_failed': 0,
+                'total_transfer_time': 0.0,
+                'peak_speed': 0.0,
+            }
+        bucket['bytes_uploaded'] += item['bytes_uploaded']
+        bucket['files_uploaded'] += 1 if success else 0
+        bucket['files_failed'] += 0 if success else 1
+        bucket['total_transfer_time'] += item['transfer_time']
+        bucket['peak_speed'] = max(bucket['peak_speed'], speed)
+
+        self._pending_count += 1
+
+    def _flush_pending(self) -> None:
+        """Write all coalesced transfers to the database in one transaction."""
+        if not self._pending_count:
+            return
+
+        daily_rows = []
+        all_time: Dict[str, Dict[str, Any]] = {}
+        for (host_name, day), totals in self._pending_daily.items():
+            daily_rows.append((
+                host_name, totals['bytes_uploaded'], totals['bytes_saved'],
+                totals['files_uploaded'], totals['files_failed'], totals['files_deduped'],
+                totals['total_transfer_time'], totals['peak_speed'], totals['peak_speed_date'], day,
+            ))
+            host_totals = all_time.get(host_name)
+            if host_totals is None:
+                all_time[host_name] = dict(totals)
+                continue
+            for key in ('bytes_uploaded', 'bytes_saved', 'files_uploaded', 'files_failed',
+                        'files_deduped', 'total_transfer_time'):
+                host_totals[key] += totals[key]
+            if totals['peak_speed'] > host_totals['peak_speed']:
+                host_totals['peak_speed'] = totals['peak_speed']
+                host_totals['peak_speed_date'] = totals['peak_speed_date']
+
+        all_time_rows = [
+            (host_name, totals['bytes_uploaded'], totals['bytes_saved'],
+             totals['files_uploaded'], totals['files_failed'], totals['files_deduped'],
+             totals['total_transfer_time'], totals['peak_speed'], totals['peak_speed_date'])
+            for host_name, totals in all_time.items()
+        ]
+        series_rows = [
+            (host_name, SERIES_MINUTE, bucket_ts, totals['bytes_uploaded'], totals['files_uploaded'],
+             totals['files_failed'], totals['total_transfer_time'], totals['peak_speed'])
+            for (host_name, bucket_ts), totals in self._pending_series.items()
+        ]
 
         with self._db_lock:
             conn = self._connect()
             try:
                 conn.execute("BEGIN TRANSACTION")
 
-                now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
                 # Update daily metrics
-                conn.execute("""
+                conn.executemany("""
                     INSERT INTO host_metrics
                         (host_name, bytes_uploaded, bytes_saved, files_uploaded, files_failed, files_deduped,
                          total_transfer_time, peak_speed, peak_speed_date, period_type, period_date)
@@ -1008,21 +1164,10 @@ class MetricsStore:
                         peak_speed = MAX(peak_speed, excluded.peak_speed),
                         peak_speed_date = CASE WHEN excluded.peak_speed > peak_speed THEN excluded.peak_speed_date ELSE peak_speed_date END,
                         updated_ts = strftime('%s', 'now')
-                """, (
-                    host_name,
-                    bytes_uploaded,
-                    bytes_saved,
-                    1 if success else 0,
-                    0 if success else 1,
-                    1 if is_deduped else 0,
-                    transfer_time,
-                    speed,
-                    now_str,
-                    today
-                ))
+                """, daily_rows)
 
                 # Update all-time metrics
-                conn.execute("""
+                conn.executemany("""
                     INSERT INTO host_metrics
                         (host_name, bytes_uploaded, bytes_saved, files_uploaded, files_failed, files_deduped,
                          total_transfer_time, peak_speed, peak_speed_date, period_type, period_date)
@@ -1037,17 +1182,25 @@ class MetricsStore:
                         peak_speed = MAX(peak_speed, excluded.peak_speed),
                         peak_speed_date = CASE WHEN excluded.peak_speed > peak_speed THEN excluded.peak_speed_date ELSE peak_speed_date END,
                         updated_ts = strftime('%s', 'now')
-                """, (
-                    host_name,
-                    bytes_uploaded,
-                    bytes_saved,
-                    1 if success else 0,
-                    0 if success else 1,
-                    1 if is_deduped else 0,
-                    transfer_time,
-                    speed,
-                    now_str
-                ))
+                """, all_time_rows)
+
+                # Update minute buckets
+                conn.executemany("""
+                    INSERT INTO host_metrics_series
+                        (host_name, resolution, bucket_ts, bytes_uploaded, files_uploaded,
+                         files_failed, total_transfer_time, peak_speed)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(host_name, resolution, bucket_ts) DO UPDATE SET
+                        bytes_uploaded = bytes_uploaded + excluded.bytes_uploaded,
+                        files_uploaded = files_uploaded + excluded.files_uploaded,
+                        files_failed = files_failed + excluded.files_failed,
+                        total_transfer_time = total_transfer_time + excluded.total_transfer_time,
+                        peak_speed = MAX(peak_speed, excluded.peak_speed)
+                """, series_rows)
+
+                if time.time() - self._last_compact >= SERIES_COMPACT_INTERVAL:
+                    self._compact_series(conn)
+                    self._last_compact = time.time()
 
                 conn.execute("COMMIT")
 
@@ -1057,13 +1210,62 @@ class MetricsStore:
             finally:
                 conn.close()
 
+        # Dropped on failure too: the session caches still hold the totals, and
+        # retrying a batch that failed to commit would keep failing the same way
+        self._pending_daily.clear()
+        self._pending_series.clear()
+        self._pending_count = 0
+
+    def _compact_series(self, conn: sqlite3.Connection, now: Optional[float] = None) -> None:
+        """Downsample old minute buckets into hourly buckets and drop expired ones.
+
+        Runs inside the caller's transaction.
+        """
+        now = time.time() if now is None else now
+        # Align to an hour boundary so one hour is never split between resolutions
+        minute_cutoff = int((now - SERIES_MINUTE_RETENTION) // SERIES_HOUR) * SERIES_HOUR
+        hour_cutoff = int(now - SERIES_HOUR_RETENTION)
+
+        conn.execute("""
+            INSERT INTO host_metrics_series
+                (host_name, resolution, bucket_ts, bytes_uploaded, files_uploaded,
+                 files_failed, total_transfer_time, peak_speed)
+            SELECT host_name, ?, (bucket_ts / ?) * ?,
+                   SUM(bytes_uploaded), SUM(files_uploaded), SUM(files_failed),
+                   SUM(total_transfer_time), MAX(peak_speed)
+            FROM host_metrics_series
+            WHERE resolution = ? AND bucket_ts < ?
+            GROUP BY host_name, bucket_ts / ?
+            ON CONFLICT(host_name, resolution, bucket_ts) DO UPDATE SET
+                bytes_uploaded = bytes_uploaded + excluded.bytes_uploaded,
+                files_uploaded = files_uploaded + excluded.files_uploaded,
+                files_failed = files_failed + excluded.files_failed,
+                total_transfer_time = total_transfer_time + excluded.total_transfer_time,
+                peak_speed = MAX(peak_speed, excluded.peak_speed)
+        """, (SERIES_HOUR, SERIES_HOUR, SERIES_HOUR, SERIES_MINUTE, minute_cutoff, SERIES_HOUR))
+        conn.execute(
+            "DELETE FROM host_metrics_series WHERE resolution = ? AND bucket_ts < ?",
+            (SERIES_MINUTE, minute_cutoff)
+        )
+        conn.execute(
+            "DELETE FROM host_metrics_series WHERE resolution = ? AND bucket_ts < ?",
+            (SERIES_HOUR, hour_cutoff)
+        )
+
     def flush(self) -> None:
         """
         Force write all pending metrics to database.
 
-        Blocks until all queued writes are processed.
+        Blocks until all queued writes are processed and committed.
         """
-        self._write_queue.join()
+        if not self._running or not self._worker_thread or not self._worker_thread.is_alive():
+            return
+        done = threading.Event()
+        self._write_queue.put({'type': 'flush', 'event': done})
+        # Give up if the writer dies (e.g. interpreter shutdown) instead of hanging
+        while not done.wait(timeout=1.0):
+            if not self._worker_thread.is_alive():
+                return
 
     def reset_session(self) -> None:
         """
@@ -1156,6 +1358,79 @@ class MetricsStore:
 
         return result
 
+    def get_throughput_series(self, host_name: Optional[str] = None, hours: float = 24,
+                              bucket_seconds: Optional[int] = None) -> list[Dict[str, Any]]:
+        """
+        Get upload throughput over time from the pre-aggregated time series.
+
+        Minute buckets cover the last two days and hourly buckets the rest of
+        the month, so the result is coarser than bucket_seconds for older data.
+        Metrics still waiting in the write buffer (up to WRITE_FLUSH_INTERVAL
+        seconds) are not included.
+
+        Args:
+            host_name: The file host identifier, or None to sum all hosts
+            hours: How far back to look
+            bucket_seconds: Width of the returned buckets, rounded to whole
+                minutes. Defaults to 1 minute up to 6 hours, 5 minutes up to
+                2 days and 1 hour beyond that.
+
+        Returns:
+            List of dicts ordered by time, one per non-empty bucket, with
+            bucket_ts (unix time of the bucket start), bytes_uploaded,
+            files_uploaded, files_failed, peak_speed and avg_speed (B/s
+            averaged over the bucket width)
+        """
+        if bucket_seconds is None:
+            if hours <= 6:
+                bucket_seconds = SERIES_MINUTE
+            elif hours <= 48:
+                bucket_seconds = 5 * SERIES_MINUTE
+            else:
+                bucket_seconds = SERIES_HOUR
+        bucket_seconds = max(SERIES_MINUTE, int(bucket_seconds) // SERIES_MINUTE * SERIES_MINUTE)
+        since = int(time.time() - hours * 3600) // bucket_seconds * bucket_seconds
+
+        where_clause = "bucket_ts >= ?"
+        params: tuple = (since,)
+        if host_name is not None:
+            where_clause += " AND host_name = ?"
+            params += (host_name,)
+
+        result = []
+        with self._db_lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute(f"""
+                    SELECT
+                        (bucket_ts / ?) * ? as bucket,
+                        SUM(bytes_uploaded) as bytes_uploaded,
+                        SUM(files_uploaded) as files_uploaded,
+                        SUM(files_failed) as files_failed,
+                        MAX(peak_speed) as peak_speed
+                    FROM host_metrics_series
+                    WHERE {where_clause}
+                    GROUP BY bucket
+                    ORDER BY bucket
+                """, (bucket_seconds, bucket_seconds) + params)
+
+                for row in cursor:
+                    result.append({
+                        'bucket_ts': row['bucket'],
+                        'bytes_uploaded': row['bytes_uploaded'],
+                        'files_uploaded': row['files_uploaded'],
+                        'files_failed': row['files_failed'],
+                        'peak_speed': row['peak_speed'],
+                        'avg_speed': row['bytes_uploaded'] / bucket_seconds,
+                    })
+
+            except Exception as e:
+                logger.error(f"Failed to get throughput series: {e}")
+            finally:
+                conn.close()
+
+        return result
+
     def cleanup_old_metrics(self, days_to_keep: int = 90) -> int:
         """
         Remove daily metrics older than specified days.
@@ -346,6 +346,8 @@ def load_user_defaults():
         'default_image_host': 'imx',
         'archive_format': 'zip',
         'archive_compression': 'store',
+        'archive_compression_workers': 1,
+        'archive_stream_uploads': False,
         'archive_split_enabled': False,
         'archive_split_size_mb': 500,
         'archive_split_mode': 'fixed',
@@ -357,14 +359,14 @@ def load_user_defaults():
             # Load integer settings
             for key in ['thumbnail_size', 'thumbnail_format', 'max_retries',
                        'parallel_batch_size', 'upload_connect_timeout', 'upload_read_timeout',
-                       'archive_split_size_mb']:
+                       'archive_split_size_mb', 'archive_compression_workers']:
                 defaults[key] = config.getint('DEFAULTS', key, fallback=defaults[key])
 
             # Load boolean settings
             for key in ['confirm_delete', 'auto_rename', 'auto_start_upload',
                        'auto_regenerate_bbcode', 'store_in_uploaded', 'store_in_central',
                        'use_median', 'stats_exclude_outliers', 'check_updates_on_startup',
-                       'archive_split_enabled']:
+                       'archive_split_enabled', 'archive_stream_uploads']:
                 defaults[key] = config.getboolean('DEFAULTS', key, fallback=defaults[key])
 
             # Load string settings
@@ -6,11 +6,12 @@ Single source of truth for sampling logic used by both queue_manager and engine.
 
 import os
 import fnmatch
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from PIL import Image
 
 
-def get_sample_indices(files: List[str], config: Dict[str, Any], folder_path: str | None = None) -> List[int]:
+def get_sample_indices(files: List[str], config: Dict[str, Any], folder_path: str | None = None,
+                       dimensions: Optional[Dict[str, Tuple[int, int]]] = None) -> List[int]:
     """
     Get indices of files to sample based on configuration.
 
@@ -18,6 +19,8 @@ def get_sample_indices(files: List[str], config: Dict[str, Any], folder_path: st
         files: List of image filenames
         config: Sampling configuration dictionary
         folder_path: Optional folder path for size-based exclusions
+        dimensions: Optional {filename: (width, height)} already read, so
+            size-based exclusions don't reopen the files
 
     Returns:
         List of indices to sample
@@ -48,13 +51,21 @@ def get_sample_indices(files: List[str], config: Dict[str, Any], folder_path: st
                 if any(fnmatch.fnmatch(filename.lower(), pattern.lower()) for pattern in patterns):
                     excluded_indices.add(i)
 
-    # 4. Exclude small images (requires PIL check if folder_path provided)
-    if config.get('exclude_small_images', False) and folder_path:
+    # 4. Exclude small images (known dimensions, else PIL check of folder_path)
+    if config.get('exclude_small_images', False) and (folder_path or dimensions is not None):
         threshold_percent = config.get('exclude_small_threshold', 50) / 100.0
         # First pass: find the largest image dimensions
         max_size = 0
         sizes = []
         for filename in files:
+            if dimensions is not None and filename in dimensions:
+                width, height = dimensions[filename]
+                sizes.append(width * height)
+                max_size = max(max_size, width * height)
+                continue
+            if not folder_path:
+                sizes.append(0)
+                continue
             try:
                 filepath = os.path.join(folder_path, filename)
                 with Image.open(filepath) as img:
@@ -0,0 +1,157 @@
+"""
+Import-time profiling for bbdrop startup (--profile-startup).
+
+Reports how long each module took to import, in the same layout as
+``python -X importtime`` (self and cumulative microseconds, nested modules
+indented under the module that imported them), so the output also works
+with tools that read importtime logs. Unlike -X importtime it works in the
+frozen build, where the interpreter flags cannot be passed.
+
+Usage:
+    from src.utils import startup_profile
+    startup_profile.install()          # as early as possible
+    ...
+    startup_profile.report()           # when startup is done
+
+Only module execution is timed (not the finder's search of sys.path), so
+numbers run slightly below -X importtime's.
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import List, Optional, TextIO, Tuple
+
+# (module name, self us, cumulative us, nesting depth), in completion order
+ImportRecord = Tuple[str, int, int, int]
+
+
+class _TimedLoader:
+    """Loader proxy that times exec_module and forwards everything else."""
+
+    def __init__(self, loader, profiler: 'ImportProfiler'):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, 'create_module', None)
+        return create_module(spec) if create_module else None
+
+    def exec_module(self, module):
+        self._profiler._enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._leave(module.__name__)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportProfiler:
+    """Meta path finder that wraps each found module's loader with a timer.
+
+    Only imports made on the thread that installed the profiler are timed,
+    so worker threads importing in the background don't skew the nesting.
+    """
+
+    def __init__(self):
+        self.records: List[ImportRecord] = []
+        self.started = time.perf_counter()
+        self._thread_id = threading.get_ident()
+        self._stack: List[List[float]] = []  # [start, time spent in children]
+
+    def find_spec(self, fullname, path, target=None):
+        if threading.get_ident() != self._thread_id:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    def _enter(self):
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def _leave(self, name: str):
+        start, children = self._stack.pop()
+        cumulative = time.perf_counter() - start
+        if self._stack:
+            self._stack[-1][1] += cumulative
+        self.records.append((name, int((cumulative - children) * 1e6), int(cumulative * 1e6), len(self._stack)))
+
+    def format_report(self, top: int = 25) -> str:
+        """The importtime table followed by the slowest imports by cumulative time."""
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for name, self_us, cumulative_us, depth in self.records:
+            lines.append(f"import time: {self_us:>9} | {cumulative_us:>10} | {'  ' * depth}{name}")
+
+        top_level_us = sum(record[2] for record in self.records if record[3] == 0)
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        lines.append("")
+        lines.append(f"Startup: {elapsed_ms:.0f} ms since profiling began, "
+                     f"{top_level_us / 1000:.0f} ms importing {len(self.records)} modules")
+        lines.append(f"Slowest {min(top, len(self.records))} imports (cumulative):")
+        for name, _, cumulative_us, _ in sorted(self.records, key=lambda r: r[2], reverse=True)[:top]:
+            lines.append(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+        return "\n".join(lines) + "\n"
+
+
+_profiler: Optional[ImportProfiler] = None
+
+
+def install() -> ImportProfiler:
+    """Start timing imports on this thread (idempotent)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler()
+        sys.meta_path.insert(0, _profiler)
+    return _profiler
+
+
+def uninstall() -> None:
+    """Stop timing imports; records collected so far are discarded."""
+    global _profiler
+    if _profiler is not None and _profiler in sys.meta_path:
+        sys.meta_path.remove(_profiler)
+    _profiler = None
+
+
+def is_active() -> bool:
+    return _profiler is not None
+
+
+def report(stream: Optional[TextIO] = None) -> Optional[str]:
+    """Write the report and stop profiling; returns the report text.
+
+    Defaults to stderr. Builds without a console write to
+    ~/.bbdrop/startup-profile.txt instead.
+    """
+    if _profiler is None:
+        return None
+    text = _profiler.format_report()
+    uninstall()
+
+    if stream is None:
+        stream = sys.stderr
+    if stream is not None:
+        try:
+            stream.write(text)
+            stream.flush()
+            return text
+        except (OSError, AttributeError, ValueError):
+            pass
+    try:
+        path = os.path.join(os.path.expanduser("~"), ".bbdrop", "startup-profile.txt")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    except OSError:
+        pass
+    return text
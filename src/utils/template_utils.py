@@ -2,13 +2,17 @@
 
 import sqlite3
 from collections import defaultdict
+from typing import Any, Dict, List, Optional
 from src.storage.database import QueueStore
 from src.utils.format_utils import format_binary_size
 from src.utils.logger import log
 from src.core.file_host_config import get_file_host_setting, get_config_manager
 
 
-def get_file_host_links_for_template(queue_store: QueueStore, gallery_path: str) -> str:
+def get_file_host_links_for_template(
+    queue_store: Optional[QueueStore], gallery_path: str,
+    uploads: Optional[List[Dict[str, Any]]] = None,
+) -> str:
     """Get file host download URLs for BBCode template placeholder.
 
     Applies per-host BBCode formatting if configured, otherwise returns raw URLs.
@@ -17,6 +21,8 @@ def get_file_host_links_for_template(queue_store: QueueStore, gallery_path: str)
     Args:
         queue_store: Database instance
         gallery_path: Gallery folder path
+        uploads: The gallery's upload records, when the caller has already
+            fetched them (batch regeneration); skips the database query
 
     Returns:
         Newline-separated download URLs (formatted or raw), or empty string if none exist.
@@ -34,7 +40,8 @@ def get_file_host_links_for_template(queue_store: QueueStore, gallery_path: str)
         [url=https://tezfiles.com/file/jkl]TezFiles - Part 2[/url]
     """
     try:
-        uploads = queue_store.get_file_host_uploads(gallery_path)
+        if uploads is None:
+            uploads = queue_store.get_file_host_uploads(gallery_path)
 
         config_manager = get_config_manager()
 
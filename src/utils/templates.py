@@ -2,7 +2,11 @@
 
 import os
 import json
+import re
+import stat
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from src.utils.logger import log
@@ -55,16 +59,7 @@ def serialize_template_file(post_title: str, body: str) -> str:
     return body
 
 
-def load_templates():
-    """Load all available templates from the template directory"""
-    template_path = get_template_path()
-    templates = {}
-
-    # Add default template
-    templates["default"] = get_default_template()
-
-    # Add Extended Example template
-    templates["Extended Example"] = """#folderName#
+_EXTENDED_EXAMPLE_TEMPLATE = """#folderName#
 [hr][/hr]
 [center][size=4][b][color=#11c153]#folderName#[/color][/b][/size]
 
@@ -82,8 +77,7 @@ custom4: [if custom4]#custom4#[else]no custom4 value set[/if]
 [if hostLinks][b]Download links:[/b]
 #hostLinks#[/if]"""
 
-    # Add Video template
-    templates["Video"] = """[b]#folderName#[/b]
+_VIDEO_TEMPLATE = """[b]#folderName#[/b]
 
 #screenshotSheet#
 
@@ -99,28 +93,98 @@ Video: #videoCodec#[if audioCodec] | Audio: #audioCodec#[/if]
 #downloadLinks#[/if][if hostLinks]
 #hostLinks#[/if]"""
 
+# file path -> ((mtime_ns, size, inode), post_title, body)
+_template_file_cache: dict = {}
+# template directory -> ((mtime_ns, inode), {template_name: file_path})
+_template_dir_cache: dict = {}
+_template_file_lock = threading.Lock()
+
+
+def _builtin_templates() -> dict:
+    """Built-in templates, in the order the template list shows them."""
+    return {
+        "default": get_default_template(),
+        "Extended Example": _EXTENDED_EXAMPLE_TEMPLATE,
+        "Video": _VIDEO_TEMPLATE,
+    }
+
+
+def _template_name_from_filename(filename: str) -> str:
+    """Map a file in the template directory to its template name."""
+    template_name = filename
+    if template_name.startswith(".template"):
+        template_name = template_name[10:]  # Remove ".template " prefix
+    # Remove .txt extension if present
+    if template_name.endswith('.template.txt'):
+        template_name = template_name[:-13]
+    if template_name.endswith('.txt'):
+        template_name = template_name[:-4]
+    return template_name
+
+
+def _custom_template_files() -> dict:
+    """Return {template_name: file_path} for the template directory.
+
+    Later files win when two names collide, same as load_templates(). The
+    listing is cached until the directory's mtime or inode changes (adding,
+    removing or renaming a file updates the mtime), so lookups cost one
+    stat; edits to a file's content are picked up by _read_template_file().
+    """
+    template_path = get_template_path()
+    try:
+        st = os.stat(template_path)
+    except OSError:
+        return {}
+    if not stat.S_ISDIR(st.st_mode):
+        return {}
+    key = (st.st_mtime_ns, st.st_ino)
+    with _template_file_lock:
+        cached = _template_dir_cache.get(template_path)
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
+    files = {}
+    for filename in os.listdir(template_path):
+        template_name = _template_name_from_filename(filename)
+        if template_name:  # Skip empty names
+            files[template_name] = os.path.join(template_path, filename)
+    with _template_file_lock:
+        _template_dir_cache[template_path] = (key, files)
+    return dict(files)
+
+
+def _read_template_file(file_path: str) -> tuple[str, str]:
+    """Return (post_title, body) for a template file.
+
+    The parsed file is cached until its mtime, size or inode changes, so
+    rendering thousands of galleries reads each template from disk once.
+    Raises OSError/UnicodeDecodeError like a plain open() would.
+    """
+    st = os.stat(file_path)
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _template_file_lock:
+        cached = _template_file_cache.get(file_path)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+    with open(file_path, 'r', encoding='utf-8') as f:
+        raw = f.read()
+    # Strip the optional #POSTTITLE: directive so template
+    # body consumers (editor, BBCode generator) don't see it.
+    post_title, body = parse_template_file(raw)
+    with _template_file_lock:
+        _template_file_cache[file_path] = (key, post_title, body)
+    return post_title, body
+
+
+def load_templates():
+    """Load all available templates from the template directory"""
+    templates = _builtin_templates()
+
     # Load custom templates
-    if os.path.exists(template_path):
-        for filename in os.listdir(template_path):
-            template_name = filename
-            if template_name.startswith(".template"):
-                template_name = template_name[10:]  # Remove ".template " prefix
-            # Remove .txt extension if present
-            if template_name.endswith('.template.txt'):
-                template_name = template_name[:-13]
-            if template_name.endswith('.txt'):
-                template_name = template_name[:-4]
-            if template_name:  # Skip empty names
-                template_file = os.path.join(template_path, filename)
-                try:
-                    with open(template_file, 'r', encoding='utf-8') as f:
-                        raw = f.read()
-                    # Strip the optional #POSTTITLE: directive so template
-                    # body consumers (editor, BBCode generator) don't see it.
-                    _, body = parse_template_file(raw)
-                    templates[template_name] = body
-                except Exception as e:
-                    log(f"Could not load template '{template_name}': {e}", level="error", category="template")
+    for template_name, template_file in _custom_template_files().items():
+        try:
+            _, templates[template_name] = _read_template_file(template_file)
+        except Exception as e:
+            log(f"Could not load template '{template_name}': {e}", level="error", category="template")
 
     return templates
 
@@ -131,23 +195,10 @@ def load_post_titles() -> dict:
     Returns {template_name: post_title_template}. Built-in templates aren't
     included — they have no post-title directive on disk.
     """
-    template_path = get_template_path()
     titles: dict = {}
-    if not os.path.isdir(template_path):
-        return titles
-    for filename in os.listdir(template_path):
-        template_name = filename
-        if template_name.startswith(".template"):
-            template_name = template_name[10:]
-        if template_name.endswith('.template.txt'):
-            template_name = template_name[:-13]
-        if template_name.endswith('.txt'):
-            template_name = template_name[:-4]
-        if not template_name:
-            continue
+    for template_name, template_file in _custom_template_files().items():
         try:
-            with open(os.path.join(template_path, filename), 'r', encoding='utf-8') as f:
-                post_title, _ = parse_template_file(f.read())
+            post_title, _ = _read_template_file(template_file)
             if post_title:
                 titles[template_name] = post_title
         except Exception as e:
@@ -160,11 +211,57 @@ def _camel_to_snake(name):
     Template placeholders use camelCase (e.g. downloadLinks, videoDetails)
     while data dicts use snake_case (e.g. download_links, video_details).
     """
-    import re
     # Insert underscore before uppercase letters and lowercase the result
     return re.sub(r'(?<=[a-z0-9])([A-Z])', r'_\1', name).lower()
 
 
+# Innermost conditional: [if...] followed by content WITHOUT another [if, then [/if]
+_IF_BLOCK_RE = re.compile(r'\[if\s+(\w+)(=([^\]]+))?\]((?:(?!\[if).)*?)\[/if\]', re.DOTALL)
+_ELSE_SPLIT_RE = re.compile(r'^(.*?)\[else\](.*?)$', re.DOTALL)
+_MAX_CONDITIONALS = 50  # Prevent infinite loops
+
+
+def _condition_met(data, placeholder_name, snake_key, expected_value):
+    """Evaluate one [if placeholder] / [if placeholder=value] test."""
+    # Get the actual value from data -- try camelCase name first,
+    # then fall back to snake_case conversion so that [if downloadLinks]
+    # finds data['download_links'].
+    actual_value = data.get(placeholder_name, '')
+    if not actual_value and snake_key != placeholder_name:
+        actual_value = data.get(snake_key, '')
+
+    if expected_value is not None:
+        # Equality check: [if placeholder=value]
+        return str(actual_value).strip() == expected_value.strip()
+    # Existence check: [if placeholder]
+    return bool(str(actual_value).strip())
+
+
+def _strip_blank_lines(text):
+    """Drop whitespace-only lines, collapse blank runs and trim blank ends."""
+    lines = text.split('\n')
+    cleaned_lines = [line for line in lines if line.strip() or line == '']  # Keep intentional blank lines
+
+    # Remove consecutive empty lines and leading/trailing empty lines
+    result_lines = []
+    prev_empty = False
+    for line in cleaned_lines:
+        is_empty = not line.strip()
+        if is_empty:
+            if not prev_empty and result_lines:  # Keep one empty line
+                result_lines.append(line)
+            prev_empty = True
+        else:
+            result_lines.append(line)
+            prev_empty = False
+
+    # Remove trailing empty lines
+    while result_lines and not result_lines[-1].strip():
+        result_lines.pop()
+
+    return '\n'.join(result_lines)
+
+
 def process_conditionals(template_content, data):
     """Process conditional logic in templates before placeholder replacement.
 
@@ -177,19 +274,13 @@ def process_conditionals(template_content, data):
     - Nested conditionals (processed inside-out)
     - Empty lines from removed conditionals are stripped
     - Placeholder names are matched as camelCase (template) or snake_case (data)
-    """
-    import re
 
+    This is the reference implementation; CompiledTemplate produces the same
+    output without rescanning the string once per block.
+    """
     # Process conditionals iteratively until no more found
-    max_iterations = 50  # Prevent infinite loops
-    iteration = 0
-
-    while iteration < max_iterations:
-        # Look for innermost conditional pattern (no nested [if] tags inside)
-        # This regex matches [if...] followed by content WITHOUT another [if, then [/if]
-        if_pattern = r'\[if\s+(\w+)(=([^\]]+))?\]((?:(?!\[if).)*?)\[/if\]'
-        match = re.search(if_pattern, template_content, re.DOTALL)
-
+    for _ in range(_MAX_CONDITIONALS):
+        match = _IF_BLOCK_RE.search(template_content)
         if not match:
             # No more conditionals found
             break
@@ -198,19 +289,8 @@ def process_conditionals(template_content, data):
         expected_value = match.group(3)  # None if no = comparison
         conditional_block = match.group(4)  # Content between [if] and [/if]
 
-        # Get the actual value from data -- try camelCase name first,
-        # then fall back to snake_case conversion so that [if downloadLinks]
-        # finds data['download_links'].
-        actual_value = data.get(placeholder_name, '')
-        if not actual_value:
-            snake_key = _camel_to_snake(placeholder_name)
-            if snake_key != placeholder_name:
-                actual_value = data.get(snake_key, '')
-
         # Check for [else] clause (only at top level, not nested)
-        else_pattern = r'^(.*?)\[else\](.*?)$'
-        else_match = re.match(else_pattern, conditional_block, re.DOTALL)
-
+        else_match = _ELSE_SPLIT_RE.match(conditional_block)
         if else_match:
             true_content = else_match.group(1)
             false_content = else_match.group(2)
@@ -218,13 +298,7 @@ def process_conditionals(template_content, data):
             true_content = conditional_block
             false_content = ''
 
-        # Determine condition
-        if expected_value is not None:
-            # Equality check: [if placeholder=value]
-            condition_met = (str(actual_value).strip() == expected_value.strip())
-        else:
-            # Existence check: [if placeholder]
-            condition_met = bool(str(actual_value).strip())
+        condition_met = _condition_met(data, placeholder_name, _camel_to_snake(placeholder_name), expected_value)
 
         # Select content based on condition
         selected_content = true_content if condition_met else false_content
@@ -232,101 +306,269 @@ def process_conditionals(template_content, data):
         # Replace the entire conditional block with selected content
         template_content = template_content[:match.start()] + selected_content + template_content[match.end():]
 
-        iteration += 1
+    return _strip_blank_lines(template_content)
 
-    # Clean up empty lines
-    lines = template_content.split('\n')
-    cleaned_lines = [line for line in lines if line.strip() or line == '']  # Keep intentional blank lines
 
-    # Remove consecutive empty lines and leading/trailing empty lines
-    result_lines = []
-    prev_empty = False
-    for line in cleaned_lines:
-        is_empty = not line.strip()
-        if is_empty:
-            if not prev_empty and result_lines:  # Keep one empty line
-                result_lines.append(line)
-            prev_empty = True
-        else:
-            result_lines.append(line)
-            prev_empty = False
+def _gallery_name_value(data):
+    # #galleryName# falls back to #folderName# binding when not explicitly set,
+    # so existing templates keep working and #galleryName# means the same thing
+    # in practice until an auto-posting workflow populates gallery_title distinctly.
+    return data.get('gallery_name') or data.get('folder_name') or ''
+
+
+# Placeholders in substitution order. hostLinks and allImages (the composites)
+# are expanded FIRST so that any main placeholders embedded inside them
+# (e.g. #folderSize# in a filehost bbcode_format) get resolved afterwards.
+_PLACEHOLDERS = (
+    ('hostLinks', lambda d: str(d.get('host_links', '') or '')),
+    ('allImages', lambda d: str(d.get('all_images', '') or '')),
+    ('cover', lambda d: str(d.get('cover', '') or '')),
+    ('videoDetails', lambda d: str(d.get('video_details', '') or '')),
+    ('screenshotSheet', lambda d: str(d.get('screenshot_sheet', '') or '')),
+    ('downloadLinks', lambda d: str(d.get('download_links', '') or '')),
+    ('folderName', lambda d: str(d.get('folder_name') or '')),
+    ('galleryName', lambda d: str(_gallery_name_value(d))),
+    ('galleryTitle', lambda d: str(d.get('gallery_title') or _gallery_name_value(d))),
+    ('width', lambda d: str(d.get('width', 0))),
+    ('height', lambda d: str(d.get('height', 0))),
+    ('longest', lambda d: str(d.get('longest', 0))),
+    ('extension', lambda d: str(d.get('extension') or '')),
+    ('pictureCount', lambda d: str(d.get('picture_count', 0))),
+    ('folderSize', lambda d: str(d.get('folder_size') or '')),
+    ('galleryLink', lambda d: str(d.get('gallery_link') or '')),
+    ('custom1', lambda d: str(d.get('custom1') or '')),
+    ('custom2', lambda d: str(d.get('custom2') or '')),
+    ('custom3', lambda d: str(d.get('custom3') or '')),
+    ('custom4', lambda d: str(d.get('custom4') or '')),
+    ('ext1', lambda d: str(d.get('ext1') or '')),
+    ('ext2', lambda d: str(d.get('ext2') or '')),
+    ('ext3', lambda d: str(d.get('ext3') or '')),
+    ('ext4', lambda d: str(d.get('ext4') or '')),
+    ('filename', lambda d: str(d.get('filename', ''))),
+    ('duration', lambda d: str(d.get('duration', ''))),
+    ('resolution', lambda d: str(d.get('resolution', ''))),
+    ('fps', lambda d: str(d.get('fps', ''))),
+    ('bitrate', lambda d: str(d.get('bitrate', ''))),
+    ('videoCodec', lambda d: str(d.get('video_codec', ''))),
+    ('audioCodec', lambda d: str(d.get('audio_codec', ''))),
+    ('audioTracks', lambda d: str(d.get('audio_tracks', ''))),
+    ('filesize', lambda d: str(d.get('filesize', ''))),
+)
+_PLACEHOLDER_INDEX = {name: i for i, (name, _) in enumerate(_PLACEHOLDERS)}
+_PLACEHOLDER_TOKENS = tuple((f'#{name}#', getter) for name, getter in _PLACEHOLDERS)
+_PLACEHOLDER_NAMES = '|'.join(name for name, _ in _PLACEHOLDERS)
+_PLACEHOLDER_RE = re.compile(f'#({_PLACEHOLDER_NAMES})#')
+# Two placeholders sharing a '#' ("#fps#width#"): which one wins depends on
+# substitution order, so such text is rendered the sequential way.
+_PLACEHOLDER_OVERLAP_RE = re.compile(f'#(?:{_PLACEHOLDER_NAMES})#(?:{_PLACEHOLDER_NAMES})#')
+_CONDITIONAL_TAG_RE = re.compile(r'\[if\s+(\w+)(?:=([^\]]+))?\]|\[else\]|\[/if\]')
+
+
+def _apply_template_sequential(template_content, data):
+    """Reference renderer: conditionals, then one str.replace per placeholder.
+
+    CompiledTemplate.render() only calls this for templates it can't mirror:
+    one with an unclosed [if] block, more than _MAX_CONDITIONALS [if] blocks,
+    '[if' text that isn't a valid tag (e.g. '[iframe]'), or two [else] in one
+    block; and a template without conditionals whose text has two
+    placeholders sharing a '#' ('#fps#width#'). The tests also use it as the
+    reference output for the compiled renderer.
+    """
+    result = process_conditionals(template_content, data)
+    for placeholder, getter in _PLACEHOLDER_TOKENS:
+        result = result.replace(placeholder, getter(data))
+    return result
 
-    # Remove trailing empty lines
-    while result_lines and not result_lines[-1].strip():
-        result_lines.pop()
 
-    return '\n'.join(result_lines)
+class _Conditional:
+    """One [if name(=value)]...[else]...[/if] node of a compiled template."""
+
+    __slots__ = ('name', 'snake_key', 'expected', 'true_nodes', 'false_nodes')
+
+    def __init__(self, name, expected):
+        self.name = name
+        self.snake_key = _camel_to_snake(name)
+        self.expected = expected
+        self.true_nodes = []
+        self.false_nodes = None  # list once an [else] is seen
+
+
+class CompiledTemplate:
+    """A template parsed once into conditional nodes and placeholder slots.
+
+    render() walks the tree once and substitutes placeholders in a single
+    regex pass, giving the same output as the sequential apply_template
+    implementation. Templates that rely on quirks of the sequential engine
+    (malformed or more than 50 [if] blocks, several [else] in one block,
+    placeholders sharing a '#') keep using it.
+    """
+
+    __slots__ = ('source', '_nodes', '_parts', '_sequential')
+
+    def __init__(self, source):
+        self.source = source
+        self._nodes = None  # conditional tree, when the template has [if] blocks
+        self._parts = None  # literal/placeholder-index list, when it has none
+        self._sequential = False
+        nodes = self._parse(source)
+        if nodes is None:
+            self._sequential = True
+        elif len(nodes) == 1 and isinstance(nodes[0], str):
+            # No conditionals: blank-line cleanup and tokenizing happen once here
+            text = _strip_blank_lines(nodes[0])
+            if _PLACEHOLDER_OVERLAP_RE.search(text):
+                self._sequential = True
+            else:
+                self._parts = self._tokenize(text)
+        else:
+            self._nodes = nodes
+
+    @staticmethod
+    def _parse(source):
+        """Build the conditional tree, or return None if it can't be mirrored."""
+        root = []
+        stack = []  # open _Conditional nodes
+        current = root
+        block_count = 0
+        pos = 0
+        for match in _CONDITIONAL_TAG_RE.finditer(source):
+            if match.start() > pos:
+                current.append(source[pos:match.start()])
+            pos = match.end()
+            tag = match.group(0)
+            if match.group(1) is not None:
+                block_count += 1
+                node = _Conditional(match.group(1), match.group(2))
+                current.append(node)
+                stack.append(node)
+                current = node.true_nodes
+            elif tag == '[else]':
+                if not stack:
+                    current.append(tag)  # Stray [else] outside a block stays literal
+                    continue
+                node = stack[-1]
+                if node.false_nodes is not None:
+                    return None
+                node.false_nodes = []
+                current = node.false_nodes
+            else:
+                if not stack:
+                    current.append(tag)  # Stray [/if] stays literal
+                    continue
+                stack.pop()
+                current = (stack[-1].false_nodes if stack and stack[-1].false_nodes is not None
+                           else stack[-1].true_nodes if stack else root)
+        if pos < len(source):
+            current.append(source[pos:])
+        # Unclosed blocks, "[if" text that isn't a valid tag, and templates past
+        # the iteration cap all behave in ways only the sequential engine reproduces
+        if stack or block_count > _MAX_CONDITIONALS or source.count('[if') != block_count:
+            return None
+        if not root:
+            return ['']
+        return root
+
+    @staticmethod
+    def _tokenize(text):
+        parts = []
+        pos = 0
+        for match in _PLACEHOLDER_RE.finditer(text):
+            if match.start() > pos:
+                parts.append(text[pos:match.start()])
+            parts.append(_PLACEHOLDER_INDEX[match.group(1)])
+            pos = match.end()
+        if pos < len(text):
+            parts.append(text[pos:])
+        return parts
+
+    @staticmethod
+    def _value(index, data, values):
+        """Placeholder value, with later placeholders inside it resolved.
+
+        Mirrors the sequential engine, where text inserted by one replace
+        pass is seen by every pass after it.
+        """
+        value = values.get(index)
+        if value is None:
+            value = _PLACEHOLDERS[index][1](data)
+            if '#' in value:
+                for placeholder, getter in _PLACEHOLDER_TOKENS[index + 1:]:
+                    if placeholder in value:
+                        value = value.replace(placeholder, getter(data))
+            values[index] = value
+        return value
+
+    def _render_nodes(self, nodes, data, out):
+        for node in nodes:
+            if isinstance(node, str):
+                out.append(node)
+            elif _condition_met(data, node.name, node.snake_key, node.expected):
+                self._render_nodes(node.true_nodes, data, out)
+            elif node.false_nodes:
+                branch = []
+                self._render_nodes(node.false_nodes, data, branch)
+                text = ''.join(branch)
+                # The sequential [else] split ends in "(.*?)$", which leaves
+                # one trailing newline out of the else branch
+                out.append(text[:-1] if text.endswith('\n') else text)
+
+    def render(self, data):
+        """Render the template for one gallery's data dict."""
+        if self._sequential:
+            return _apply_template_sequential(self.source, data)
+        values = {}
+        if self._parts is not None:
+            return ''.join(part if isinstance(part, str) else self._value(part, data, values)
+                           for part in self._parts)
+        out = []
+        self._render_nodes(self._nodes, data, out)
+        text = _strip_blank_lines(''.join(out))
+        if _PLACEHOLDER_OVERLAP_RE.search(text):
+            result = text
+            for placeholder, getter in _PLACEHOLDER_TOKENS:
+                result = result.replace(placeholder, getter(data))
+            return result
+        return _PLACEHOLDER_RE.sub(
+            lambda m: self._value(_PLACEHOLDER_INDEX[m.group(1)], data, values), text)
+
+
+@lru_cache(maxsize=128)
+def compile_template(template_content):
+    """Return the CompiledTemplate for a template body (cached by content)."""
+    return CompiledTemplate(template_content)
+
 
 def apply_template(template_content, data):
     """Apply a template with data replacement"""
-    # Process conditional logic first (before placeholder replacement)
-    result = process_conditionals(template_content, data)
+    return compile_template(template_content).render(data)
 
-    # Replace placeholders with actual data
-    # hostLinks and allImages are expanded FIRST so that any main placeholders
-    # embedded inside them (e.g. #folderSize# in a filehost bbcode_format)
-    # get resolved in the second pass.
-    composite_replacements = {
-        '#hostLinks#': data.get('host_links', ''),
-        '#allImages#': data.get('all_images', ''),
-        '#cover#': data.get('cover', ''),
-        '#videoDetails#': data.get('video_details', ''),
-        '#screenshotSheet#': data.get('screenshot_sheet', ''),
-        '#downloadLinks#': data.get('download_links', ''),
-    }
-    for placeholder, value in composite_replacements.items():
-        result = result.replace(placeholder, str(value or ''))
 
-    # #galleryName# falls back to #folderName# binding when not explicitly set,
-    # so existing templates keep working and #galleryName# means the same thing
-    # in practice until an auto-posting workflow populates gallery_title distinctly.
-    gallery_name_value = data.get('gallery_name') or data.get('folder_name') or ''
-    gallery_title_value = data.get('gallery_title') or gallery_name_value
-
-    replacements = {
-        '#folderName#': str(data.get('folder_name') or ''),
-        '#galleryName#': str(gallery_name_value),
-        '#galleryTitle#': str(gallery_title_value),
-        '#width#': str(data.get('width', 0)),
-        '#height#': str(data.get('height', 0)),
-        '#longest#': str(data.get('longest', 0)),
-        '#extension#': str(data.get('extension') or ''),
-        '#pictureCount#': str(data.get('picture_count', 0)),
-        '#folderSize#': str(data.get('folder_size') or ''),
-        '#galleryLink#': str(data.get('gallery_link') or ''),
-        '#custom1#': str(data.get('custom1') or ''),
-        '#custom2#': str(data.get('custom2') or ''),
-        '#custom3#': str(data.get('custom3') or ''),
-        '#custom4#': str(data.get('custom4') or ''),
-        '#ext1#': str(data.get('ext1') or ''),
-        '#ext2#': str(data.get('ext2') or ''),
-        '#ext3#': str(data.get('ext3') or ''),
-        '#ext4#': str(data.get('ext4') or ''),
-        '#filename#': str(data.get('filename', '')),
-        '#duration#': str(data.get('duration', '')),
-        '#resolution#': str(data.get('resolution', '')),
-        '#fps#': str(data.get('fps', '')),
-        '#bitrate#': str(data.get('bitrate', '')),
-        '#videoCodec#': str(data.get('video_codec', '')),
-        '#audioCodec#': str(data.get('audio_codec', '')),
-        '#audioTracks#': str(data.get('audio_tracks', '')),
-        '#filesize#': str(data.get('filesize', '')),
-    }
-    for placeholder, value in replacements.items():
-        result = result.replace(placeholder, str(value or ''))
+def get_compiled_template(template_name):
+    """Return the CompiledTemplate for a template name, or None if unknown.
+
+    Custom template files are re-read only when their mtime changes, so
+    rendering many galleries doesn't reload the template directory each time.
+    """
+    template_file = _custom_template_files().get(template_name)
+    if template_file:
+        try:
+            _, body = _read_template_file(template_file)
+            return compile_template(body)
+        except Exception as e:
+            log(f"Could not load template '{template_name}': {e}", level="error", category="template")
+    body = _builtin_templates().get(template_name)
+    return compile_template(body) if body is not None else None
 
-    return result
 
 def generate_bbcode_from_template(template_name, data):
     """Generate bbcode content using a specific template"""
-    templates = load_templates()
+    template = get_compiled_template(template_name)
 
-    if template_name not in templates:
+    if template is None:
         log(f"Template '{template_name}' not found, using default", level="warning", category="template")
-        template_name = "default"
+        template = get_compiled_template("default")
 
-    template_content = templates[template_name]
-    return apply_template(template_content, data)
+    return template.render(data)
 
 
 def save_gallery_artifacts(
@@ -337,6 +579,9 @@ def save_gallery_artifacts(
     store_in_central: Optional[bool] = None,
     custom_fields: Optional[dict] = None,
     cover_bbcode: str = "",
+    file_host_uploads: Optional[list] = None,
+    post_titles: Optional[dict] = None,
+    compiled_template: Optional[CompiledTemplate] = None,
 ) -> dict:
     """Save BBCode and JSON artifacts for a completed gallery.
 
@@ -346,6 +591,9 @@ def save_gallery_artifacts(
     - template_name: which template to use for full bbcode generation
     - store_in_uploaded/store_in_central: overrides for storage locations. When None, read defaults
     - custom_fields: optional dict with custom1-4 and ext1-4 values
+    - file_host_uploads/post_titles/compiled_template: values already fetched by
+      a batch caller (see src.processing.artifact_regeneration). When given, the
+      database, template directory and template lookups are skipped
 
     Returns: dict with paths written: { 'uploaded': {'bbcode': str, 'json': str}, 'central': {...}}
     """
@@ -419,26 +667,27 @@ def save_gallery_artifacts(
 
     # Get file host data from database
     queue_store = None
-    try:
-        from src.storage.database import QueueStore
-        queue_store = QueueStore()
-    except Exception as e:
-        log(f"Failed to open queue store for artifacts: {e}", level="warning", category="artifact")
+    if file_host_uploads is None:
+        try:
+            from src.storage.database import QueueStore
+            queue_store = QueueStore()
+        except Exception as e:
+            log(f"Failed to open queue store for artifacts: {e}", level="warning", category="artifact")
 
     # Get file host download links for BBCode template
     host_links = ''
-    if queue_store:
+    if queue_store or file_host_uploads is not None:
         try:
             from src.utils.template_utils import get_file_host_links_for_template
-            host_links = get_file_host_links_for_template(queue_store, folder_path)
+            host_links = get_file_host_links_for_template(queue_store, folder_path, uploads=file_host_uploads)
         except Exception as e:
             log(f"Failed to get file host links: {e}", level="warning", category="template")
 
     # Build file_hosts array for JSON artifact
     file_hosts_data = []
-    if queue_store:
+    if queue_store or file_host_uploads is not None:
         try:
-            fh_uploads = queue_store.get_file_host_uploads(folder_path)
+            fh_uploads = file_host_uploads if file_host_uploads is not None else queue_store.get_file_host_uploads(folder_path)
             for u in fh_uploads:
                 if u['status'] == 'completed' and u.get('download_url'):
                     file_hosts_data.append({
@@ -466,7 +715,7 @@ def save_gallery_artifacts(
 
     # Resolve the post-title template for this template (if any) before building
     # template_data, so #galleryTitle# can be populated for the body pass.
-    post_title_templates = load_post_titles()
+    post_title_templates = post_titles if post_titles is not None else load_post_titles()
     post_title_tpl = post_title_templates.get(template_name, '')
 
     template_data = {
@@ -576,7 +825,10 @@ def save_gallery_artifacts(
         resolved_post_title = gallery_name
     template_data['gallery_title'] = resolved_post_title
 
-    bbcode_content = generate_bbcode_from_template(template_name, template_data)
+    if compiled_template is not None:
+        bbcode_content = compiled_template.render(template_data)
+    else:
+        bbcode_content = generate_bbcode_from_template(template_name, template_data)
 
     # Compose JSON payload (align with CLI structure)
     json_payload = {
@@ -649,4 +901,15 @@ def save_gallery_artifacts(
         written_paths.setdefault('central', {})['bbcode'] = os.path.join(central_path, bbcode_filename)
         written_paths.setdefault('central', {})['json'] = os.path.join(central_path, json_filename)
 
+    # Keep the duplicate-detection index in step with the files on disk
+    if written_paths:
+        try:
+            from src.storage.gallery_index import get_gallery_index
+            get_gallery_index().record(
+                folder_path, gallery_name, gallery_id,
+                [path for location in written_paths.values() for path in location.values()],
+            )
+        except Exception as e:
+            log(f"Failed to update gallery index: {e}", level="warning", category="artifact")
+
     return written_paths
@@ -0,0 +1,499 @@
+"""
+ZIP archives assembled from members compressed ahead of time.
+
+zipfile compresses each member inside ``ZipFile.write()`` and has no public
+way to add data that is already compressed, so members cannot be
+compressed in parallel and then written with it. This module splits the
+two steps:
+
+- ``compress_member()`` compresses one file into a ``CompressedMember``
+  (CRC-32, sizes and the compressed bytes, spooled to a temp file when
+  large). It only reads its own file, so any number can run at once on a
+  thread pool; zlib, bz2 and lzma release the GIL while compressing.
+- ``PrecompressedZipWriter`` writes those members, in order, to a
+  sequential output as local header + data, then the central directory.
+- ``PrecompressedSplitZipWriter`` writes them as a split archive
+  (.z01, .z02, ..., .zip) in splitzip's volume layout. ``stored_member()``
+  prepares uncompressed members for it without spooling a copy.
+
+The container is written from the ZIP specification (PKWARE APPNOTE)
+with ``struct``, including ZIP64 records for large archives, rather than
+through zipfile internals. Headers carry the final CRC and sizes, so no
+data descriptors are needed and the output never seeks.
+
+Split volumes match splitzip's ``SplitZipWriter`` byte for byte (ZIP32,
+UTF-8 names, local headers never split across volumes, the central
+directory folded into the last data volume when it fits), which is also
+what ``src.utils.zip_stream`` plans. splitzip writes each local header
+with a placeholder CRC and seeks back to patch it; here the CRC is known
+first, so every volume is written once, front to back.
+"""
+
+import bz2
+import lzma
+import os
+import struct
+import tempfile
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+# Read size when compressing a member
+_CHUNK_SIZE = 1024 * 1024
+
+# Sizes, offsets and counts above these need ZIP64 records (same limits as zipfile)
+_ZIP64_LIMIT = (1 << 31) - 1
+_ZIP_FILECOUNT_LIMIT = (1 << 16) - 1
+
+# "Version needed to extract", by feature (APPNOTE 4.4.3)
+_VERSION_DEFAULT = 20
+_VERSION_ZIP64 = 45
+_VERSION_BZIP2 = 46
+_VERSION_LZMA = 63
+
+# Split archives: smallest volume splitzip accepts, and its fixed header fields
+_MIN_VOLUME_SIZE = 64 * 1024
+_ZIP32_LIMIT = 0xFFFFFFFF
+_SPLIT_VERSION = 20
+
+# General purpose flag bits (APPNOTE 4.4.4)
+_FLAG_LZMA_EOS = 0x0002
+_FLAG_UTF8 = 0x0800
+
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+_CENTRAL_HEADER = struct.Struct('<4s4B4H3L5H2L')
+_END_RECORD = struct.Struct('<4s4H2LH')
+_ZIP64_END_RECORD = struct.Struct('<4sQ2H2L4Q')
+_ZIP64_LOCATOR = struct.Struct('<4sLQL')
+_ZIP64_EXTRA_ID = 0x0001
+
+_LOCAL_SIGNATURE = b'PK\x03\x04'
+_CENTRAL_SIGNATURE = b'PK\x01\x02'
+_END_SIGNATURE = b'PK\x05\x06'
+_ZIP64_END_SIGNATURE = b'PK\x06\x06'
+_ZIP64_LOCATOR_SIGNATURE = b'PK\x06\x07'
+
+SUPPORTED_COMPRESSION = (zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA)
+
+
+class _LzmaZipCompressor:
+    """LZMA in the framing ZIP uses: version, properties size, properties, raw stream.
+
+    The ``.lzma`` (FORMAT_ALONE) encoder writes the 5 property bytes, an
+    8-byte "size unknown" field, then an end-marked stream; the size field
+    is dropped and the properties get ZIP's 4-byte prefix instead.
+    """
+
+    _ALONE_HEADER_SIZE = 13
+
+    def __init__(self):
+        self._compressor = lzma.LZMACompressor(format=lzma.FORMAT_ALONE)
+        self._header = b''
+        self._header_done = False
+
+    def compress(self, data: bytes) -> bytes:
+        return self._frame(self._compressor.compress(data))
+
+    def flush(self) -> bytes:
+        return self._frame(self._compressor.flush())
+
+    def _frame(self, out: bytes) -> bytes:
+        if self._header_done:
+            return out
+        self._header += out
+        if len(self._header) < self._ALONE_HEADER_SIZE:
+            return b''
+        self._header_done = True
+        properties = self._header[:5]
+        rest = self._header[self._ALONE_HEADER_SIZE:]
+        return struct.pack('<BBH', 9, 4, len(properties)) + properties + rest
+
+
+def _new_compressor(compress_type: int):
+    if compress_type == zipfile.ZIP_DEFLATED:
+        return zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    if compress_type == zipfile.ZIP_BZIP2:
+        return bz2.BZ2Compressor()
+    if compress_type == zipfile.ZIP_LZMA:
+        return _LzmaZipCompressor()
+    raise ValueError(f"Unsupported compression type for precompressed members: {compress_type}")
+
+
+class CompressedMember:
+    """One file compressed for a ZIP, not yet written. Close (or write) it to free its spool."""
+
+    def __init__(self, zinfo: zipfile.ZipInfo, compress_type: int, crc: int,
+                 file_size: int, compress_size: int, data):
+        self.zinfo = zinfo
+        self.compress_type = compress_type
+        self.crc = crc
+        self.file_size = file_size
+        self.compress_size = compress_size
+        self.data = data
+
+    def close(self) -> None:
+        self.data.close()
+
+
+def compress_member(file_path: Path, compress_type: int, spool_bytes: int,
+                    arcname: Optional[str] = None) -> CompressedMember:
+    """Compress one file as a ZIP member.
+
+    Args:
+        file_path: File to compress
+        compress_type: zipfile.ZIP_DEFLATED, ZIP_BZIP2 or ZIP_LZMA
+        spool_bytes: Compressed bytes kept in memory before spilling to a temp file
+        arcname: Name inside the archive (default: the file's name)
+    """
+    file_path = Path(file_path)
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname=arcname or file_path.name)
+    compressor = _new_compressor(compress_type)
+    data = tempfile.SpooledTemporaryFile(max_size=spool_bytes)
+    crc = 0
+    file_size = 0
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                crc = zlib.crc32(chunk, crc)
+                file_size += len(chunk)
+                data.write(compressor.compress(chunk))
+        data.write(compressor.flush())
+    except BaseException:
+        data.close()
+        raise
+    compress_size = data.tell()
+    data.seek(0)
+    return CompressedMember(zinfo, compress_type, crc, file_size, compress_size, data)
+
+
+def stored_member(file_path: Path, arcname: Optional[str] = None) -> CompressedMember:
+    """Prepare one file as an uncompressed (STORED) ZIP member.
+
+    The file is read once for its CRC-32 and opened again for the writer
+    to copy from, so no spool is needed. The writer refuses the member if
+    the file's length changes in between.
+
+    Args:
+        file_path: File to store
+        arcname: Name inside the archive (default: the file's name)
+    """
+    file_path = Path(file_path)
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname=arcname or file_path.name)
+    crc = 0
+    file_size = 0
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+    return CompressedMember(zinfo, zipfile.ZIP_STORED, crc, file_size, file_size,
+                            open(file_path, 'rb'))
+
+
+def _copy_member_data(member: CompressedMember, write: Callable[[bytes], Any]) -> None:
+    copied = 0
+    for chunk in iter(lambda: member.data.read(_CHUNK_SIZE), b''):
+        write(chunk)
+        copied += len(chunk)
+    if copied != member.compress_size:
+        raise RuntimeError(f"Member data changed while archiving: {member.zinfo.filename}")
+
+
+def _dos_date_time(date_time: Tuple[int, ...]) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = date_time[:6]
+    return ((year - 1980) << 9 | month << 5 | day,
+            hour << 11 | minute << 5 | second // 2)
+
+
+def _zip64_extra(*values: int) -> bytes:
+    return struct.pack(f'<HH{len(values)}Q', _ZIP64_EXTRA_ID, 8 * len(values), *values)
+
+
+class _Entry:
+    __slots__ = ('member', 'name', 'flags', 'version', 'offset')
+
+    def __init__(self, member: CompressedMember, name: bytes, flags: int, version: int, offset: int):
+        self.member = member
+        self.name = name
+        self.flags = flags
+        self.version = version
+        self.offset = offset
+
+
+class PrecompressedZipWriter:
+    """Writes CompressedMembers to a write-only output as one ZIP archive.
+
+    Only ``write()`` is called on the output; offsets are counted here.
+    """
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._position = 0
+        self._entries: List[_Entry] = []
+        self._closed = False
+
+    def _write(self, data: bytes) -> None:
+        self._fp.write(data)
+        self._position += len(data)
+
+    def write_member(self, member: CompressedMember) -> None:
+        """Append a member's local header and data, then close the member."""
+        try:
+            zinfo = member.zinfo
+            try:
+                name = zinfo.filename.encode('ascii')
+                flags = 0
+            except UnicodeEncodeError:
+                name = zinfo.filename.encode('utf-8')
+                flags = _FLAG_UTF8
+            version = _VERSION_DEFAULT
+            if member.compress_type == zipfile.ZIP_BZIP2:
+                version = _VERSION_BZIP2
+            elif member.compress_type == zipfile.ZIP_LZMA:
+                version = _VERSION_LZMA
+                flags |= _FLAG_LZMA_EOS
+
+            extra = b''
+            file_size, compress_size = member.file_size, member.compress_size
+            if file_size > _ZIP64_LIMIT or compress_size > _ZIP64_LIMIT:
+                extra = _zip64_extra(file_size, compress_size)
+                file_size = compress_size = 0xFFFFFFFF
+                version = max(version, _VERSION_ZIP64)
+
+            entry = _Entry(member, name, flags, version, self._position)
+            dosdate, dostime = _dos_date_time(zinfo.date_time)
+            self._write(_LOCAL_HEADER.pack(
+                _LOCAL_SIGNATURE, version, flags, member.compress_type, dostime, dosdate,
+                member.crc, compress_size, file_size, len(name), len(extra),
+            ) + name + extra)
+            _copy_member_data(member, self._write)
+            self._entries.append(entry)
+        finally:
+            member.close()
+
+    def close(self) -> None:
+        """Write the central directory and end records."""
+        if self._closed:
+            return
+        self._closed = True
+        start_dir = self._position
+        for entry in self._entries:
+            member = entry.member
+            zinfo = member.zinfo
+            zip64_values = []
+            file_size, compress_size, offset = member.file_size, member.compress_size, entry.offset
+            if file_size > _ZIP64_LIMIT:
+                zip64_values.append(file_size)
+                file_size = 0xFFFFFFFF
+            if compress_size > _ZIP64_LIMIT:
+                zip64_values.append(compress_size)
+                compress_size = 0xFFFFFFFF
+            if offset > _ZIP64_LIMIT:
+                zip64_values.append(offset)
+                offset = 0xFFFFFFFF
+            extra = _zip64_extra(*zip64_values) if zip64_values else b''
+            version = max(entry.version, _VERSION_ZIP64) if zip64_values else entry.version
+            dosdate, dostime = _dos_date_time(zinfo.date_time)
+            self._write(_CENTRAL_HEADER.pack(
+                _CENTRAL_SIGNATURE, version, zinfo.create_system, version, 0,
+                entry.flags, member.compress_type, dostime, dosdate,
+                member.crc, compress_size, file_size,
+                len(entry.name), len(extra), 0, 0, 0, zinfo.external_attr, offset,
+            ) + entry.name + extra)
+
+        count = len(self._entries)
+        dir_size = self._position - start_dir
+        if count > _ZIP_FILECOUNT_LIMIT or start_dir > _ZIP64_LIMIT or dir_size > _ZIP64_LIMIT:
+            zip64_end = self._position
+            self._write(_ZIP64_END_RECORD.pack(
+                _ZIP64_END_SIGNATURE, _ZIP64_END_RECORD.size - 12, _VERSION_ZIP64, _VERSION_ZIP64,
+                0, 0, count, count, dir_size, start_dir,
+            ))
+            self._write(_ZIP64_LOCATOR.pack(_ZIP64_LOCATOR_SIGNATURE, 0, zip64_end, 1))
+            count = min(count, 0xFFFF)
+            dir_size = min(dir_size, 0xFFFFFFFF)
+            start_dir = min(start_dir, 0xFFFFFFFF)
+        self._write(_END_RECORD.pack(_END_SIGNATURE, 0, 0, count, count, dir_size, start_dir, 0))
+
+    def __enter__(self) -> 'PrecompressedZipWriter':
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+
+
+class _SplitEntry:
+    __slots__ = ('name', 'compress_type', 'dostime', 'dosdate', 'crc',
+                 'compress_size', 'file_size', 'disk', 'offset', 'external_attr')
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+
+class _Volume:
+    __slots__ = ('path', 'file', 'out')
+
+    def __init__(self, path: Path, file, out):
+        self.path = path
+        self.file = file
+        self.out = out
+
+
+class PrecompressedSplitZipWriter:
+    """Writes CompressedMembers as a split ZIP (.z01, .z02, ..., .zip) without seeking.
+
+    Only DEFLATED and STORED members are accepted, and ZIP64 is not
+    supported, as in splitzip.
+
+    Args:
+        archive_path: Path of the final .zip volume
+        split_size: Maximum volume size in bytes
+        wrap: Called with each volume's open file; the object it returns is
+            written to instead (e.g. a hashing wrapper)
+    """
+
+    def __init__(self, archive_path: Path, split_size: int,
+                 wrap: Optional[Callable[[Any], Any]] = None):
+        if split_size < _MIN_VOLUME_SIZE:
+            raise ValueError(f"Split size {split_size} is below the {_MIN_VOLUME_SIZE} byte minimum")
+        self.archive_path = Path(archive_path)
+        self.split_size = split_size
+        self._wrap = wrap
+        self._volumes: List[_Volume] = []
+        self._used = 0              # Bytes in the current volume
+        self._final = False
+        self._entries: List[_SplitEntry] = []
+        self._closed = False
+
+    @property
+    def volumes(self) -> List[Tuple[Path, Any]]:
+        """(path, written-to object) per volume in order; final paths once closed."""
+        return [(v.path, v.out) for v in self._volumes]
+
+    def _volume_path(self, number: int) -> Path:
+        path = self.archive_path
+        return path.parent / f"{path.stem}.z{number + 1:02d}"
+
+    def _open_volume(self, final: bool = False) -> None:
+        if self._volumes:
+            self._volumes[-1].file.close()
+        path = self.archive_path if final else self._volume_path(len(self._volumes))
+        f = open(path, 'wb')
+        self._volumes.append(_Volume(path, f, self._wrap(f) if self._wrap else f))
+        self._used = 0
+        self._final = final
+
+    def _space(self) -> int:
+        if self._final:
+            return _ZIP32_LIMIT
+        if not self._volumes:
+            self._open_volume()
+        return self.split_size - self._used
+
+    def _ensure_space(self, count: int) -> None:
+        """Start the next volume unless ``count`` bytes fit in this one."""
+        if self._space() < count:
+            self._open_volume()
+
+    def _write(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            space = self._space()
+            if space <= 0:
+                self._open_volume()
+                continue
+            chunk = view[:space]
+            self._volumes[-1].out.write(chunk)
+            self._used += len(chunk)
+            view = view[len(chunk):]
+
+    def write_member(self, member: CompressedMember) -> None:
+        """Append a member's local header and data, then close the member."""
+        try:
+            if member.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                raise ValueError(f"Split archives only support STORED and DEFLATED, "
+                                 f"not {member.compress_type}")
+            if member.file_size > _ZIP32_LIMIT or member.compress_size > _ZIP32_LIMIT:
+                raise ValueError(f"{member.zinfo.filename} exceeds the 4 GiB ZIP32 limit "
+                                 f"of split archives")
+            if len(self._entries) >= _ZIP_FILECOUNT_LIMIT:
+                raise ValueError(f"Split archives hold at most {_ZIP_FILECOUNT_LIMIT} members")
+            name = member.zinfo.filename.encode('utf-8')
+            dosdate, dostime = _dos_date_time(member.zinfo.date_time)
+            header = _LOCAL_HEADER.pack(
+                _LOCAL_SIGNATURE, _SPLIT_VERSION, _FLAG_UTF8, member.compress_type,
+                dostime, dosdate, member.crc, member.compress_size, member.file_size,
+                len(name), 0,
+            ) + name
+            # A local header never spans two volumes
+            self._ensure_space(len(header))
+            entry = _SplitEntry(
+                name=name, compress_type=member.compress_type, dostime=dostime, dosdate=dosdate,
+                crc=member.crc, compress_size=member.compress_size, file_size=member.file_size,
+                disk=len(self._volumes) - 1, offset=self._used,
+                external_attr=((member.zinfo.external_attr >> 16) & 0o777) << 16,
+            )
+            self._write(header)
+            _copy_member_data(member, self._write)
+            self._entries.append(entry)
+        finally:
+            member.close()
+
+    def _start_final_volume(self, reserved: int) -> None:
+        """Continue in the current volume if the central directory fits, else open the .zip."""
+        if not self._volumes:
+            self._open_volume(final=True)
+        elif ((len(self._volumes) == 1 and self._used < self.split_size)
+              or (len(self._volumes) >= 2 and self.split_size - self._used >= reserved)):
+            # Renamed to the final path on close
+            self._final = True
+        else:
+            self._open_volume(final=True)
+
+    def close(self) -> List[Path]:
+        """Write the central directory and end record, close every volume.
+
+        Returns:
+            Volume paths in order (.z01, .z02, ..., .zip)
+        """
+        if self._closed:
+            return [v.path for v in self._volumes]
+        self._closed = True
+        directory = b''.join(
+            _CENTRAL_HEADER.pack(
+                _CENTRAL_SIGNATURE, _SPLIT_VERSION, 0, _SPLIT_VERSION, 0, _FLAG_UTF8,
+                e.compress_type, e.dostime, e.dosdate, e.crc, e.compress_size, e.file_size,
+                len(e.name), 0, 0, e.disk, 0, e.external_attr, e.offset,
+            ) + e.name
+            for e in self._entries
+        )
+        self._start_final_volume(len(directory) + _END_RECORD.size)
+        start_disk, start_offset = len(self._volumes) - 1, self._used
+        count = len(self._entries)
+        self._write(directory)
+        self._write(_END_RECORD.pack(
+            _END_SIGNATURE, len(self._volumes) - 1, start_disk, count, count,
+            len(directory), start_offset, 0,
+        ))
+        self._close_files()
+        last = self._volumes[-1]
+        if last.path != self.archive_path:
+            os.replace(last.path, self.archive_path)
+            last.path = self.archive_path
+        return [v.path for v in self._volumes]
+
+    def _close_files(self) -> None:
+        for volume in self._volumes:
+            volume.file.close()
+
+    def __enter__(self) -> 'PrecompressedSplitZipWriter':
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._closed = True
+            self._close_files()
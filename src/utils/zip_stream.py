@@ -0,0 +1,405 @@
+"""
+Store-mode ZIP archives planned from their source files and streamed on demand.
+
+``plan_stored_zip`` and ``plan_split_stored_zip`` run the same writers that
+ArchiveManager uses for store-mode ZIPs (zipfile for single archives,
+splitzip for split ones) against a recording sink instead of a file.
+Headers, data descriptors and central directories are kept as bytes; member
+data is kept as (source file, offset, length) references. Each resulting
+``StoredZipPart`` reads back exactly the bytes ArchiveManager would have
+written, taken straight from the gallery images, so a part can be uploaded
+without ever existing on disk.
+
+Planning reads every source once, because the writers need each member's
+CRC-32 before they can finish its header. Sources are stat'ed while
+planning, and a reader refuses to serve a file whose size or mtime has
+changed since then: the planned CRC and sizes would no longer match it.
+
+Split planning overrides splitzip's volume handling (``_open_volume``,
+``_fold_current_volume_to_final``, ``_write_file_data`` and the state they
+touch), which splitzip does not promise to keep. It is only used with the
+splitzip releases listed in ``SUPPORTED_SPLITZIP_VERSIONS`` (the version
+pinned in requirements.txt); with any other, ``split_streaming_supported()``
+is False and callers write split archives to disk instead.
+"""
+
+import hashlib
+import io
+import os
+import shutil
+import threading
+import zipfile
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import splitzip
+from splitzip import STORED, SplitZipWriter
+from splitzip.volume import VolumeManager
+
+# splitzip releases whose private volume API the split recorder was checked against
+SUPPORTED_SPLITZIP_VERSIONS = ('0.3.1',)
+
+# Read size for planning and hashing passes
+_CHUNK_SIZE = 1024 * 1024
+
+# {source path: (st_size, st_mtime_ns)} captured while planning
+_SourceStats = Dict[str, Tuple[int, int]]
+
+
+class _FileRange:
+    """``length`` bytes of ``path`` starting at ``offset``."""
+
+    __slots__ = ('path', 'offset', 'length')
+
+    def __init__(self, path: str, offset: int, length: int):
+        self.path = path
+        self.offset = offset
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+
+_Segment = Union[bytearray, _FileRange]
+
+
+class _SourceCursor:
+    """Tracks which source file, if any, the writer is copying right now.
+
+    Shared by every recorder of one plan, so a member that splitzip spreads
+    over two volumes continues at the right source offset in the second.
+    """
+
+    def __init__(self):
+        self.stats: _SourceStats = {}
+        self._path: Optional[str] = None
+        self._offset = 0
+
+    def begin(self, path) -> None:
+        path = str(path)
+        st = os.stat(path)
+        self.stats[path] = (st.st_size, st.st_mtime_ns)
+        self._path = path
+        self._offset = 0
+
+    def end(self) -> None:
+        path, copied = self._path, self._offset
+        self._path = None
+        if copied != self.stats[path][0]:
+            raise RuntimeError(f"Source changed while planning archive: {path}")
+
+    def consume(self, count: int) -> Optional[Tuple[str, int]]:
+        """Claim the next ``count`` source bytes; None outside a member copy."""
+        if self._path is None:
+            return None
+        offset = self._offset
+        self._offset += count
+        return self._path, offset
+
+
+class _SegmentRecorder:
+    """Write-only sink that records bytes as literals or source file ranges.
+
+    Refuses to seek, like ``_HashingWriter``, so zipfile emits the same
+    data-descriptor layout as when ArchiveManager writes through one.
+    """
+
+    def __init__(self, cursor: _SourceCursor):
+        self.segments: List[_Segment] = []
+        self.size = 0
+        self._cursor = cursor
+
+    def write(self, data) -> int:
+        count = len(data)
+        if not count:
+            return 0
+        last = self.segments[-1] if self.segments else None
+        source = self._cursor.consume(count)
+        if source is None:
+            if isinstance(last, bytearray):
+                last += data
+            else:
+                self.segments.append(bytearray(data))
+        else:
+            path, offset = source
+            if (isinstance(last, _FileRange) and last.path == path
+                    and last.offset + last.length == offset):
+                last.length += count
+            else:
+                self.segments.append(_FileRange(path, offset, count))
+        self.size += count
+        return count
+
+    def patch(self, offset: int, data: bytes) -> None:
+        """Overwrite already recorded literal bytes (splitzip's header fix-up)."""
+        end = offset + len(data)
+        position = 0
+        for segment in self.segments:
+            seg_end = position + len(segment)
+            if offset < seg_end and end > position:
+                if not isinstance(segment, bytearray):
+                    raise ValueError("Cannot patch bytes that come from a source file")
+                start, stop = max(offset, position), min(end, seg_end)
+                segment[start - position:stop - position] = data[start - offset:stop - offset]
+            position = seg_end
+        if end > position:
+            raise ValueError(f"Patch at {offset} runs past end of volume ({position} bytes)")
+
+    def tell(self) -> int:
+        return self.size
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+    def seekable(self) -> bool:
+        return False
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _PartReader:
+    """Seekable reader over a StoredZipPart's segments."""
+
+    def __init__(self, segments: List[_Segment], size: int, sources: _SourceStats):
+        self._segments = segments
+        self._sources = sources
+        self.size = size
+        self._starts: List[int] = []
+        position = 0
+        for segment in segments:
+            self._starts.append(position)
+            position += len(segment)
+        self._pos = 0
+        self._file = None
+        self._file_path: Optional[str] = None
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.size - self._pos
+        out = bytearray()
+        while size > 0 and self._pos < self.size:
+            index = bisect_right(self._starts, self._pos) - 1
+            segment = self._segments[index]
+            within = self._pos - self._starts[index]
+            count = min(size, len(segment) - within)
+            if isinstance(segment, bytearray):
+                out += segment[within:within + count]
+            else:
+                out += self._read_range(segment, within, count)
+            self._pos += count
+            size -= count
+        return bytes(out)
+
+    def _read_range(self, segment: _FileRange, within: int, count: int) -> bytes:
+        if self._file_path != segment.path:
+            self._close_file()
+            f = open(segment.path, 'rb')
+            st = os.fstat(f.fileno())
+            if (st.st_size, st.st_mtime_ns) != self._sources[segment.path]:
+                f.close()
+                raise RuntimeError(f"Source changed since archive was planned: {segment.path}")
+            self._file, self._file_path = f, segment.path
+        self._file.seek(segment.offset + within)
+        data = self._file.read(count)
+        if len(data) != count:
+            raise RuntimeError(f"Source truncated since archive was planned: {segment.path}")
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_path = None
+
+    def close(self) -> None:
+        self._close_file()
+
+    def __enter__(self) -> '_PartReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class StoredZipPart:
+    """One archive part (a whole ZIP or one split volume) that is never written.
+
+    ``path`` is where ArchiveManager would have put the file; only its name
+    is meaningful (it becomes the uploaded filename).
+    """
+
+    def __init__(self, path: Path, segments: List[_Segment], size: int, sources: _SourceStats):
+        self.path = Path(path)
+        self.size = size
+        self._segments = segments
+        self._sources = sources
+        self._digests: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        self._digest_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    def open(self) -> _PartReader:
+        """Return a reader positioned at the start of the part."""
+        return _PartReader(self._segments, self.size, self._sources)
+
+    def is_current(self) -> bool:
+        """True while every source still has the size and mtime it was planned with."""
+        for path, planned in self._sources.items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                return False
+            if (st.st_size, st.st_mtime_ns) != planned:
+                return False
+        return True
+
+    def hexdigests(self, algorithms: Iterable[str]) -> Dict[str, str]:
+        """Digests of the part's bytes, computed with one read and cached."""
+        key = tuple(algorithms)
+        with self._digest_lock:
+            if key not in self._digests:
+                hashers = {name: hashlib.new(name) for name in key}
+                with self.open() as reader:
+                    while True:
+                        chunk = reader.read(_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        for hasher in hashers.values():
+                            hasher.update(chunk)
+                self._digests[key] = {name: h.hexdigest() for name, h in hashers.items()}
+            return dict(self._digests[key])
+
+    def md5(self) -> str:
+        return self.hexdigests(('md5',))['md5']
+
+
+def _part_sources(segments: List[_Segment], stats: _SourceStats) -> _SourceStats:
+    paths = {s.path for s in segments if isinstance(s, _FileRange)}
+    return {path: stats[path] for path in paths}
+
+
+def plan_stored_zip(image_files: List[Path], archive_path: Path) -> StoredZipPart:
+    """Plan the ZIP ``ArchiveManager._create_zip`` writes with compression 'store'.
+
+    Args:
+        image_files: Files to add, in archive order
+        archive_path: Path the archive would have been written to
+
+    Returns:
+        StoredZipPart whose bytes equal the file _create_zip would write
+    """
+    cursor = _SourceCursor()
+    sink = _SegmentRecorder(cursor)
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_STORED) as zf:
+        for image_file in image_files:
+            # Same steps as ZipFile.write(), with the copy bracketed by the cursor
+            zinfo = zipfile.ZipInfo.from_file(image_file, arcname=image_file.name)
+            zinfo.compress_type = zipfile.ZIP_STORED
+            with open(image_file, 'rb') as src, zf.open(zinfo, 'w') as dest:
+                cursor.begin(image_file)
+                shutil.copyfileobj(src, dest, _CHUNK_SIZE)
+                cursor.end()
+    return StoredZipPart(archive_path, sink.segments, sink.size,
+                         _part_sources(sink.segments, cursor.stats))
+
+
+class _RecordingVolumeManager(VolumeManager):
+    """splitzip VolumeManager that records each volume instead of creating it."""
+
+    def __init__(self, base_path: Path, split_size: int, cursor: _SourceCursor):
+        super().__init__(base_path, split_size)
+        self._cursor = cursor
+        self.recorders: Dict[int, _SegmentRecorder] = {}
+
+    def _open_volume(self, volume_number: int, is_final: bool = False) -> None:
+        self._current_file = self.recorders[volume_number] = _SegmentRecorder(self._cursor)
+        self._current_volume = volume_number
+        self._bytes_written_to_volume = 0
+        self._is_final_volume = is_final
+        self._volume_paths.append(self.volume_path_for(volume_number, is_final))
+
+    def _fold_current_volume_to_final(self) -> None:
+        # The real manager renames the last .zNN to .zip and keeps appending
+        self._volume_paths[-1] = self.base_path
+        self._is_final_volume = True
+
+    def write_at_offset(self, data: bytes, volume: int, offset: int) -> None:
+        if volume not in self.recorders:
+            raise ValueError(f"Volume {volume} has not been created")
+        self.recorders[volume].patch(offset, data)
+
+
+class _RecordingSplitZipWriter(SplitZipWriter):
+    """SplitZipWriter whose member copies are recorded as source file ranges."""
+
+    def __init__(self, path: Path, split_size: int):
+        super().__init__(str(path), split_size=split_size, compression=STORED)
+        self._cursor = _SourceCursor()
+        self._volume_mgr = _RecordingVolumeManager(self.path, self.split_size, self._cursor)
+
+    def _write_file_data(self, path, compression, compresslevel, total_size):
+        self._cursor.begin(path)
+        result = super()._write_file_data(path, compression, compresslevel, total_size)
+        self._cursor.end()
+        return result
+
+    def parts(self) -> List[StoredZipPart]:
+        manager = self._volume_mgr
+        stats = self._cursor.stats
+        return [
+            StoredZipPart(path, recorder.segments, recorder.size,
+                          _part_sources(recorder.segments, stats))
+            for path, recorder in zip(manager.volume_paths,
+                                      (manager.recorders[n] for n in sorted(manager.recorders)))
+        ]
+
+
+def split_streaming_supported() -> bool:
+    """True if the installed splitzip is one the split recorder supports."""
+    return getattr(splitzip, '__version__', None) in SUPPORTED_SPLITZIP_VERSIONS
+
+
+def plan_split_stored_zip(image_files: List[Path], archive_path: Path,
+                          split_size: int) -> List[StoredZipPart]:
+    """Plan the volumes ``ArchiveManager._create_split_zip`` writes with compression 'store'.
+
+    Args:
+        image_files: Files to add, in archive order
+        archive_path: Path of the final .zip volume
+        split_size: Maximum volume size in bytes
+
+    Returns:
+        Parts in upload order (.z01, .z02, ..., .zip)
+
+    Raises:
+        RuntimeError: If the installed splitzip is not supported
+    """
+    if not split_streaming_supported():
+        raise RuntimeError(
+            f"Streaming split archives needs splitzip {' or '.join(SUPPORTED_SPLITZIP_VERSIONS)}, "
+            f"found {getattr(splitzip, '__version__', 'unknown')}"
+        )
+    with _RecordingSplitZipWriter(archive_path, split_size) as zf:
+        for image_file in image_files:
+            zf.write(str(image_file), arcname=image_file.name)
+    return zf.parts()
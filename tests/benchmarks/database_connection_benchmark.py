@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark for pooled SQLite connections in QueueStore.
+
+Compares ops/sec of the hot QueueStore read paths with the per-thread
+connection pool against the original open-per-call path (connect + four
+PRAGMAs + schema check on every call).
+
+Operations measured:
+1. get_pending_file_host_uploads(host)  - polled every second per host worker
+2. get_file_host_pending_stats(host)    - host worker status refresh
+3. get_file_host_uploads(path)          - per-gallery lookups
+4. get_galleries_for_dashboard()        - link scanner dashboard (heavy, fewer ops)
+
+Usage:
+    python tests/benchmarks/database_connection_benchmark.py [--galleries 50000] [--seconds 2]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.storage.database import (
+    QueueStore,
+    _ConnectionContext,
+    get_connection_pool_stats,
+    set_connection_pooling,
+)
+
+HOSTS = ['rapidgator', 'keep2share', 'fileboom', 'tezfiles', 'gofile', 'filedot', 'katfile']
+
+
+def create_test_database(gallery_count=50000):
+    """Create temporary database with galleries and file host uploads"""
+    temp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(temp_dir, "benchmark.db")
+    store = QueueStore(db_path, pooled=True)
+
+    print(f"Creating test database with {gallery_count} galleries...")
+    start = time.perf_counter()
+
+    statuses = ['completed', 'ready', 'uploading', 'incomplete', 'failed', 'queued']
+    store.bulk_upsert(
+        {
+            'path': f'/fake/gallery_{i:06d}',
+            'name': f'Gallery {i}',
+            'status': statuses[i % len(statuses)],
+            'added_time': 1700000000 + i,
+            'total_images': 10 + (i % 30),
+            'scan_complete': True,
+        }
+        for i in range(gallery_count)
+    )
+
+    # One upload row per gallery, spread across hosts; ~5% still pending
+    with _ConnectionContext(db_path) as conn:
+        conn.execute("BEGIN")
+        conn.executemany(
+            """
+            INSERT INTO file_host_uploads (gallery_fk, host_name, status, part_number)
+            SELECT id, ?, ?, 0 FROM galleries WHERE path = ?
+            """,
+            (
+                (HOSTS[i % len(HOSTS)], 'pending' if i % 20 == 0 else 'completed', f'/fake/gallery_{i:06d}')
+                for i in range(gallery_count)
+            ),
+        )
+        conn.execute("COMMIT")
+
+    print(f"✓ Created {gallery_count} galleries in {time.perf_counter() - start:.1f}s")
+    return store, temp_dir
+
+
+def measure_ops(func, seconds):
+    """Run func repeatedly for `seconds`; return ops/sec."""
+    func()  # warm up (first call may open a connection)
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        func()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def run_benchmarks(store, gallery_count, seconds):
+    sample_paths = [f'/fake/gallery_{i:06d}' for i in range(0, gallery_count, max(1, gallery_count // 97))]
+    path_cycle = {'i': 0}
+
+    def lookup_gallery():
+        path_cycle['i'] = (path_cycle['i'] + 1) % len(sample_paths)
+        store.get_file_host_uploads(sample_paths[path_cycle['i']])
+
+    operations = [
+        ("get_pending_file_host_uploads", lambda: store.get_pending_file_host_uploads('rapidgator'), seconds),
+        ("get_file_host_pending_stats", lambda: store.get_file_host_pending_stats('rapidgator'), seconds),
+        ("get_file_host_uploads", lookup_gallery, seconds),
+        ("get_galleries_for_dashboard", store.get_galleries_for_dashboard, seconds * 2),
+    ]
+
+    results = []
+    for name, func, duration in operations:
+        set_connection_pooling(False)
+        unpooled = measure_ops(func, duration)
+        set_connection_pooling(True)
+        pooled = measure_ops(func, duration)
+        results.append((name, unpooled, pooled))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--galleries', type=int, default=50000, help='Galleries in the test database (default: 50000)')
+    parser.add_argument('--seconds', type=float, default=2.0, help='Measurement time per operation and mode (default: 2)')
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("QueueStore connection pooling benchmark")
+    print("=" * 72)
+
+    store, temp_dir = create_test_database(args.galleries)
+    try:
+        results = run_benchmarks(store, args.galleries, args.seconds)
+    finally:
+        set_connection_pooling(True)
+        store.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print()
+    print(f"{'Operation':<32} {'open-per-call':>15} {'pooled':>12} {'speedup':>9}")
+    print("-" * 72)
+    for name, unpooled, pooled in results:
+        speedup = pooled / unpooled if unpooled else float('inf')
+        print(f"{name:<32} {unpooled:>11.0f} op/s {pooled:>8.0f} op/s {speedup:>8.1f}x")
+    print()
+    print(f"Pool stats: {get_connection_pool_stats()}")
+
+
+if __name__ == "__main__":
+    main()
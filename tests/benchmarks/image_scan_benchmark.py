@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the single-pass image header reader used by gallery scans.
+
+Compares the old three-pass scan in QueueManager._scan_images against one
+read_image_header() call per file, over a folder of generated images.
+
+Old passes (all through PIL):
+1. os.path.getsize + Image.open().verify() on every file
+2. Image.open().size on the sampled files (_calculate_dimensions)
+3. Image.open().size on every file (per-file dimensions for cover detection)
+
+Usage:
+    python tests/benchmarks/image_scan_benchmark.py [--images 5000] [--rounds 3]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.image_header import read_image_header
+
+# Mix of formats roughly like a real gallery folder
+FORMATS = [('jpg', 'JPEG'), ('jpg', 'JPEG'), ('jpg', 'JPEG'), ('png', 'PNG'), ('gif', 'GIF')]
+SAMPLE_COUNT = 25  # Default fixed sampling count in Settings > Scanning
+
+
+def create_test_folder(image_count):
+    """Write image_count small images with varied sizes and formats"""
+    temp_dir = tempfile.mkdtemp()
+    print(f"Creating {image_count} test images...")
+    start = time.perf_counter()
+    templates = {}
+    for i in range(image_count):
+        ext, fmt = FORMATS[i % len(FORMATS)]
+        size = (160 + (i % 7) * 16, 120 + (i % 5) * 16)
+        key = (fmt, size)
+        if key not in templates:
+            # Encode once per (format, size) and copy bytes; keeps setup fast
+            path = os.path.join(temp_dir, f"template.{ext}")
+            Image.new('RGB', size, color=(i % 256, 80, 160)).save(path, format=fmt)
+            with open(path, 'rb') as f:
+                templates[key] = f.read()
+            os.remove(path)
+        with open(os.path.join(temp_dir, f"img_{i:05d}.{ext}"), 'wb') as f:
+            f.write(templates[key])
+    print(f"✓ Created {image_count} images in {time.perf_counter() - start:.1f}s")
+    return temp_dir
+
+
+def three_pass_scan(path, files):
+    """The scan as it was before read_image_header"""
+    total_size = 0
+    failed = []
+    for f in files:
+        fp = os.path.join(path, f)
+        total_size += os.path.getsize(fp)
+        try:
+            with Image.open(fp) as img:
+                img.verify()
+        except Exception as e:
+            failed.append((f, str(e)))
+
+    step = max(1, len(files) // SAMPLE_COUNT)
+    dims = []
+    for f in files[::step]:
+        with Image.open(os.path.join(path, f)) as img:
+            dims.append(img.size)
+
+    file_dimensions = {}
+    for f in files:
+        with Image.open(os.path.join(path, f)) as img:
+            file_dimensions[f] = img.size
+    return total_size, failed, file_dimensions
+
+
+def single_pass_scan(path, files):
+    """One header read per file; sampling reuses the collected dimensions"""
+    total_size = 0
+    failed = []
+    file_dimensions = {}
+    for f in files:
+        header = read_image_header(os.path.join(path, f))
+        total_size += header.size or 0
+        if header.error:
+            failed.append((f, header.error))
+        else:
+            file_dimensions[f] = header.dimensions
+
+    step = max(1, len(files) // SAMPLE_COUNT)
+    dims = [file_dimensions[f] for f in files[::step] if f in file_dimensions]
+    return total_size, failed, file_dimensions
+
+
+def best_of(func, rounds, *args):
+    best = float('inf')
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--images', type=int, default=5000, help='Images in the test folder (default: 5000)')
+    parser.add_argument('--rounds', type=int, default=3, help='Timed rounds per method, best is reported (default: 3)')
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("Gallery image scan benchmark")
+    print("=" * 72)
+
+    temp_dir = create_test_folder(args.images)
+    try:
+        files = sorted(os.listdir(temp_dir))
+        old_time, old_result = best_of(three_pass_scan, args.rounds, temp_dir, files)
+        new_time, new_result = best_of(single_pass_scan, args.rounds, temp_dir, files)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    if old_result != new_result:
+        print("✗ Results differ between methods")
+        sys.exit(1)
+
+    print()
+    print(f"{'Method':<32} {'time':>10} {'files/s':>12}")
+    print("-" * 72)
+    for name, elapsed in (("three-pass PIL", old_time), ("single-pass header", new_time)):
+        print(f"{name:<32} {elapsed:>9.3f}s {len(files) / elapsed:>12.0f}")
+    print()
+    print(f"Speedup: {old_time / new_time:.1f}x (results identical)")
+
+
+if __name__ == "__main__":
+    main()
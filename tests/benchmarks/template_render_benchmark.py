@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark for compiled BBCode templates.
+
+Renders the built-in "Extended Example" template for a batch of galleries,
+the way artifact regeneration does after a template edit, and compares:
+
+1. Sequential engine: process_conditionals() rescans the string once per
+   [if] block, then one str.replace pass per placeholder (~35 passes)
+2. CompiledTemplate: parsed once, one tree walk plus one substitution pass
+
+Usage:
+    python tests/benchmarks/template_render_benchmark.py [--galleries 5000] [--rounds 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.templates import _apply_template_sequential, _builtin_templates, compile_template
+
+
+def make_gallery_data(count):
+    """Template data dicts shaped like save_gallery_artifacts() builds them"""
+    galleries = []
+    for i in range(count):
+        images = "  ".join(
+            f"[url=https://img.example/i/{i}_{n}][img]https://img.example/t/{i}_{n}.jpg[/img][/url]"
+            for n in range(40)
+        )
+        galleries.append({
+            'folder_name': f"Gallery {i:05d}",
+            'gallery_name': f"Gallery {i:05d}",
+            'width': 1200 + i % 400,
+            'height': 800 + i % 300,
+            'longest': 1200 + i % 400,
+            'extension': 'JPG',
+            'picture_count': 40,
+            'folder_size': f"{(i % 900) / 3:.1f} MB",
+            'gallery_link': f"https://img.example/g/{i}" if i % 4 else '',
+            'all_images': images,
+            'host_links': f"[url=https://files.example/{i}]#folderName# (#folderSize#)[/url]" if i % 2 else '',
+            'custom1': 'tag' if i % 3 == 0 else '',
+            'ext1': f"ext-{i}" if i % 5 == 0 else '',
+        })
+    return galleries
+
+
+def render_sequential(template, galleries):
+    return [_apply_template_sequential(template, data) for data in galleries]
+
+
+def render_compiled(template, galleries):
+    compiled = compile_template(template)
+    return [compiled.render(data) for data in galleries]
+
+
+def best_of(func, rounds, *args):
+    best = float('inf')
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--galleries', type=int, default=5000, help='Galleries to render (default: 5000)')
+    parser.add_argument('--rounds', type=int, default=3, help='Timed rounds per method, best is reported (default: 3)')
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("BBCode template render benchmark")
+    print("=" * 72)
+
+    template = _builtin_templates()["Extended Example"]
+    galleries = make_gallery_data(args.galleries)
+
+    old_time, old_result = best_of(render_sequential, args.rounds, template, galleries)
+    new_time, new_result = best_of(render_compiled, args.rounds, template, galleries)
+
+    if old_result != new_result:
+        print("✗ Output differs between methods")
+        sys.exit(1)
+
+    print()
+    print(f"{'Method':<32} {'time':>10} {'renders/s':>12}")
+    print("-" * 72)
+    for name, elapsed in (("sequential replace", old_time), ("compiled template", new_time)):
+        print(f"{name:<32} {elapsed:>9.3f}s {len(galleries) / elapsed:>12.0f}")
+    print()
+    print(f"Speedup: {old_time / new_time:.1f}x (output identical)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ reference counting, and error handling. Uses real file I/O with pytest fixtures
 to catch actual API breakage (e.g., splitfile API changes).
 """
 
+import hashlib
+import os
+import threading
 import pytest
 import zipfile
 from pathlib import Path
@@ -587,6 +590,257 @@ class TestBackwardCompatibility:
         assert not zip_path.exists()
 
 
+class TestPartHashes:
+    """Test per-part digests computed while writing / cached with the archive."""
+
+    def test_zip_hashed_while_written(self, temp_archive_dir, gallery_folder):
+        """Single ZIP digests match the file without a second read."""
+        manager = ArchiveManager(temp_dir=temp_archive_dir, hash_algorithms=('md5', 'sha256'))
+        paths = manager.create_or_reuse_archive(1, gallery_folder)
+        data = paths[0].read_bytes()
+
+        with patch('src.utils.archive_manager.hash_file') as mock_hash:
+            digests = manager.get_part_hashes(paths[0])
+        mock_hash.assert_not_called()
+        assert digests['md5'] == hashlib.md5(data).hexdigest()
+        assert digests['sha256'] == hashlib.sha256(data).hexdigest()
+        assert manager.get_part_md5(paths[0]) == digests['md5']
+
+    @pytest.mark.parametrize('compression', ['store', 'deflate'])
+    def test_hashed_zip_is_valid(self, temp_archive_dir, gallery_folder, compression):
+        """Streamed ZIP (data descriptors) still round-trips every image."""
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        paths = manager.create_or_reuse_archive(1, gallery_folder, compression=compression)
+        with zipfile.ZipFile(paths[0]) as zf:
+            assert zf.testzip() is None
+            for name in zf.namelist():
+                assert zf.read(name) == (gallery_folder / name).read_bytes()
+
+    def test_split_zip_hashed_while_written(self, temp_archive_dir, tmp_path):
+        """Split ZIP volumes are hashed as they are written, never read back."""
+        folder = tmp_path / "noisy"
+        folder.mkdir()
+        for i in range(3):
+            (folder / f"noise{i}.jpg").write_bytes(os.urandom(700 * 1024))
+
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        paths = manager.create_or_reuse_archive(1, folder, split_size_mb=1)
+        assert len(paths) > 1
+        assert set(manager.archive_hashes[1]) == set(paths)
+
+        with patch('src.utils.archive_manager.hash_file') as mock_hash:
+            md5s = [manager.get_part_md5(p) for p in paths]
+        mock_hash.assert_not_called()
+        assert md5s == [hashlib.md5(p.read_bytes()).hexdigest() for p in paths]
+
+    def test_split_parts_hashed_once(self, temp_archive_dir, tmp_path):
+        """Split parts are hashed on first request, then served from the cache."""
+        pytest.importorskip("splitzip")
+        folder = tmp_path / "noisy"
+        folder.mkdir()
+        for i in range(3):
+            (folder / f"noise{i}.jpg").write_bytes(os.urandom(700 * 1024))
+
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        paths = manager.create_or_reuse_archive(1, folder, split_size_mb=1)
+        assert len(paths) > 1
+
+        first = [manager.get_part_md5(p) for p in paths]
+        assert first == [hashlib.md5(p.read_bytes()).hexdigest() for p in paths]
+        with patch('src.utils.archive_manager.hash_file') as mock_hash:
+            assert [manager.get_part_md5(p) for p in paths] == first
+        mock_hash.assert_not_called()
+
+    def test_hashes_dropped_with_archive(self, temp_archive_dir, gallery_folder):
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        manager.create_or_reuse_archive(1, gallery_folder)
+        assert 1 in manager.archive_hashes
+        manager.release_archive(1, force_delete=True)
+        assert 1 not in manager.archive_hashes
+
+    def test_unmanaged_file_hashed_but_not_cached(self, temp_archive_dir, tmp_path):
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b'\x00' * 4096)
+        assert manager.get_part_md5(video) == hashlib.md5(video.read_bytes()).hexdigest()
+        assert manager.archive_hashes == {}
+
+
+class TestStreamedArchive:
+    """Test store-mode ZIP plans that are streamed instead of written."""
+
+    def test_stream_matches_archive(self, temp_archive_dir, gallery_folder):
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        parts = manager.create_or_reuse_stream(1, gallery_folder, "My Gallery")
+        written = ArchiveManager(temp_dir=temp_archive_dir / "real").create_or_reuse_archive(
+            1, gallery_folder, "My Gallery")
+
+        assert [p.name for p in parts] == [p.name for p in written]
+        assert not parts[0].path.exists()
+        with parts[0].open() as reader:
+            assert reader.read() == written[0].read_bytes()
+
+    def test_plan_reused_until_source_changes(self, temp_archive_dir, gallery_folder):
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        first = manager.create_or_reuse_stream(1, gallery_folder)
+        assert manager.create_or_reuse_stream(1, gallery_folder) is first
+
+        (gallery_folder / "image001.jpg").write_bytes(b"edited")
+        assert manager.create_or_reuse_stream(1, gallery_folder) is not first
+
+    def test_part_md5_from_stream(self, temp_archive_dir, gallery_folder):
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        part = manager.create_or_reuse_stream(1, gallery_folder)[0]
+        with part.open() as reader:
+            expected = hashlib.md5(reader.read()).hexdigest()
+        with patch('src.utils.archive_manager.hash_file') as mock_hash:
+            assert manager.get_part_md5(part.path) == expected
+        mock_hash.assert_not_called()
+
+    def test_release_keeps_plan_until_forced(self, temp_archive_dir, gallery_folder):
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        manager.create_or_reuse_stream(1, gallery_folder)
+        assert manager.release_archive(1) is False
+        assert 1 in manager.stream_cache
+        manager.release_archive(1, force_delete=True)
+        assert 1 not in manager.stream_cache
+
+    def test_split_stream(self, temp_archive_dir, tmp_path):
+        folder = tmp_path / "noisy"
+        folder.mkdir()
+        for i in range(3):
+            (folder / f"noise{i}.jpg").write_bytes(os.urandom(700 * 1024))
+
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        parts = manager.create_or_reuse_stream(1, folder, split_size_mb=1)
+        written = manager.create_or_reuse_archive(1, folder, split_size_mb=1)
+
+        assert [p.name for p in parts] == [p.name for p in written]
+        for part, path in zip(parts, written):
+            assert manager.get_part_md5(part.path) == hashlib.md5(path.read_bytes()).hexdigest()
+
+
+class TestParallelCompression:
+    """Test thread-pool member compression and per-gallery build locks."""
+
+    @pytest.fixture
+    def manager(self, temp_archive_dir):
+        manager = ArchiveManager(temp_dir=temp_archive_dir)
+        yield manager
+        manager.cleanup_all()
+
+    @pytest.mark.parametrize('compression', ['deflate', 'lzma', 'bzip2'])
+    def test_parallel_zip_matches_sources(self, manager, gallery_folder, compression):
+        paths = manager.create_or_reuse_archive(
+            1, gallery_folder, compression=compression, compression_workers=2)
+        with zipfile.ZipFile(paths[0]) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == sorted(p.name for p in gallery_folder.iterdir())
+            for info in zf.infolist():
+                assert zf.read(info.filename) == (gallery_folder / info.filename).read_bytes()
+        assert manager.get_part_md5(paths[0]) == hashlib.md5(paths[0].read_bytes()).hexdigest()
+
+    def test_store_does_not_use_pool(self, manager, gallery_folder):
+        with patch.object(manager, '_create_zip_parallel') as mock_parallel:
+            manager.create_or_reuse_archive(1, gallery_folder, compression='store', compression_workers=4)
+        mock_parallel.assert_not_called()
+
+    def test_default_is_sequential(self, manager, gallery_folder):
+        with patch.object(manager, '_create_zip_parallel') as mock_parallel:
+            manager.create_or_reuse_archive(1, gallery_folder, compression='deflate')
+        mock_parallel.assert_not_called()
+
+    def test_large_members_spill_to_disk(self, manager, gallery_folder):
+        with patch('src.utils.archive_manager.PARALLEL_SPOOL_BYTES', 0):
+            paths = manager.create_or_reuse_archive(
+                1, gallery_folder, compression='deflate', compression_workers=2)
+        with zipfile.ZipFile(paths[0]) as zf:
+            assert zf.testzip() is None
+            assert len(zf.namelist()) == 4
+
+    def test_pool_failure_falls_back(self, manager, gallery_folder):
+        with patch.object(manager, '_get_compress_pool', side_effect=RuntimeError("can't start new thread")):
+            paths = manager.create_or_reuse_archive(
+                1, gallery_folder, compression='deflate', compression_workers=2)
+        with zipfile.ZipFile(paths[0]) as zf:
+            assert zf.testzip() is None
+
+    def test_different_galleries_build_concurrently(self, manager, gallery_folder):
+        """A slow build for one gallery does not block another gallery."""
+        release = threading.Event()
+        original = manager._create_zip_hashed
+
+        def slow_build(folder_path, base_name, compression):
+            if base_name.startswith('bbdrop_gallery_1'):
+                assert release.wait(5)
+            return original(folder_path, base_name, compression)
+
+        with patch.object(manager, '_create_zip_hashed', side_effect=slow_build):
+            slow = threading.Thread(target=manager.create_or_reuse_archive, args=(1, gallery_folder))
+            slow.start()
+            paths = manager.create_or_reuse_archive(2, gallery_folder)
+            assert paths[0].exists()
+            release.set()
+            slow.join(5)
+        assert 1 in manager.archive_cache
+
+    def test_same_gallery_builds_once(self, manager, gallery_folder):
+        """Concurrent requests for one gallery share a single build."""
+        with patch.object(manager, '_create_zip_hashed', wraps=manager._create_zip_hashed) as build:
+            threads = [threading.Thread(target=manager.create_or_reuse_archive, args=(1, gallery_folder))
+                       for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(5)
+        assert build.call_count == 1
+        assert manager.archive_cache[1][1] == 4
+
+    def test_build_locks_released(self, manager, gallery_folder):
+        """Per-gallery build locks are dropped once no build holds them."""
+        threads = [threading.Thread(target=manager.create_or_reuse_archive, args=(n % 2, gallery_folder))
+                   for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        manager.create_or_reuse_stream(3, gallery_folder)
+        assert manager._build_locks == {}
+
+    def test_build_lock_released_on_failure(self, manager, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            manager.create_or_reuse_archive(1, tmp_path / "missing")
+        assert manager._build_locks == {}
+
+    @pytest.fixture
+    def noisy_folder(self, tmp_path):
+        folder = tmp_path / "noisy"
+        folder.mkdir()
+        for i in range(4):
+            (folder / f"noise{i}.jpg").write_bytes(os.urandom(300 * 1024) + b"a" * 300 * 1024)
+        return folder
+
+    def test_split_zip_uses_pool(self, manager, noisy_folder):
+        """Split ZIPs compress on the pool and match a sequential build."""
+        sequential = manager.create_or_reuse_archive(
+            1, noisy_folder, compression='deflate', split_size_mb=1)
+        with patch.object(manager, '_compress_parallel', wraps=manager._compress_parallel) as pool_build:
+            parallel = manager.create_or_reuse_archive(
+                2, noisy_folder, compression='deflate', split_size_mb=1, compression_workers=2)
+        pool_build.assert_called_once()
+        assert len(parallel) > 1
+        assert [p.read_bytes() for p in parallel] == [p.read_bytes() for p in sequential]
+        assert [manager.get_part_md5(p) for p in parallel] == \
+            [hashlib.md5(p.read_bytes()).hexdigest() for p in parallel]
+
+    def test_split_pool_failure_falls_back(self, manager, noisy_folder):
+        with patch.object(manager, '_get_compress_pool', side_effect=RuntimeError("can't start new thread")):
+            paths = manager.create_or_reuse_archive(
+                1, noisy_folder, compression='deflate', split_size_mb=1, compression_workers=2)
+        assert [manager.get_part_md5(p) for p in paths] == \
+            [hashlib.md5(p.read_bytes()).hexdigest() for p in paths]
+
+
 class TestMultipleGalleries:
     """Test managing archives for multiple galleries."""
 
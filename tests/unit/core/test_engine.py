@@ -19,8 +19,9 @@ import os
 import tempfile
 import shutil
 import threading
+import time
 from typing import List
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.core.engine import (
     AtomicCounter,
@@ -167,6 +168,53 @@ class TestByteCountingCallback:
         assert counter.get() == 0
 
 
+    def test_callback_with_host_draws_from_shaper(self):
+        """Test callback passes byte deltas to the bandwidth shaper for its host."""
+        counter = AtomicCounter()
+        callback = ByteCountingCallback(global_counter=counter, host_id='imx')
+
+        with patch('src.core.engine.get_bandwidth_shaper') as mock_shaper:
+            callback(100, 1000)
+            callback(100, 1000)
+            callback(400, 1000)
+
+        assert [c.args for c in mock_shaper.return_value.throttle.call_args_list] == [
+            ('imx', 100, None), ('imx', 300, None)]
+        assert counter.get() == 400
+
+    def test_callback_passes_stop_check_to_shaper(self):
+        """Test a stop request can end the callback's rate-limit sleep."""
+        stop = Mock(return_value=False)
+        callback = ByteCountingCallback(host_id='imx', should_stop=stop)
+
+        with patch('src.core.engine.get_bandwidth_shaper') as mock_shaper:
+            callback(100, 1000)
+
+        mock_shaper.return_value.throttle.assert_called_once_with('imx', 100, stop)
+
+    def test_callback_with_pause_never_sleeps(self):
+        """Test multi-loop callbacks hand the delay to pause instead of sleeping."""
+        pauses = []
+        callback = ByteCountingCallback(host_id='imx', pause=pauses.append)
+
+        with patch('src.core.engine.get_bandwidth_shaper') as mock_shaper:
+            mock_shaper.return_value.reserve.side_effect = [0.0, 0.25]
+            callback(100, 1000)
+            callback(300, 1000)
+
+        assert not mock_shaper.return_value.throttle.called
+        assert [c.args for c in mock_shaper.return_value.reserve.call_args_list] == [
+            ('imx', 100), ('imx', 200)]
+        assert pauses == [0.25]
+
+    def test_callback_without_host_is_not_throttled(self):
+        """Test callback without host_id never touches the shaper."""
+        with patch('src.core.engine.get_bandwidth_shaper') as mock_shaper:
+            ByteCountingCallback(global_counter=AtomicCounter())(100, 1000)
+
+        mock_shaper.assert_not_called()
+
+
 # ============================================================================
 # UploadEngine Initialization Tests
 # ============================================================================
@@ -990,3 +1038,226 @@ class TestIntegration:
         assert len(uploaded_files) == 5
         assert len(progress_updates) >= 5
         assert result['gallery_url'].startswith('https://imx.to/g/')
+
+
+# ============================================================================
+# CurlMulti Engine Tests
+# ============================================================================
+
+class TestCurlMultiEngine:
+    """Test suite for the single-loop CurlMulti engine mode."""
+
+    @pytest.fixture
+    def upload_server(self):
+        """Local HTTP server that answers every POST with an IMX-style JSON body."""
+        import json
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                name = self.path.rsplit('/', 1)[-1]
+                if name == 'broken.jpg':
+                    self.send_response(500)
+                    self.end_headers()
+                    self.wfile.write(b'boom')
+                    return
+                body = json.dumps({'status': 'success', 'data': {
+                    'gallery_id': 'gal123', 'image_url': f'http://test.com/{name}'}}).encode()
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f'http://127.0.0.1:{server.server_address[1]}'
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def temp_image_folder(self):
+        temp_dir = tempfile.mkdtemp()
+        for i in range(6):
+            with open(os.path.join(temp_dir, f'img{i}.jpg'), 'wb') as f:
+                f.write(b'x' * 2048)
+        yield temp_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _make_uploader(self, base_url, fail_names=()):
+        import io
+        import json
+        import pycurl
+
+        uploader = Mock()
+        uploader.config = None
+        uploader.configure_mock(web_url='https://imx.to')
+        uploader.supports_gallery_rename.return_value = False
+        uploader.get_gallery_url.side_effect = lambda gid, gallery_name='': f'https://imx.to/g/{gid}'
+        uploader.upload_image.return_value = {
+            'status': 'success', 'data': {'gallery_id': 'gal123', 'image_url': 'http://test.com/first'}}
+        uploader.supports_multi_upload.return_value = True
+        prepared = []
+
+        def prepare(curl, image_path, gallery_id=None, progress_callback=None, **kwargs):
+            curl.reset()
+            name = os.path.basename(image_path)
+            if name in fail_names:
+                name = 'broken.jpg'
+            prepared.append(os.path.basename(image_path))
+            buf = io.BytesIO()
+            curl.setopt(pycurl.URL, f'{base_url}/upload/{name}')
+            curl.setopt(pycurl.POSTFIELDS, 'x' * 64)
+            curl.setopt(pycurl.WRITEDATA, buf)
+            return buf
+
+        def finish(curl, buf, image_path, curl_error=None):
+            if curl_error:
+                raise Exception(f'curl error {curl_error}')
+            if curl.getinfo(pycurl.RESPONSE_CODE) != 200:
+                raise Exception('Upload failed with status code 500')
+            return json.loads(buf.getvalue())
+
+        uploader.prepare_multi_upload.side_effect = prepare
+        uploader.finish_multi_upload.side_effect = finish
+        uploader.prepared = prepared
+        return uploader
+
+    def test_multi_mode_uploads_without_thread_pool(self, upload_server, temp_image_folder):
+        """Multi mode drives every non-first image through the uploader's multi hooks."""
+        uploader = self._make_uploader(upload_server)
+        progress, uploaded = [], []
+
+        result = UploadEngine(uploader).run(
+            folder_path=temp_image_folder,
+            gallery_name="Multi",
+            thumbnail_size=3,
+            thumbnail_format=2,
+            max_retries=0,
+            parallel_batch_size=4,
+            template_name="default",
+            on_progress=lambda c, t, p, f: progress.append(c),
+            on_image_uploaded=lambda f, d, s: uploaded.append(f),
+            engine_mode="multi",
+        )
+
+        assert uploader.upload_image.call_count == 1  # gallery creation only
+        assert sorted(uploader.prepared) == [f'img{i}.jpg' for i in range(1, 6)]
+        assert result['successful_count'] == 6
+        assert result['failed_count'] == 0
+        assert len(uploaded) == 6
+        assert progress[-1] == 6
+        # Results keep the folder order regardless of completion order
+        urls = [img['image_url'] for img in result['images'][1:]]
+        assert urls == [f'http://test.com/img{i}.jpg' for i in range(1, 6)]
+
+    def test_multi_mode_reports_failures_and_retries(self, upload_server, temp_image_folder):
+        """HTTP errors surface as failed_details and go through the retry rounds."""
+        uploader = self._make_uploader(upload_server, fail_names=('img3.jpg',))
+
+        result = UploadEngine(uploader).run(
+            folder_path=temp_image_folder,
+            gallery_name="Multi",
+            thumbnail_size=3,
+            thumbnail_format=2,
+            max_retries=2,
+            parallel_batch_size=2,
+            template_name="default",
+            engine_mode="multi",
+        )
+
+        assert result['successful_count'] == 5
+        assert result['failed_count'] == 1
+        assert result['failed_details'][0][0] == 'img3.jpg'
+        assert 'status code 500' in result['failed_details'][0][1]
+        assert uploader.prepared.count('img3.jpg') == 3
+
+    def test_multi_mode_honours_soft_stop(self, upload_server, temp_image_folder):
+        """Soft stop prevents refills but lets in-flight transfers finish."""
+        uploader = self._make_uploader(upload_server)
+
+        result = UploadEngine(uploader).run(
+            folder_path=temp_image_folder,
+            gallery_name="Multi",
+            thumbnail_size=3,
+            thumbnail_format=2,
+            max_retries=0,
+            parallel_batch_size=2,
+            template_name="default",
+            should_soft_stop=lambda: True,
+            engine_mode="multi",
+        )
+
+        assert len(uploader.prepared) == 2
+        assert result['successful_count'] == 3
+
+    def test_multi_mode_pauses_over_limit_transfers(self, upload_server, temp_image_folder):
+        """Over the upload limit, multi-mode transfers are paused, never slept in a callback."""
+        import pycurl
+        from src.network.bandwidth_shaper import BandwidthShaper
+
+        uploader = self._make_uploader(upload_server)
+        prepare = uploader.prepare_multi_upload.side_effect
+
+        def prepare_with_progress(curl, image_path, progress_callback=None, **kwargs):
+            buf = prepare(curl, image_path, **kwargs)
+            curl.setopt(pycurl.POSTFIELDS, 'x' * 200_000)
+            curl.setopt(pycurl.NOPROGRESS, 0)
+            curl.setopt(pycurl.XFERINFOFUNCTION,
+                        lambda dt, d, ut, u: progress_callback(int(u), int(ut)) if ut else None)
+            return buf
+
+        uploader.prepare_multi_upload.side_effect = prepare_with_progress
+        shaper = BandwidthShaper()
+        shaper.set_global_limit(1_000_000)
+        shaper.throttle = Mock(side_effect=AssertionError("slept inside the multi loop"))
+        delays = []
+        reserve = shaper.reserve
+        shaper.reserve = lambda host_id, nbytes: delays.append(reserve(host_id, nbytes)) or delays[-1]
+
+        start = time.monotonic()
+        with patch('src.core.engine.get_bandwidth_shaper', return_value=shaper), \
+                patch.object(UploadEngine, '_host_id', return_value='imx'):
+            result = UploadEngine(uploader).run(
+                folder_path=temp_image_folder,
+                gallery_name="Multi",
+                thumbnail_size=3,
+                thumbnail_format=2,
+                max_retries=0,
+                parallel_batch_size=3,
+                template_name="default",
+                engine_mode="multi",
+            )
+
+        assert result['successful_count'] == 6
+        assert any(delay > 0 for delay in delays)  # Some transfers had to be paused
+        # 1 MB at 1 MB/s with a 0.5 MB burst: paced, not instant
+        assert time.monotonic() - start >= 0.3
+
+    def test_multi_mode_falls_back_to_threads(self, temp_image_folder):
+        """Hosts without multi support keep using upload_image on the thread pool."""
+        uploader = Mock()
+        uploader.config = None
+        uploader.configure_mock(web_url='https://imx.to')
+        uploader.supports_multi_upload.return_value = False
+        uploader.upload_image.return_value = {
+            'status': 'success', 'data': {'gallery_id': 'gal123', 'image_url': 'http://test.com/x'}}
+
+        result = UploadEngine(uploader).run(
+            folder_path=temp_image_folder,
+            gallery_name="Multi",
+            thumbnail_size=3,
+            thumbnail_format=2,
+            max_retries=0,
+            parallel_batch_size=2,
+            template_name="default",
+            engine_mode="multi",
+        )
+
+        assert uploader.upload_image.call_count == 6
+        assert not uploader.prepare_multi_upload.called
+        assert result['successful_count'] == 6
@@ -22,6 +22,7 @@ class MockRenameWorker(QObject):
     status_check_completed = pyqtSignal(dict)
     status_check_error = pyqtSignal(str)
     quick_count_available = pyqtSignal(int, int)  # current, total for quick count
+    status_check_partial = pyqtSignal(dict)  # results for galleries whose shards finished
 
     def __init__(self):
         super().__init__()
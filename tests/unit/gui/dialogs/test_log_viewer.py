@@ -19,7 +19,14 @@ mock_logger.read_current_log.return_value = ""
 
 
 @pytest.fixture
-def mock_logger_module(monkeypatch):
+def log_index(tmp_path):
+    """Log index over an empty temp directory (never the real logs dir)"""
+    from src.utils.log_index import LogIndex
+    return LogIndex(str(tmp_path / "index_logs"))
+
+
+@pytest.fixture
+def mock_logger_module(monkeypatch, log_index):
     """Mock the logger module to prevent ImportError"""
     mock_module = Mock()
     mock_module.get_logger = Mock(return_value=mock_logger)
@@ -29,6 +36,7 @@ def mock_logger_module(monkeypatch):
     monkeypatch.setattr('src.utils.logging.get_logger', mock_module.get_logger)
     monkeypatch.setattr('src.utils.logger.register_log_viewer', mock_module.register_log_viewer)
     monkeypatch.setattr('src.utils.logger.unregister_log_viewer', mock_module.unregister_log_viewer)
+    monkeypatch.setattr('src.gui.dialogs.log_viewer.get_log_index', lambda: log_index)
 
     return mock_module
 
@@ -748,6 +756,52 @@ class TestFileReading:
         assert dialog.cmb_tail.currentText() == "Full"
 
 
+class TestIndexedSearch:
+    """Test searching current and rotated logs through the log index"""
+
+    @pytest.fixture
+    def indexed_logs(self, log_index, temp_log_dir):
+        log_index.logs_dir = str(temp_log_dir)
+        return log_index
+
+    def test_search_spans_rotated_gz(self, dialog, indexed_logs, qtbot):
+        dialog.find_input.setText("old log")
+        dialog.cmb_level_filter.setCurrentText("All")
+        dialog._start_indexed_search()
+        qtbot.waitUntil(lambda: dialog.btn_search_all.isEnabled(), timeout=5000)
+
+        assert dialog.log_view.rowCount() == 1
+        assert dialog.log_view.item(0, 3).text() == "Old log entry"
+        assert dialog.log_view.item(0, 0).toolTip() == "bbdrop.log.1.gz"
+        assert "1 lines from 1 file(s)" in dialog.lbl_search_status.text()
+
+    def test_results_are_not_mixed_with_live_messages(self, dialog, indexed_logs, qtbot):
+        dialog.cmb_level_filter.setCurrentText("All")
+        dialog._start_indexed_search()
+        qtbot.waitUntil(lambda: dialog.btn_search_all.isEnabled(), timeout=5000)
+        assert [dialog.log_view.item(r, 3).text() for r in range(2)] == ["Test log entry", "Old log entry"]
+
+        dialog.append_message("12:00:01 INFO: live", "info", "general")
+        assert dialog.log_view.rowCount() == 2
+
+        dialog.btn_refresh.click()
+        dialog.append_message("12:00:02 INFO: live", "info", "general")
+        assert dialog.log_view.item(0, 3).text() == "live"
+
+    def test_query_follows_filters(self, dialog):
+        dialog.find_input.setText("  gallery ")
+        dialog.cmb_level_filter.setCurrentText("WARNING+")
+        dialog._filters_row["auth"].setChecked(False)
+        dialog.chk_until.setChecked(True)
+
+        query = dialog._search_query()
+
+        assert query.text == "gallery"
+        assert query.min_level == "warning"
+        assert "auth" not in query.categories and "uploads" in query.categories
+        assert len(query.until) == 19
+
+
 class TestDialogButtons:
     """Test dialog button functionality"""
 
@@ -565,3 +565,24 @@ class TestOnTimeframeChanged:
 
         # Should have called with 'today'
         mock_store.get_hosts_for_period.assert_called_with('today')
+
+
+class TestThroughputChart:
+    """Test the File Hosts tab throughput chart."""
+
+    def test_chart_loads_default_range(self, dialog, mock_metrics_store):
+        """Test the chart is fed the last 24 hours in 5 minute buckets."""
+        mock_get, mock_store = mock_metrics_store
+        mock_store.get_throughput_series.assert_called_with(hours=24, bucket_seconds=300)
+
+    def test_range_change_reloads_series(self, dialog, mock_metrics_store):
+        """Test selecting a range queries hourly buckets for a week."""
+        mock_get, mock_store = mock_metrics_store
+        mock_store.get_throughput_series.return_value = [
+            {'bucket_ts': int(time.time()) // 3600 * 3600, 'avg_speed': 2048.0},
+        ]
+
+        dialog._throughput_range_combo.setCurrentIndex(3)  # Last 7 Days
+
+        mock_store.get_throughput_series.assert_called_with(hours=24 * 7, bucket_seconds=3600)
+        assert len(dialog._throughput_chart._points) == 1
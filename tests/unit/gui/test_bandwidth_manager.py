@@ -635,6 +635,31 @@ class TestBandwidthManager:
         assert alpha_up == 0.75
         assert alpha_down == 0.18
 
+    def test_update_upload_limits_configures_shaper(self, qtbot, monkeypatch):
+        """Verify update_upload_limits reaches the shared shaper and QSettings."""
+        from src.gui.bandwidth_manager import BandwidthManager
+        from src.network.bandwidth_shaper import get_bandwidth_shaper
+
+        saved_values = {}
+        monkeypatch.setattr(QSettings, '__init__', lambda self, *args, **kwargs: None)
+        monkeypatch.setattr(QSettings, 'value', lambda self, key, default, type=None: default)
+        monkeypatch.setattr(QSettings, 'setValue',
+                            lambda self, key, value: saved_values.__setitem__(key, value))
+
+        manager = BandwidthManager()
+        try:
+            manager.update_upload_limits(4096, "imx=1024, rapidgator=512")
+
+            assert manager.get_upload_limit() == 4096
+            assert get_bandwidth_shaper().limits() == (
+                4096 * 1024, {'imx': 1024 * 1024, 'rapidgator': 512 * 1024})
+            assert saved_values[BandwidthManager.SETTINGS_KEY_UPLOAD_LIMIT] == 4096
+            assert saved_values[BandwidthManager.SETTINGS_KEY_HOST_UPLOAD_LIMITS] == "imx=1024, rapidgator=512"
+        finally:
+            manager.update_upload_limits(0, "")
+            manager.stop()
+        assert get_bandwidth_shaper().limits() == (0, {})
+
     # =========================================================================
     # Stop and Cleanup Tests
     # =========================================================================
@@ -0,0 +1,304 @@
+"""Tests for the model/view gallery table (GalleryTableModel, proxy and view)."""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+from src.gui.gallery_table_model import (
+    PROGRESS_ROLE, SORT_ROLE, GalleryFilterProxyModel, GalleryTableModel,
+)
+from src.gui.widgets.gallery_table import GalleryTableWidget
+from src.storage.queue_manager import GalleryQueueItem
+from src.utils.format_utils import format_binary_size
+
+COL = GalleryTableWidget
+
+
+class FakeQueueManager(QObject):
+    """Just the QueueManager surface the model uses."""
+
+    status_changed = pyqtSignal(str, str, str)
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = {item.path: item for item in items}
+        self.store = MagicMock()
+
+    def get_all_items(self):
+        return sorted(self.items.values(), key=lambda item: item.insertion_order)
+
+    def get_item(self, path):
+        return self.items.get(path)
+
+    def update_custom_field(self, path, field_name, value):
+        setattr(self.items[path], field_name, value)
+        return True
+
+
+def _item(n, **fields):
+    defaults = dict(path=f"/g/gallery{n}", name=f"Gallery {n}", db_id=n, insertion_order=n)
+    defaults.update(fields)
+    return GalleryQueueItem(**defaults)
+
+
+@pytest.fixture
+def queue(qapp):
+    return FakeQueueManager([
+        _item(1, status="completed", progress=100, total_images=10, uploaded_images=10,
+              total_size=3 * 1024 ** 2, tab_name="Main"),
+        _item(2, status="uploading", progress=40, total_images=10, uploaded_images=4,
+              total_size=1024, tab_name="Archive"),
+        _item(3, status="ready", tab_name="Main", media_type="video"),
+    ])
+
+
+@pytest.fixture
+def model(queue):
+    return GalleryTableModel(queue)
+
+
+def _text(model, row, col, role=Qt.ItemDataRole.DisplayRole):
+    return model.data(model.index(row, col), role)
+
+
+class TestGalleryTableModel:
+
+    def test_rows_follow_queue_order(self, model):
+        assert model.rowCount() == 3
+        assert model.columnCount() == len(COL.COLUMNS)
+        assert [_text(model, row, COL.COL_NAME) for row in range(3)] == [
+            "Gallery 1", "Gallery 2", "Gallery 3"]
+        assert model.headerData(COL.COL_NAME, Qt.Orientation.Horizontal) == "gallery name"
+
+    def test_cell_contents(self, model):
+        assert _text(model, 0, COL.COL_ORDER) == "1"
+        assert _text(model, 0, COL.COL_UPLOADED) == "10/10"
+        assert _text(model, 2, COL.COL_UPLOADED) == ""
+        assert _text(model, 0, COL.COL_SIZE) == format_binary_size(3 * 1024 ** 2, precision=2)
+        assert _text(model, 1, COL.COL_STATUS_TEXT) == "Uploading"
+        assert _text(model, 1, COL.COL_PROGRESS, PROGRESS_ROLE) == (40, "uploading")
+        assert _text(model, 0, COL.COL_NAME, Qt.ItemDataRole.UserRole) == "/g/gallery1"
+        assert _text(model, 2, COL.COL_MEDIA_TYPE, Qt.ItemDataRole.UserRole) == "video"
+        assert _text(model, 1, COL.COL_STATUS, Qt.ItemDataRole.UserRole) == "uploading"
+
+    def test_progress_provider_overrides_item_progress(self, queue):
+        model = GalleryTableModel(queue, progress_provider=lambda item: (7, "incomplete"))
+        assert _text(model, 0, COL.COL_PROGRESS, PROGRESS_ROLE) == (7, "incomplete")
+
+    def test_refresh_item_emits_row_scoped_data_changed(self, model, queue, qtbot):
+        queue.items["/g/gallery2"].uploaded_images = 5
+        with qtbot.waitSignal(model.dataChanged) as blocker:
+            model.refresh_item("/g/gallery2", [COL.COL_UPLOADED, COL.COL_PROGRESS])
+
+        top_left, bottom_right = blocker.args[:2]
+        assert (top_left.row(), top_left.column()) == (1, COL.COL_UPLOADED)
+        assert (bottom_right.row(), bottom_right.column()) == (1, COL.COL_PROGRESS)
+        assert _text(model, 1, COL.COL_UPLOADED) == "5/10"
+
+    def test_status_changed_refreshes_row(self, model, queue, qtbot):
+        with qtbot.waitSignal(model.dataChanged) as blocker:
+            queue.status_changed.emit("/g/gallery3", "ready", "queued")
+        assert blocker.args[0].row() == 2
+
+    def test_sync_inserts_and_removes_rows(self, model, queue, qtbot):
+        del queue.items["/g/gallery2"]
+        queue.items["/g/gallery4"] = _item(4)
+        with qtbot.waitSignal(model.rowsRemoved), qtbot.waitSignal(model.rowsInserted):
+            model.sync()
+
+        assert [model.path_for_row(row) for row in range(model.rowCount())] == [
+            "/g/gallery1", "/g/gallery3", "/g/gallery4"]
+        assert model.row_for_path("/g/gallery4") == 2
+        assert model.row_for_path("/g/gallery2") is None
+
+    def test_edit_custom_and_ext_columns(self, model, queue):
+        assert model.flags(model.index(0, COL.COL_CUSTOM1)) & Qt.ItemFlag.ItemIsEditable
+        assert not model.flags(model.index(0, COL.COL_NAME)) & Qt.ItemFlag.ItemIsEditable
+
+        assert model.setData(model.index(0, COL.COL_CUSTOM1), "note")
+        assert model.setData(model.index(0, COL.COL_EXT2), "ext")
+
+        assert queue.items["/g/gallery1"].custom1 == "note"
+        assert queue.items["/g/gallery1"].ext2 == "ext"
+        queue.store.update_item_custom_field.assert_called_once_with("/g/gallery1", "ext2", "ext")
+
+    def test_renamed_column_uses_unnamed_set(self, queue):
+        queue.items["/g/gallery1"].gallery_id = "abc"
+        queue.items["/g/gallery2"].image_host_id = "turbo"
+        model = GalleryTableModel(queue)
+        assert _text(model, 0, COL.COL_RENAMED, Qt.ItemDataRole.ToolTipRole) is None
+
+        model.set_unnamed_galleries(["abc"])
+
+        assert _text(model, 0, COL.COL_RENAMED, Qt.ItemDataRole.ToolTipRole) == "Pending rename"
+        assert _text(model, 1, COL.COL_RENAMED) == "N/A"
+
+
+class TestGalleryFilterProxyModel:
+
+    @pytest.fixture
+    def proxy(self, model):
+        proxy = GalleryFilterProxyModel()
+        proxy.setSourceModel(model)
+        return proxy
+
+    def _names(self, proxy):
+        return [proxy.index(row, COL.COL_NAME).data() for row in range(proxy.rowCount())]
+
+    def test_tab_filter(self, proxy):
+        proxy.set_tab("Main")
+        assert self._names(proxy) == ["Gallery 1", "Gallery 3"]
+
+        proxy.set_tab("Archive", tab_paths=["/g/gallery3"])
+        assert self._names(proxy) == ["Gallery 2", "Gallery 3"]
+
+        proxy.set_tab(GalleryFilterProxyModel.ALL_TABS)
+        assert proxy.rowCount() == 3
+
+    def test_text_filter(self, proxy):
+        proxy.set_text_filter("gallery2")
+        assert self._names(proxy) == ["Gallery 2"]
+
+    def test_sort_by_size_is_numeric(self, proxy, model):
+        assert isinstance(_text(model, 0, COL.COL_SIZE, SORT_ROLE), float)
+        proxy.sort(COL.COL_SIZE, Qt.SortOrder.DescendingOrder)
+        assert self._names(proxy) == ["Gallery 1", "Gallery 2", "Gallery 3"]
+
+    def test_online_imx_sorts_most_offline_first_in_both_directions(self, queue, qapp):
+        queue.items["/g/gallery1"].imx_status = "Online (10/10)"
+        queue.items["/g/gallery1"].imx_status_checked = 1_700_000_000
+        queue.items["/g/gallery2"].imx_status = "Partial (6/10)"
+        queue.items["/g/gallery2"].imx_status_checked = 1_700_000_000
+        proxy = GalleryFilterProxyModel()
+        proxy.setSourceModel(GalleryTableModel(queue))
+
+        for order in (Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder):
+            proxy.sort(COL.COL_ONLINE_IMX, order)
+            assert proxy.index(0, COL.COL_NAME).data() == "Gallery 2"
+
+    def test_live_update_is_resorted(self, proxy, queue, model):
+        proxy.sort(COL.COL_SIZE, Qt.SortOrder.DescendingOrder)
+
+        queue.items["/g/gallery3"].total_size = 10 * 1024 ** 3
+        model.refresh_item("/g/gallery3", [COL.COL_SIZE])
+
+        assert self._names(proxy)[0] == "Gallery 3"
+
+
+class TestGalleryTableView:
+
+    def test_view_filters_and_reports_selection(self, queue, qtbot):
+        from src.gui.widgets.gallery_table_view import GalleryTableView
+
+        view = GalleryTableView(queue)
+        qtbot.addWidget(view)
+        view.switch_to_tab("Main")
+
+        assert view.model().rowCount() == 2
+        assert view.isColumnHidden(COL.COL_STATUS_TEXT)
+        assert view.select_path("/g/gallery3")
+        assert view.selected_paths() == ["/g/gallery3"]
+        assert not view.select_path("/g/gallery2")  # Filtered out by the tab
+
+
+class TestModelViewMode:
+    """GalleryTableView wired into the main window behind gui/virtual_gallery_table."""
+
+    @pytest.fixture
+    def tabbed(self, queue, qtbot):
+        from src.gui.widgets.tabbed_gallery import TabbedGalleryWidget
+
+        widget = TabbedGalleryWidget()
+        qtbot.addWidget(widget)
+        widget.tab_manager = MagicMock()
+        widget.tab_manager.load_tab_galleries.return_value = []
+        widget.enable_model_view(queue)
+        return widget
+
+    def test_setting_defaults_off(self, tmp_path, monkeypatch):
+        from src.gui.widgets import gallery_table_view
+
+        config_file = tmp_path / "bbdrop.ini"
+        monkeypatch.setattr("src.utils.paths.get_config_path", lambda: str(config_file))
+        assert not gallery_table_view.model_view_enabled()
+
+        config_file.write_text("[Advanced]\ngui/virtual_gallery_table = True\n", encoding="utf-8")
+        assert gallery_table_view.model_view_enabled()
+
+    def test_view_replaces_widget_rows(self, tabbed):
+        assert tabbed.table.isHidden()
+        assert tabbed.table.rowCount() == 0
+        assert tabbed.hosts_delegate is tabbed.table_view.hosts_delegate
+        assert tabbed.action_delegate is tabbed.table_view.action_delegate
+        assert tabbed.gallery_count() == 3
+
+    def test_tab_filter_goes_through_proxy(self, tabbed):
+        tabbed._apply_filter("Archive")
+        assert tabbed.table_view.model().rowCount() == 1
+
+        tabbed._apply_filter("All Tabs")
+        assert tabbed.table_view.model().rowCount() == 3
+
+    def test_selected_paths(self, tabbed):
+        tabbed._apply_filter("Main")
+        tabbed.table_view.select_path("/g/gallery1")
+        assert tabbed.selected_gallery_paths() == ["/g/gallery1"]
+
+    def test_controller_adds_removes_and_refreshes_through_model(self, tabbed, queue):
+        from src.gui.gallery_table_controller import GalleryTableController
+
+        mw = MagicMock()
+        mw.gallery_table = tabbed
+        mw.path_to_row = {}
+        mw._last_scan_states = {}
+        controller = GalleryTableController(mw)
+        model = tabbed.table_view.gallery_model
+
+        new_item = _item(4, status="ready", tab_name="Main")
+        queue.items[new_item.path] = new_item
+        controller._add_gallery_to_table(new_item)
+        assert model.row_for_path("/g/gallery4") == 3
+        mw._populate_table_row.assert_not_called()
+
+        changed = []
+        model.dataChanged.connect(lambda top, bottom, roles: changed.append(top.row()))
+        controller._update_specific_gallery_display("/g/gallery2")
+        assert changed == [1]
+
+        del queue.items["/g/gallery1"]
+        controller._remove_gallery_from_table("/g/gallery1")
+        assert model.row_for_path("/g/gallery1") is None
+        assert model.rowCount() == 3
+        assert mw.path_to_row == {}
+
+    def test_initial_load_fills_model_without_rows_in_widget(self, tabbed, queue):
+        from src.gui.table_row_manager import TableRowManager
+
+        queue.store.get_all_file_host_uploads_batch.return_value = {
+            "/g/gallery1": [{"host_name": "rapidgator", "status": "completed"}],
+        }
+        queue.store.get_scan_status_by_gallery_host.return_value = {
+            ("/g/gallery1", "rapidgator"): {"status": "online"},
+        }
+        mw = MagicMock()
+        mw.gallery_table = tabbed
+        mw.queue_manager = queue
+        mw.path_to_row = {}
+        mw._get_unnamed_galleries.return_value = {}
+        progress = MagicMock()
+
+        TableRowManager(mw)._initialize_table_from_queue(progress)
+
+        model = tabbed.table_view.gallery_model
+        assert model.rowCount() == 3
+        assert tabbed.table.rowCount() == 0
+        hosts = model.index(0, COL.COL_HOSTS_STATUS)
+        assert set(hosts.data(Qt.ItemDataRole.UserRole + 1)) == {"rapidgator"}
+        assert hosts.data(Qt.ItemDataRole.UserRole + 2) == {"rapidgator": {"status": "online"}}
+        progress.assert_called_once_with(3, 3)
+        mw._populate_table_row.assert_not_called()
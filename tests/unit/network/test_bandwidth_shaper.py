@@ -0,0 +1,153 @@
+"""Tests for the token-bucket upload bandwidth shaper."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.network.bandwidth_shaper import (
+    MIN_BURST_BYTES, BandwidthShaper, TokenBucket, get_bandwidth_shaper, parse_host_limits,
+)
+
+
+class FakeClock:
+    """Drives time.monotonic and time.sleep in the shaper module."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch('src.network.bandwidth_shaper.time.monotonic', fake.monotonic), \
+            patch('src.network.bandwidth_shaper.time.sleep', fake.sleep):
+        yield fake
+
+
+class TestTokenBucket:
+
+    def test_unlimited_never_waits(self, clock):
+        bucket = TokenBucket(0)
+        bucket.consume(10 ** 9)
+        assert bucket.wait_time() == 0
+
+    def test_debt_is_repaid_at_rate(self, clock):
+        bucket = TokenBucket(100_000)
+        bucket.consume(MIN_BURST_BYTES + 50_000)
+        assert bucket.wait_time() == pytest.approx(0.5)
+
+        clock.now += 0.5
+        assert bucket.wait_time() == 0
+
+    def test_idle_credit_is_capped(self, clock):
+        bucket = TokenBucket(1_000_000)
+        clock.now += 60
+        bucket.consume(bucket.capacity + 1_000_000)
+        assert bucket.wait_time() == pytest.approx(1.0)
+
+    def test_rate_change_keeps_debt(self, clock):
+        bucket = TokenBucket(100_000)
+        bucket.consume(MIN_BURST_BYTES + 100_000)
+        bucket.set_rate(50_000)
+        assert bucket.wait_time() == pytest.approx(2.0)
+        bucket.set_rate(0)
+        assert bucket.wait_time() == 0
+
+
+class TestBandwidthShaper:
+
+    def test_no_limits_does_not_sleep(self, clock):
+        shaper = BandwidthShaper()
+        shaper.throttle('imx', 10 ** 9)
+        assert clock.slept == 0
+        assert not shaper.is_limited('imx')
+
+    def test_global_limit_paces_all_hosts(self, clock):
+        shaper = BandwidthShaper()
+        shaper.set_global_limit(100_000)
+        start = clock.now
+        for host in ('imx', 'rapidgator') * 10:
+            shaper.throttle(host, 50_000)
+        # 1 MB at 100 KB/s, less the initial burst
+        assert clock.now - start == pytest.approx((1_000_000 - MIN_BURST_BYTES) / 100_000, abs=0.01)
+
+    def test_host_limit_only_applies_to_that_host(self, clock):
+        shaper = BandwidthShaper()
+        shaper.configure(0, {'rapidgator': 100_000})
+        shaper.throttle('imx', 10 ** 7)
+        assert clock.slept == 0
+
+        shaper.throttle('rapidgator', MIN_BURST_BYTES + 200_000)
+        assert clock.slept == pytest.approx(2.0, abs=0.01)
+        assert shaper.limits() == (0, {'rapidgator': 100_000})
+
+    def test_slower_of_global_and_host_wins(self, clock):
+        shaper = BandwidthShaper()
+        shaper.configure(1_000_000, {'imx': 100_000})
+        shaper.throttle('imx', MIN_BURST_BYTES + 100_000)
+        assert clock.slept == pytest.approx(1.0, abs=0.01)
+
+    def test_configure_clears_unlisted_hosts(self, clock):
+        shaper = BandwidthShaper()
+        shaper.configure(0, {'imx': 100_000, 'turbo': 100_000})
+        shaper.configure(0, {'turbo': 200_000})
+        assert shaper.limits() == (0, {'turbo': 200_000})
+        assert not shaper.is_limited('imx')
+
+    def test_should_stop_ends_wait(self, clock):
+        shaper = BandwidthShaper()
+        shaper.set_global_limit(1_000)
+        shaper.throttle(None, MIN_BURST_BYTES + 100_000, should_stop=lambda: clock.slept > 0)
+        assert clock.slept < 1
+
+    def test_reserve_reports_delay_without_sleeping(self, clock):
+        shaper = BandwidthShaper()
+        shaper.set_global_limit(1_000)
+        assert shaper.reserve('imx', MIN_BURST_BYTES) == 0
+        assert shaper.reserve('imx', 2_000) == pytest.approx(2.0)
+        assert shaper.reserve('imx', 0) == pytest.approx(2.0)
+        assert clock.slept == 0
+        clock.now += 2
+        assert shaper.reserve('imx', 0) == 0
+
+    def test_lifting_limit_releases_waiting_transfer(self):
+        shaper = BandwidthShaper()
+        shaper.set_global_limit(1_000)
+        done = threading.Event()
+
+        def transfer():
+            shaper.throttle('imx', MIN_BURST_BYTES + 1_000_000)  # ~1000 s at the limit
+            done.set()
+
+        thread = threading.Thread(target=transfer, daemon=True)
+        thread.start()
+        time.sleep(0.05)
+        assert not done.is_set()
+        shaper.set_global_limit(0)
+        assert done.wait(2)
+
+    def test_shared_instance(self):
+        assert get_bandwidth_shaper() is get_bandwidth_shaper()
+
+
+class TestParseHostLimits:
+
+    def test_parses_pairs(self):
+        assert parse_host_limits("imx=2048, Rapidgator = 512,") == {'imx': 2048, 'rapidgator': 512}
+
+    def test_skips_invalid_entries(self):
+        assert parse_host_limits("imx, turbo=fast, pixhost=0, =5, k2s=10") == {'k2s': 10}
+
+    def test_empty(self):
+        assert parse_host_limits("") == {}
+        assert parse_host_limits(None) == {}
@@ -0,0 +1,170 @@
+"""Tests for CurlHandlePool — per-host reusable keep-alive curl handles."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pycurl
+import pytest
+
+from src.network.curl_pool import CurlHandlePool, get_curl_pool
+
+
+@pytest.fixture
+def keepalive_server():
+    """Local HTTP/1.1 server that keeps connections open between requests."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            body = b'ok'
+            if self.path == '/cookie':
+                body = (self.headers.get('Cookie') or '').encode()
+            self.send_response(200)
+            if self.path == '/login':
+                self.send_header('Set-Cookie', 'session=old-login; Path=/')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+    server.shutdown()
+    server.server_close()
+
+
+def _get(curl, url):
+    buf = BytesIO()
+    curl.setopt(pycurl.URL, url)
+    curl.setopt(pycurl.WRITEDATA, buf)
+    curl.perform()
+    return buf.getvalue()
+
+
+class TestCurlHandlePoolReuse:
+    """Handles and connections are reused across acquire/release cycles."""
+
+    def test_released_handle_is_reused(self):
+        pool = CurlHandlePool()
+        curl = pool.acquire('rapidgator')
+        pool.release('rapidgator', curl)
+        assert pool.acquire('rapidgator') is curl
+        stats = pool.stats('rapidgator')
+        assert stats['handles_created'] == 1
+        assert stats['handles_reused'] == 1
+        pool.close()
+
+    def test_hosts_do_not_share_handles(self):
+        pool = CurlHandlePool()
+        curl = pool.acquire('rapidgator')
+        pool.release('rapidgator', curl)
+        assert pool.acquire('keep2share') is not curl
+        pool.close()
+
+    def test_idle_list_is_capped(self):
+        pool = CurlHandlePool(max_idle_per_host=2)
+        handles = [pool.acquire('rapidgator') for _ in range(4)]
+        for curl in handles:
+            pool.release('rapidgator', curl)
+        assert pool.stats('rapidgator')['idle_handles'] == 2
+        pool.close()
+        assert pool.stats()['idle_handles'] == 0
+
+    def test_connection_reused_across_requests(self, keepalive_server):
+        pool = CurlHandlePool()
+        for _ in range(5):
+            curl = pool.acquire('local')
+            assert _get(curl, keepalive_server) == b'ok'
+            pool.release('local', curl)
+
+        stats = pool.stats('local')
+        assert stats['transfers'] == 5
+        assert stats['new_connections'] == 1
+        assert pool.handshakes_saved('local') == 4
+        pool.close()
+
+    def test_unperformed_handle_not_counted(self):
+        pool = CurlHandlePool()
+        pool.release('local', pool.acquire('local'))
+        assert pool.stats('local')['transfers'] == 0
+        pool.close()
+
+    def test_cookies_do_not_survive_release(self, keepalive_server):
+        pool = CurlHandlePool()
+        curl = pool.acquire('local')
+        curl.setopt(pycurl.COOKIEFILE, '')
+        _get(curl, keepalive_server + 'login')
+        assert _get(curl, keepalive_server + 'cookie') == b'session=old-login'
+        pool.release('local', curl)
+
+        reused = pool.acquire('local')
+        assert reused is curl
+        reused.setopt(pycurl.COOKIEFILE, '')
+        assert _get(reused, keepalive_server + 'cookie') == b''
+        assert reused.getinfo(pycurl.INFO_COOKIELIST) == []
+        pool.release('local', reused)
+        pool.close()
+
+    def test_concurrent_acquire_release(self, keepalive_server):
+        pool = CurlHandlePool()
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(5):
+                    curl = pool.acquire('local')
+                    _get(curl, keepalive_server)
+                    pool.release('local', curl)
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not errors
+        stats = pool.stats('local')
+        assert stats['transfers'] == 20
+        assert stats['handles_created'] <= 4
+        pool.close()
+
+
+class TestGetCurlPool:
+
+    def test_singleton(self):
+        assert get_curl_pool() is get_curl_pool()
+
+
+class TestFileHostClientPooling:
+    """FileHostClient routes its handles through the pool when given one."""
+
+    def _client(self, pool):
+        from src.network.file_host_client import FileHostClient
+        config = MagicMock()
+        config.name = 'TestHost'
+        config.requires_auth = False
+        return FileHostClient(config, MagicMock(), curl_pool=pool)
+
+    def test_without_pool_creates_fresh_handles(self):
+        client = self._client(None)
+        curl = client._new_curl()
+        assert isinstance(curl, pycurl.Curl)
+        client._done_curl(curl)
+
+    def test_with_pool_reuses_handles(self):
+        pool = CurlHandlePool()
+        client = self._client(pool)
+        curl = client._new_curl()
+        client._done_curl(curl)
+        assert client._new_curl() is curl
+        assert pool.stats('TestHost')['handles_reused'] == 1
+        pool.close()
@@ -7,8 +7,13 @@ and session management with full pycurl mocking.
 
 import pytest
 import json
+import os
 import time
 import hashlib
+import threading
+from email.policy import default as email_policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch, MagicMock
 
 import pycurl
@@ -16,6 +21,7 @@ import pycurl
 from src.network.file_host_client import FileHostClient
 from src.core.file_host_config import HostConfig
 from src.core.engine import AtomicCounter
+from src.utils.zip_stream import plan_stored_zip
 
 
 class TestFileHostClientInitialization:
@@ -516,6 +522,31 @@ class TestFileHostClientUploadMultistep:
         assert "403" in str(exc_info.value)
         assert "Invalid API key" in str(exc_info.value)
 
+    @patch('src.network.file_host_client.pycurl.Curl')
+    def test_multistep_uses_passed_file_hash(
+        self, mock_curl_class, mock_host_config, test_file, bandwidth_counter
+    ):
+        """A file_hash from the caller goes into the init URL without re-reading the file."""
+        mock_host_config.require_file_hash = True
+        mock_host_config.upload_init_url += "&hash={hash}"
+        mock_curl = MagicMock()
+        mock_curl_class.return_value = mock_curl
+        mock_curl.getinfo.return_value = 403
+
+        client = FileHostClient(
+            host_config=mock_host_config,
+            bandwidth_counter=bandwidth_counter,
+            credentials="api_key"
+        )
+
+        with patch.object(client, '_calculate_file_hash') as mock_hash:
+            with pytest.raises(Exception):
+                client.upload_file(test_file, file_hash="cafe0123")
+
+        mock_hash.assert_not_called()
+        urls = [c[0][1] for c in mock_curl.setopt.call_args_list if c[0][0] == pycurl.URL]
+        assert "hash=cafe0123" in urls[0]
+
     @patch('src.network.file_host_client.pycurl.Curl')
     @patch('time.sleep')
     def test_multistep_upload_poll_timeout(
@@ -1014,3 +1045,104 @@ class TestFileHostClientEdgeCases:
         # Test hash calculation
         calculated_hash = client._calculate_file_hash(test_file)
         assert calculated_hash == expected_hash
+
+
+class TestFileHostClientStreamedUpload:
+    """Uploads whose body is read from a planned ZIP (real pycurl, local server)."""
+
+    @pytest.fixture
+    def upload_server(self):
+        """Records each request's method, headers and body; answers with JSON."""
+        requests = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def _receive(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                requests.append((self.command, self.headers, body))
+                reply = json.dumps({"data": {"url": "abc", "id": "f1"}}).encode()
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(reply)))
+                self.end_headers()
+                self.wfile.write(reply)
+
+            do_POST = do_PUT = _receive
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f'http://127.0.0.1:{server.server_address[1]}/upload', requests
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def part(self, tmp_path):
+        folder = tmp_path / "gallery"
+        folder.mkdir()
+        for i in range(3):
+            (folder / f"img{i}.jpg").write_bytes(os.urandom(50_000))
+        files = sorted(folder.iterdir())
+        return plan_stored_zip(files, tmp_path / "never_written.zip")
+
+    def _config(self, url, method):
+        config = Mock(spec=HostConfig)
+        config.name = "StreamHost"
+        config.requires_auth = False
+        config.upload_endpoint = url
+        config.method = method
+        config.file_field = "filedata"
+        config.extra_fields = {"folder": "root"}
+        config.response_type = "json"
+        config.link_path = ["data", "url"]
+        config.link_prefix = "https://download.test/"
+        config.link_suffix = ""
+        config.link_regex = None
+        config.file_id_path = ["data", "id"]
+        config.get_server = None
+        config.upload_init_url = None
+        config.auth_type = None
+        config.upload_timeout = 30
+        config.inactivity_timeout = 30
+        return config
+
+    def test_post_streams_multipart_form(self, upload_server, part):
+        url, requests = upload_server
+        client = FileHostClient(host_config=self._config(url, "POST"), bandwidth_counter=AtomicCounter())
+
+        result = client.upload_file(part.path, stream=part)
+
+        assert result['url'] == 'https://download.test/abc'
+        assert not part.path.exists()
+        method, headers, body = requests[0]
+        assert method == 'POST'
+        message = BytesParser(policy=email_policy).parsebytes(
+            f"Content-Type: {headers['Content-Type']}\r\n\r\n".encode() + body)
+        fields = [(p.get_param('name', header='content-disposition'), p) for p in message.iter_parts()]
+        assert [name for name, _ in fields] == ['filedata', 'folder']
+        file_part = fields[0][1]
+        assert file_part.get_filename() == part.name
+        with part.open() as reader:
+            assert file_part.get_payload(decode=True) == reader.read()
+        assert fields[1][1].get_content().strip() == 'root'
+
+    def test_put_streams_raw_body(self, upload_server, part):
+        url, requests = upload_server
+        client = FileHostClient(host_config=self._config(url, "PUT"), bandwidth_counter=AtomicCounter())
+
+        client.upload_file(part.path, stream=part)
+
+        method, headers, body = requests[0]
+        assert method == 'PUT'
+        assert int(headers['Content-Length']) == part.size
+        with part.open() as reader:
+            assert body == reader.read()
+
+    def test_changed_source_fails_upload(self, upload_server, part, tmp_path):
+        url, requests = upload_server
+        client = FileHostClient(host_config=self._config(url, "PUT"), bandwidth_counter=AtomicCounter())
+        (tmp_path / "gallery" / "img1.jpg").write_bytes(b"edited")
+
+        with pytest.raises(RuntimeError, match="changed"):
+            client.upload_file(part.path, stream=part)
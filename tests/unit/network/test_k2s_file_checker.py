@@ -1,5 +1,7 @@
 """Tests for K2SFileChecker — file availability via getFilesInfo API."""
 
+import threading
+
 import pytest
 from unittest.mock import patch, Mock
 
@@ -252,3 +254,58 @@ class TestCheckGalleryFromInventory:
             {'f1': 'http://k2s.cc/f1'}, inventory)
         assert result['status'] == 'offline'
         assert result['offline'] == 1
+
+
+class TestWalkFolders:
+    """Test the concurrent folder walk."""
+
+    def _make_checker(self):
+        return K2SFileChecker(api_base="https://k2s.cc/api/v2", auth_token="fake")
+
+    def _tree_api(self, tree, failing=()):
+        """Fake _api_post serving a {folder_id: [subfolder ids]} tree, one file per folder."""
+        def mock_post(endpoint, body):
+            if endpoint == 'getFoldersList':
+                return {'status': 'success', 'foldersIds': tree.get(body.get('parent_id', '/'), [])}
+            folder_id = body['parent']
+            if folder_id in failing:
+                raise Exception("HTTP 500")
+            return {'status': 'success', 'files': [
+                {'id': f'file-{folder_id}', 'size': 1, 'extended_info': {'storage_object': 'available'}}
+            ]}
+        return mock_post
+
+    def test_yields_every_folder_with_parent(self):
+        checker = self._make_checker()
+        tree = {'/': ['a', 'b'], 'a': ['a1', 'a2'], 'b': ['b1']}
+        with patch.object(checker, '_api_post', side_effect=self._tree_api(tree)):
+            listings = list(checker.walk_folders(max_workers=3))
+
+        assert listings[0].folder_id == '/'
+        parents = {listing.folder_id: listing.parent_id for listing in listings}
+        assert parents == {'/': None, 'a': '/', 'b': '/', 'a1': 'a', 'a2': 'a', 'b1': 'b'}
+        assert all(listing.files is not None for listing in listings)
+
+    def test_failed_file_listing_reported(self):
+        checker = self._make_checker()
+        with patch.object(checker, '_api_post', side_effect=self._tree_api({'/': ['a', 'b']}, failing={'b'})):
+            listings = {listing.folder_id: listing for listing in checker.walk_folders()}
+
+        assert listings['a'].files[0]['id'] == 'file-a'
+        assert listings['b'].files is None
+
+    def test_folder_cycle_is_walked_once(self):
+        checker = self._make_checker()
+        with patch.object(checker, '_api_post', side_effect=self._tree_api({'/': ['a'], 'a': ['a', '/']})):
+            listings = list(checker.walk_folders())
+
+        assert sorted(listing.folder_id for listing in listings) == ['/', 'a']
+
+    def test_cancel_stops_walk(self):
+        checker = self._make_checker()
+        cancel = threading.Event()
+        with patch.object(checker, '_api_post', side_effect=self._tree_api({'/': ['a'], 'a': ['a1']})):
+            walk = checker.walk_folders(cancel_event=cancel)
+            assert next(walk).folder_id == '/'
+            cancel.set()
+            assert list(walk) == []
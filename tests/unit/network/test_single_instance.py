@@ -0,0 +1,41 @@
+"""Tests for the single instance handoff client."""
+
+import socket
+import threading
+
+from src.network.single_instance import check_single_instance
+
+
+def _listener():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    return server
+
+
+class TestCheckSingleInstance:
+
+    def test_sends_folder_to_running_instance(self):
+        server = _listener()
+        received = []
+
+        def accept():
+            client, _ = server.accept()
+            received.append(client.recv(1024).decode('utf-8'))
+            client.close()
+
+        thread = threading.Thread(target=accept)
+        thread.start()
+        try:
+            assert check_single_instance("/galleries/new", port=server.getsockname()[1]) is True
+            thread.join(timeout=5)
+        finally:
+            server.close()
+        assert received == ["/galleries/new"]
+
+    def test_no_instance_running(self):
+        server = _listener()
+        port = server.getsockname()[1]
+        server.close()
+
+        assert check_single_instance(port=port) is False
@@ -1,5 +1,8 @@
 """Tests for ThumbnailChecker — batch thumbnail liveness via HEAD + ETag."""
 
+import threading
+import time
+
 import pytest
 from unittest.mock import patch, Mock, call
 
@@ -131,3 +134,118 @@ class TestThumbnailCheckerProgress:
 
         assert len(progress_calls) > 0
         assert progress_calls[-1] == (5, 5)
+
+
+@pytest.fixture
+def thumb_server():
+    """Local keep-alive server: /live* is online, /gone* is 404, /dead* has a dead ETag.
+
+    /slow* answers like /live* after 0.2s.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from src.network.dead_image_etags import DEAD_IMAGE_ETAGS
+
+    dead_etag = next(iter(DEAD_IMAGE_ETAGS))
+    requested = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_HEAD(self):
+            requested.append(self.path)
+            if self.path.startswith('/slow'):
+                time.sleep(0.2)
+            if self.path.startswith('/gone'):
+                self.send_response(404)
+            elif self.path.startswith('/err'):
+                self.send_response(503)
+            else:
+                self.send_response(200)
+                self.send_header('ETag', dead_etag if self.path.startswith('/dead') else '"live-1"')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}', requested
+    server.shutdown()
+    server.server_close()
+
+
+class TestCheckGalleries:
+    """Multiplexed check_galleries() against a local HTTP server."""
+
+    def test_classifies_each_gallery(self, thumb_server):
+        base, _ = thumb_server
+        galleries = [
+            ('live', [f'{base}/live{i}.jpg' for i in range(10)]),
+            ('dead', [f'{base}/dead{i}.jpg' for i in range(3)]),
+            ('mixed', [f'{base}/live0.jpg', f'{base}/gone0.jpg', f'{base}/err0.jpg']),
+        ]
+        results = dict(ThumbnailChecker().check_galleries(galleries, max_connections=2))
+
+        assert results['live']['status'] == 'online'
+        assert results['live']['online'] == 10
+        assert results['dead']['status'] == 'offline'
+        assert len(results['dead']['offline_urls']) == 3
+        assert results['mixed']['status'] == 'partial'
+        assert (results['mixed']['online'], results['mixed']['offline'], results['mixed']['errors']) == (1, 1, 1)
+
+    def test_empty_gallery_is_unknown(self, thumb_server):
+        results = dict(ThumbnailChecker().check_galleries([('empty', [])]))
+        assert results['empty']['status'] == 'unknown'
+        assert results['empty']['total'] == 0
+
+    def test_early_exit_skips_remaining_requests(self, thumb_server):
+        base, requested = thumb_server
+        urls = [f'{base}/dead{i}.jpg' for i in range(40)]
+        results = dict(ThumbnailChecker().check_galleries([('g', urls)], early_exit_threshold=5))
+
+        assert results['g']['status'] == 'offline'
+        assert results['g']['offline'] == 40
+        assert len(requested) == 5
+
+    def test_checks_galleries_concurrently(self, thumb_server):
+        """All galleries come back from one loop, with throughput recorded."""
+        base, requested = thumb_server
+        galleries = [(n, [f'{base}/live{n}-{i}.jpg' for i in range(3)]) for n in range(6)]
+        checker = ThumbnailChecker()
+        results = dict(checker.check_galleries(galleries, max_connections=4))
+
+        assert len(results) == 6
+        assert all(r['status'] == 'online' for r in results.values())
+        assert checker.last_stats['checks'] == 18
+        assert checker.last_stats['galleries'] == 6
+        assert checker.last_stats['checks_per_sec'] > 0
+
+    def test_slow_host_requests_are_not_queued_into_timeouts(self, thumb_server):
+        """Over HTTP/1.1 only one request per connection is handed to libcurl,
+        so requests waiting for a connection don't spend their timeout queued."""
+        base, _ = thumb_server
+        galleries = [('slow', [f'{base}/slow{i}.jpg' for i in range(10)])]
+        with patch('src.network.thumbnail_checker.HEAD_TIMEOUT', 1):
+            results = dict(ThumbnailChecker().check_galleries(
+                galleries, max_connections=1, early_exit_threshold=0))
+
+        assert results['slow']['online'] == 10
+        assert results['slow']['errors'] == 0
+
+    def test_progress_reports_per_gallery(self, thumb_server):
+        base, _ = thumb_server
+        calls = []
+        galleries = [('a', [f'{base}/live{i}.jpg' for i in range(4)])]
+        list(ThumbnailChecker().check_galleries(
+            galleries, progress_callback=lambda key, checked, total: calls.append((key, checked, total))))
+        assert calls[-1] == ('a', 4, 4)
+
+    def test_cancel_stops_without_yielding(self, thumb_server):
+        base, requested = thumb_server
+        cancel = threading.Event()
+        cancel.set()
+        galleries = [('a', [f'{base}/live{i}.jpg' for i in range(50)])]
+        assert list(ThumbnailChecker().check_galleries(galleries, cancel_event=cancel)) == []
+        assert requested == []
@@ -0,0 +1,141 @@
+"""Tests for batch artifact regeneration."""
+
+import json
+import os
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.processing.artifact_regeneration import RegenJob, regenerate_artifacts
+from src.storage.database import QueueStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return QueueStore(str(tmp_path / "test.db"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_paths(tmp_path):
+    """Keep templates and central storage inside tmp_path; no host BBCode formats."""
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / ".template Batch.txt").write_text(
+        "#POSTTITLE: Title #folderName#\n"
+        "[b]#folderName#[/b] #width#x#height#\n#allImages#\n[if hostLinks]#hostLinks#[/if]",
+        encoding="utf-8",
+    )
+    with patch('src.utils.templates.get_template_path', return_value=str(template_dir)), \
+            patch('src.utils.paths.get_central_storage_path', return_value=str(tmp_path / "central")), \
+            patch('src.utils.template_utils.get_file_host_setting', return_value=''), \
+            patch('src.utils.template_utils.get_config_manager', return_value=Mock(hosts={})):
+        yield
+
+
+def _make_gallery(store, tmp_path, name, gallery_id, with_json=True, images=()):
+    gallery_dir = tmp_path / name
+    gallery_dir.mkdir()
+    path = os.path.normpath(str(gallery_dir))
+    store.bulk_upsert([{
+        'path': path,
+        'name': name,
+        'status': 'completed',
+        'added_time': 1700000000,
+        'gallery_id': gallery_id,
+        'uploaded_files': [fname for fname, _ in images],
+        'uploaded_images_data': list(images),
+    }])
+    if with_json:
+        uploaded = gallery_dir / ".uploaded"
+        uploaded.mkdir()
+        (uploaded / f"{name}_{gallery_id}.json").write_text(json.dumps({
+            'meta': {'gallery_id': gallery_id, 'gallery_name': name},
+            'stats': {'successful_count': 1, 'total_size': 1024 * 1024, 'avg_width': 0, 'avg_height': 0},
+            'images': [{'original_filename': 'a.jpg', 'bbcode': f'[img]{name}.jpg[/img]'}],
+        }), encoding="utf-8")
+    return path
+
+
+def _read_bbcode(path, name, gallery_id):
+    with open(os.path.join(path, ".uploaded", f"{name}_{gallery_id}_bbcode.txt"), encoding="utf-8") as f:
+        return f.read()
+
+
+class TestRegenerateArtifacts:
+
+    def test_regenerates_from_json_with_batch_lookups(self, store, tmp_path):
+        images = [('a.jpg', {'image_url': 'https://imx.to/i/a', 'width': 640, 'height': 480})]
+        paths = [_make_gallery(store, tmp_path, f"gal{i}", f"id{i}", images=images) for i in range(3)]
+        upload_id = store.add_file_host_upload(gallery_path=paths[0], host_name='rapidgator', status='completed')
+        store.update_file_host_upload(upload_id, download_url='https://rg.example/file/1')
+        progress = []
+
+        # Dimensions come from the images table; the folders hold no image files
+        with patch.object(store, 'get_file_host_uploads', side_effect=AssertionError("per-gallery query")):
+            summary = regenerate_artifacts(
+                store,
+                [RegenJob(path=p, template_name="Batch", gallery_name=f"gal{i}", gallery_id=f"id{i}")
+                 for i, p in enumerate(paths)],
+                progress_callback=lambda done, total, _path: progress.append((done, total)),
+                store_in_uploaded=True,
+                store_in_central=False,
+            )
+
+        assert len(summary.regenerated) == 3
+        assert not summary.failed and not summary.skipped
+        assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+        assert _read_bbcode(paths[0], "gal0", "id0") == (
+            "[b]gal0[/b] 640x480\n[img]gal0.jpg[/img]\nhttps://rg.example/file/1"
+        )
+        assert _read_bbcode(paths[1], "gal1", "id1") == "[b]gal1[/b] 640x480\n[img]gal1.jpg[/img]"
+        with open(os.path.join(paths[0], ".uploaded", "gal0_id0.json"), encoding="utf-8") as f:
+            payload = json.load(f)
+        assert payload['meta']['gallery_title'] == "Title gal0"
+        assert payload['file_hosts'][0]['download_url'] == 'https://rg.example/file/1'
+
+    def test_missing_json_uses_db_image_urls(self, store, tmp_path):
+        images = [('a.jpg', {'image_url': 'https://imx.to/i/a', 'thumb_url': 'https://imx.to/t/a.jpg',
+                             'width': 100, 'height': 50})]
+        rebuilt = _make_gallery(store, tmp_path, "rebuilt", "rid", with_json=False, images=images)
+        empty = _make_gallery(store, tmp_path, "empty", "eid", with_json=False)
+
+        summary = regenerate_artifacts(
+            store,
+            [RegenJob(path=rebuilt, template_name="Batch", gallery_name="rebuilt", gallery_id="rid"),
+             RegenJob(path=empty, template_name="Batch", gallery_name="empty", gallery_id="eid")],
+            store_in_uploaded=True,
+            store_in_central=False,
+        )
+
+        assert [job.path for job in summary.regenerated] == [rebuilt]
+        assert [job.path for job in summary.skipped] == [empty]
+        assert _read_bbcode(rebuilt, "rebuilt", "rid") == (
+            "[b]rebuilt[/b] 100x50\n[url=https://imx.to/i/a][img]https://imx.to/t/a.jpg[/img][/url]"
+        )
+
+    def test_unknown_template_falls_back_to_default(self, store, tmp_path):
+        images = [('a.jpg', {'image_url': 'https://imx.to/i/a', 'width': 640, 'height': 480})]
+        path = _make_gallery(store, tmp_path, "gal", "gid", images=images)
+
+        summary = regenerate_artifacts(
+            store, [RegenJob(path=path, template_name="Nope", gallery_name="gal", gallery_id="gid")],
+            store_in_uploaded=True, store_in_central=False,
+        )
+
+        assert len(summary.regenerated) == 1
+        assert _read_bbcode(path, "gal", "gid") == "gal\n[img]gal.jpg[/img]"
+
+    def test_cancel_leaves_galleries_untouched(self, store, tmp_path):
+        path = _make_gallery(store, tmp_path, "gal", "gid")
+        cancel = threading.Event()
+        cancel.set()
+
+        summary = regenerate_artifacts(
+            store, [RegenJob(path=path, gallery_name="gal", gallery_id="gid")],
+            cancel_event=cancel, store_in_uploaded=True, store_in_central=False,
+        )
+
+        assert summary.cancelled
+        assert not summary.regenerated
+        assert not os.path.exists(os.path.join(path, ".uploaded", "gal_gid_bbcode.txt"))
@@ -591,6 +591,84 @@ class TestFileHostWorkerProcessUpload:
         # Should update database with failure
         mock_queue_store.update_file_host_upload.assert_called()
 
+    @patch('src.processing.file_host_workers.is_family_dedup_enabled', return_value=False)
+    @patch('src.processing.file_host_workers.get_config_manager')
+    @patch('src.processing.file_host_workers.get_coordinator')
+    @patch('src.processing.file_host_workers.get_archive_manager')
+    @patch('src.processing.file_host_workers.QSettings')
+    def test_store_zip_streamed_when_enabled(self, mock_qsettings, mock_archive_mgr,
+                                             mock_coord, mock_config_mgr, mock_family, tmp_path):
+        """ZIP + store with streaming on uploads planned parts; no archive is built"""
+        from src.utils.archive_manager import ArchiveManager
+
+        mock_config = Mock()
+        mock_config.name = "TestHost"
+        mock_config.require_file_hash = True
+        mock_config_mgr.return_value.get_host.return_value = mock_config
+        gallery = tmp_path / "gallery"
+        gallery.mkdir()
+        (gallery / "a.jpg").write_bytes(b"\xff\xd8" + b"x" * 5000)
+
+        mock_queue_store = Mock()
+        mock_queue_store.get_file_host_uploads.return_value = []
+        worker = FileHostWorker("testhost", mock_queue_store)
+        worker.archive_manager = ArchiveManager(temp_dir=tmp_path / "temp")
+        worker._get_or_create_archive = Mock()
+        client = Mock()
+        client.upload_file.return_value = {'status': 'success', 'url': 'u', 'file_id': 'f'}
+        worker._create_client = Mock(return_value=client)
+
+        defaults = {'archive_format': 'zip', 'archive_compression': 'store',
+                    'archive_stream_uploads': True}
+        with patch('src.utils.paths.load_user_defaults', return_value=defaults), \
+                patch('src.utils.metrics_store.get_metrics_store', return_value=None):
+            worker._process_upload(upload_id=1, db_id=7, gallery_path=str(gallery),
+                                   gallery_name="G", host_name="testhost", host_config=mock_config)
+
+        worker._get_or_create_archive.assert_not_called()
+        part = worker.archive_manager.stream_cache[7][0]
+        kwargs = client.upload_file.call_args.kwargs
+        assert kwargs['stream'] is part
+        assert kwargs['file_hash'] == part.md5()
+        assert not (tmp_path / "temp" / "streamed").exists()
+
+    @patch('src.processing.file_host_workers.is_family_dedup_enabled', return_value=False)
+    @patch('src.processing.file_host_workers.get_config_manager')
+    @patch('src.processing.file_host_workers.get_coordinator')
+    @patch('src.processing.file_host_workers.get_archive_manager')
+    @patch('src.processing.file_host_workers.QSettings')
+    def test_split_written_to_disk_with_unsupported_splitzip(self, mock_qsettings, mock_archive_mgr,
+                                                             mock_coord, mock_config_mgr, mock_family,
+                                                             tmp_path):
+        """Split streaming falls back to a written archive if splitzip is not the pinned version"""
+        mock_config = Mock()
+        mock_config.name = "TestHost"
+        mock_config_mgr.return_value.get_host.return_value = mock_config
+        gallery = tmp_path / "gallery"
+        gallery.mkdir()
+        (gallery / "a.jpg").write_bytes(b"\xff\xd8" + b"x" * 5000)
+        archive = tmp_path / "a.zip"
+        archive.write_bytes(b"PK")
+
+        worker = FileHostWorker("testhost", Mock(get_file_host_uploads=Mock(return_value=[])))
+        worker._get_streamed_archive = Mock()
+        worker._get_or_create_archive = Mock(return_value=[archive])
+        client = Mock()
+        client.upload_file.return_value = {'status': 'success', 'url': 'u', 'file_id': 'f'}
+        worker._create_client = Mock(return_value=client)
+
+        defaults = {'archive_format': 'zip', 'archive_compression': 'store',
+                    'archive_stream_uploads': True, 'archive_split_enabled': True,
+                    'archive_split_size_mb': 100}
+        with patch('src.utils.paths.load_user_defaults', return_value=defaults), \
+                patch('src.utils.zip_stream.split_streaming_supported', return_value=False), \
+                patch('src.utils.metrics_store.get_metrics_store', return_value=None):
+            worker._process_upload(upload_id=1, db_id=7, gallery_path=str(gallery),
+                                   gallery_name="G", host_name="testhost", host_config=mock_config)
+
+        worker._get_streamed_archive.assert_not_called()
+        worker._get_or_create_archive.assert_called_once()
+
 
 class TestFileHostWorkerEdgeCases:
     """Test edge cases and error handling"""
@@ -628,3 +706,238 @@ class TestFileHostWorkerEdgeCases:
 
         # Should handle error gracefully
         assert "testhost" not in worker.host_credentials
+
+
+class TestFileHostWorkerLanes:
+    """Test concurrent upload lanes"""
+
+    def _make_worker(self, mock_config_mgr, queue_store=None):
+        mock_config = Mock()
+        mock_config.name = "TestHost"
+        mock_config.requires_auth = False
+        mock_config_mgr.return_value.get_host.return_value = mock_config
+        return FileHostWorker("testhost", queue_store or Mock()), mock_config
+
+    @patch('src.processing.file_host_workers.get_file_host_setting', return_value=4)
+    @patch('src.processing.file_host_workers.get_config_manager')
+    @patch('src.processing.file_host_workers.get_coordinator')
+    @patch('src.processing.file_host_workers.get_archive_manager')
+    @patch('src.processing.file_host_workers.QSettings')
+    def test_lane_limit_capped_by_coordinator(self, mock_qsettings, mock_archive_mgr,
+                                              mock_coord, mock_config_mgr, mock_setting):
+        """max_connections is capped by the coordinator's per-host limit"""
+        mock_coord.return_value.per_host_limit = 2
+        worker, _ = self._make_worker(mock_config_mgr)
+        assert worker._lane_limit() == 2
+
+        mock_coord.return_value.per_host_limit = 8
+        assert worker._lane_limit() == 4
+
+    @patch('src.processing.file_host_workers.get_config_manager')
+    @patch('src.processing.file_host_workers.get_coordinator')
+    @patch('src.processing.file_host_workers.get_archive_manager')
+    @patch('src.processing.file_host_workers.QSettings')
+    def test_cancel_targets_single_lane(self, mock_qsettings, mock_archive_mgr,
+                                        mock_coord, mock_config_mgr):
+        """cancel_current_upload(db_id) cancels only that gallery's lane"""
+        import threading
+        from src.processing.file_host_coordinator import FileHostCoordinator
+
+        mock_coord.return_value = FileHostCoordinator(global_limit=4, per_host_limit=4)
+        worker, host_config = self._make_worker(mock_config_mgr)
+
+        started = threading.Barrier(3, timeout=5)
+        cancelled = {}
+
+        def fake_process(row, host_config=None):
+            started.wait()  # both lanes running at the same time
+            deadline = time.time() + 2
+            while time.time() < deadline and not worker._is_cancelled():
+                time.sleep(0.01)
+            cancelled[row['gallery_fk']] = worker._is_cancelled()
+
+        with patch.object(worker, '_process_single_pending_row', side_effect=fake_process):
+            for upload_id, db_id in ((1, 10), (2, 20)):
+                worker._start_lane(
+                    {'id': upload_id, 'gallery_fk': db_id, 'host_name': 'testhost'},
+                    host_config, threaded=True,
+                )
+            started.wait()
+            assert {u['db_id'] for u in worker.get_active_uploads()} == {10, 20}
+            worker.cancel_current_upload(db_id=10)
+            worker._join_lanes()
+
+        assert cancelled == {10: True, 20: False}
+        assert worker.get_active_uploads() == []
+
+    @patch('src.processing.file_host_workers.get_config_manager')
+    @patch('src.processing.file_host_workers.get_coordinator')
+    @patch('src.processing.file_host_workers.get_archive_manager')
+    @patch('src.processing.file_host_workers.QSettings')
+    def test_lane_waits_through_slot_timeouts(self, mock_qsettings, mock_archive_mgr,
+                                              mock_coord, mock_config_mgr):
+        """A slot timeout keeps the lane registered and retries instead of exiting"""
+        from contextlib import contextmanager
+
+        attempts = []
+
+        @contextmanager
+        def acquire_slot(db_id, host_name, timeout=None):
+            attempts.append(db_id)
+            if len(attempts) < 3:
+                raise TimeoutError("no slot")
+            yield
+
+        mock_coord.return_value.acquire_slot.side_effect = acquire_slot
+        row = {'id': 1, 'gallery_fk': 10, 'host_name': 'testhost'}
+        queue_store = Mock()
+        queue_store.get_pending_file_host_uploads.return_value = [row]
+        worker, host_config = self._make_worker(mock_config_mgr, queue_store)
+
+        seen_active = []
+
+        def fake_process(upload, host_config=None):
+            seen_active.append(worker.get_active_uploads())
+
+        with patch.object(worker, '_process_single_pending_row', side_effect=fake_process):
+            worker._start_lane(row, host_config, threaded=False)
+
+        assert attempts == [10, 10, 10]
+        assert seen_active == [[{'upload_id': 1, 'db_id': 10, 'host_name': 'testhost'}]]
+        assert worker.get_active_uploads() == []
+
+    @patch('src.processing.file_host_workers.get_config_manager')
+    @patch('src.processing.file_host_workers.get_coordinator')
+    @patch('src.processing.file_host_workers.get_archive_manager')
+    @patch('src.processing.file_host_workers.QSettings')
+    def test_current_upload_tracked_per_lane(self, mock_qsettings, mock_archive_mgr,
+                                             mock_coord, mock_config_mgr):
+        """Each lane reads back its own current_* values while others run"""
+        import threading
+        from src.processing.file_host_coordinator import FileHostCoordinator
+
+        mock_coord.return_value = FileHostCoordinator(global_limit=4, per_host_limit=4)
+        worker, host_config = self._make_worker(mock_config_mgr)
+
+        started = threading.Barrier(2, timeout=5)
+        seen = {}
+
+        def fake_process(row, host_config=None):
+            worker.current_upload_id = row['id']
+            worker.current_db_id = row['gallery_fk']
+            worker.current_host = 'testhost'
+            started.wait()  # both lanes have written their fields
+            seen[row['id']] = (worker.current_upload_id, worker.current_db_id)
+
+        with patch.object(worker, '_process_single_pending_row', side_effect=fake_process):
+            for upload_id, db_id in ((1, 10), (2, 20)):
+                worker._start_lane(
+                    {'id': upload_id, 'gallery_fk': db_id, 'host_name': 'testhost'},
+                    host_config, threaded=True,
+                )
+            worker._join_lanes()
+
+        assert seen == {1: (1, 10), 2: (2, 20)}
+        assert worker.get_current_upload_info() is None
+
+    @patch('src.processing.file_host_workers.get_file_host_setting')
+    @patch('src.processing.file_host_workers.get_config_manager')
+    @patch('src.processing.file_host_workers.get_coordinator')
+    @patch('src.processing.file_host_workers.get_archive_manager')
+    @patch('src.processing.file_host_workers.QSettings')
+    def test_run_dispatches_galleries_concurrently(self, mock_qsettings, mock_archive_mgr,
+                                                   mock_coord, mock_config_mgr, mock_setting,
+                                                   tmp_path):
+        """run() fills free lanes but never runs one gallery in two lanes"""
+        import threading
+        from src.processing.file_host_coordinator import FileHostCoordinator
+
+        mock_setting.side_effect = lambda host, key, type_hint=None: {
+            'max_connections': 3, 'enabled': True,
+        }.get(key)
+        mock_coord.return_value = FileHostCoordinator(global_limit=3, per_host_limit=3)
+
+        rows = [
+            {'id': 1, 'gallery_fk': 10, 'host_name': 'testhost', 'gallery_path': str(tmp_path)},
+            {'id': 2, 'gallery_fk': 10, 'host_name': 'testhost', 'gallery_path': str(tmp_path)},
+            {'id': 3, 'gallery_fk': 20, 'host_name': 'testhost', 'gallery_path': str(tmp_path)},
+        ]
+        done = set()
+        queue_store = Mock()
+        queue_store.get_pending_file_host_uploads.side_effect = (
+            lambda host_name=None: [r for r in rows if r['id'] not in done]
+        )
+        worker, _ = self._make_worker(mock_config_mgr, queue_store)
+
+        lock = threading.Lock()
+        running = set()
+        overlaps = []
+        max_parallel = [0]
+
+        def fake_process(row, host_config=None):
+            with lock:
+                if row['gallery_fk'] in {g for _, g in running}:
+                    overlaps.append(row['id'])
+                running.add((row['id'], row['gallery_fk']))
+                max_parallel[0] = max(max_parallel[0], len(running))
+            time.sleep(0.3)
+            with lock:
+                running.discard((row['id'], row['gallery_fk']))
+                done.add(row['id'])
+
+        with patch.object(worker, '_process_single_pending_row', side_effect=fake_process):
+            thread = threading.Thread(target=worker.run)
+            thread.start()
+            deadline = time.time() + 10
+            while len(done) < 3 and time.time() < deadline:
+                time.sleep(0.05)
+            worker._stop_event.set()
+            thread.join(timeout=5)
+
+        assert done == {1, 2, 3}
+        assert overlaps == []
+        assert max_parallel[0] == 2
+
+
+class TestFileHostWorkerDispatch:
+    """Test event-driven dispatch in the run loop"""
+
+    @patch('src.processing.file_host_workers.get_file_host_setting')
+    @patch('src.processing.file_host_workers.get_config_manager')
+    @patch('src.processing.file_host_workers.get_coordinator')
+    @patch('src.processing.file_host_workers.get_archive_manager')
+    @patch('src.processing.file_host_workers.QSettings')
+    def test_idle_worker_waits_for_signal(self, mock_qsettings, mock_archive_mgr,
+                                          mock_coord, mock_config_mgr, mock_setting):
+        """An idle worker does not poll the DB and wakes as soon as work is signalled"""
+        import threading
+        from src.storage.work_signal import WorkSignal
+
+        mock_setting.return_value = 1
+        mock_coord.return_value.per_host_limit = 1
+        mock_config = Mock()
+        mock_config.name = "TestHost"
+        mock_config.requires_auth = False
+        mock_config_mgr.return_value.get_host.return_value = mock_config
+
+        queue_store = Mock()
+        queue_store.get_pending_file_host_uploads.return_value = []
+        worker = FileHostWorker("testhost", queue_store)
+        worker._work_signal = WorkSignal()
+
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        try:
+            time.sleep(0.5)
+            assert queue_store.get_pending_file_host_uploads.call_count == 1
+
+            worker._work_signal.notify("testhost")
+            deadline = time.time() + 2
+            while queue_store.get_pending_file_host_uploads.call_count < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            assert queue_store.get_pending_file_host_uploads.call_count == 2
+        finally:
+            worker._stop_event.set()
+            worker._work_signal.notify("testhost")
+            thread.join(timeout=5)
+        assert not thread.is_alive()
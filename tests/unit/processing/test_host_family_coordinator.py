@@ -173,25 +173,25 @@ class TestCoordinatorNoOpCases:
         assert _row_status(store, path, "keep2share") in ("pending", "completed")
 
 
+def _drain_md5_pollers(coord, timeout=5.0):
+    """Wait until every md5 poller has applied its last result and gone idle."""
+    for poller in list(coord._md5_pollers.values()):
+        assert poller.join(timeout)
+
+
 class TestCoordinatorMd5Poller:
-    """Covers the NULL-md5 path where the coordinator spawns a background
-    poller instead of unblocking siblings immediately. Tests run the poller
-    synchronously by overriding `_schedule_md5_fetch` — no real threading
-    or HTTP happens.
+    """Covers the NULL-md5 path where the coordinator hands the primary to
+    the host's md5 poller instead of unblocking siblings immediately. The
+    poller runs with zero delays and each test waits for it to go idle; no
+    real HTTP happens.
     """
 
     @pytest.fixture
-    def sync_coord(self, store):
-        """Coordinator that runs the md5 poller synchronously on this thread."""
-        c = HostFamilyCoordinator(queue_store=store)
-
-        def _run_sync(gallery_fk, family, primary_row_id, host_name, canonical_file_id):
-            hfc_module._md5_fetch_worker(
-                store, gallery_fk, family, primary_row_id, host_name, canonical_file_id
-            )
-
-        c._schedule_md5_fetch = _run_sync
-        return c
+    def sync_coord(self, store, monkeypatch):
+        """Coordinator whose md5 poller polls (and retries) without waiting."""
+        monkeypatch.setattr(hfc_module, "K2S_MD5_INITIAL_DELAY_SEC", 0)
+        monkeypatch.setattr(hfc_module, "K2S_MD5_BACKOFF_BASE_SEC", 0)
+        return HostFamilyCoordinator(queue_store=store)
 
     def test_null_md5_with_url_schedules_poller_and_unblocks_on_landing(
         self, store, sync_coord
@@ -208,13 +208,15 @@ class TestCoordinatorMd5Poller:
 
         # Poller lands md5 on first call
         with patch.object(
-            hfc_module.FileHostClient, "fetch_md5_for_host", return_value="server-md5"
+            hfc_module.FileHostClient, "fetch_md5s_for_host",
+            return_value={"abc123": "server-md5"},
         ) as mock_fetch:
             sync_coord.on_host_gallery_settled(gallery_fk, "keep2share", True)
+            _drain_md5_pollers(sync_coord)
 
         mock_fetch.assert_called_once()
         # canonical id should be "abc123", not the user_file_id
-        assert mock_fetch.call_args.args[1] == "abc123"
+        assert mock_fetch.call_args.args[1] == ["abc123"]
 
         # md5 written to primary row
         assert _row(store, path, "keep2share")["md5_hash"] == "server-md5"
@@ -233,10 +235,10 @@ class TestCoordinatorMd5Poller:
         gallery_fk = _row(store, path, "keep2share")["gallery_fk"]
 
         with patch.object(
-            hfc_module.FileHostClient, "fetch_md5_for_host", return_value=None
-        ) as mock_fetch, \
-             patch.object(hfc_module.time, "sleep"):  # skip the backoff waits
+            hfc_module.FileHostClient, "fetch_md5s_for_host", return_value={}
+        ) as mock_fetch:
             sync_coord.on_host_gallery_settled(gallery_fk, "keep2share", True)
+            _drain_md5_pollers(sync_coord)
 
         assert mock_fetch.call_count == hfc_module.K2S_MD5_MAX_ATTEMPTS
         # md5 still NULL, but siblings unblocked so they can full-upload
@@ -254,14 +256,15 @@ class TestCoordinatorMd5Poller:
         gallery_fk = _row(store, path, "keep2share")["gallery_fk"]
 
         with patch.object(
-            hfc_module.FileHostClient, "fetch_md5_for_host"
+            hfc_module.FileHostClient, "fetch_md5s_for_host"
         ) as mock_fetch:
             sync_coord.on_host_gallery_settled(gallery_fk, "keep2share", True)
+            _drain_md5_pollers(sync_coord)
 
         mock_fetch.assert_not_called()
         assert _row_status(store, path, "fileboom") == "pending"
 
-    def test_dedup_only_retry_blocks_when_winner_has_null_md5(self, store):
+    def test_dedup_only_retry_blocks_when_winner_has_null_md5(self, store, sync_coord):
         """Regression: after a primary fails and a promoted primary succeeds
         with NULL md5, `_run_family_retry_scan` must NOT flip the original
         primary's failed row to `pending` immediately. If it did, that
@@ -278,7 +281,7 @@ class TestCoordinatorMd5Poller:
         # instead of running it. This lets `_run_family_retry_scan` run while
         # md5 is still NULL (the exact race the fix addresses), and lets the
         # test explicitly drive the poller afterwards.
-        coord = HostFamilyCoordinator(queue_store=store)
+        coord = sync_coord
         deferred_polls: list = []
         coord._schedule_md5_fetch = lambda **kw: deferred_polls.append(kw)
 
@@ -310,12 +313,14 @@ class TestCoordinatorMd5Poller:
 
         # Now actually run the poller. With md5 landing, both the dedup_only
         # retry row AND the tezfiles waiter should be unblocked.
+        del coord._schedule_md5_fetch
         with patch.object(
             hfc_module.FileHostClient,
-            "fetch_md5_for_host",
-            return_value="post-rewrite-md5",
+            "fetch_md5s_for_host",
+            return_value={"xyz789": "post-rewrite-md5"},
         ):
-            hfc_module._md5_fetch_worker(store, **deferred_polls[0])
+            coord._schedule_md5_fetch(**deferred_polls[0])
+            _drain_md5_pollers(coord)
 
         assert _row(store, path, "fileboom")["md5_hash"] == "post-rewrite-md5"
         k2s_after = _row(store, path, "keep2share")
@@ -337,8 +342,105 @@ class TestCoordinatorMd5Poller:
         gallery_fk = _row(store, path, "keep2share")["gallery_fk"]
 
         with patch.object(
-            hfc_module.FileHostClient, "fetch_md5_for_host"
+            hfc_module.FileHostClient, "fetch_md5s_for_host"
         ) as mock_fetch:
             sync_coord.on_host_gallery_settled(gallery_fk, "keep2share", True)
+            _drain_md5_pollers(sync_coord)
+
+        mock_fetch.assert_not_called()
+
+
+class TestSharedMd5Poller:
+    """Covers the real per-host poller thread: batching, retries, shutdown."""
+
+    @pytest.fixture(autouse=True)
+    def _fast_timings(self, monkeypatch):
+        monkeypatch.setattr(hfc_module, "K2S_MD5_INITIAL_DELAY_SEC", 0.05)
+        monkeypatch.setattr(hfc_module, "K2S_MD5_BACKOFF_BASE_SEC", 0.05)
+        monkeypatch.setattr(hfc_module, "K2S_MD5_BATCH_WINDOW_SEC", 5)
+
+    def _completed_primaries(self, store, count):
+        """count galleries whose keep2share primary completed with NULL md5."""
+        galleries = []
+        for i in range(count):
+            path = f"/tmp/shared_poll{i}"
+            ids = _add_family_rows(store, path, ["keep2share", "fileboom"])
+            store.update_file_host_upload(
+                ids["keep2share"],
+                status="completed",
+                download_url=f"https://k2s.cc/file/canon{i}/g{i}.zip",
+            )
+            galleries.append((path, _row(store, path, "keep2share")["gallery_fk"]))
+        return galleries
+
+    def _settle_together(self, store, coord, galleries):
+        """Settle every primary before the poller can take its first batch.
+
+        The poller's lock is held while scheduling, so a slow settle can't
+        let the first file go out in a batch of its own.
+        """
+        poller = hfc_module._FamilyMd5Poller(store, "keep2share")
+        coord._md5_pollers["keep2share"] = poller
+        with poller._cond:
+            for _, gallery_fk in galleries:
+                coord.on_host_gallery_settled(gallery_fk, "keep2share", True)
+
+    def test_galleries_share_one_batched_call(self, store, coord):
+        galleries = self._completed_primaries(store, 3)
+
+        with patch.object(
+            hfc_module.FileHostClient, "fetch_md5s_for_host",
+            side_effect=lambda host, ids, log_callback=None: {i: f"md5-{i}" for i in ids},
+        ) as mock_fetch:
+            self._settle_together(store, coord, galleries)
+            _drain_md5_pollers(coord)
+
+        mock_fetch.assert_called_once()
+        assert sorted(mock_fetch.call_args.args[1]) == ["canon0", "canon1", "canon2"]
+        for i, (path, _) in enumerate(galleries):
+            assert _row(store, path, "keep2share")["md5_hash"] == f"md5-canon{i}"
+            assert _row_status(store, path, "fileboom") == "pending"
+
+    def test_only_missing_md5s_are_retried(self, store, coord):
+        galleries = self._completed_primaries(store, 2)
+        calls = []
+
+        def fetch(host, ids, log_callback=None):
+            calls.append(sorted(ids))
+            return {"canon0": "early"} if len(calls) == 1 else {"canon1": "late"}
+
+        with patch.object(hfc_module.FileHostClient, "fetch_md5s_for_host", side_effect=fetch):
+            self._settle_together(store, coord, galleries)
+            _drain_md5_pollers(coord)
+
+        assert calls == [["canon0", "canon1"], ["canon1"]]
+        assert _row(store, galleries[0][0], "keep2share")["md5_hash"] == "early"
+        assert _row(store, galleries[1][0], "keep2share")["md5_hash"] == "late"
+
+    def test_exhausted_poll_unblocks_siblings(self, store, coord):
+        (path, gallery_fk), = self._completed_primaries(store, 1)
+
+        with patch.object(
+            hfc_module.FileHostClient, "fetch_md5s_for_host", return_value={}
+        ) as mock_fetch:
+            coord.on_host_gallery_settled(gallery_fk, "keep2share", True)
+            _drain_md5_pollers(coord)
+
+        assert mock_fetch.call_count == hfc_module.K2S_MD5_MAX_ATTEMPTS
+        assert _row(store, path, "keep2share")["md5_hash"] is None
+        assert _row_status(store, path, "fileboom") == "pending"
+
+    def test_shutdown_drops_pending_polls(self, store, coord, monkeypatch):
+        monkeypatch.setattr(hfc_module, "K2S_MD5_INITIAL_DELAY_SEC", 60)
+        (path, gallery_fk), = self._completed_primaries(store, 1)
+
+        with patch.object(hfc_module.FileHostClient, "fetch_md5s_for_host") as mock_fetch:
+            coord.on_host_gallery_settled(gallery_fk, "keep2share", True)
+            poller = coord._md5_pollers["keep2share"]
+            assert poller.pending_count() == 1
+
+            coord.shutdown()
 
+        assert poller.pending_count() == 0
         mock_fetch.assert_not_called()
+        assert _row_status(store, path, "fileboom") == "blocked"
@@ -7,6 +7,8 @@ Tests the following methods:
 - _parse_online_image_ids(): Parse online image IDs from textarea
 - check_image_status(): Queue status check with cancellation handling
 - _perform_status_check(): Fast path vs slow path optimization
+- _perform_sharded_status_check(): Bounded concurrent requests for large URL sets
+- _ModerateResponseParser: Incremental parsing of streamed responses
 """
 
 import pytest
@@ -14,7 +16,7 @@ import threading
 import queue
 from unittest.mock import Mock, patch
 
-from src.processing.rename_worker import RenameWorker
+from src.processing.rename_worker import RenameWorker, _ModerateResponseParser
 
 
 # =============================================================================
@@ -1355,3 +1357,166 @@ class TestQuickCountSignal:
 
         # Should handle large counts correctly
         minimal_worker.quick_count_available.emit.assert_called_once_with(5000, 5000)
+
+
+# =============================================================================
+# TestModerateResponseParser - Tests for incremental response parsing
+# =============================================================================
+
+class TestModerateResponseParser:
+    """Test _ModerateResponseParser against the whole-string parsers."""
+
+    HTML = (
+        '<html><body>' + '<div>filler</div>\n' * 200
+        + '<p>Found: 3 images</p>\n'
+        + '<textarea class="imageallcodes" rows="10">\n'
+        + '[url=https://imx.to/i/abc123][img]https://i.imx.to/thumb/abc123.jpg[/img][/url]\n'
+        + 'https://imx.to/i/def456\nhttps://imx.to/i/ghi789</textarea>'
+        + '<textarea class="imageallcodes">https://imx.to/i/zzz999</textarea>'
+        + '</body></html>'
+    )
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 100000])
+    def test_chunked_parse_matches_full_parse(self, minimal_worker, chunk_size):
+        """Test IDs split across chunks are still found, and only the first textarea is read."""
+        data = self.HTML.encode('utf-8')
+        parser = _ModerateResponseParser()
+        for i in range(0, len(data), chunk_size):
+            parser.feed(data[i:i + chunk_size])
+        parser.close()
+
+        assert parser.found_count == 3
+        assert parser.online_ids == minimal_worker._parse_online_image_ids(self.HTML)
+        assert parser.online_ids == {'abc123', 'def456', 'ghi789'}
+        assert parser.done
+
+    def test_stops_consuming_after_textarea(self):
+        """Test chunks after the closing textarea are ignored."""
+        parser = _ModerateResponseParser()
+        parser.feed(b'Found: 1 image <textarea class="imageallcodes">https://imx.to/i/a1</textarea>')
+        read = parser.bytes_read
+        parser.feed(b'x' * 1000)
+
+        assert parser.done
+        assert parser.bytes_read == read
+
+    def test_detects_ddos_guard(self):
+        """Test DDoS-Guard pages are flagged."""
+        parser = _ModerateResponseParser()
+        parser.feed(b'<title>DDoS-Guard</title>')
+
+        assert parser.ddos_guard
+
+
+# =============================================================================
+# TestShardedStatusCheck - Tests for _perform_sharded_status_check()
+# =============================================================================
+
+def moderate_post(offline_ids=(), fail_on=None):
+    """Build a session.post side effect answering like /user/moderate.
+
+    Args:
+        offline_ids: Image IDs to leave out of the response
+        fail_on: Image ID whose shard gets an HTTP 500
+    """
+    def post(url, data=None, **kwargs):
+        urls = data['imagesid'].split('\n')
+        ids = [u.rsplit('/', 1)[-1] for u in urls]
+        if fail_on in ids:
+            return create_streaming_response(500, '')
+        online = [u for u, img_id in zip(urls, ids) if img_id not in offline_ids]
+        html = (f'<p>Found: {len(online)} images</p>'
+                f'<textarea class="imageallcodes">{chr(10).join(online)}</textarea>')
+        return create_streaming_response(200, html)
+    return post
+
+
+@pytest.fixture
+def sharded_worker(minimal_worker):
+    """Worker with a shard size of 3 URLs."""
+    minimal_worker.STATUS_CHECK_SHARD_SIZE = 3
+    minimal_worker.status_check_partial = Mock()
+    minimal_worker.last_reauth_attempt = 0
+    minimal_worker.min_reauth_interval = 5.0
+    return minimal_worker
+
+
+@pytest.fixture
+def sharded_galleries():
+    """Three galleries, 7 URLs: shards are [a1 a2 b1] [b2 b3 b4] [c1]."""
+    return [
+        {'db_id': 1, 'path': '/a', 'name': 'A', 'image_urls': ['https://imx.to/i/a1', 'https://imx.to/i/a2']},
+        {'db_id': 2, 'path': '/b', 'name': 'B',
+         'image_urls': [f'https://imx.to/i/b{i}' for i in range(1, 5)]},
+        {'db_id': 3, 'path': '/c', 'name': 'C', 'image_urls': ['https://imx.to/i/c1']},
+    ]
+
+
+class TestShardedStatusCheck:
+    """Test sharded status checks for URL sets larger than one shard."""
+
+    def test_small_sets_use_single_request(self, sharded_worker):
+        """Test URL sets within one shard keep the single-request path."""
+        sharded_worker.session.post.side_effect = moderate_post()
+        galleries = [{'db_id': 1, 'path': '/a', 'name': 'A',
+                      'image_urls': ['https://imx.to/i/a1', 'https://imx.to/i/a2']}]
+
+        result = sharded_worker._perform_status_check(galleries)
+
+        assert sharded_worker.session.post.call_count == 1
+        assert result['/a']['online'] == 2
+        sharded_worker.status_check_partial.emit.assert_not_called()
+
+    def test_results_match_per_gallery(self, sharded_worker, sharded_galleries):
+        """Test online/offline URLs are attributed to galleries across shards."""
+        sharded_worker.session.post.side_effect = moderate_post(offline_ids={'b3', 'c1'})
+
+        result = sharded_worker._perform_status_check(sharded_galleries)
+
+        assert sharded_worker.session.post.call_count == 3
+        posted = sorted(len(c.kwargs['data']['imagesid'].split('\n'))
+                        for c in sharded_worker.session.post.call_args_list)
+        assert posted == [1, 3, 3]
+        assert result['/a']['online'] == 2
+        assert result['/b']['online'] == 3
+        assert result['/b']['offline_urls'] == ['https://imx.to/i/b3']
+        assert result['/c'] == {
+            'db_id': 3, 'name': 'C', 'total': 1, 'online': 0, 'offline': 1,
+            'online_urls': [], 'offline_urls': ['https://imx.to/i/c1'],
+        }
+
+    def test_partial_results_emitted_once_per_gallery(self, sharded_worker, sharded_galleries):
+        """Test each gallery is emitted exactly once, when its last shard finishes."""
+        sharded_worker.session.post.side_effect = moderate_post()
+
+        result = sharded_worker._perform_status_check(sharded_galleries)
+
+        emitted = [path for c in sharded_worker.status_check_partial.emit.call_args_list
+                   for path in c.args[0]]
+        assert sorted(emitted) == ['/a', '/b', '/c']
+        assert sharded_worker.status_check_progress.emit.call_args_list[-1].args == (7, 7)
+        assert all(r['offline'] == 0 for r in result.values())
+
+    def test_failed_shard_drops_only_its_galleries(self, sharded_worker, sharded_galleries):
+        """Test a failed shard leaves its galleries out instead of failing the check."""
+        sharded_worker.session.post.side_effect = moderate_post(fail_on='b2')
+
+        result = sharded_worker._perform_status_check(sharded_galleries)
+
+        # Shard 2 holds b2-b4, so gallery B is incomplete; A (shard 1) and C are fine
+        assert set(result) == {'/a', '/c'}
+
+    def test_all_shards_failing_raises(self, sharded_worker, sharded_galleries):
+        """Test the error surfaces when no shard succeeded."""
+        sharded_worker.session.post.return_value = create_streaming_response(500, '')
+
+        with pytest.raises(Exception, match="HTTP 500"):
+            sharded_worker._perform_status_check(sharded_galleries)
+
+    def test_cancelled_check_returns_empty(self, sharded_worker, sharded_galleries):
+        """Test cancellation before the shards start returns no results."""
+        sharded_worker._status_check_cancelled.set()
+
+        assert sharded_worker._perform_status_check(sharded_galleries) == {}
+        sharded_worker.session.post.assert_not_called()
+
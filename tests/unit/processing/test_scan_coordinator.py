@@ -1,11 +1,15 @@
 """Tests for ScanCoordinator — multi-host scan orchestration."""
 
 import pytest
+import sqlite3
 import threading
 import time
 from unittest.mock import Mock, patch, MagicMock, call
 
-from src.processing.scan_coordinator import ScanCoordinator, HostScanJob
+from src.network.connection_limiter import ConnectionLimiter
+from src.network.k2s_file_checker import FolderListing
+from src.processing.scan_coordinator import ScanCoordinator, HostScanJob, _ScanResultWriter
+from src.storage.k2s_inventory_cache import K2SInventoryCache
 
 
 class TestHostScanJob:
@@ -71,37 +75,67 @@ class TestScanCoordinatorExecution:
 
     @patch('src.processing.scan_coordinator.ThumbnailChecker')
     def test_image_host_scan_calls_checker(self, MockChecker):
-        """Image host job should create ThumbnailChecker and call check_gallery."""
+        """Image host job should check all galleries through check_galleries."""
         mock_instance = Mock()
-        mock_instance.check_gallery.return_value = {
-            'status': 'online', 'online': 5, 'offline': 0, 'errors': 0, 'total': 5, 'offline_urls': []
-        }
+        mock_instance.check_galleries.side_effect = lambda galleries, **kw: (
+            (db_id, {'status': 'online', 'online': len(urls), 'offline': 0, 'errors': 0,
+                     'total': len(urls), 'offline_urls': []})
+            for db_id, urls in galleries
+        )
+        mock_instance.last_stats = {'checks': 5, 'checks_per_sec': 50.0}
         MockChecker.return_value = mock_instance
 
         coord = ScanCoordinator.__new__(ScanCoordinator)
         coord._cancelled = threading.Event()
-        coord._connection_limiter = Mock()
-        coord._connection_limiter.connection.return_value.__enter__ = Mock()
-        coord._connection_limiter.connection.return_value.__exit__ = Mock(return_value=False)
+        coord._connection_limiter = ConnectionLimiter()
         coord._progress_callback = None
+        coord._thumbnail_rates = {}
 
         job = HostScanJob(
             host_type='image',
             host_id='turbo',
             galleries=[{'db_id': 1, 'path': '/a', 'thumb_urls': ['u1', 'u2', 'u3', 'u4', 'u5']}],
         )
-        results = coord._run_image_host_job(job)
+        results = list(coord._run_image_host_job(job))
         assert len(results) == 1
         assert results[0][3] == 'online'  # status field in result tuple
+        assert coord._thumbnail_rates == {'turbo': 50.0}
+
+    @patch('src.processing.scan_coordinator.ThumbnailChecker')
+    def test_image_host_budget_uses_free_limiter_slots(self, MockChecker):
+        """The checker gets every free slot for the host, and they are released after."""
+        mock_instance = Mock()
+        mock_instance.check_galleries.return_value = iter(())
+        mock_instance.last_stats = {}
+        MockChecker.return_value = mock_instance
+
+        coord = ScanCoordinator.__new__(ScanCoordinator)
+        coord._cancelled = threading.Event()
+        coord._connection_limiter = ConnectionLimiter(host_limits={'turbo': 6})
+        coord._progress_callback = None
+        coord._thumbnail_rates = {}
+        coord._connection_limiter.acquire('turbo')  # an upload holds one slot
+
+        job = HostScanJob(host_type='image', host_id='turbo',
+                          galleries=[{'db_id': 1, 'path': '/a', 'thumb_urls': ['u1']}])
+        list(coord._run_image_host_job(job))
+
+        assert mock_instance.check_galleries.call_args.kwargs['max_connections'] == 5
+        assert coord._connection_limiter.available('turbo') == 5
 
     @patch('src.processing.scan_coordinator.K2SFileChecker')
-    def test_k2s_file_scan_calls_checker(self, MockChecker):
-        """K2S file host job should walk folders via get_all_files and check via inventory."""
+    def test_k2s_file_scan_calls_checker(self, MockChecker, tmp_path):
+        """K2S file host job should refresh the inventory cache and check via indexed lookup."""
         mock_instance = Mock()
-        mock_instance.get_all_files.return_value = [
-            {'id': 'f1', 'name': 'file1.zip', 'size': 1024, 'status': 1},
+        mock_instance.walk_folders.return_value = [
+            FolderListing(folder_id='/', parent_id=None, subfolder_ids=['d1'], files=[]),
+            FolderListing(folder_id='d1', parent_id='/', files=[
+                {'id': 'f1', 'name': 'file1.zip', 'size': 1024,
+                 'extended_info': {'storage_object': 'available'}},
+                {'id': 'f9', 'name': 'other.zip', 'size': 5,
+                 'extended_info': {'storage_object': 'available'}},
+            ]),
         ]
-        mock_instance.calc_storage_used.return_value = 1024
         mock_instance.check_gallery_from_inventory.return_value = {
             'status': 'online', 'online': 1, 'offline': 0, 'errors': 0, 'total': 1, 'offline_urls': []
         }
@@ -114,7 +148,7 @@ class TestScanCoordinatorExecution:
         coord._connection_limiter.connection.return_value.__exit__ = Mock(return_value=False)
         coord._progress_callback = None
         coord._credentials = {'keep2share': 'test-token'}
-        coord._k2s_inventory_by_host = {}
+        coord._k2s_inventory_cache = K2SInventoryCache(str(tmp_path / 'k2s_inventory.db'))
         coord._k2s_storage_by_host = {}
         coord._k2s_lock = threading.Lock()
 
@@ -123,11 +157,87 @@ class TestScanCoordinatorExecution:
             host_id='keep2share',
             galleries=[{'db_id': 1, 'file_ids': {'f1': 'http://k2s.cc/file/f1'}}],
         )
-        results = coord._run_k2s_job(job)
+        results = list(coord._run_k2s_job(job))
         assert len(results) == 1
         assert results[0][3] == 'online'  # status field in result tuple
+        mock_instance.walk_folders.assert_called_once()
+        mock_instance.get_all_files.assert_not_called()
+        file_ids, inventory = mock_instance.check_gallery_from_inventory.call_args.args
+        assert file_ids == {'f1': 'http://k2s.cc/file/f1'}
+        assert set(inventory) == {'f1'}
+        assert coord._k2s_storage_by_host == {'keep2share': 1029}
+
+        # A second scan right after reuses the stored inventory
+        list(coord._run_k2s_job(job))
+        mock_instance.walk_folders.assert_called_once()
+        mock_instance.check_files.assert_not_called()
+
+    @patch('src.processing.scan_coordinator.K2SFileChecker')
+    def test_k2s_files_missing_from_reused_inventory_are_verified(self, MockChecker, tmp_path):
+        """A file uploaded after the last walk is checked with getFilesInfo, not reported offline."""
+        mock_instance = Mock()
+        mock_instance.walk_folders.return_value = [
+            FolderListing(folder_id='/', parent_id=None, files=[
+                {'id': 'f1', 'name': 'old.zip', 'size': 10,
+                 'extended_info': {'storage_object': 'available'}},
+            ]),
+        ]
+        mock_instance.check_files.return_value = {'new': True, 'gone': False}
+        mock_instance.check_gallery_from_inventory.return_value = {
+            'status': 'online', 'online': 1, 'offline': 0, 'errors': 0, 'total': 1, 'offline_urls': []
+        }
+        MockChecker.return_value = mock_instance
+
+        coord = ScanCoordinator.__new__(ScanCoordinator)
+        coord._cancelled = threading.Event()
+        coord._progress_callback = None
+        coord._credentials = {'keep2share': 'test-token'}
+        coord._k2s_inventory_cache = K2SInventoryCache(str(tmp_path / 'k2s_inventory.db'))
+        coord._k2s_storage_by_host = {}
+        coord._k2s_lock = threading.Lock()
+
+        first = HostScanJob(host_type='file', host_id='keep2share',
+                            galleries=[{'db_id': 1, 'file_ids': {'f1': 'u1'}}])
+        list(coord._run_k2s_job(first))
+        mock_instance.check_files.assert_not_called()  # Complete walk: nothing to verify
+
+        later = HostScanJob(host_type='file', host_id='keep2share',
+                            galleries=[{'db_id': 2, 'file_ids': {'f1': 'u1', 'new': 'u2', 'gone': 'u3'}}])
+        list(coord._run_k2s_job(later))
+
+        mock_instance.walk_folders.assert_called_once()
+        mock_instance.check_files.assert_called_once_with(['new', 'gone'])
+        _, inventory = mock_instance.check_gallery_from_inventory.call_args.args
+        assert set(inventory) == {'f1', 'new'}
+
+    @patch('src.processing.scan_coordinator.K2SFileChecker')
+    def test_k2s_falls_back_to_memory_walk_without_cache(self, MockChecker):
+        mock_instance = Mock()
+        mock_instance.get_all_files.return_value = [
+            {'id': 'f1', 'name': 'file1.zip', 'size': 1024, 'status': 1},
+        ]
+        mock_instance.calc_storage_used.return_value = 1024
+        mock_instance.check_gallery_from_inventory.return_value = {
+            'status': 'online', 'online': 1, 'offline': 0, 'errors': 0, 'total': 1, 'offline_urls': []
+        }
+        MockChecker.return_value = mock_instance
+
+        coord = ScanCoordinator.__new__(ScanCoordinator)
+        coord._cancelled = threading.Event()
+        coord._progress_callback = None
+        coord._credentials = {'keep2share': 'test-token'}
+        coord._k2s_inventory_cache = Mock()
+        coord._k2s_inventory_cache.is_fresh.side_effect = sqlite3.OperationalError("disk I/O error")
+        coord._k2s_storage_by_host = {}
+        coord._k2s_lock = threading.Lock()
+
+        job = HostScanJob(host_type='file', host_id='keep2share',
+                          galleries=[{'db_id': 1, 'file_ids': {'f1': 'http://k2s.cc/file/f1'}}])
+        results = list(coord._run_k2s_job(job))
+
+        assert results[0][3] == 'online'
         mock_instance.get_all_files.assert_called_once()
-        mock_instance.check_gallery_from_inventory.assert_called_once()
+        assert coord._k2s_storage_by_host == {'keep2share': 1024}
 
 
 class TestScanCoordinatorCancellation:
@@ -186,3 +296,109 @@ class TestScanCoordinatorIMXRouting:
             {'db_id': 1, 'image_host_id': 'turbo', 'thumb_urls': ['u1']},
         ]
         assert coord._build_imx_job(galleries) is None
+
+
+def _result(db_id, host_id='turbo', checked_ts=None):
+    return (db_id, 'image', host_id, 'online', 1, 1, checked_ts or int(time.time()), None)
+
+
+class TestScanResultStreaming:
+    """Results are written in batches while the scan runs."""
+
+    def test_writer_flushes_in_batches(self):
+        store = Mock()
+        writer = _ScanResultWriter(store, batch_size=3)
+        for i in range(7):
+            writer.add(_result(i))
+        assert store.bulk_upsert_scan_results.call_count == 2
+        writer.flush()
+        assert [len(c.args[0]) for c in store.bulk_upsert_scan_results.call_args_list] == [3, 3, 1]
+        assert writer.written == 7
+
+    def test_writer_survives_store_errors(self):
+        store = Mock()
+        store.bulk_upsert_scan_results.side_effect = RuntimeError("locked")
+        writer = _ScanResultWriter(store, batch_size=2)
+        writer.add(_result(1))
+        writer.add(_result(2))
+        assert writer.failed == 2
+        assert writer.written == 0
+
+    def _coordinator(self, store):
+        coord = ScanCoordinator(store=store, connection_limiter=Mock(), credentials={'x': 'y'})
+        return coord
+
+    def test_cancelled_scan_keeps_results(self):
+        """Results produced before a cancel are written, not discarded."""
+        store = Mock()
+        store.get_scan_checkpoint.return_value = None
+        coord = self._coordinator(store)
+
+        def job_results(job):
+            for gallery in job.galleries:
+                if gallery['db_id'] == 3:
+                    coord.cancel()
+                    return
+                yield _result(gallery['db_id'])
+
+        coord._run_image_host_job = job_results
+        galleries = [{'db_id': i, 'image_host_id': 'turbo', 'thumb_urls': ['u']} for i in range(1, 6)]
+        coord._run_scan(galleries, [], scan_key='age:7::last_scan')
+
+        written = [r for c in store.bulk_upsert_scan_results.call_args_list for r in c.args[0]]
+        assert [r[0] for r in written] == [1, 2]
+        store.save_scan_checkpoint.assert_called_once()
+        store.clear_scan_checkpoint.assert_not_called()
+
+    def test_completed_scan_clears_checkpoint(self):
+        store = Mock()
+        store.get_scan_checkpoint.return_value = None
+        summaries = []
+        coord = self._coordinator(store)
+        coord._completion_callback = summaries.append
+        coord._run_image_host_job = lambda job: (_result(g['db_id']) for g in job.galleries)
+
+        galleries = [{'db_id': i, 'image_host_id': 'turbo', 'thumb_urls': ['u']} for i in range(1, 4)]
+        coord._run_scan(galleries, [], scan_key='problems:0::last_scan')
+
+        store.clear_scan_checkpoint.assert_called_once()
+        assert summaries[0]['total_galleries'] == 3
+
+
+class TestScanCheckpointResume:
+    """A restarted scan skips galleries the interrupted run already checked."""
+
+    def test_resume_skips_checked_items(self):
+        store = Mock()
+        started = int(time.time()) - 60
+        store.get_scan_checkpoint.return_value = {'scan_key': 'k', 'started_ts': started}
+        store.get_scan_results_checked_since.return_value = {(1, 'image', 'turbo'), (7, 'file', 'rapidgator')}
+        coord = ScanCoordinator(store=store, connection_limiter=Mock(), credentials={'x': 'y'})
+
+        images, uploads = coord._resume_from_checkpoint(
+            'k',
+            [{'db_id': 1, 'image_host_id': 'turbo'}, {'db_id': 2, 'image_host_id': 'turbo'}],
+            [{'gallery_fk': 7, 'host_name': 'rapidgator'}, {'gallery_fk': 7, 'host_name': 'keep2share'}],
+        )
+        assert [g['db_id'] for g in images] == [2]
+        assert [u['host_name'] for u in uploads] == ['keep2share']
+        store.get_scan_results_checked_since.assert_called_once_with(started)
+        store.save_scan_checkpoint.assert_not_called()
+
+    def test_different_scan_starts_fresh(self):
+        store = Mock()
+        store.get_scan_checkpoint.return_value = {'scan_key': 'other', 'started_ts': int(time.time())}
+        coord = ScanCoordinator(store=store, connection_limiter=Mock(), credentials={'x': 'y'})
+        galleries = [{'db_id': 1, 'image_host_id': 'turbo'}]
+        images, _ = coord._resume_from_checkpoint('k', galleries, [])
+        assert images == galleries
+        store.save_scan_checkpoint.assert_called_once()
+
+    def test_stale_checkpoint_starts_fresh(self):
+        store = Mock()
+        store.get_scan_checkpoint.return_value = {'scan_key': 'k', 'started_ts': int(time.time()) - 7200}
+        coord = ScanCoordinator(store=store, connection_limiter=Mock(), credentials={'x': 'y'})
+        galleries = [{'db_id': 1, 'image_host_id': 'turbo'}]
+        images, _ = coord._resume_from_checkpoint('k', galleries, [], resume_max_age=3600)
+        assert images == galleries
+        store.get_scan_results_checked_since.assert_not_called()
@@ -13,7 +13,7 @@ import os
 import pytest
 import time
 
-from src.storage.database import QueueStore
+from src.storage.database import QueueStore, set_connection_pooling
 
 
 @pytest.fixture
@@ -257,6 +257,66 @@ class TestBatchQueryPerformance:
         # Verify batch is significantly faster
         assert speedup >= 10, f"Batch query should be at least 10x faster (got {speedup:.1f}x)"
 
+    def test_pooled_store_query_performance(self, tmp_path):
+        """Verify pooled connections speed up per-gallery queries and batch still wins"""
+        db_path = str(tmp_path / "pooled.db")
+        pooled_db = QueueStore(db_path, pooled=True)
+        pooled_db.bulk_upsert([
+            {
+                'path': f'/fake/gallery_{i}',
+                'name': f'Gallery {i}',
+                'status': 'completed',
+                'added_time': 1700000000 + i,
+            }
+            for i in range(100)
+        ])
+        for i in range(100):
+            for host in ['rapidgator', 'gofile']:
+                pooled_db.add_file_host_upload(
+                    gallery_path=f'/fake/gallery_{i}',
+                    host_name=host,
+                    status='completed'
+                )
+        paths = [gallery['path'] for gallery in pooled_db.load_all_items()]
+
+        def individual(store):
+            start = time.perf_counter()
+            for path in paths:
+                store.get_file_host_uploads(path)
+            return time.perf_counter() - start
+
+        def best_of(func, runs=3):
+            return min(func() for _ in range(runs))
+
+        try:
+            # Warm up the pooled connection and its statement cache
+            pooled_db.get_all_file_host_uploads_batch()
+            individual(pooled_db)
+
+            def batch():
+                start = time.perf_counter()
+                pooled_db.get_all_file_host_uploads_batch()
+                return time.perf_counter() - start
+
+            batch_time = best_of(batch)
+            pooled_time = best_of(lambda: individual(pooled_db))
+            set_connection_pooling(False)
+            unpooled_time = best_of(lambda: individual(pooled_db))
+        finally:
+            set_connection_pooling(True)
+            pooled_db.close()
+
+        print("\nPooled store (100 galleries, 200 uploads):")
+        print(f"  Batch query:                    {batch_time*1000:.2f}ms")
+        print(f"  Individual queries, pooled:     {pooled_time*1000:.2f}ms")
+        print(f"  Individual queries, per-call:   {unpooled_time*1000:.2f}ms")
+
+        assert unpooled_time / pooled_time >= 2, (
+            f"Pooled per-gallery queries should be at least 2x faster "
+            f"(got {unpooled_time / pooled_time:.1f}x)"
+        )
+        assert batch_time < pooled_time, "Batch query should beat per-gallery queries even when pooled"
+
     def test_batch_query_scales_linearly(self, temp_db):
         """Verify batch query scales well with dataset size"""
         # Test with different dataset sizes
@@ -426,5 +486,60 @@ class TestBatchQueryLargeDatasets:
             "Should return all 50 uploads for gallery"
 
 
+
+class TestBatchQueriesForPaths:
+    """Path-filtered batch lookups used by artifact regeneration"""
+
+    def test_uploads_batch_filtered_by_paths(self, populated_db):
+        """Only the requested galleries are returned, with the same records"""
+        all_uploads = populated_db.get_all_file_host_uploads_batch()
+        wanted = [os.path.normpath(f"/fake/gallery_{i}") for i in (1, 4, 7)]
+
+        filtered = populated_db.get_all_file_host_uploads_batch(wanted)
+
+        assert set(filtered) == set(wanted)
+        for path in wanted:
+            assert filtered[path] == all_uploads[path]
+
+    def test_uploads_batch_chunks_large_path_lists(self, populated_db):
+        """Path lists over the IN (...) chunk size still return every match"""
+        paths = [os.path.normpath(f"/fake/gallery_{i}") for i in range(10)]
+        paths += [f"/fake/missing_{i}" for i in range(1200)]
+
+        filtered = populated_db.get_all_file_host_uploads_batch(paths)
+
+        assert len(filtered) == 10
+
+    def test_image_urls_with_thumbs_and_dimensions(self, temp_db):
+        """Image URLs can include thumbs; dimensions aggregate stored sizes"""
+        images = [
+            ('a.jpg', {'image_url': 'https://imx.to/i/a', 'thumb_url': 'https://imx.to/t/a.jpg', 'width': 800, 'height': 600}),
+            ('b.jpg', {'image_url': 'https://imx.to/i/b', 'thumb_url': 'https://imx.to/t/b.jpg', 'width': 1200, 'height': 1000}),
+            ('c.jpg', {'image_url': 'https://imx.to/i/c'}),
+        ]
+        temp_db.bulk_upsert([{
+            'path': '/fake/images',
+            'name': 'Images',
+            'status': 'completed',
+            'added_time': 1700000000,
+            'uploaded_files': [name for name, _ in images],
+            'uploaded_images_data': images,
+        }])
+        path = os.path.normpath('/fake/images')
+
+        plain = temp_db.get_image_urls_for_galleries([path])
+        with_thumbs = temp_db.get_image_urls_for_galleries([path], include_thumbs=True)
+        dims = temp_db.get_image_dimensions_for_galleries([path, '/fake/none'])
+
+        assert plain[path][0] == {'filename': 'a.jpg', 'url': 'https://imx.to/i/a'}
+        assert with_thumbs[path][0]['thumb_url'] == 'https://imx.to/t/a.jpg'
+        assert with_thumbs[path][2]['thumb_url'] == ''
+        assert dims == {path: {
+            'avg_width': 1000.0, 'avg_height': 800.0,
+            'max_width': 1200, 'max_height': 1000,
+            'min_width': 800, 'min_height': 600,
+        }}
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
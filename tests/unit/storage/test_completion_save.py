@@ -41,6 +41,8 @@ def mock_store():
     store.bulk_upsert_async.return_value = None
     store.delete_by_paths.return_value = 1
     store.update_item_custom_field.return_value = True
+    store.get_image_scan_cache.return_value = {}
+    store.prune_image_scan_cache.return_value = 0
     return store
 
 
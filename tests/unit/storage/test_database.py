@@ -25,8 +25,13 @@ from unittest.mock import Mock, patch
 from src.storage.database import (
     QueueStore,
     _connect,
+    _ConnectionContext,
     _ensure_schema,
-    _initialize_default_tabs
+    _initialize_default_tabs,
+    _schema_initialized_dbs,
+    close_pooled_connections,
+    get_connection_pool_stats,
+    set_connection_pooling,
 )
 
 
@@ -112,6 +117,122 @@ class TestDatabaseConnection:
         conn.close()
 
 
+class TestConnectionPool:
+    """Test the per-thread pooled connections shared by QueueStore methods."""
+
+    @pytest.fixture
+    def pooled_store(self, temp_db):
+        store = QueueStore(db_path=temp_db, pooled=True)
+        yield store
+        store._executor.shutdown(wait=True)
+        store.close()
+
+    def test_same_thread_reuses_connection(self, pooled_store):
+        """Consecutive calls on one thread get the same connection."""
+        with _ConnectionContext(pooled_store.db_path) as first:
+            pass
+        with _ConnectionContext(pooled_store.db_path) as second:
+            pass
+        assert first is second
+        assert second.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_threads_get_separate_connections(self, pooled_store):
+        """Each thread owns its own connection."""
+        seen = []
+
+        def grab():
+            with _ConnectionContext(pooled_store.db_path) as conn:
+                seen.append(id(conn))
+
+        with _ConnectionContext(pooled_store.db_path) as main_conn:
+            pass
+        t = threading.Thread(target=grab)
+        t.start()
+        t.join()
+        assert seen and seen[0] != id(main_conn)
+
+    def test_pooled_calls_count_as_reuse(self, pooled_store):
+        """Repeated QueueStore calls reuse rather than reopen."""
+        pooled_store.get_pending_file_host_uploads()
+        before = get_connection_pool_stats()
+        for _ in range(5):
+            pooled_store.get_pending_file_host_uploads('rapidgator')
+        after = get_connection_pool_stats()
+        assert after['reused'] - before['reused'] >= 5
+        assert after['opened'] == before['opened']
+
+    def test_replaced_database_file_is_reopened(self, temp_db_dir):
+        """A pooled connection to a deleted/recreated file is not reused."""
+        path = os.path.join(temp_db_dir, 'replaced.db')
+        store = QueueStore(db_path=path, pooled=True)
+        store.bulk_upsert([{'path': '/test/a', 'status': 'ready', 'added_time': 1}])
+        with _ConnectionContext(path) as old_conn:
+            pass
+
+        close_pooled_connections(path)
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+        _schema_initialized_dbs.discard(os.path.realpath(path))
+        store = QueueStore(db_path=path, pooled=True)
+
+        with _ConnectionContext(path) as new_conn:
+            assert new_conn is not old_conn
+        assert store.load_all_items() == []
+
+    def test_failed_call_rolls_back_open_transaction(self, pooled_store):
+        """An exception inside the context does not leave a transaction open."""
+        with pytest.raises(RuntimeError):
+            with _ConnectionContext(pooled_store.db_path) as conn:
+                conn.execute("BEGIN")
+                conn.execute("INSERT INTO settings(key, value_text) VALUES('k', 'v')")
+                raise RuntimeError("boom")
+        with _ConnectionContext(pooled_store.db_path) as conn:
+            assert not conn.in_transaction
+            assert conn.execute("SELECT COUNT(*) FROM settings WHERE key = 'k'").fetchone()[0] == 0
+
+    def test_pooling_can_be_disabled(self, pooled_store):
+        """With pooling off, each call gets a fresh connection."""
+        set_connection_pooling(False)
+        try:
+            with _ConnectionContext(pooled_store.db_path) as first:
+                pass
+            with _ConnectionContext(pooled_store.db_path) as second:
+                pass
+            assert first is not second
+        finally:
+            set_connection_pooling(True)
+
+    def test_unpooled_store_opens_per_call(self, queue_store):
+        """Stores created without pooled=True keep the open-per-call path."""
+        with _ConnectionContext(queue_store.db_path) as first:
+            pass
+        with _ConnectionContext(queue_store.db_path) as second:
+            pass
+        assert first is not second
+
+    def test_close_all_leaves_checked_out_connection_open(self, pooled_store):
+        """close_all() from another thread retires an in-use connection; release closes it."""
+        with _ConnectionContext(pooled_store.db_path) as conn:
+            closer = threading.Thread(target=close_pooled_connections, args=(pooled_store.db_path,))
+            closer.start()
+            closer.join()
+            # Still usable by the thread that checked it out
+            assert conn.execute("SELECT COUNT(*) FROM settings").fetchone()[0] >= 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        with _ConnectionContext(pooled_store.db_path) as new_conn:
+            assert new_conn is not conn
+
+    def test_close_all_closes_idle_connections(self, pooled_store):
+        """Idle pooled connections are closed right away."""
+        with _ConnectionContext(pooled_store.db_path) as conn:
+            pass
+        assert close_pooled_connections(pooled_store.db_path) >= 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
 class TestSchemaInitialization:
     """Test database schema creation."""
 
@@ -822,6 +943,28 @@ class TestMigrations:
         assert 'failed_files' in columns
         conn.close()
 
+    def test_migration_adds_scan_cache_content_hash(self, temp_db):
+        """Test migration adds content_hash to an existing scan cache table."""
+        conn = _connect(temp_db)
+        _ensure_schema(conn)
+        conn.execute("DROP TABLE image_scan_cache")
+        conn.execute(
+            "CREATE TABLE image_scan_cache (folder TEXT NOT NULL, name TEXT NOT NULL, "
+            "size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+            "width INTEGER NOT NULL DEFAULT 0, height INTEGER NOT NULL DEFAULT 0, "
+            "format TEXT, valid INTEGER NOT NULL, error TEXT, checked_ts INTEGER NOT NULL, "
+            "PRIMARY KEY (folder, name)) WITHOUT ROWID"
+        )
+        conn.execute("UPDATE settings SET value_text = '17' WHERE key = 'schema_version'")
+        _schema_initialized_dbs.discard(temp_db)
+        _ensure_schema(conn)
+
+        cursor = conn.execute("PRAGMA table_info(image_scan_cache)")
+        columns = [col[1] for col in cursor.fetchall()]
+
+        assert 'content_hash' in columns
+        conn.close()
+
     def test_migration_adds_custom_fields(self, temp_db):
         """Test migration adds custom1-4 fields."""
         conn = _connect(temp_db)
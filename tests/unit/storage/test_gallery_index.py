@@ -0,0 +1,169 @@
+"""Tests for the persistent index of uploaded galleries."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.storage import gallery_index
+from src.storage.gallery_index import GalleryIndex, parse_artifact_filename
+
+
+def _artifacts(directory, name, gallery_id):
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, f"{name}_{gallery_id}.json"),
+             os.path.join(directory, f"{name}_{gallery_id}_bbcode.txt")]
+    for path in paths:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("{}")
+    return paths
+
+
+@pytest.fixture
+def central(tmp_path):
+    path = tmp_path / "galleries"
+    path.mkdir()
+    return str(path)
+
+
+@pytest.fixture
+def index(tmp_path, central):
+    return GalleryIndex(str(tmp_path / "gallery_index.db"), central_path=central)
+
+
+class TestParseArtifactFilename:
+
+    def test_artifact_names(self):
+        assert parse_artifact_filename("My_Gallery_abc12.json") == ("My_Gallery", "abc12")
+        assert parse_artifact_filename("Beach_x9_bbcode.txt") == ("Beach", "x9")
+
+    def test_other_files(self):
+        assert parse_artifact_filename("notes.txt") is None
+        assert parse_artifact_filename("noid.json") is None
+
+
+class TestFindExisting:
+
+    def test_first_lookup_seeds_from_central_store(self, index, central, tmp_path):
+        existing = _artifacts(central, "Beach", "g1")
+        _artifacts(central, "Beach_Party", "g2")
+
+        found = index.find_existing([str(tmp_path / "a" / "Beach"), str(tmp_path / "Forest")])
+
+        # Exact gallery name: "Beach" no longer matches Beach_Party's artifacts
+        assert found == {str(tmp_path / "a" / "Beach"): sorted(existing)}
+        assert index.artifact_count() == 4
+
+    def test_batch_is_one_indexed_lookup(self, index, central, tmp_path):
+        for n in range(30):
+            _artifacts(central, f"Gallery {n}", f"id{n}")
+        folders = [str(tmp_path / f"Gallery {n}") for n in range(0, 60, 2)]
+        index.find_existing(folders[:1])  # Seed
+
+        with patch("glob.glob") as glob_spy, patch.object(gallery_index, "_scan_artifacts") as scan_spy:
+            found = index.find_existing(folders)
+
+        glob_spy.assert_not_called()
+        scan_spy.assert_not_called()
+        assert sorted(found) == sorted(folders[:15])
+
+    def test_recorded_folder_matches_after_rename(self, index, tmp_path):
+        folder = tmp_path / "Holiday"
+        paths = _artifacts(str(folder / ".uploaded"), "Renamed Gallery", "g7")
+        index.record(str(folder), "Renamed Gallery", "g7", paths)
+
+        assert index.find_existing([str(folder)]) == {str(folder): sorted(paths)}
+        assert index.find_existing([str(tmp_path / "elsewhere" / "Holiday")]) == {}
+
+    def test_bare_folder_name(self, index, central):
+        paths = _artifacts(central, "Beach", "g1")
+        assert index.find_existing(["Beach"]) == {"Beach": sorted(paths)}
+
+    def test_deleted_artifacts_stop_matching(self, index, central, tmp_path):
+        paths = _artifacts(central, "Beach", "g1")
+        folder = str(tmp_path / "Beach")
+        assert index.find_existing([folder])
+
+        os.remove(paths[0])
+        assert index.find_existing([folder]) == {folder: [paths[1]]}
+        os.remove(paths[1])
+        assert index.find_existing([folder]) == {}
+        assert index.artifact_count() == 0
+
+    def test_artifacts_saved_after_seeding_are_found(self, index, central, tmp_path):
+        index.find_existing([str(tmp_path / "x")])
+        paths = _artifacts(central, "Late", "g3")
+        index.record(str(tmp_path / "src" / "Late"), "Late", "g3", paths)
+
+        assert index.find_existing([str(tmp_path / "Late")]) == {str(tmp_path / "Late"): sorted(paths)}
+
+
+class TestRebuild:
+
+    def test_rebuild_scans_central_and_uploaded_folders(self, index, central, tmp_path):
+        _artifacts(central, "Beach", "g1")
+        roots = tmp_path / "library"
+        uploaded = _artifacts(str(roots / "2024" / "Forest" / ".uploaded"), "Forest", "g2")
+        _artifacts(str(roots / "2024" / "Forest" / ".uploaded" / "nested" / ".uploaded"), "Skip", "g3")
+
+        result = index.rebuild(scan_roots=[str(roots)])
+
+        assert (result.central, result.folders, result.uploaded) == (2, 1, 2)
+        forest = str(roots / "2024" / "Forest")
+        assert index.find_existing([forest]) == {forest: sorted(uploaded)}
+
+    def test_rebuild_keeps_recorded_artifacts_outside_scanned_areas(self, index, central, tmp_path):
+        folder = tmp_path / "Other"
+        kept = _artifacts(str(folder / ".uploaded"), "Other", "g4")
+        index.record(str(folder), "Other", "g4", kept)
+        gone = _artifacts(str(tmp_path / "Gone" / ".uploaded"), "Gone", "g5")
+        index.record(str(tmp_path / "Gone"), "Gone", "g5", gone)
+        for path in gone:
+            os.remove(path)
+
+        result = index.rebuild()
+
+        assert result.kept == 2
+        assert index.artifact_count() == 2
+        assert index.find_existing([str(folder)]) == {str(folder): sorted(kept)}
+
+    def test_rebuild_keeps_source_folder_of_central_artifacts(self, index, central, tmp_path):
+        paths = _artifacts(central, "Named", "g6")
+        folder = str(tmp_path / "Folder")
+        index.record(folder, "Named", "g6", paths)
+
+        index.rebuild()
+
+        assert index.find_existing([folder]) == {folder: sorted(paths)}
+
+    def test_moved_central_store_is_reseeded(self, tmp_path, central):
+        db = str(tmp_path / "gallery_index.db")
+        GalleryIndex(db, central_path=central).find_existing(["x"])
+        moved = str(tmp_path / "moved")
+        paths = _artifacts(moved, "Beach", "g1")
+
+        assert GalleryIndex(db, central_path=moved).find_existing(["Beach"]) == {"Beach": sorted(paths)}
+
+
+class TestSaveGalleryArtifactsUpdatesIndex:
+
+    def test_saved_artifacts_are_recorded(self, index, central, tmp_path):
+        from src.storage.gallery_management import find_existing_galleries
+        from src.utils.templates import save_gallery_artifacts
+
+        folder = tmp_path / "Sunset"
+        folder.mkdir()
+        results = {'gallery_id': 'gx1', 'gallery_name': 'Sunset Pics', 'images': [],
+                   'avg_width': 10, 'avg_height': 10}
+        with patch('src.utils.templates.generate_bbcode_from_template', return_value="bb"), \
+                patch('src.utils.templates.load_post_titles', return_value={}), \
+                patch('src.utils.templates.load_user_defaults', return_value={}), \
+                patch('src.utils.templates.get_central_storage_path', return_value=central), \
+                patch('src.storage.gallery_index.get_gallery_index', return_value=index):
+            index.find_existing(["seed"])
+            written = save_gallery_artifacts(str(folder), results, file_host_uploads=[])
+            found = find_existing_galleries([str(folder)])
+
+        assert found[str(folder)] == sorted(
+            path for location in written.values() for path in location.values())
+        assert len(found[str(folder)]) == 4
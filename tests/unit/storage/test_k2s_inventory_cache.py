@@ -0,0 +1,130 @@
+"""Tests for the persistent K2S-family inventory cache."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.network.k2s_file_checker import FolderListing, K2SFileChecker
+from src.storage.k2s_inventory_cache import K2SInventoryCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return K2SInventoryCache(str(tmp_path / "k2s_inventory.db"))
+
+
+def _file(file_id, size=100, state='available'):
+    return {'id': file_id, 'name': f'{file_id}.zip', 'size': size,
+            'extended_info': {'storage_object': state}}
+
+
+def _walk(*folders):
+    """Root listing plus one FolderListing per (folder_id, files) pair."""
+    listings = [FolderListing(folder_id='/', parent_id=None,
+                              subfolder_ids=[folder_id for folder_id, _ in folders], files=[])]
+    listings += [FolderListing(folder_id=folder_id, parent_id='/', files=files)
+                 for folder_id, files in folders]
+    return listings
+
+
+class TestRefresh:
+
+    def test_first_refresh_stores_inventory(self, cache):
+        result = cache.refresh('keep2share', _walk(
+            ('d1', [_file('f1', 100), _file('f2', 200, 'removed')]),
+            ('d2', [_file('f3', 300)]),
+        ))
+
+        assert result.complete
+        assert (result.folders, result.changed, result.failed) == (3, 3, 0)
+        assert cache.file_count('keep2share') == 3
+        assert cache.storage_used('keep2share') == 400
+        assert cache.is_fresh('keep2share')
+        assert not cache.is_fresh('fileboom')
+
+    def test_unchanged_folders_are_not_rewritten(self, cache):
+        cache.refresh('keep2share', _walk(('d1', [_file('f1')]), ('d2', [_file('f2')])))
+
+        with patch.object(K2SInventoryCache, '_replace_folder',
+                          wraps=K2SInventoryCache._replace_folder) as replace_spy:
+            result = cache.refresh('keep2share', _walk(
+                ('d1', [_file('f1')]),
+                ('d2', [_file('f2', state='removed')]),
+            ))
+
+        assert result.changed == 1
+        assert [call.args[2].folder_id for call in replace_spy.call_args_list] == ['d2']
+        assert cache.get_files('keep2share', ['f2'])['f2']['is_available'] is False
+
+    def test_vanished_folder_removed_after_complete_walk(self, cache):
+        cache.refresh('keep2share', _walk(('d1', [_file('f1')]), ('d2', [_file('f2')])))
+
+        result = cache.refresh('keep2share', _walk(('d1', [_file('f1')])))
+
+        assert result.removed == 1
+        assert set(cache.get_files('keep2share', ['f1', 'f2'])) == {'f1'}
+
+    def test_failed_listing_keeps_previous_rows(self, cache):
+        cache.refresh('keep2share', _walk(('d1', [_file('f1')]), ('d2', [_file('f2')])))
+        walk = _walk(('d1', None))  # d1 listing failed, d2 not reached
+
+        result = cache.refresh('keep2share', walk)
+
+        assert not result.complete
+        assert (result.failed, result.removed) == (1, 0)
+        assert set(cache.get_files('keep2share', ['f1', 'f2'])) == {'f1', 'f2'}
+
+    def test_cancelled_walk_is_not_complete(self, cache):
+        cache.refresh('keep2share', _walk(('d1', [_file('f1')]), ('d2', [_file('f2')])))
+        cancel = threading.Event()
+        cancel.set()
+
+        result = cache.refresh('keep2share', _walk(('d1', [_file('f1')])), cancel_event=cancel)
+
+        assert not result.complete
+        assert cache.file_count('keep2share') == 2
+
+    def test_file_moved_between_folders(self, cache):
+        cache.refresh('keep2share', _walk(('d1', [_file('f1')]), ('d2', [])))
+
+        cache.refresh('keep2share', _walk(('d2', [_file('f1')]), ('d1', [])))
+
+        assert cache.file_count('keep2share') == 1
+        assert cache.storage_used('keep2share') == 100
+
+    def test_hosts_are_separate(self, cache):
+        cache.refresh('keep2share', _walk(('d1', [_file('f1')])))
+        cache.refresh('tezfiles', _walk(('d1', [_file('f2')])))
+
+        assert set(cache.get_files('keep2share', ['f1', 'f2'])) == {'f1'}
+        assert set(cache.get_files('tezfiles', ['f1', 'f2'])) == {'f2'}
+
+    def test_stale_host_is_not_fresh(self, cache):
+        cache.refresh('keep2share', _walk(('d1', [_file('f1')])))
+
+        with patch('src.storage.k2s_inventory_cache.time.time', return_value=time.time() + 3600):
+            assert not cache.is_fresh('keep2share')
+
+
+class TestLookup:
+
+    def test_lookup_feeds_check_gallery_from_inventory(self, cache):
+        cache.refresh('keep2share', _walk(
+            ('d1', [_file(f'f{i}', state='available' if i % 2 else 'removed') for i in range(1200)]),
+        ))
+        file_id_to_url = {f'f{i}': f'http://k2s.cc/file/f{i}' for i in range(1, 1201)}
+
+        inventory = cache.get_files('keep2share', file_id_to_url)
+        checker = K2SFileChecker(api_base="https://k2s.cc/api/v2", auth_token="fake")
+        result = checker.check_gallery_from_inventory(file_id_to_url, inventory)
+
+        assert len(inventory) == 1199  # f1200 is not in the account
+        assert result['status'] == 'partial'
+        assert result['online'] == 600
+        assert result['offline'] == 600
+        assert 'http://k2s.cc/file/f1200' in result['offline_urls']
+
+    def test_empty_lookup(self, cache):
+        assert cache.get_files('keep2share', []) == {}
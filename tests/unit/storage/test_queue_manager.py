@@ -63,6 +63,8 @@ def mock_store():
     store.bulk_upsert_async.return_value = None
     store.delete_by_paths.return_value = 1
     store.update_item_custom_field.return_value = True
+    store.get_image_scan_cache.return_value = {}
+    store.prune_image_scan_cache.return_value = 0
     return store
 
 
@@ -1285,3 +1287,67 @@ class TestComprehensiveScanVideoItem:
             assert item.media_type == "video"
             assert item.scan_complete is True
             assert item.total_images == 1  # only video files counted
+
+
+class TestScanWorkerPool:
+    """Test the pooled scan pipeline"""
+
+    def test_galleries_scan_concurrently(self, queue_manager):
+        """Different paths are scanned on separate pool threads"""
+        barrier = threading.Barrier(3, timeout=5)
+        reached = []
+
+        def fake_scan(path):
+            barrier.wait()
+            reached.append(path)
+
+        queue_manager._comprehensive_scan_item = fake_scan
+        for i in range(3):
+            queue_manager._scan_queue.put(f"/fake/gallery{i}")
+
+        deadline = time.time() + 5
+        while len(reached) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert sorted(reached) == ["/fake/gallery0", "/fake/gallery1", "/fake/gallery2"]
+
+    def test_same_path_never_scans_twice_at_once(self, queue_manager):
+        """Repeat requests for a path run one after another, none are dropped"""
+        lock = threading.Lock()
+        running = {"now": 0, "max": 0}
+        calls = []
+
+        def fake_scan(path):
+            with lock:
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+            time.sleep(0.05)
+            with lock:
+                running["now"] -= 1
+                calls.append(path)
+
+        queue_manager._comprehensive_scan_item = fake_scan
+        for _ in range(3):
+            queue_manager._scan_queue.put("/fake/same")
+
+        deadline = time.time() + 5
+        while len(calls) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert calls == ["/fake/same"] * 3
+        assert running["max"] == 1
+
+    def test_scan_status_reports_throughput(self, queue_manager):
+        """scan_status_changed carries galleries/s and files/s"""
+        emitted = []
+        queue_manager.scan_status_changed.connect(lambda *args: emitted.append(args))
+        queue_manager._comprehensive_scan_item = lambda path: None
+
+        queue_manager._scan_one("/fake/rated")
+
+        assert emitted
+        queue_size, pending, galleries_per_s, files_per_s = emitted[-1]
+        assert galleries_per_s > 0
+        assert files_per_s == 0  # path is not a queue item
+
+    def test_scan_rates_idle(self, queue_manager):
+        """No recent completions means zero throughput"""
+        assert queue_manager._scan_rates() == (0.0, 0.0)
@@ -0,0 +1,128 @@
+"""Tests for the persistent per-file scan result cache."""
+
+import hashlib
+import os
+import tempfile
+import time
+
+import pytest
+from PIL import Image
+
+from src.storage.database import QueueStore, _ConnectionContext
+from src.storage.scan_cache import ImageScanCache
+from src.utils.image_header import read_image_header
+
+
+@pytest.fixture
+def queue_store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = QueueStore(db_path=os.path.join(tmpdir, 'test.db'))
+        yield store
+        store.close()
+
+
+@pytest.fixture
+def gallery(tmp_path):
+    folder = tmp_path / 'gallery'
+    folder.mkdir()
+    for i in range(3):
+        Image.new('RGB', (100 + i, 50), color='red').save(folder / f'img{i}.jpg')
+    (folder / 'bad.jpg').write_bytes(b'\x00' * 16)
+    return str(folder)
+
+
+def _scan(cache, folder):
+    """Run a lookup, read the misses, store them; return (headers, files read)."""
+    files = sorted(os.listdir(folder))
+    hits, misses = cache.lookup(folder, files)
+    fresh = {f: read_image_header(os.path.join(folder, f), hash_content=True)
+             for f in misses}
+    cache.store_results(folder, {f: (misses[f], fresh[f]) for f in misses})
+    return {**hits, **fresh}, sorted(misses)
+
+
+class TestImageScanCache:
+
+    def test_second_scan_is_all_hits(self, queue_store, gallery):
+        cache = ImageScanCache(queue_store)
+        first, read = _scan(cache, gallery)
+        assert len(read) == 4
+
+        second, read = _scan(cache, gallery)
+        assert read == []
+        assert second == first
+        stats = cache.stats()
+        assert stats['hits'] == 4
+        assert stats['misses'] == 4
+        assert stats['hit_rate'] == 0.5
+
+    def test_content_hash_is_returned(self, queue_store, gallery):
+        cache = ImageScanCache(queue_store)
+        _scan(cache, gallery)
+        hits, misses = cache.lookup(gallery, ['img0.jpg'])
+        assert misses == {}
+        with open(os.path.join(gallery, 'img0.jpg'), 'rb') as f:
+            expected = hashlib.md5(f.read()).hexdigest()
+        assert hits['img0.jpg'].content_hash == expected
+
+    def test_row_without_hash_is_a_miss(self, queue_store, gallery):
+        cache = ImageScanCache(queue_store)
+        _scan(cache, gallery)
+        with _ConnectionContext(queue_store.db_path) as conn:
+            conn.execute("UPDATE image_scan_cache SET content_hash = NULL")
+        _, read = _scan(cache, gallery)
+        assert len(read) == 4
+
+    def test_invalid_verdict_is_cached(self, queue_store, gallery):
+        cache = ImageScanCache(queue_store)
+        _scan(cache, gallery)
+        headers, _ = _scan(cache, gallery)
+        assert not headers['bad.jpg'].valid
+        assert headers['img1.jpg'].dimensions == (101, 50)
+
+    def test_modified_file_is_read_again(self, queue_store, gallery):
+        cache = ImageScanCache(queue_store)
+        _scan(cache, gallery)
+
+        path = os.path.join(gallery, 'img0.jpg')
+        Image.new('RGB', (300, 200), color='blue').save(path)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        headers, read = _scan(cache, gallery)
+        assert read == ['img0.jpg']
+        assert headers['img0.jpg'].dimensions == (300, 200)
+
+    def test_prune_evicts_deleted_folders(self, queue_store, gallery, tmp_path):
+        cache = ImageScanCache(queue_store)
+        _scan(cache, gallery)
+        gone = tmp_path / 'gone'
+        gone.mkdir()
+        Image.new('RGB', (10, 10)).save(gone / 'a.jpg')
+        _scan(cache, str(gone))
+
+        for f in os.listdir(gone):
+            os.remove(gone / f)
+        gone.rmdir()
+
+        assert cache.prune() == 1
+        assert queue_store.get_image_scan_cache(str(gone)) == {}
+        assert len(queue_store.get_image_scan_cache(gallery)) == 4
+        assert cache.stats()['evicted'] == 1
+
+    def test_prune_evicts_unused_folders(self, queue_store, gallery):
+        cache = ImageScanCache(queue_store, max_age_days=30)
+        _scan(cache, gallery)
+        old = int(time.time()) - 31 * 86400
+        with _ConnectionContext(queue_store.db_path) as conn:
+            conn.execute("UPDATE image_scan_cache SET checked_ts = ?", (old,))
+
+        assert cache.prune() == 4
+        assert queue_store.get_image_scan_cache(gallery) == {}
+
+    def test_invalidate(self, queue_store, gallery):
+        cache = ImageScanCache(queue_store)
+        _scan(cache, gallery)
+        cache.invalidate(gallery)
+        _, read = _scan(cache, gallery)
+        assert len(read) == 4
@@ -24,6 +24,8 @@ def _make_queue_manager():
     qm._pending_save_timer = None
     qm._version = 0
     qm._scan_queue = MagicMock()
+    qm._verify_pool = None
+    qm._scan_cache = None
     qm.status_changed = MagicMock()
     qm.scan_status_changed = MagicMock()
     qm.store = MagicMock()
@@ -206,3 +208,35 @@ class TestScanResultKeys:
                 'file_sizes', 'file_dimensions',
             }
             assert expected_keys.issubset(result.keys())
+
+
+@pytest.mark.unit
+class TestScanCacheIntegration:
+    """_scan_images() skips header reads for files unchanged since the last scan."""
+
+    @pytest.mark.parametrize('fast_scan', [True, False])
+    def test_rescan_reads_no_headers(self, fast_scan):
+        from src.storage.database import QueueStore
+        from src.storage.scan_cache import ImageScanCache
+
+        qm = _make_queue_manager()
+        qm._get_scanning_config = lambda: {'fast_scan': fast_scan, 'pil_sampling': 2}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = QueueStore(db_path=os.path.join(tmpdir, 'cache.db'))
+            qm._scan_cache = ImageScanCache(store)
+            gallery = os.path.join(tmpdir, 'gallery')
+            os.makedirs(gallery)
+            _create_real_images(gallery, [('a.jpg', 120, 80), ('b.jpg', 60, 40)])
+            files = sorted(os.listdir(gallery))
+
+            with patch('src.storage.queue_manager.QSettings'):
+                first = qm._scan_images(gallery, files)
+                with patch('src.storage.queue_manager.read_image_header',
+                           side_effect=AssertionError("header re-read")):
+                    second = qm._scan_images(gallery, files)
+            store.close()
+
+        assert second['file_dimensions'] == first['file_dimensions'] == {'a.jpg': (120, 80), 'b.jpg': (60, 40)}
+        assert second['total_size'] == first['total_size']
+        assert qm._scan_cache.stats()['hits'] == 2
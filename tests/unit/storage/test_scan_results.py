@@ -384,3 +384,28 @@ class TestGetGalleriesForScanAgeMode:
         db_ids = [g['db_id'] for g in result['image_galleries']]
         assert 1 in db_ids
         assert 2 in db_ids
+
+
+class TestScanCheckpoint:
+    """Tests for the link scan checkpoint and resume queries."""
+
+    def test_checkpoint_round_trip(self, store):
+        assert store.get_scan_checkpoint() is None
+        store.save_scan_checkpoint({'scan_key': 'age:7::last_scan', 'started_ts': 123})
+        assert store.get_scan_checkpoint() == {'scan_key': 'age:7::last_scan', 'started_ts': 123}
+        store.clear_scan_checkpoint()
+        assert store.get_scan_checkpoint() is None
+
+    def test_checked_since(self, store):
+        conn = _connect(store.db_path)
+        conn.execute(
+            "INSERT INTO galleries (path, name, status, added_ts) VALUES (?, ?, ?, ?)",
+            ('/test/cp', 'cp', 'completed', int(time.time()))
+        )
+        gal_id = conn.execute("SELECT id FROM galleries WHERE path = '/test/cp'").fetchone()[0]
+        conn.close()
+        store.bulk_upsert_scan_results([
+            (gal_id, 'image', 'turbo', 'online', 1, 1, 1000, None),
+            (gal_id, 'file', 'rapidgator', 'online', 1, 1, 2000, None),
+        ])
+        assert store.get_scan_results_checked_since(1500) == {(gal_id, 'file', 'rapidgator')}
@@ -0,0 +1,94 @@
+"""Tests for the in-process file host work signal."""
+
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from src.storage.database import QueueStore
+from src.storage.work_signal import WorkSignal, get_file_host_work_signal
+
+
+@pytest.fixture
+def queue_store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = QueueStore(db_path=os.path.join(tmpdir, 'test.db'))
+        yield store, tmpdir
+        store.close()
+
+
+class TestWorkSignal:
+
+    def test_wait_times_out_without_notify(self):
+        signal = WorkSignal()
+        seen = signal.generation('rapidgator')
+        assert signal.wait('rapidgator', seen, timeout=0.05) is False
+
+    def test_notify_before_wait_is_not_lost(self):
+        """A notify between reading the generation and waiting returns at once."""
+        signal = WorkSignal()
+        seen = signal.generation('rapidgator')
+        signal.notify('rapidgator')
+        start = time.monotonic()
+        assert signal.wait('rapidgator', seen, timeout=5) is True
+        assert time.monotonic() - start < 1
+
+    def test_channels_are_independent(self):
+        signal = WorkSignal()
+        seen = signal.generation('rapidgator')
+        signal.notify('gofile')
+        assert signal.wait('rapidgator', seen, timeout=0.05) is False
+
+    def test_broadcast_wakes_every_channel(self):
+        signal = WorkSignal()
+        seen_a = signal.generation('rapidgator')
+        seen_b = signal.generation('gofile')
+        signal.notify()
+        assert signal.wait('rapidgator', seen_a, timeout=0) is True
+        assert signal.wait('gofile', seen_b, timeout=0) is True
+
+    def test_wakes_blocked_waiter(self):
+        signal = WorkSignal()
+        seen = signal.generation('rapidgator')
+        woke = []
+
+        def waiter():
+            woke.append(signal.wait('rapidgator', seen, timeout=5))
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        signal.notify('rapidgator')
+        thread.join(timeout=5)
+        assert woke == [True]
+
+
+class TestQueueStoreNotifies:
+
+    def test_add_pending_upload_notifies_host(self, queue_store):
+        store, tmpdir = queue_store
+        signal = get_file_host_work_signal()
+        seen = signal.generation('rapidgator')
+        store.add_file_host_upload(tmpdir, 'rapidgator', status='pending')
+        assert signal.generation('rapidgator') != seen
+
+    def test_add_blocked_upload_does_not_notify(self, queue_store):
+        store, tmpdir = queue_store
+        signal = get_file_host_work_signal()
+        seen = signal.generation('keep2share')
+        store.add_file_host_upload(tmpdir, 'keep2share', status='blocked')
+        assert signal.generation('keep2share') == seen
+
+    def test_update_to_pending_notifies_host(self, queue_store):
+        store, tmpdir = queue_store
+        signal = get_file_host_work_signal()
+        upload_id = store.add_file_host_upload(tmpdir, 'fileboom', status='blocked')
+
+        seen = signal.generation('fileboom')
+        store.update_file_host_upload(upload_id, uploaded_bytes=10)
+        assert signal.generation('fileboom') == seen
+
+        store.update_file_host_upload(upload_id, status='pending')
+        assert signal.generation('fileboom') != seen
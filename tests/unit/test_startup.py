@@ -0,0 +1,54 @@
+"""Tests for the bbdrop.py startup fast paths (version, single-instance handoff)."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import bbdrop
+
+
+@pytest.fixture
+def argv(monkeypatch):
+    def set_argv(*args):
+        monkeypatch.setattr(sys, "argv", ["bbdrop.py", *args])
+    return set_argv
+
+
+@pytest.fixture
+def setup_calls():
+    """The credential migrations that a fast path must not reach."""
+    with patch("src.utils.credentials.migrate_credentials_from_ini") as migrate:
+        yield migrate
+
+
+class TestStartupFastPaths:
+
+    def test_gui_handoff_forwards_folder_before_setup(self, argv, setup_calls, tmp_path):
+        argv("--gui", "--debug", str(tmp_path))
+        with patch("src.network.single_instance.check_single_instance", return_value=True) as check:
+            assert bbdrop.main() is None
+
+        check.assert_called_once_with(str(tmp_path))
+        setup_calls.assert_not_called()
+
+    def test_gui_handoff_without_folder_brings_instance_to_front(self, argv, setup_calls, capsys):
+        argv("--gui")
+        with patch("src.network.single_instance.check_single_instance", return_value=True) as check:
+            bbdrop.main()
+
+        check.assert_called_once_with()
+        assert "already running" in capsys.readouterr().out
+        setup_calls.assert_not_called()
+
+    def test_non_folder_arguments_are_not_forwarded(self, tmp_path):
+        with patch("src.network.single_instance.check_single_instance") as check:
+            assert bbdrop._handoff_to_running_instance([str(tmp_path / "missing")]) is False
+        check.assert_not_called()
+
+    def test_version_skips_setup(self, argv, setup_calls, capsys):
+        argv("--version")
+        bbdrop.main()
+
+        assert capsys.readouterr().out.strip() == f"imxup {bbdrop.__version__}"
+        setup_calls.assert_not_called()
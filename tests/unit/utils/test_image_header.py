@@ -0,0 +1,101 @@
+"""Tests for the single-pass image header reader."""
+
+import hashlib
+import os
+
+import pytest
+from PIL import Image
+
+from src.utils.image_header import read_image_header
+
+
+def _save(tmp_path, name, size, fmt=None, **kwargs):
+    path = tmp_path / name
+    Image.new('RGB', size, color='red').save(path, format=fmt, **kwargs)
+    return str(path)
+
+
+class TestFastPathFormats:
+    """JPEG, PNG and GIF headers are parsed without PIL"""
+
+    @pytest.mark.parametrize('name,fmt', [
+        ('a.jpg', 'JPEG'),
+        ('a.png', 'PNG'),
+        ('a.gif', 'GIF'),
+    ])
+    def test_reads_dimensions_and_size(self, tmp_path, name, fmt):
+        path = _save(tmp_path, name, (321, 123))
+        header = read_image_header(path)
+        assert header.valid
+        assert header.format == fmt
+        assert header.dimensions == (321, 123)
+        assert header.size == os.path.getsize(path)
+
+    def test_progressive_jpeg_with_exif(self, tmp_path):
+        img = Image.new('RGB', (640, 480), color='blue')
+        exif = Image.Exif()
+        exif[0x010F] = 'Camera' * 200
+        path = str(tmp_path / 'p.jpg')
+        img.save(path, progressive=True, exif=exif.tobytes())
+        header = read_image_header(path)
+        assert header.valid
+        assert header.dimensions == (640, 480)
+
+    def test_fast_path_skips_pil(self, tmp_path, monkeypatch):
+        path = _save(tmp_path, 'a.jpg', (10, 20))
+        import src.utils.image_header as image_header
+
+        def fail(*args, **kwargs):
+            raise AssertionError("PIL should not be used")
+
+        monkeypatch.setattr(image_header, '_read_with_pil', fail)
+        assert read_image_header(path).dimensions == (10, 20)
+
+    def test_hash_content(self, tmp_path):
+        path = _save(tmp_path, 'a.png', (64, 64))
+        with open(path, 'rb') as f:
+            expected = hashlib.md5(f.read()).hexdigest()
+        assert read_image_header(path).content_hash is None
+        header = read_image_header(path, hash_content=True)
+        assert header.dimensions == (64, 64)
+        assert header.content_hash == expected
+
+
+class TestValidity:
+    """Verdicts match PIL for broken and unusual files"""
+
+    def test_garbage_is_invalid(self, tmp_path):
+        path = tmp_path / 'bad.jpg'
+        path.write_bytes(b'\x00\x00\x00\x00')
+        header = read_image_header(str(path))
+        assert not header.valid
+        assert header.error.startswith("Invalid image:")
+        assert header.size == 4
+
+    def test_truncated_jpeg_header_is_invalid(self, tmp_path):
+        path = _save(tmp_path, 'a.jpg', (100, 100))
+        with open(path, 'rb') as f:
+            data = f.read(30)
+        with open(path, 'wb') as f:
+            f.write(data)
+        assert not read_image_header(path).valid
+
+    def test_truncated_png_is_invalid(self, tmp_path):
+        path = _save(tmp_path, 'a.png', (100, 100))
+        with open(path, 'rb') as f:
+            data = f.read()
+        with open(path, 'wb') as f:
+            f.write(data[:-20])
+        assert not read_image_header(path).valid
+
+    def test_misnamed_file_falls_back_to_pil(self, tmp_path):
+        path = _save(tmp_path, 'really_bmp.jpg', (40, 30), fmt='BMP')
+        header = read_image_header(path)
+        assert header.valid
+        assert header.format == 'BMP'
+        assert header.dimensions == (40, 30)
+
+    def test_missing_file(self, tmp_path):
+        header = read_image_header(str(tmp_path / 'missing.jpg'))
+        assert not header.valid
+        assert header.size is None
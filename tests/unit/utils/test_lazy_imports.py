@@ -0,0 +1,39 @@
+"""Tests for module attributes imported on first use."""
+
+import sys
+import types
+
+import pytest
+
+from src.utils.lazy_imports import LazyImports
+
+
+@pytest.fixture
+def module():
+    mod = types.ModuleType("lazy_host")
+    mod._lazy = LazyImports("lazy_host", {"OrderedDict": "collections", "Missing": "collections"})
+    mod.__getattr__ = mod._lazy.load
+    sys.modules["lazy_host"] = mod
+    yield mod
+    del sys.modules["lazy_host"]
+
+
+class TestLazyImports:
+
+    def test_first_access_imports_and_caches(self, module):
+        from collections import OrderedDict
+
+        assert "OrderedDict" not in vars(module)
+        assert module.OrderedDict is OrderedDict
+        assert vars(module)["OrderedDict"] is OrderedDict
+        assert module._lazy.OrderedDict is OrderedDict
+
+    def test_patched_value_wins(self, module, monkeypatch):
+        monkeypatch.setattr("lazy_host.OrderedDict", dict)
+        assert module._lazy.OrderedDict is dict
+
+    def test_unknown_names_raise_attribute_error(self, module):
+        with pytest.raises(AttributeError):
+            module.NotMapped
+        with pytest.raises(AttributeError):
+            module.Missing  # Mapped, but not in the source module
@@ -0,0 +1,166 @@
+"""Tests for the block index over current and rotated log files."""
+
+import gzip
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import log_index
+from src.utils.log_index import LogIndex, LogQuery, parse_record_start
+
+
+def _line(day, second, level, category, message):
+    return f"2026-10-{day:02d} 12:{second // 60:02d}:{second % 60:02d} {level}: [{category}] {message}\n"
+
+
+def _day_lines(day, count=300):
+    lines = []
+    for i in range(count):
+        if i % 50 == 0:
+            lines.append(_line(day, i, "ERROR", "uploads", f"Upload failed for gallery_{day}_{i} on imx"))
+            lines.append("Traceback (most recent call last):\n  RuntimeError: boom\n")
+        else:
+            lines.append(_line(day, i, "DEBUG", "network", f"Sent chunk {i} for gallery_{day}_{i} to rapidgator"))
+    return "".join(lines)
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    with gzip.open(tmp_path / "bbdrop.log.2026-10-14.gz", "wt", encoding="utf-8") as f:
+        f.write(_day_lines(14))
+    (tmp_path / "bbdrop.log.2026-10-15").write_text(_day_lines(15), encoding="utf-8")
+    (tmp_path / "bbdrop.log").write_text(_day_lines(16), encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def index(logs_dir):
+    idx = LogIndex(str(logs_dir))
+    idx.update()
+    return idx
+
+
+class TestParseRecordStart:
+
+    def test_record_line(self):
+        assert parse_record_start("2026-10-16 12:00:01 WARNING: [uploads:file] Slow host") == (
+            "2026-10-16 12:00:01", "warning", "uploads", "Slow host")
+
+    def test_defaults_and_continuation(self):
+        assert parse_record_start("2026-10-16 12:00:01 plain") == ("2026-10-16 12:00:01", "info", "general", "plain")
+        assert parse_record_start("  File \"x.py\", line 1") is None
+
+
+class TestSearch:
+
+    def test_text_search_spans_rotated_and_gz_files(self, index):
+        matches = index.search(LogQuery(text="gallery_14_100"))
+
+        assert [m.message for m in matches] == ["Upload failed for gallery_14_100 on imx"]
+        assert matches[0].path.endswith(".gz")
+        assert (matches[0].level, matches[0].category) == ("error", "uploads")
+
+    def test_results_are_newest_first(self, index):
+        matches = index.search(LogQuery(min_level="error", text="upload failed"))
+
+        stamps = [m.timestamp for m in matches]
+        assert len(stamps) == 18
+        assert stamps == sorted(stamps, reverse=True)
+        assert stamps[0].startswith("2026-10-16")
+
+    def test_level_and_category_filters(self, index):
+        errors = index.search(LogQuery(min_level="error"))
+        network = index.search(LogQuery(categories={"network"}, text="rapidgator"), limit=10)
+
+        # Each error record has two traceback continuation lines
+        assert len(errors) == 3 * 6 * 3
+        assert {m.category for m in errors} == {"uploads"}
+        assert any(m.message.strip() == "RuntimeError: boom" for m in errors)
+        assert len(network) == 10 and {m.category for m in network} == {"network"}
+
+    def test_jump_to_time(self, index):
+        matches = index.search(LogQuery(until="2026-10-15 12:02:00"), limit=3)
+
+        assert [m.timestamp for m in matches] == ["2026-10-15 12:02:00", "2026-10-15 12:01:59",
+                                                  "2026-10-15 12:01:58"]
+
+    def test_word_prefix_and_unknown_word(self, index):
+        assert index.search(LogQuery(text="rapidgat", since="2026-10-16 12:04:59"))
+        assert index.search(LogQuery(text="mediafire")) == []
+
+    def test_text_starting_mid_word(self, index):
+        """The Find box matches substrings, so "allery" must find "gallery_16_7"."""
+        expected = index.search(LogQuery(text="gallery_16_7"))
+        assert expected
+        assert index.search(LogQuery(text="allery_16_7")) == expected
+        assert index.search(LogQuery(text="ery_16_7 to rapid")) == \
+            index.search(LogQuery(text="gallery_16_7 to rapid")) != []
+        assert index.search(LogQuery(text="allery_16_7 to gator")) == []
+
+    def test_only_candidate_blocks_are_read(self, logs_dir):
+        with patch.object(log_index, "BLOCK_SIZE", 1024):
+            idx = LogIndex(str(logs_dir))
+            idx.update()
+        reads = []
+        real_scan = LogIndex._scan_blocks
+
+        def spy(self, path, blocks, query, cancel_event):
+            reads.extend(blocks)
+            return real_scan(self, path, blocks, query, cancel_event)
+
+        with patch.object(LogIndex, "_scan_blocks", spy):
+            assert len(idx.search(LogQuery(text="gallery_15_42"))) == 1
+
+        conn = sqlite3.connect(idx.db_path)
+        total_blocks = conn.execute("SELECT COUNT(*) FROM log_blocks").fetchone()[0]
+        conn.close()
+        assert len(reads) == 1 < total_blocks
+
+
+class TestUpdate:
+
+    def test_incremental_update_reads_only_new_data(self, index, logs_dir):
+        assert index.update() == 0
+
+        with open(logs_dir / "bbdrop.log", "a", encoding="utf-8") as f:
+            f.write(_line(16, 3000, "INFO", "queue", "Added gallery_new_one"))
+        assert 0 < index.update() <= log_index.BLOCK_SIZE + 200
+
+        assert [m.message for m in index.search(LogQuery(text="gallery_new_one"))] == ["Added gallery_new_one"]
+
+    def test_partial_last_line_is_not_indexed(self, index, logs_dir):
+        with open(logs_dir / "bbdrop.log", "a", encoding="utf-8") as f:
+            f.write("2026-10-16 13:00:00 INFO: [queue] half writ")
+        index.update()
+        assert index.search(LogQuery(text="half")) == []
+
+        with open(logs_dir / "bbdrop.log", "a", encoding="utf-8") as f:
+            f.write("ten\n")
+        index.update()
+        assert [m.message for m in index.search(LogQuery(text="half"))] == ["half written"]
+
+    def test_rotation_reuses_index(self, index, logs_dir):
+        current = logs_dir / "bbdrop.log"
+        rotated = logs_dir / "bbdrop.log.2026-10-16.gz"
+        with open(current, "rb") as f_in, gzip.open(rotated, "wb") as f_out:
+            f_out.write(f_in.read())
+        os.remove(current)
+        current.write_text(_line(17, 0, "INFO", "general", "New day"), encoding="utf-8")
+
+        with patch.object(LogIndex, "_index_file", wraps=index._index_file) as index_spy:
+            index.update()
+
+        assert [call.args[2] for call in index_spy.call_args_list] == [str(current)]
+        matches = index.search(LogQuery(text="gallery_16_250"))
+        assert [m.path for m in matches] == [str(rotated)]
+
+    def test_deleted_file_is_dropped(self, index, logs_dir):
+        os.remove(logs_dir / "bbdrop.log.2026-10-14.gz")
+        index.update()
+
+        assert index.search(LogQuery(text="gallery_14_100")) == []
+        conn = sqlite3.connect(index.db_path)
+        assert conn.execute("SELECT COUNT(*) FROM log_files").fetchone()[0] == 2
+        conn.close()
@@ -6,7 +6,7 @@ Testing unified logging interface and message routing
 
 import pytest
 import logging
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 from src.utils.logger import (
     timestamp,
     set_main_window,
@@ -524,3 +524,204 @@ class TestCategorySubtype:
 
         # Should check upload success mode
         mock_logger.should_log_upload_file_success.assert_called_once_with("gui")
+
+
+class TestLazyArgs:
+    """Test deferred %-formatting through args"""
+
+    @patch('src.utils.logger._get_app_logger')
+    def test_args_are_formatted(self, mock_get_logger):
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+        mock_logger.should_emit_file.return_value = True
+
+        log("Sent %d bytes to %s", level="info", category="network", args=(42, "imx"))
+
+        assert "Sent 42 bytes to imx" in mock_logger.log_to_file.call_args[0][0]
+
+    @patch('src.utils.logger._get_app_logger')
+    def test_bad_args_do_not_raise(self, mock_get_logger):
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+        mock_logger.should_emit_file.return_value = True
+
+        log("No placeholders", level="info", category="general", args=(1,))
+
+        assert "No placeholders (1,)" in mock_logger.log_to_file.call_args[0][0]
+
+    @patch('src.utils.logger._get_app_logger')
+    def test_filtered_record_is_never_formatted(self, mock_get_logger):
+        from src.utils import logger
+
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+        mock_logger.should_emit_file.return_value = False
+        mock_logger.should_emit_gui.return_value = False
+        logger._main_window = Mock()
+
+        arg = MagicMock()
+        log("Value %s", level="debug", category="network", args=(arg,))
+
+        arg.__str__.assert_not_called()
+        mock_logger.log_to_file.assert_not_called()
+        logger._main_window.add_log_message.assert_not_called()
+
+
+class TestBackgroundLogging:
+    """Test background (queued) logging mode"""
+
+    @pytest.fixture(autouse=True)
+    def stop_pipeline(self):
+        from src.utils.logger import stop_async_logging
+        stop_async_logging()
+        yield
+        stop_async_logging()
+
+    @pytest.fixture
+    def file_log(self):
+        mock_logger = Mock()
+        mock_logger.should_emit_file.return_value = True
+        with patch('src.utils.logger._get_app_logger', return_value=mock_logger):
+            yield mock_logger
+
+    def test_records_are_emitted_in_order(self, file_log):
+        from src.utils.logger import flush_logs, get_log_stats, start_async_logging
+
+        start_async_logging(max_queue=1000)
+        for i in range(200):
+            log("record %d", level="info", category="uploads", args=(i,))
+        assert flush_logs(timeout=5)
+
+        messages = [call[0][0] for call in file_log.log_to_file.call_args_list]
+        assert [int(m.rsplit(" ", 1)[1]) for m in messages] == list(range(200))
+        stats = get_log_stats()
+        assert stats["async"] and stats["processed"] == 200 and stats["dropped"] == 0
+
+    def test_log_returns_while_writer_is_busy(self, file_log):
+        import threading
+        from src.utils.logger import flush_logs, start_async_logging
+
+        release = threading.Event()
+        file_log.log_to_file.side_effect = lambda *a: release.wait(5)
+        start_async_logging(max_queue=1000)
+
+        log("first", level="info", category="general")
+        log("second", level="info", category="general")  # Must not wait on the first write
+        release.set()
+
+        assert flush_logs(timeout=5)
+        assert file_log.log_to_file.call_count == 2
+
+    def test_overflow_drops_oldest_but_keeps_errors(self, file_log):
+        import threading
+        from src.utils.logger import flush_logs, get_log_stats, start_async_logging
+
+        release = threading.Event()
+        file_log.log_to_file.side_effect = lambda *a: release.wait(5)
+        start_async_logging(max_queue=5, overflow="drop_oldest")
+        log("blocker", level="info", category="general")
+        while get_log_stats()["queued"]:  # Writer picked up the blocker
+            pass
+
+        for i in range(20):
+            log("info %d", level="info", category="general", args=(i,))
+        log("fatal", level="error", category="general")
+        release.set()
+        assert flush_logs(timeout=5)
+
+        # Threads left over from other tests may log into the same queue, so
+        # check this test's own records rather than exact totals
+        stats = get_log_stats()
+        assert stats["dropped"] >= 15
+        assert set(stats["dropped_by_level"]) == {"info"}
+        written = [call[0][0] for call in file_log.log_to_file.call_args_list]
+        assert any("fatal" in m for m in written)
+        assert any("dropped" in m and "log records" in m for m in written)
+        assert any(m.endswith("info 19") for m in written)
+        assert not any(m.endswith("info 0") for m in written)
+
+    def test_error_is_written_before_log_returns(self, file_log):
+        import time
+        from src.utils.logger import start_async_logging
+
+        file_log.log_to_file.side_effect = lambda *a: time.sleep(0.01)
+        start_async_logging(max_queue=1000)
+        for i in range(10):
+            log("info %d", level="info", category="general", args=(i,))
+        log("ERROR: disk full")  # Level taken from the prefix
+
+        written = [call[0][0] for call in file_log.log_to_file.call_args_list]
+        assert len(written) == 11
+        assert "disk full" in written[-1]
+
+    def test_default_overflow_blocks_instead_of_dropping(self, file_log):
+        import threading
+        from src.utils.logger import flush_logs, get_log_stats, start_async_logging
+
+        release = threading.Event()
+        file_log.log_to_file.side_effect = lambda *a: release.wait(5)
+        start_async_logging(max_queue=3)
+        assert get_log_stats()["overflow"] == "block"
+        log("blocker", level="info", category="general")
+        while get_log_stats()["queued"]:
+            pass
+
+        producer = threading.Thread(
+            target=lambda: [log("info %d", level="info", category="general", args=(i,)) for i in range(6)])
+        producer.start()
+        producer.join(0.3)
+        assert producer.is_alive()  # Waiting for room, not dropping
+        release.set()
+        producer.join(5)
+        assert flush_logs(timeout=5)
+
+        assert get_log_stats()["dropped"] == 0
+        written = [call[0][0] for call in file_log.log_to_file.call_args_list]
+        assert [m for m in written if "info " in m][-1].endswith("info 5")
+        assert len(written) == 7
+
+    def test_drop_newest_keeps_queued_records(self, file_log):
+        import threading
+        from src.utils.logger import flush_logs, get_log_stats, start_async_logging
+
+        release = threading.Event()
+        file_log.log_to_file.side_effect = lambda *a: release.wait(5)
+        start_async_logging(max_queue=3, overflow="drop_newest")
+        log("blocker", level="info", category="general")
+        while get_log_stats()["queued"]:
+            pass
+
+        for i in range(6):
+            log("info %d", level="info", category="general", args=(i,))
+        release.set()
+        assert flush_logs(timeout=5)
+
+        written = [call[0][0] for call in file_log.log_to_file.call_args_list]
+        assert any(m.endswith("info 2") for m in written)
+        assert not any(m.endswith("info 3") for m in written)
+
+    def test_stop_flushes_and_returns_to_sync(self, file_log):
+        from src.utils.logger import get_log_stats, start_async_logging, stop_async_logging
+
+        start_async_logging()
+        log("queued", level="info", category="general")
+        stop_async_logging()
+
+        assert file_log.log_to_file.call_count == 1
+        assert get_log_stats()["async"] is False
+
+        log("direct", level="info", category="general")
+        assert file_log.log_to_file.call_count == 2
+
+    def test_configure_follows_settings(self, file_log):
+        from src.utils.logger import configure_async_logging, get_log_stats
+
+        file_log.get_settings.return_value = {
+            "async_enabled": True, "async_queue_size": 500, "async_overflow": "block"}
+        configure_async_logging()
+        stats = get_log_stats()
+        assert (stats["async"], stats["max_queue"], stats["overflow"]) == (True, 500, "block")
+
+        file_log.get_settings.return_value = {"async_enabled": False}
+        configure_async_logging()
+        assert get_log_stats()["async"] is False
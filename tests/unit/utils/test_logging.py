@@ -193,7 +193,8 @@ class TestLogLevelFiltering:
             logger = AppLogger.__new__(AppLogger)
             logger._gui_level = logging.WARNING
             logger._settings = {}
-            logger.get_settings = Mock(return_value={'cats_gui_general': True})
+            logger._settings.update({'cats_gui_general': True})
+            logger._refresh_filter_flags()
 
             # Below level - should not emit
             assert logger.should_emit_gui('general', logging.INFO) == False
@@ -208,10 +209,11 @@ class TestLogLevelFiltering:
             logger = AppLogger.__new__(AppLogger)
             logger._gui_level = logging.INFO
             logger._settings = {}
-            logger.get_settings = Mock(return_value={
+            logger._settings.update({
                 'cats_gui_uploads': True,
                 'cats_gui_auth': False
             })
+            logger._refresh_filter_flags()
 
             assert logger.should_emit_gui('uploads', logging.INFO) == True
             assert logger.should_emit_gui('auth', logging.INFO) == False
@@ -222,7 +224,8 @@ class TestLogLevelFiltering:
             logger = AppLogger.__new__(AppLogger)
             logger._file_level = logging.DEBUG
             logger._settings = {'enabled': 'true'}
-            logger.get_settings = Mock(return_value={'cats_file_general': True})
+            logger._settings.update({'cats_file_general': True})
+            logger._refresh_filter_flags()
 
             # TRACE should never be logged to file
             assert logger.should_emit_file('general', AppLogger.TRACE) == False
@@ -236,7 +239,8 @@ class TestLogLevelFiltering:
             logger = AppLogger.__new__(AppLogger)
             logger._file_level = logging.INFO
             logger._settings = {'enabled': 'false'}
-            logger.get_settings = Mock(return_value={'cats_file_general': True})
+            logger._settings.update({'cats_file_general': True})
+            logger._refresh_filter_flags()
 
             assert logger.should_emit_file('general', logging.INFO) == False
 
@@ -246,10 +250,11 @@ class TestLogLevelFiltering:
             logger = AppLogger.__new__(AppLogger)
             logger._file_level = logging.INFO
             logger._settings = {'enabled': 'true'}
-            logger.get_settings = Mock(return_value={
+            logger._settings.update({
                 'cats_file_network': True,
                 'cats_file_ui': False
             })
+            logger._refresh_filter_flags()
 
             assert logger.should_emit_file('network', logging.INFO) == True
             assert logger.should_emit_file('ui', logging.INFO) == False
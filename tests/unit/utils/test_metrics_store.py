@@ -0,0 +1,141 @@
+"""Tests for MetricsStore write coalescing and the throughput time series."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+import src.utils.metrics_store as metrics_store_module
+from src.utils.metrics_store import (
+    SERIES_HOUR, SERIES_HOUR_RETENTION, SERIES_MINUTE, SERIES_MINUTE_RETENTION, MetricsStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    MetricsStore._instance = None
+    with patch.object(metrics_store_module, 'get_central_store_base_path', return_value=str(tmp_path)):
+        instance = MetricsStore()
+    yield instance
+    instance.close()
+    MetricsStore._instance = None
+
+
+def _series_rows(store):
+    conn = store._connect()
+    try:
+        return [tuple(row) for row in conn.execute(
+            "SELECT host_name, resolution, bucket_ts, bytes_uploaded, files_uploaded "
+            "FROM host_metrics_series ORDER BY resolution, bucket_ts"
+        )]
+    finally:
+        conn.close()
+
+
+class TestCoalescedWrites:
+
+    def test_transfers_are_merged_into_one_flush(self, store):
+        with patch.object(store, '_flush_pending', wraps=store._flush_pending) as flush_spy:
+            for i in range(50):
+                store.record_transfer('rapidgator', bytes_uploaded=1000, transfer_time=0.5,
+                                      success=i % 10 != 0, deduped=i == 0, bytes_saved=10)
+            store.flush()
+
+        assert flush_spy.call_count == 1
+        for period in ('today', 'all_time'):
+            metrics = store.get_aggregated_metrics('rapidgator', period)
+            assert metrics['bytes_uploaded'] == 50_000
+            assert metrics['bytes_saved'] == 500
+            assert metrics['files_uploaded'] == 45
+            assert metrics['files_failed'] == 5
+            assert metrics['files_deduped'] == 1
+            assert metrics['total_transfer_time'] == pytest.approx(25.0)
+            assert metrics['peak_speed'] == pytest.approx(2000.0)
+
+    def test_flush_adds_to_existing_rows(self, store):
+        store.record_transfer('rapidgator', bytes_uploaded=100, transfer_time=1.0, success=True)
+        store.flush()
+        store.record_transfer('rapidgator', bytes_uploaded=900, transfer_time=0.1, success=True)
+        store.record_transfer('filedot', bytes_uploaded=50, transfer_time=1.0, success=False)
+        store.flush()
+
+        rapidgator = store.get_aggregated_metrics('rapidgator', 'all_time')
+        assert rapidgator['bytes_uploaded'] == 1000
+        assert rapidgator['files_uploaded'] == 2
+        assert rapidgator['peak_speed'] == pytest.approx(9000.0)
+        assert store.get_aggregated_metrics('filedot', 'today')['files_failed'] == 1
+
+    def test_batch_size_triggers_flush_without_waiting(self, store):
+        with patch.object(metrics_store_module, 'WRITE_BATCH_SIZE', 5), \
+                patch.object(metrics_store_module, 'WRITE_FLUSH_INTERVAL', 60.0):
+            for _ in range(5):
+                store.record_transfer('rapidgator', bytes_uploaded=10, transfer_time=1.0, success=True)
+
+            deadline = time.time() + 5
+            while time.time() < deadline:
+                if store.get_aggregated_metrics('rapidgator', 'all_time')['files_uploaded'] == 5:
+                    break
+                time.sleep(0.05)
+
+        assert store.get_aggregated_metrics('rapidgator', 'all_time')['files_uploaded'] == 5
+
+    def test_close_flushes_pending_transfers(self, store):
+        store.record_transfer('rapidgator', bytes_uploaded=10, transfer_time=1.0, success=True)
+        store.close()
+
+        assert store.get_aggregated_metrics('rapidgator', 'all_time')['files_uploaded'] == 1
+
+
+class TestThroughputSeries:
+
+    def test_transfers_land_in_minute_buckets(self, store):
+        now = time.time()
+        with patch.object(metrics_store_module.time, 'time', return_value=now):
+            store.record_transfer('rapidgator', bytes_uploaded=6000, transfer_time=1.0, success=True)
+            store.record_transfer('filedot', bytes_uploaded=3000, transfer_time=1.0, success=True)
+        store.flush()
+
+        bucket_ts = int(now // SERIES_MINUTE) * SERIES_MINUTE
+        assert _series_rows(store) == [
+            ('filedot', SERIES_MINUTE, bucket_ts, 3000, 1),
+            ('rapidgator', SERIES_MINUTE, bucket_ts, 6000, 1),
+        ]
+
+        series = store.get_throughput_series(hours=1)
+        assert [point['bucket_ts'] for point in series] == [bucket_ts]
+        assert series[0]['bytes_uploaded'] == 9000
+        assert series[0]['avg_speed'] == pytest.approx(9000 / SERIES_MINUTE)
+        assert store.get_throughput_series('filedot', hours=1)[0]['bytes_uploaded'] == 3000
+        assert store.get_throughput_series('missing', hours=1) == []
+
+    def test_compaction_downsamples_and_expires(self, store):
+        now = time.time()
+        hour = int((now - SERIES_MINUTE_RETENTION) // SERIES_HOUR) * SERIES_HOUR - SERIES_HOUR
+        expired = int(now - SERIES_HOUR_RETENTION) // SERIES_HOUR * SERIES_HOUR - SERIES_HOUR
+        recent = int(now // SERIES_MINUTE) * SERIES_MINUTE
+        conn = store._connect()
+        try:
+            conn.executemany(
+                "INSERT INTO host_metrics_series "
+                "(host_name, resolution, bucket_ts, bytes_uploaded, files_uploaded, "
+                "files_failed, total_transfer_time, peak_speed) VALUES (?, ?, ?, ?, ?, 0, 1.0, ?)",
+                [
+                    ('rapidgator', SERIES_MINUTE, hour + 60, 100, 1, 5.0),
+                    ('rapidgator', SERIES_MINUTE, hour + 120, 200, 2, 7.0),
+                    ('rapidgator', SERIES_MINUTE, recent, 300, 3, 9.0),
+                    ('rapidgator', SERIES_HOUR, expired, 400, 4, 1.0),
+                ]
+            )
+            store._compact_series(conn, now=now)
+        finally:
+            conn.close()
+
+        assert _series_rows(store) == [
+            ('rapidgator', SERIES_MINUTE, recent, 300, 3),
+            ('rapidgator', SERIES_HOUR, hour, 300, 3),
+        ]
+        series = store.get_throughput_series('rapidgator', hours=24 * 7)
+        assert [(point['bucket_ts'], point['bytes_uploaded']) for point in series] == [
+            (hour, 300), (recent // SERIES_HOUR * SERIES_HOUR, 300),
+        ]
+        assert series[0]['peak_speed'] == pytest.approx(7.0)
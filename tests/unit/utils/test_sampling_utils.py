@@ -165,6 +165,19 @@ class TestGetSampleIndices:
         assert 1 not in indices
         assert 3 not in indices
 
+    def test_small_image_exclusion_with_known_dimensions(self):
+        """Test small image exclusion uses passed dimensions without opening files"""
+        files = [f"image{i}.jpg" for i in range(4)]
+        dimensions = dict(zip(files, [(1000, 1000), (500, 500), (1000, 1000), (300, 300)]))
+        config = {
+            'sampling_method': 0,
+            'sampling_fixed_count': 10,
+            'exclude_small_images': True,
+            'exclude_small_threshold': 50,
+        }
+        indices = get_sample_indices(files, config, '/nonexistent', dimensions)
+        assert indices == [0, 2]
+
     def test_all_excluded_returns_middle(self):
         """Test when all images excluded, returns middle image"""
         files = [f"image{i}.jpg" for i in range(5)]
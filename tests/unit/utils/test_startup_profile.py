@@ -0,0 +1,58 @@
+"""Tests for the --profile-startup import timer."""
+
+import io
+import sys
+
+import pytest
+
+from src.utils import startup_profile
+
+
+@pytest.fixture
+def fake_package(tmp_path, monkeypatch):
+    pkg = tmp_path / "profiled_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("from profiled_pkg import child\n")
+    (pkg / "child.py").write_text("VALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "profiled_pkg"
+    for name in [m for m in sys.modules if m.startswith("profiled_pkg")]:
+        del sys.modules[name]
+    startup_profile.uninstall()
+
+
+class TestStartupProfile:
+
+    def test_records_nested_imports_in_importtime_layout(self, fake_package):
+        profiler = startup_profile.install()
+        import profiled_pkg
+
+        assert profiled_pkg.child.VALUE == 42
+        names = [(name, depth) for name, _, _, depth in profiler.records]
+        assert names == [("profiled_pkg.child", 1), ("profiled_pkg", 0)]
+        (_, child_self, child_cum, _), (_, parent_self, parent_cum, _) = profiler.records
+        assert child_self == child_cum
+        assert parent_cum >= parent_self + child_cum - 1
+
+        out = io.StringIO()
+        text = startup_profile.report(out)
+        assert out.getvalue() == text
+        lines = text.splitlines()
+        assert lines[0] == "import time: self [us] | cumulative | imported package"
+        assert lines[1].endswith("|   profiled_pkg.child")
+        assert lines[2].endswith("| profiled_pkg")
+        assert "importing 2 modules" in text
+
+    def test_report_uninstalls(self, fake_package):
+        startup_profile.install()
+        startup_profile.report(io.StringIO())
+
+        assert not startup_profile.is_active()
+        assert not any(isinstance(f, startup_profile.ImportProfiler) for f in sys.meta_path)
+        assert startup_profile.report(io.StringIO()) is None
+
+    def test_loaded_module_keeps_original_loader_behaviour(self, fake_package):
+        startup_profile.install()
+        import profiled_pkg.child
+
+        assert profiled_pkg.child.__spec__.loader.get_filename("profiled_pkg.child").endswith("child.py")
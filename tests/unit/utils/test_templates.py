@@ -1,8 +1,20 @@
 """Tests for template processing and video placeholder resolution."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 
-from src.utils.templates import apply_template, process_conditionals, _camel_to_snake
+from src.utils import templates as templates_module
+from src.utils.templates import (
+    CompiledTemplate,
+    _apply_template_sequential,
+    _builtin_templates,
+    _camel_to_snake,
+    apply_template,
+    generate_bbcode_from_template,
+    process_conditionals,
+)
 
 
 class TestCamelToSnake:
@@ -158,3 +170,97 @@ class TestVideoPlaceholders:
         assert '[img]thumb.jpg[/img]' in result
         assert 'Codec: H.264' in result
         assert '[img]sheet.jpg[/img]' in result
+
+
+class TestCompiledTemplate:
+    """The compiled renderer must match the sequential replace engine."""
+
+    DATA_SETS = [
+        {},
+        {'folder_name': 'Gallery', 'ext1': 'one', 'gallery_link': 'http://g', 'width': 800},
+        {'host_links': '[url=x]#folderName# (#folderSize#)[/url]', 'folder_name': 'F',
+         'folder_size': '12.0 MB', 'all_images': '#hostLinks#', 'audio_codec': 'AAC'},
+        {'ext2': 'a', 'width': None, 'fps': '#ext1#', 'ext1': '0', 'custom1': ' '},
+    ]
+
+    TEMPLATES = [
+        "",
+        "#folderName#\n\n\n  \n#allImages#\n\n",
+        "[if ext1]a[else]b\n[/if]end",
+        "[if ext1][if galleryLink]L[else]N[/if][else]\n[if ext2=a]A[/if][/if]",
+        "x [else] y [/if] #width##height#",
+        "#fps#width#",
+        "[if ext1]unclosed #ext1#",
+        "[if ext1]a[else]b[else]c[/if]",
+        "[iframe]#folderName#",
+    ]
+
+    @pytest.mark.parametrize('template', TEMPLATES + list(_builtin_templates().values()))
+    def test_matches_sequential_engine(self, template):
+        compiled = CompiledTemplate(template)
+        for data in self.DATA_SETS:
+            assert compiled.render(data) == _apply_template_sequential(template, data)
+
+    def test_builtin_templates_use_the_tree(self):
+        for template in _builtin_templates().values():
+            assert not CompiledTemplate(template)._sequential
+
+    @pytest.mark.parametrize('template', [
+        "[if ext1]unclosed",
+        "[if ext1]a[else]b[else]c[/if]",
+        "[iframe][if ext1]x[/if]",
+        "[if ext1]x[/if]" * 51,
+    ])
+    def test_quirky_templates_fall_back_to_sequential(self, template):
+        assert CompiledTemplate(template)._sequential
+
+    def test_static_template_is_tokenized_once(self):
+        compiled = CompiledTemplate("#folderName# - #width#")
+        assert compiled._parts is not None
+        assert compiled.render({'folder_name': 'G', 'width': 10}) == 'G - 10'
+
+
+class TestTemplateFileCache:
+    """Template files are parsed once and reloaded when they change."""
+
+    @pytest.fixture
+    def template_dir(self, tmp_path):
+        with patch('src.utils.templates.get_template_path', return_value=str(tmp_path)):
+            yield tmp_path
+
+    def test_file_read_once_until_modified(self, template_dir):
+        path = template_dir / '.template Mine.txt'
+        path.write_text('#POSTTITLE: T\nA #folderName#', encoding='utf-8')
+
+        with patch('builtins.open', wraps=open) as mock_open:
+            assert generate_bbcode_from_template('Mine', {'folder_name': 'x'}) == 'A x'
+            assert generate_bbcode_from_template('Mine', {'folder_name': 'y'}) == 'A y'
+        assert mock_open.call_count == 1
+
+        path.write_text('B #folderName#', encoding='utf-8')
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert generate_bbcode_from_template('Mine', {'folder_name': 'z'}) == 'B z'
+        assert templates_module.load_templates()['Mine'] == 'B #folderName#'
+
+    def test_directory_listed_once_until_it_changes(self, template_dir):
+        (template_dir / '.template One.txt').write_text('1 #folderName#', encoding='utf-8')
+
+        with patch('src.utils.templates.os.listdir', wraps=os.listdir) as mock_listdir:
+            assert generate_bbcode_from_template('One', {'folder_name': 'x'}) == '1 x'
+            assert generate_bbcode_from_template('One', {'folder_name': 'y'}) == '1 y'
+            assert mock_listdir.call_count == 1
+
+            (template_dir / '.template Two.txt').write_text('2 #folderName#', encoding='utf-8')
+            st = template_dir.stat()
+            os.utime(template_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            assert generate_bbcode_from_template('Two', {'folder_name': 'z'}) == '2 z'
+            assert mock_listdir.call_count == 2
+
+    def test_unknown_template_uses_default(self, template_dir):
+        result = generate_bbcode_from_template('Missing', {'folder_name': 'G', 'all_images': 'I'})
+        assert result == 'G\nI'
+
+    def test_custom_file_overrides_builtin(self, template_dir):
+        (template_dir / '.template default.txt').write_text('custom #folderName#', encoding='utf-8')
+        assert generate_bbcode_from_template('default', {'folder_name': 'G'}) == 'custom G'
@@ -0,0 +1,177 @@
+"""Tests for ZIP archives assembled from precompressed members."""
+
+import io
+import os
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import zip_precompressed
+from src.utils.zip_precompressed import (
+    PrecompressedSplitZipWriter,
+    PrecompressedZipWriter,
+    compress_member,
+    stored_member,
+)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    files = []
+    for n, data in enumerate([b"", b"x" * 5000, os.urandom(20000), "café".encode() * 900]):
+        path = tmp_path / f"img_{n}.jpg"
+        path.write_bytes(data)
+        files.append(path)
+    (tmp_path / "résumé.png").write_bytes(b"utf8 name")
+    files.append(tmp_path / "résumé.png")
+    return files
+
+
+def _build(files, compress_type, spool_bytes=1 << 20):
+    out = io.BytesIO()
+    with PrecompressedZipWriter(out) as zf:
+        for path in files:
+            zf.write_member(compress_member(path, compress_type, spool_bytes))
+    out.seek(0)
+    return out
+
+
+def _build_stored(files):
+    out = io.BytesIO()
+    with PrecompressedZipWriter(out) as zf:
+        for path in files:
+            zf.write_member(stored_member(path))
+    out.seek(0)
+    return out
+
+
+@pytest.mark.parametrize('compress_type', zip_precompressed.SUPPORTED_COMPRESSION)
+def test_zipfile_reads_members(sources, compress_type):
+    with zipfile.ZipFile(_build(sources, compress_type)) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == [p.name for p in sources]
+        for path in sources:
+            info = zf.getinfo(path.name)
+            assert info.compress_type == compress_type
+            assert zf.read(path.name) == path.read_bytes()
+
+
+def test_matches_zipfile_metadata(sources):
+    expected = io.BytesIO()
+    with zipfile.ZipFile(expected, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for path in sources:
+            zf.write(path, arcname=path.name)
+    with zipfile.ZipFile(expected) as ours_ref, zipfile.ZipFile(_build(sources, zipfile.ZIP_DEFLATED)) as ours:
+        for ref, info in zip(ours_ref.infolist(), ours.infolist()):
+            assert (info.filename, info.date_time, info.CRC, info.file_size, info.external_attr) == \
+                (ref.filename, ref.date_time, ref.CRC, ref.file_size, ref.external_attr)
+
+
+def test_spooled_members(sources):
+    with zipfile.ZipFile(_build(sources, zipfile.ZIP_DEFLATED, spool_bytes=0)) as zf:
+        assert zf.testzip() is None
+
+
+def test_zip64_records(sources):
+    """Offsets, sizes and counts past the limits are written as ZIP64 records."""
+    with patch.object(zip_precompressed, '_ZIP64_LIMIT', 10), \
+            patch.object(zip_precompressed, '_ZIP_FILECOUNT_LIMIT', 2):
+        data = _build(sources, zipfile.ZIP_DEFLATED)
+    assert b'PK\x06\x06' in data.getvalue()
+    with zipfile.ZipFile(data) as zf:
+        assert zf.testzip() is None
+        assert [zf.read(p.name) for p in sources] == [p.read_bytes() for p in sources]
+
+
+def test_writes_sequentially_without_seeking(sources):
+    class WriteOnly:
+        def __init__(self):
+            self.buffer = io.BytesIO()
+
+        def write(self, data):
+            return self.buffer.write(data)
+
+    out = WriteOnly()
+    with PrecompressedZipWriter(out) as zf:
+        zf.write_member(compress_member(sources[1], zipfile.ZIP_LZMA, 1 << 20))
+    with zipfile.ZipFile(io.BytesIO(out.buffer.getvalue())) as zf:
+        assert zf.read(sources[1].name) == sources[1].read_bytes()
+
+
+def test_unsupported_compression(sources):
+    with pytest.raises(ValueError):
+        compress_member(sources[0], zipfile.ZIP_STORED, 0)
+
+
+def test_stored_member(sources):
+    with zipfile.ZipFile(_build_stored(sources)) as zf:
+        assert zf.testzip() is None
+        assert [zf.read(p.name) for p in sources] == [p.read_bytes() for p in sources]
+
+
+def test_stored_member_refuses_changed_file(sources):
+    member = stored_member(sources[1])
+    sources[1].write_bytes(b"y" * 10)
+    with pytest.raises(RuntimeError):
+        PrecompressedZipWriter(io.BytesIO()).write_member(member)
+
+
+class TestSplitWriter:
+    """Split volumes match splitzip's output byte for byte, written without seeking."""
+
+    @pytest.fixture
+    def noisy(self, tmp_path):
+        folder = tmp_path / "src"
+        folder.mkdir()
+        files = []
+        for n, size in enumerate([150_000, 10, 90_000, 300_000]):
+            path = folder / f"img_{n}.jpg"
+            path.write_bytes(os.urandom(size // 2) + b"a" * (size - size // 2))
+            files.append(path)
+        (folder / "é.png").write_bytes(b"utf8 name")
+        files.append(folder / "é.png")
+        return files
+
+    @pytest.mark.parametrize('split_size', [64 * 1024, 100_000, 1 << 20])
+    @pytest.mark.parametrize('compress_type', [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_matches_splitzip(self, tmp_path, noisy, split_size, compress_type):
+        splitzip = pytest.importorskip("splitzip")
+        (tmp_path / "ref").mkdir()
+        (tmp_path / "ours").mkdir()
+        with splitzip.SplitZipWriter(tmp_path / "ref" / "g.zip", split_size=split_size,
+                                     compression=compress_type) as zf:
+            for path in noisy:
+                zf.write(path, arcname=path.name)
+        expected = zf.volume_paths
+
+        with PrecompressedSplitZipWriter(tmp_path / "ours" / "g.zip", split_size) as zf:
+            for path in noisy:
+                if compress_type == zipfile.ZIP_STORED:
+                    zf.write_member(stored_member(path))
+                else:
+                    zf.write_member(compress_member(path, compress_type, 1 << 20))
+        written = zf.close()
+
+        assert [p.name for p in written] == [p.name for p in expected]
+        for ours, ref in zip(written, expected):
+            assert ours.read_bytes() == ref.read_bytes()
+
+    def test_volumes_written_without_seeking(self, tmp_path, noisy):
+        class WriteOnly:
+            def __init__(self, fp):
+                self.fp = fp
+
+            def write(self, data):
+                return self.fp.write(data)
+
+        with PrecompressedSplitZipWriter(tmp_path / "g.zip", 64 * 1024, wrap=WriteOnly) as zf:
+            for path in noisy:
+                zf.write_member(stored_member(path))
+        assert [type(out) for _, out in zf.volumes] == [WriteOnly] * len(zf.volumes)
+        assert len(zf.volumes) > 1
+        assert zf.volumes[-1][0] == tmp_path / "g.zip"
+
+    def test_rejects_small_volumes(self, tmp_path):
+        with pytest.raises(ValueError):
+            PrecompressedSplitZipWriter(tmp_path / "g.zip", 1024)
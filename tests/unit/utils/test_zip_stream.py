@@ -0,0 +1,128 @@
+"""Tests for planned store-mode ZIPs streamed from their source files."""
+
+import hashlib
+import io
+import os
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.archive_manager import ArchiveManager
+from src.utils.zip_stream import plan_split_stored_zip, plan_stored_zip, split_streaming_supported
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ArchiveManager(temp_dir=tmp_path / "archives")
+
+
+@pytest.fixture
+def gallery(tmp_path):
+    """Incompressible images so split sizes are predictable; one unicode name."""
+    folder = tmp_path / "gallery"
+    folder.mkdir()
+    for i in range(6):
+        (folder / f"img_{i:02d}.jpg").write_bytes(os.urandom(90_000 + i * 1_000))
+    (folder / "café_ü.png").write_bytes(os.urandom(40_000))
+    return folder
+
+
+def _read_all(part, chunk=None):
+    with part.open() as reader:
+        if chunk is None:
+            return reader.read()
+        out = bytearray()
+        while True:
+            data = reader.read(chunk)
+            if not data:
+                return bytes(out)
+            out += data
+
+
+class TestPlanStoredZip:
+
+    def test_matches_create_zip_bytes(self, manager, gallery):
+        files = manager._get_image_files(gallery)
+        written = manager._create_zip(gallery, "g", "store")
+
+        part = plan_stored_zip(files, written)
+
+        expected = written.read_bytes()
+        assert part.size == len(expected)
+        assert part.name == written.name
+        assert _read_all(part) == expected
+        assert _read_all(part, chunk=4097) == expected
+
+    def test_does_not_write_archive(self, manager, gallery, tmp_path):
+        target = tmp_path / "never" / "g.zip"
+        part = plan_stored_zip(manager._get_image_files(gallery), target)
+        assert not target.parent.exists()
+        with zipfile.ZipFile(io.BytesIO(_read_all(part))) as zf:
+            assert zf.testzip() is None
+            assert zf.read("café_ü.png") == (gallery / "café_ü.png").read_bytes()
+
+    def test_seek_and_partial_reads(self, manager, gallery, tmp_path):
+        part = plan_stored_zip(manager._get_image_files(gallery), tmp_path / "g.zip")
+        data = _read_all(part)
+        with part.open() as reader:
+            reader.seek(12_345)
+            assert reader.read(70_000) == data[12_345:82_345]
+            reader.seek(-22, io.SEEK_END)
+            assert reader.read() == data[-22:]
+            assert reader.read(10) == b""
+
+    def test_md5_matches_bytes(self, manager, gallery, tmp_path):
+        part = plan_stored_zip(manager._get_image_files(gallery), tmp_path / "g.zip")
+        assert part.md5() == hashlib.md5(_read_all(part)).hexdigest()
+
+    def test_changed_source_refused(self, manager, gallery, tmp_path):
+        part = plan_stored_zip(manager._get_image_files(gallery), tmp_path / "g.zip")
+        assert part.is_current()
+
+        changed = gallery / "img_03.jpg"
+        changed.write_bytes(os.urandom(1_000))
+
+        assert not part.is_current()
+        with pytest.raises(RuntimeError, match="changed"):
+            _read_all(part)
+
+
+@pytest.mark.skipif(not split_streaming_supported(), reason="installed splitzip is not supported")
+class TestPlanSplitStoredZip:
+
+    @pytest.mark.parametrize("split_size", [64 * 1024, 200_000, 300_000, 10_000_000])
+    def test_matches_create_split_zip_bytes(self, manager, gallery, split_size):
+        files = manager._get_image_files(gallery)
+        written = manager._create_split_zip(files, "g", "store", split_size)
+
+        parts = plan_split_stored_zip(files, manager.temp_dir / "g.zip", split_size)
+
+        assert [p.name for p in parts] == [p.name for p in written]
+        for part, path in zip(parts, written):
+            expected = path.read_bytes()
+            assert part.size == len(expected)
+            assert _read_all(part) == expected
+
+    def test_parts_only_reference_their_sources(self, manager, gallery, tmp_path):
+        parts = plan_split_stored_zip(manager._get_image_files(gallery), tmp_path / "g.zip", 200_000)
+        (gallery / "img_05.jpg").write_bytes(b"changed")
+
+        # Only the volume holding the rewritten image goes stale
+        assert not all(part.is_current() for part in parts)
+        assert parts[0].is_current()
+
+
+class TestSplitzipVersionGuard:
+
+    def test_unsupported_version_refused(self, manager, gallery, tmp_path):
+        with patch('splitzip.__version__', '9.9.9'):
+            assert not split_streaming_supported()
+            with pytest.raises(RuntimeError, match="9.9.9"):
+                plan_split_stored_zip(manager._get_image_files(gallery), tmp_path / "g.zip", 200_000)
+
+    def test_single_zip_does_not_need_supported_splitzip(self, manager, gallery, tmp_path):
+        with patch('splitzip.__version__', '9.9.9'):
+            part = plan_stored_zip(manager._get_image_files(gallery), tmp_path / "g.zip")
+        with zipfile.ZipFile(io.BytesIO(_read_all(part))) as zf:
+            assert zf.testzip() is None